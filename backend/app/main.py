@@ -2,14 +2,26 @@ import os
 import sys
 import logging
 import traceback
+from .utils.import_budget import import_profiler
+
+# 이후 import의 패키지별 비용 측정 (IMPORT_TIME_BUDGET_MS 설정 시)
+import_profiler.install()
+
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from dotenv import load_dotenv
 from .database import engine, Base
-from .models import user, simulator, failure_scenario
-from .routers import auth, users, simulators, failure_scenarios, failure_analytics
-from .utils.schema_updater import auto_update_schema, check_schema_differences
+from .models import user, simulator, failure_scenario, failure_cascade
+from .routers import auth, users, simulators, failure_scenarios, failure_cascades, failure_analytics
+from .utils.schema_updater import apply_ddl_auto
+from .services.tick_scheduler import tick_scheduler
+from .services.cache_invalidation import invalidation_bus
+from .services.compiled_cache import compiled_cache
+from .services.cache_warmup import cache_warmup
+from .services.upload_parser_pool import upload_parser_pool
+
+import_profiler.uninstall()
 
 # 더 자세한 로깅 설정
 logging.basicConfig(
@@ -24,40 +36,6 @@ logger = logging.getLogger(__name__)
 # 환경변수 로드
 load_dotenv()
 
-# DDL Auto 설정에 따른 테이블 생성/업데이트
-ddl_auto = os.getenv("DDL_AUTO", "update").lower()  # 기본값을 update로 변경
-
-if ddl_auto == "create":
-    # 기존 테이블 삭제 후 재생성
-    Base.metadata.drop_all(bind=engine)
-    Base.metadata.create_all(bind=engine)
-    logger.info("✅ DDL_AUTO=create: 모든 테이블을 재생성했습니다.")
-elif ddl_auto == "update":
-    # 스키마 차이점 확인
-    differences = check_schema_differences(engine, Base.metadata)
-    
-    # 차이점 로깅
-    if differences['missing_tables']:
-        logger.info(f"생성할 테이블: {differences['missing_tables']}")
-    if differences['missing_columns']:
-        logger.info(f"추가할 컬럼: {differences['missing_columns']}")
-    
-    # 자동 스키마 업데이트 실행
-    auto_update_schema(engine, Base.metadata)
-    logger.info("✅ DDL_AUTO=update: 스키마를 자동으로 업데이트했습니다.")
-elif ddl_auto == "validate":
-    # 스키마 검증만 수행
-    differences = check_schema_differences(engine, Base.metadata)
-    if differences['missing_tables'] or differences['missing_columns']:
-        logger.warning(f"⚠️ 스키마 불일치 감지: {differences}")
-    else:
-        logger.info("✅ DDL_AUTO=validate: 스키마가 일치합니다.")
-elif ddl_auto == "none":
-    logger.info("ℹ️ DDL_AUTO=none: 테이블 자동 생성이 비활성화되었습니다.")
-else:
-    logger.warning(f"⚠️ 알 수 없는 DDL_AUTO 값: {ddl_auto}. 기본값 'update'를 사용합니다.")
-    auto_update_schema(engine, Base.metadata)
-
 app = FastAPI(
     title="Dynamic API Simulator",
     description="동적 API 시뮬레이터 웹 애플리케이션",
@@ -95,12 +73,39 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# DDL Auto 설정에 따른 테이블 생성/업데이트 (import 시점이 아닌 워커 시작 시 1회)
+@app.on_event("startup")
+def initialize_schema():
+    import_profiler.report()
+    apply_ddl_auto(engine, Base.metadata, os.getenv("DDL_AUTO", "update"))
+
+
+# 백그라운드 작업 시작/종료
+@app.on_event("startup")
+async def start_background_tasks():
+    invalidation_bus.start_listener(engine)
+    cache_warmup.start()
+    if tick_scheduler.enabled:
+        await tick_scheduler.start()
+
+
+@app.on_event("shutdown")
+async def stop_background_tasks():
+    await tick_scheduler.stop()
+    invalidation_bus.stop_listener()
+    if cache_warmup.completed_at is not None:
+        # 워밍업 이후 갱신된 항목까지 다음 시작 때 바로 쓸 수 있도록 저장
+        cache_warmup.save_snapshot()
+    compiled_cache.shutdown()
+    upload_parser_pool.shutdown()
+
 # 라우터 등록
 app.include_router(auth.router)
 app.include_router(users.router)
 app.include_router(simulators.router)
 app.include_router(simulators.data_router)
 app.include_router(failure_scenarios.router)
+app.include_router(failure_cascades.router)
 app.include_router(failure_analytics.router)
 
 @app.get("/")
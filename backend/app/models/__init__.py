@@ -1,5 +1,6 @@
 from .user import User
 from .simulator import Simulator
 from .failure_scenario import FailureScenario
+from .failure_cascade import FailureCascade
 
-__all__ = ["User", "Simulator", "FailureScenario"]
\ No newline at end of file
+__all__ = ["User", "Simulator", "FailureScenario", "FailureCascade"]
\ No newline at end of file
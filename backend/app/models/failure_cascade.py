@@ -0,0 +1,51 @@
+from sqlalchemy import String, Integer, Float, DateTime, Boolean, ForeignKey, func
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from datetime import datetime
+from typing import TYPE_CHECKING
+from ..database import Base
+
+if TYPE_CHECKING:
+    from .simulator import Simulator
+
+
+class FailureCascade(Base):
+    """고장 전파 간선 - 원인 시뮬레이터의 고장이 지연 후 대상 시뮬레이터 파라미터에 미치는 영향"""
+    __tablename__ = "failure_cascades"
+    
+    # Primary Key
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    
+    # Foreign Keys
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    source_simulator_id: Mapped[int] = mapped_column(Integer, ForeignKey("simulators.id"), nullable=False, index=True)
+    target_simulator_id: Mapped[int] = mapped_column(Integer, ForeignKey("simulators.id"), nullable=False, index=True)
+    
+    # 영향 설정
+    target_parameter: Mapped[str] = mapped_column(String(255), nullable=False)
+    # offset: 값 + magnitude, scale: 값 × magnitude
+    effect: Mapped[str] = mapped_column(String(20), default="offset", nullable=False)
+    magnitude: Mapped[float] = mapped_column(Float, nullable=False)
+    # 원인 고장 발생 후 영향이 시작되기까지의 시간과 최대 영향에 도달하기까지의 시간(초)
+    delay_seconds: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)
+    ramp_seconds: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)
+    
+    # 상태
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    
+    # 타임스탬프
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
+    
+    # 관계 설정
+    source_simulator: Mapped["Simulator"] = relationship(
+        "Simulator", back_populates="outgoing_cascades", foreign_keys=[source_simulator_id]
+    )
+    target_simulator: Mapped["Simulator"] = relationship(
+        "Simulator", back_populates="incoming_cascades", foreign_keys=[target_simulator_id]
+    )
+    
+    def __repr__(self) -> str:
+        return (
+            f"FailureCascade(id={self.id!r}, source_simulator_id={self.source_simulator_id!r}, "
+            f"target_simulator_id={self.target_simulator_id!r}, target_parameter={self.target_parameter!r})"
+        )
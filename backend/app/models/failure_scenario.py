@@ -19,6 +19,11 @@ class FailureScenario(Base):
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
     simulator_id: Mapped[int] = mapped_column(Integer, ForeignKey("simulators.id"), nullable=True)
     
+    # 일괄 적용으로 만든 시뮬레이터별 복사본이면 원본 시나리오 ID (일반 시나리오는 NULL, 원본 삭제 시 함께 삭제)
+    source_scenario_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("failure_scenarios.id", ondelete="CASCADE"), nullable=True, index=True
+    )
+    
     # 시나리오 정보
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str] = mapped_column(Text, nullable=True)
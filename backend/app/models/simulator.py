@@ -1,4 +1,4 @@
-from sqlalchemy import String, Integer, DateTime, Boolean, ForeignKey, Text, func
+from sqlalchemy import String, Integer, DateTime, Boolean, ForeignKey, Index, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime
 from typing import TYPE_CHECKING, List
@@ -7,10 +7,15 @@ from ..database import Base
 if TYPE_CHECKING:
     from .user import User
     from .failure_scenario import FailureScenario
+    from .failure_cascade import FailureCascade
 
 
 class Simulator(Base):
     __tablename__ = "simulators"
+    __table_args__ = (
+        # 사용자별 시뮬레이터 이름 중복 방지 (일괄 생성의 ON CONFLICT 대상)
+        Index("ix_simulators_user_id_name", "user_id", "name", unique=True),
+    )
     
     # Primary Key
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
@@ -23,6 +28,11 @@ class Simulator(Base):
     parameters: Mapped[str] = mapped_column(Text, nullable=False)  # JSON 문자열로 저장
     parameter_config: Mapped[str] = mapped_column(Text, nullable=True, default='{}')  # 파라미터 설정 JSON
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    # 값 생성 방식: static(파라미터 값/랜덤) | replay(업로드 파일의 행을 순서대로 재생) | fleet(정의 하나를 N개 인스턴스로 서비스)
+    mode: Mapped[str] = mapped_column(String(20), default="static", nullable=False)
+    replay_config: Mapped[str] = mapped_column(Text, nullable=True)  # 재생 설정 JSON (dataset_id, advance, wrap 등)
+    fleet_config: Mapped[str] = mapped_column(Text, nullable=True)  # 플릿 설정 JSON (instance_count, 인스턴스별 overrides)
+    clock_config: Mapped[str] = mapped_column(Text, nullable=True)  # 시뮬레이션 시계 상태 JSON (배속, 일시정지, 기준점) - 없으면 실제 시간
     
     # 타임스탬프
     created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), nullable=False)
@@ -36,6 +46,19 @@ class Simulator(Base):
         back_populates="simulator",
         cascade="all, delete-orphan"
     )
+    # 관계 설정: 이 시뮬레이터에서 나가는/들어오는 고장 전파 간선 (시뮬레이터 삭제 시 함께 삭제)
+    outgoing_cascades: Mapped[List["FailureCascade"]] = relationship(
+        "FailureCascade",
+        back_populates="source_simulator",
+        foreign_keys="FailureCascade.source_simulator_id",
+        cascade="all, delete-orphan"
+    )
+    incoming_cascades: Mapped[List["FailureCascade"]] = relationship(
+        "FailureCascade",
+        back_populates="target_simulator",
+        foreign_keys="FailureCascade.target_simulator_id",
+        cascade="all, delete-orphan"
+    )
     
     def __repr__(self) -> str:
         return f"Simulator(id={self.id!r}, name={self.name!r}, user_id={self.user_id!r}, is_active={self.is_active!r})"
\ No newline at end of file
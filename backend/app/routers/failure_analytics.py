@@ -1,16 +1,21 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File, Form
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
+from starlette.background import BackgroundTask
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
+from urllib.parse import quote
+import os
 
 from ..database import get_db
 from ..utils.auth import get_current_user
 from ..models.user import User
 from ..models.simulator import Simulator
 from ..models.failure_scenario import FailureScenario
-from ..services.failure_engine import FailureEngine, FailureType, NoiseType
+from ..services.failure_scenario_service import FailureScenarioService
+from ..services.upload_parser_pool import upload_parser_pool
 import json
-import numpy as np
 
 router = APIRouter(
     prefix="/api/failure-analytics",
@@ -37,6 +42,10 @@ def generate_failure_pattern(
     - spike: 스파이크
     - degradation: 성능 저하
     """
+    import numpy as np
+
+    from ..services.failure_engine import FailureEngine
+
     try:
         engine = FailureEngine()
         time_array, values = engine.generate_failure_pattern(
@@ -95,8 +104,11 @@ def simulate_advanced_failure(
         }
     }
     """
+    from ..services.failure_engine import FailureEngine, MarkovStateStore
+
     try:
-        engine = FailureEngine()
+        # 마르코프 상태는 이 시계열 안에서만 이어지도록 요청별 저장소 사용
+        engine = FailureEngine(state_key="simulate", state_store=MarkovStateStore())
         num_samples = duration_seconds * sample_rate
         
         results = []
@@ -172,6 +184,10 @@ def predict_failure_probability(
             detail="예측을 위해 최소 2개 이상의 데이터 포인트가 필요합니다."
         )
     
+    import numpy as np
+
+    from ..services.failure_engine import FailureEngine
+
     try:
         engine = FailureEngine()
         probability = engine.predict_failure_probability(
@@ -212,6 +228,75 @@ def predict_failure_probability(
         )
 
 
+@router.post("/transform")
+async def transform_with_failure(
+    file: UploadFile = File(..., description="기록된 CSV 또는 Excel 파일"),
+    scenario_id: int = Form(..., description="적용할 고장 시나리오 ID"),
+    interval_seconds: float = Form(1.0, gt=0, description="time_column이 없을 때 행 사이 간격(초)"),
+    time_column: Optional[str] = Form(None, description="경과 시간 계산에 사용할 컬럼 (초 단위 숫자 또는 날짜/시각)"),
+    label_column: str = Form("failure_active", description="고장 적용 여부(0/1)를 기록할 컬럼 이름"),
+    seed: Optional[int] = Form(None, description="확률적 고장/노이즈 재현용 시드"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    기록된 데이터셋 전체에 고장 시나리오를 적용한 CSV 다운로드
+    
+    파일을 청크 단위로 읽어 벡터화된 고장 엔진으로 변환하고 변환된 청크를 바로 전송하므로,
+    파일 크기와 관계없이 메모리 사용량이 일정합니다. 각 행에는 고장 적용 여부 라벨 컬럼이 추가됩니다.
+    
+    - 시나리오 파라미터는 같은 이름의 컬럼(또는 컬럼명을 파라미터 키로 변환한 이름)에 적용됩니다
+    - 시간 기반 고장 패턴의 경과 시간은 `time_column` 값 또는 행 번호 × `interval_seconds`입니다
+    """
+    from ..services.failure_transform import FailureTransform
+    from ..utils.file_parser import FileParser
+
+    scenario = FailureScenarioService.get_scenario(
+        db=db, scenario_id=scenario_id, user_id=current_user.id
+    )
+    if not scenario:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="고장 시나리오를 찾을 수 없습니다."
+        )
+
+    failure_config: Dict[str, Any] = {'failure_parameters': scenario.failure_parameters}
+    if scenario.advanced_config:
+        try:
+            failure_config['advanced_config'] = json.loads(scenario.advanced_config)
+        except json.JSONDecodeError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"고급 고장 시나리오 설정 파싱 오류: {str(e)}"
+            )
+
+    size = FileParser.validate_upload(file)
+    transform = FailureTransform(
+        file.file, file.filename.lower(), size, failure_config,
+        interval_seconds=interval_seconds,
+        time_column=time_column or None,
+        label_column=label_column,
+        seed=seed
+    )
+
+    # 응답이 끝날 때까지 업로드 풀 슬롯 하나를 차지
+    upload_parser_pool.acquire()
+    try:
+        await run_in_threadpool(transform.prepare)
+    except BaseException:
+        upload_parser_pool.release()
+        raise
+
+    body, release = upload_parser_pool.streaming(transform.iter_csv())
+    download_name = f"{os.path.splitext(file.filename)[0]}_failure_{scenario_id}.csv"
+    return StreamingResponse(
+        body,
+        media_type="text/csv; charset=utf-8",
+        headers={"Content-Disposition": f"attachment; filename*=UTF-8''{quote(download_name)}"},
+        background=BackgroundTask(release)
+    )
+
+
 @router.get("/failure-types")
 def get_failure_types(current_user: User = Depends(get_current_user)):
     """사용 가능한 고장 유형 목록 조회"""
@@ -252,6 +337,12 @@ def get_failure_types(current_user: User = Depends(get_current_user)):
                 "name": "드리프트",
                 "description": "일정한 속도로 이탈",
                 "parameters": ["drift_rate"]
+            },
+            {
+                "type": "markov",
+                "name": "마르코프 건강 상태",
+                "description": "전이율 행렬에 따라 정상/저하/고장 임박/고장/수리 상태를 오가며 상태별로 값 변환",
+                "parameters": ["states", "rates", "transforms", "initial_state", "state_parameter"]
             }
         ]
     }
@@ -285,6 +376,24 @@ def get_noise_types(current_user: User = Depends(get_current_user)):
                 "name": "포아송 분포 노이즈",
                 "description": "이산 사건을 모델링하는 노이즈",
                 "parameters": []
+            },
+            {
+                "type": "pink",
+                "name": "핑크 노이즈",
+                "description": "1/f 스펙트럼의 유색 노이즈 (시뮬레이터별로 이어짐)",
+                "parameters": ["intensity"]
+            },
+            {
+                "type": "brown",
+                "name": "브라운 노이즈",
+                "description": "누설 적분 랜덤 워크 (leak이 1에 가까울수록 느리게 변화)",
+                "parameters": ["intensity", "leak"]
+            },
+            {
+                "type": "arma",
+                "name": "AR(p)/ARMA 과정",
+                "description": "자기회귀 이동평균 과정 (ma를 생략하면 AR(p))",
+                "parameters": ["intensity", "ar", "ma"]
             }
         ]
     }
@@ -293,6 +402,7 @@ def get_noise_types(current_user: User = Depends(get_current_user)):
 @router.get("/test-engine")
 def test_failure_engine(current_user: User = Depends(get_current_user)):
     """고장 엔진 테스트 및 데모"""
+    from ..services.failure_engine import FailureEngine
     
     engine = FailureEngine(seed=42)  # 재현 가능한 결과를 위한 시드
     
@@ -0,0 +1,146 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+from typing import List, Optional
+import logging
+
+from ..database import get_db
+from ..utils.auth import get_current_user
+from ..models.user import User
+from ..schemas.failure_cascade import (
+    FailureCascadeCreate,
+    FailureCascadeUpdate,
+    FailureCascadeResponse,
+    CascadePlanResponse
+)
+from ..services.failure_cascade_service import FailureCascadeService
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    prefix="/api/failure-cascades",
+    tags=["failure-cascades"]
+)
+
+
+@router.post("/", response_model=FailureCascadeResponse, status_code=status.HTTP_201_CREATED)
+def create_failure_cascade(
+    cascade_data: FailureCascadeCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    고장 전파 간선 생성
+
+    원인 시뮬레이터에 고장 시나리오가 적용되면 delay_seconds 뒤부터 대상 시뮬레이터의
+    target_parameter가 바뀌고, 대상에서 나가는 간선을 따라 연쇄적으로 전파됩니다.
+    순환을 만드는 간선은 거부됩니다 (400).
+    """
+    try:
+        return FailureCascadeService.create_cascade(
+            db=db,
+            cascade_data=cascade_data,
+            user_id=current_user.id
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
+@router.get("/", response_model=List[FailureCascadeResponse])
+def get_my_cascades(
+    simulator_id: Optional[int] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """현재 사용자의 고장 전파 간선 조회 (simulator_id를 주면 그 시뮬레이터에 연결된 간선만)"""
+    return FailureCascadeService.get_cascades_by_user(
+        db=db,
+        user_id=current_user.id,
+        simulator_id=simulator_id
+    )
+
+
+@router.get("/plan", response_model=CascadePlanResponse)
+def get_cascade_plan(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """활성 간선으로 컴파일한 전파 계획의 위상 단계 조회"""
+    levels, edge_count = FailureCascadeService.get_plan_levels(db=db, user_id=current_user.id)
+    return {"levels": levels, "edge_count": edge_count}
+
+
+@router.get("/{cascade_id}", response_model=FailureCascadeResponse)
+def get_failure_cascade(
+    cascade_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """특정 고장 전파 간선 조회"""
+    cascade = FailureCascadeService.get_cascade(
+        db=db,
+        cascade_id=cascade_id,
+        user_id=current_user.id
+    )
+
+    if not cascade:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="고장 전파 간선을 찾을 수 없습니다."
+        )
+
+    return cascade
+
+
+@router.put("/{cascade_id}", response_model=FailureCascadeResponse)
+def update_failure_cascade(
+    cascade_id: int,
+    cascade_data: FailureCascadeUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """고장 전파 간선 업데이트"""
+    try:
+        cascade = FailureCascadeService.update_cascade(
+            db=db,
+            cascade_id=cascade_id,
+            cascade_data=cascade_data,
+            user_id=current_user.id
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    if not cascade:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="고장 전파 간선을 찾을 수 없습니다."
+        )
+
+    return cascade
+
+
+@router.delete("/{cascade_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_failure_cascade(
+    cascade_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """고장 전파 간선 삭제"""
+    success = FailureCascadeService.delete_cascade(
+        db=db,
+        cascade_id=cascade_id,
+        user_id=current_user.id
+    )
+
+    if not success:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="고장 전파 간선을 찾을 수 없습니다."
+        )
+
+    return None
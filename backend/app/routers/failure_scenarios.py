@@ -12,6 +12,8 @@ from ..schemas.failure_scenario import (
     FailureScenarioUpdate,
     FailureScenarioResponse,
     FailureScenarioApply,
+    FailureScenarioBulkApply,
+    FailureScenarioBulkRelease,
     SimulatorWithFailureResponse
 )
 from ..services.failure_scenario_service import FailureScenarioService
@@ -225,6 +227,67 @@ def release_scenario_from_simulator(
         )
 
 
+@router.post("/bulk/apply")
+def bulk_apply_scenario(
+    apply_request: FailureScenarioBulkApply,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    고장 시나리오를 여러 시뮬레이터에 한 번에 적용
+    
+    대상은 `simulator_ids`, `name_prefix`, `all_simulators` 중 하나로 지정하며 현재 사용자의 시뮬레이터만 대상입니다.
+    한 트랜잭션으로 적용되어 모든 대상이 같은 시각(`applied_at`)에 고장 상태로 바뀝니다.
+    """
+    try:
+        return FailureScenarioService.bulk_apply_scenario(
+            db=db,
+            scenario_id=apply_request.scenario_id,
+            selector=apply_request,
+            user_id=current_user.id
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"고장 시나리오 일괄 적용 중 오류가 발생했습니다: {str(e)}"
+        )
+
+
+@router.post("/bulk/release")
+def bulk_release_scenarios(
+    release_request: FailureScenarioBulkRelease,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    여러 시뮬레이터의 고장 시나리오를 한 번에 해제
+    
+    `scenario_id`를 지정하면 그 시나리오(와 일괄 적용 복사본)가 적용된 시뮬레이터만 해제합니다.
+    """
+    try:
+        return FailureScenarioService.bulk_release_scenarios(
+            db=db,
+            selector=release_request,
+            user_id=current_user.id,
+            scenario_id=release_request.scenario_id
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"고장 시나리오 일괄 해제 중 오류가 발생했습니다: {str(e)}"
+        )
+
+
 @router.get("/simulator/{simulator_id}/current", response_model=SimulatorWithFailureResponse)
 def get_simulator_current_response(
     simulator_id: int,
@@ -2,22 +2,33 @@
 시뮬레이터 관련 API 라우터 - CRUD 및 동적 API 엔드포인트
 """
 import logging
-from typing import List, Optional, Dict, Any
-from fastapi import APIRouter, Depends, HTTPException, status, Path, Query, UploadFile, File
+import re
+from typing import List, Literal, Optional, Dict, Any
+from fastapi import APIRouter, Depends, HTTPException, status, Path, Query, UploadFile, File, Form, Response
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
 
-from ..database import get_db
+from ..database import SessionLocal, get_db
 from ..schemas.simulator import (
     SimulatorCreate,
     SimulatorUpdate,
     SimulatorResponse,
     SimulatorDataResponse,
-    SimulatorInactiveResponse
+    SimulatorInactiveResponse,
+    SimulatorClockUpdate,
+    SimulatorClockResponse,
+    UploadProfileResponse,
+    ReplaySimulatorCreate,
+    SheetUploadResponse,
+    SimulatorBulkCreate,
+    SimulatorBulkCreateResponse
 )
-from ..services.simulator_service import SimulatorService
+from ..services.simulator_service import BULK_CREATE_MAX_ITEMS, SimulatorService
+from ..services.upload_parser_pool import upload_parser_pool
+from ..services.data_cache import data_microcache
 from ..models.user import User
 from ..utils.auth import get_current_user
-from ..utils.file_parser import FileParser
 
 
 router = APIRouter(
@@ -61,6 +72,64 @@ async def create_simulator(
         )
 
 
+@router.post("/bulk", response_model=SimulatorBulkCreateResponse, summary="시뮬레이터 일괄 생성")
+def bulk_create_simulators(
+    bulk_create: SimulatorBulkCreate,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    여러 시뮬레이터를 한 번에 생성합니다.
+    
+    - 각 항목은 `POST /api/simulators/`와 같은 형식(SimulatorCreate)으로 검증하며,
+      검증에 실패한 항목만 `invalid`로 표시하고 나머지는 생성합니다
+    - 이름 충돌은 한 번의 조회로 확인하고, 기존/요청 안에서 중복된 이름은 `conflict`로 표시합니다
+    - 생성은 한 트랜잭션의 다중 행 INSERT로 실행되며 항목별 결과는 요청 순서대로 반환됩니다
+    - 한 요청의 최대 항목 수: SIMULATOR_BULK_MAX_ITEMS (기본값 10000)
+    """
+    if len(bulk_create.simulators) > BULK_CREATE_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"한 번에 생성할 수 있는 시뮬레이터는 최대 {BULK_CREATE_MAX_ITEMS}개입니다."
+        )
+    
+    results: List[Dict[str, Any]] = []
+    valid: List[SimulatorCreate] = []
+    positions: List[int] = []
+    for index, item in enumerate(bulk_create.simulators):
+        try:
+            valid.append(SimulatorCreate.model_validate(item))
+            positions.append(index)
+            results.append({})
+        except ValidationError as e:
+            name = item.get("name")
+            results.append({
+                "index": index,
+                "name": name if isinstance(name, str) else None,
+                "status": "invalid",
+                "detail": "; ".join(error["msg"] for error in e.errors())
+            })
+    
+    if valid:
+        try:
+            created = SimulatorService.bulk_create_simulators(db, current_user.id, valid)
+        except Exception as e:
+            logging.error(f"시뮬레이터 일괄 생성 중 오류: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="시뮬레이터 생성 중 오류가 발생했습니다"
+            )
+        for index, result in zip(positions, created):
+            results[index] = {"index": index, **result}
+    
+    created_count = sum(1 for result in results if result["status"] == "created")
+    return {
+        "created": created_count,
+        "failed": len(results) - created_count,
+        "results": results
+    }
+
+
 @router.get("/", response_model=List[SimulatorResponse], summary="내 시뮬레이터 목록 조회")
 async def list_my_simulators(
     skip: int = Query(0, ge=0, description="건너뛸 항목 수"),
@@ -223,8 +292,99 @@ async def toggle_simulator_status(
         )
 
 
+@router.get("/{simulator_id}/clock", response_model=SimulatorClockResponse, summary="시뮬레이션 시계 조회")
+async def get_simulator_clock(
+    simulator_id: int = Path(..., description="시뮬레이터 ID"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    시뮬레이터의 시뮬레이션 시계 상태(배속, 일시정지, 현재 가상 시각)를 조회합니다.
+    
+    시간 기반 고장 패턴(gradual, cyclic, drift)은 이 시계를 기준으로 계산됩니다.
+    """
+    try:
+        clock = SimulatorService.get_simulator_clock(db, simulator_id, current_user.id)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=str(e)
+        )
+    
+    if clock is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="시뮬레이터를 찾을 수 없습니다"
+        )
+    
+    return clock
+
+
+@router.put("/{simulator_id}/clock", response_model=SimulatorClockResponse, summary="시뮬레이션 시계 설정")
+async def update_simulator_clock(
+    simulator_id: int = Path(..., description="시뮬레이터 ID"),
+    clock_update: SimulatorClockUpdate = ...,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    시뮬레이션 시계의 배속, 일시정지, 시점 이동을 설정합니다.
+    
+    - **speed**: 배속 (예: 3600이면 실제 1초에 1시간이 흐름)
+    - **paused**: true면 일시정지, false면 재개
+    - **seek_to**: 지정한 가상 시각(UTC)으로 이동
+    - **advance_seconds**: 현재 가상 시각에서 지정한 초만큼 이동
+    
+    6시간짜리 점진적 고장 시나리오를 speed=3600으로 설정하면 6초 만에 재생됩니다.
+    """
+    try:
+        clock = SimulatorService.update_simulator_clock(
+            db, simulator_id, current_user.id, clock_update
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=str(e)
+        )
+    
+    if clock is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="시뮬레이터를 찾을 수 없습니다"
+        )
+    
+    return clock
+
+
+@router.delete("/{simulator_id}/clock", response_model=SimulatorClockResponse, summary="시뮬레이션 시계 초기화")
+async def reset_simulator_clock(
+    simulator_id: int = Path(..., description="시뮬레이터 ID"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    시뮬레이션 시계를 실제 시간(배속 1.0)으로 되돌립니다.
+    """
+    try:
+        clock = SimulatorService.reset_simulator_clock(db, simulator_id, current_user.id)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=str(e)
+        )
+    
+    if clock is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="시뮬레이터를 찾을 수 없습니다"
+        )
+    
+    return clock
+
+
 @router.post("/upload", response_model=List[str], summary="CSV/Excel 파일 업로드 및 컬럼명 추출")
 async def upload_file_for_parameters(
+    response: Response,
     file: UploadFile = File(..., description="CSV 또는 Excel 파일"),
     current_user: User = Depends(get_current_user)
 ) -> List[str]:
@@ -232,7 +392,7 @@ async def upload_file_for_parameters(
     CSV/Excel 파일을 업로드하여 컬럼명(파라미터 키)을 추출합니다.
     
     - 지원 형식: .csv, .xlsx, .xls
-    - 최대 파일 크기: 10MB
+    - 최대 파일 크기: UPLOAD_MAX_SIZE_MB (기본값 1024MB, 앞부분만 읽어 헤더를 인식)
     - 첫 번째 행을 헤더로 자동 인식 (지능형 알고리즘 사용)
     
     **헤더 인식 알고리즘:**
@@ -241,13 +401,18 @@ async def upload_file_for_parameters(
     - 빈 값이 없어야 함
     - 영문자 또는 한글이 포함되어야 함
     
+    단계별 파싱 시간은 `Server-Timing` 응답 헤더로 확인할 수 있습니다.
+    
     **응답 예시:**
     ```json
     ["water_qty", "saving", "depth_data"]
     ```
     """
     try:
-        headers = await FileParser.parse_file(file)
+        # 파싱은 이벤트 루프 밖의 제한된 풀에서 실행 (pandas/openpyxl도 풀 작업에서만 import)
+        headers, profile = await upload_parser_pool.parse_headers(file)
+        # 단계별 파싱 비용 (브라우저 개발자 도구의 Timing 탭에서 확인 가능)
+        response.headers["Server-Timing"] = profile.server_timing()
         return headers
     
     except HTTPException:
@@ -260,6 +425,185 @@ async def upload_file_for_parameters(
         )
 
 
+@router.post("/upload/profile", response_model=UploadProfileResponse, summary="CSV/Excel 파일 컬럼 통계 및 파라미터 설정 생성")
+async def profile_uploaded_file(
+    response: Response,
+    file: UploadFile = File(..., description="CSV 또는 Excel 파일"),
+    current_user: User = Depends(get_current_user)
+) -> Dict[str, Any]:
+    """
+    CSV/Excel 파일 전체를 읽어 컬럼별 통계와 시뮬레이터 생성용 파라미터 설정을 계산합니다.
+    
+    - 헤더 행은 `/upload`와 같은 알고리즘으로 감지
+    - 숫자 컬럼: 최소/최대/평균/표준편차/분위수 (분위수는 큰 파일에서 표본 기준)
+    - 문자열/불린 컬럼: 고유값 목록 (UPLOAD_PROFILE_DISTINCT_LIMIT개 초과 시 생략)
+    - 파일은 청크 단위로 한 번만 순회하므로 큰 파일도 메모리 사용량이 일정합니다
+    
+    응답의 `parameters`, `parameter_config`는 `POST /api/simulators/`에 그대로 사용할 수 있습니다.
+    숫자 컬럼은 관측된 최소~최대 범위의 랜덤 값으로 설정되며,
+    파라미터 키는 컬럼명을 키 규칙(영문자로 시작, 영문자/숫자/언더스코어)에 맞게 변환한 값입니다.
+    """
+    try:
+        result, profile = await upload_parser_pool.profile_columns(file)
+        response.headers["Server-Timing"] = profile.server_timing()
+        return result
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        logging.error(f"파일 통계 처리 중 오류: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="파일 처리 중 예상치 못한 오류가 발생했습니다"
+        )
+
+
+@router.post("/upload/sheets", response_model=SheetUploadResponse, status_code=status.HTTP_201_CREATED, summary="Excel 시트별 시뮬레이터 일괄 생성")
+async def create_simulators_from_sheets(
+    response: Response,
+    file: UploadFile = File(..., description="Excel 파일 (.xlsx, .xls)"),
+    name_prefix: Optional[str] = Form(None, description="시뮬레이터 이름 접두어 (예: plant-a → plant-a-<시트 이름>)"),
+    statistics: bool = Form(False, description="시트 전체를 읽어 숫자 컬럼을 관측 범위의 랜덤 값으로 설정"),
+    is_active: bool = Form(True, description="활성화 상태"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Excel 파일의 워크시트마다 시뮬레이터를 하나씩, 한 트랜잭션으로 생성합니다.
+    
+    시트별 헤더 감지/타입 추론은 업로드 파싱 풀에서 동시에 실행되므로
+    전체 소요 시간은 가장 느린 시트에 가깝습니다.
+    
+    - 시뮬레이터 이름: 시트 이름의 영문자/숫자 외 문자를 하이픈으로 바꾼 값
+      (남는 문자가 없으면 `sheet-<순번>`), `name_prefix`가 있으면 앞에 붙임
+    - `statistics=false`: 앞부분만 읽어 컬럼별 첫 값을 기본값으로 사용
+    - `statistics=true`: `/upload/profile`과 같이 시트 전체의 통계로 parameters/parameter_config 설정
+    - 빈 시트는 건너뛰고 `skipped`에 사유를 담으며, 이름이 하나라도 겹치면 아무것도 생성하지 않습니다
+    """
+    sheets, profile = await upload_parser_pool.parse_sheets(file, statistics=statistics)
+    response.headers["Server-Timing"] = profile.server_timing()
+    
+    skipped = [
+        {"sheet": sheet, "detail": outcome.detail}
+        for sheet, outcome in sheets if isinstance(outcome, HTTPException)
+    ]
+    parsed = [(sheet, outcome) for sheet, outcome in sheets if not isinstance(outcome, HTTPException)]
+    if not parsed:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="시뮬레이터를 만들 수 있는 시트가 없습니다."
+        )
+    
+    simulator_creates = []
+    for position, (sheet, result) in enumerate(parsed):
+        name = re.sub(r'[^a-zA-Z0-9]+', '-', sheet).strip('-') or f"sheet-{position + 1}"
+        if name_prefix:
+            name = f"{name_prefix}-{name}"
+        try:
+            simulator_creates.append(SimulatorCreate(
+                name=name,
+                parameters=result["parameters"],
+                parameter_config=result["parameter_config"],
+                is_active=is_active
+            ))
+        except ValidationError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"시트 '{sheet}': " + "; ".join(error["msg"] for error in e.errors())
+            )
+    
+    try:
+        simulators = SimulatorService.create_simulators(db, current_user.id, simulator_creates)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        logging.error(f"시트별 시뮬레이터 생성 중 오류: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="시뮬레이터 생성 중 오류가 발생했습니다"
+        )
+    
+    return {
+        "simulators": [
+            {
+                "sheet": sheet,
+                "header_row": result["header_row"],
+                "simulator": SimulatorService.prepare_simulator_response(simulator)
+            }
+            for (sheet, result), simulator in zip(parsed, simulators)
+        ],
+        "skipped": skipped
+    }
+
+
+@router.post("/replay", response_model=SimulatorResponse, status_code=status.HTTP_201_CREATED, summary="재생 시뮬레이터 생성")
+async def create_replay_simulator(
+    response: Response,
+    file: UploadFile = File(..., description="재생할 CSV 또는 Excel 파일"),
+    name: str = Form(..., description="시뮬레이터 이름"),
+    advance: str = Form("request", description="request: 요청마다 다음 행, clock: 시뮬레이터 시계 기준"),
+    wrap: str = Form("loop", description="끝에 도달한 뒤 loop | ping_pong | hold"),
+    interval_seconds: float = Form(1.0, description="clock 모드에서 한 행이 차지하는 가상 시간(초)"),
+    is_active: bool = Form(True, description="활성화 상태"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    업로드한 파일의 행을 순서대로 내보내는 재생 시뮬레이터를 생성합니다.
+    
+    파일은 한 번만 컬럼별 NumPy 파일로 변환되고, `/api/data/{user_id}/{name}` 요청마다
+    원본 파일을 다시 읽지 않고 메모리 맵에서 한 행을 꺼냅니다.
+    
+    - **advance**: `request`면 요청마다 다음 행, `clock`이면 시뮬레이터 시계의 경과 시간 기준 행
+      (시계 배속/일시정지/시점 이동을 따름)
+    - **wrap**: 마지막 행 이후 `loop`(처음부터 반복), `ping_pong`(역순으로 되돌아옴), `hold`(마지막 행 유지)
+    - 파라미터 키는 컬럼명을 키 규칙에 맞게 변환한 값이며, 기본값은 첫 행입니다
+    - 적용된 고장 시나리오는 재생 값 위에 그대로 적용됩니다
+    """
+    try:
+        replay_create = ReplaySimulatorCreate(
+            name=name,
+            is_active=is_active,
+            replay={"advance": advance, "wrap": wrap, "interval_seconds": interval_seconds}
+        )
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="; ".join(error["msg"] for error in e.errors())
+        )
+    
+    # 파일 변환 전에 이름 중복을 먼저 확인
+    if SimulatorService.get_simulator_by_name_and_user(db, str(current_user.id), replay_create.name):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"이미 '{replay_create.name}' 이름의 시뮬레이터가 존재합니다."
+        )
+    
+    manifest, profile = await upload_parser_pool.build_replay_dataset(file)
+    response.headers["Server-Timing"] = profile.server_timing()
+    
+    try:
+        new_simulator = SimulatorService.create_replay_simulator(
+            db, current_user.id, replay_create, manifest
+        )
+        return SimulatorService.prepare_simulator_response(new_simulator)
+    
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        logging.error(f"재생 시뮬레이터 생성 중 오류: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="시뮬레이터 생성 중 오류가 발생했습니다"
+        )
+
+
 # 동적 API 엔드포인트 라우터
 data_router = APIRouter(
     prefix="/api/data",
@@ -268,11 +612,61 @@ data_router = APIRouter(
 )
 
 
+def _run_with_session(func, *args):
+    """
+    새 DB 세션으로 func(db, *args) 실행 (스레드 풀에서 호출)
+
+    마이크로캐시의 계산은 요청과 분리된 태스크에서 실행되어 처음 요청한 클라이언트가
+    끊긴 뒤에도 계속될 수 있으므로, 요청 종료 시 닫히는 get_db 세션 대신 계산 전용 세션을 사용합니다.
+    """
+    db = SessionLocal()
+    try:
+        return func(db, *args)
+    finally:
+        db.close()
+
+
+@data_router.get("/{user_id}", summary="사용자 전체 시뮬레이터 스냅샷 조회")
+async def get_user_snapshot(
+    user_id: str = Path(..., description="사용자 ID"),
+    format: Literal["document", "columnar"] = Query("document", description="document: 이름별 값, columnar: 파라미터 구성별 값 배열")
+):
+    """
+    사용자의 모든 시뮬레이터 현재 값을 한 번의 요청으로 반환합니다.
+    
+    시뮬레이터마다 `/api/data/{user_id}/{simulator_name}`을 호출하는 대신 주기적으로 전체 값을 읽을 때 사용합니다.
+    값은 한 번의 일괄 평가로 생성되며, 비활성화 시뮬레이터는 이름만 `inactive`에 포함됩니다.
+    
+    응답 예시 (document):
+    {"user_id": "rlawogur816", "timestamp": "...", "format": "document",
+     "simulators": {"pump-001": {"flow_rate": 48.1}, "pump-002": {"flow_rate": 51.7}}, "inactive": []}
+    
+    응답 예시 (columnar):
+    {"user_id": "rlawogur816", "timestamp": "...", "format": "columnar",
+     "groups": [{"simulators": ["pump-001", "pump-002"], "columns": {"flow_rate": [48.1, 51.7]}}], "inactive": []}
+    """
+    try:
+        return await data_microcache.get_or_compute(
+            ("snapshot", user_id.lower(), format),
+            lambda: run_in_threadpool(_run_with_session, SimulatorService.get_user_snapshot, user_id, format == "columnar")
+        )
+    
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="데이터 조회 중 오류가 발생했습니다"
+        )
+
+
 @data_router.get("/{user_id}/{simulator_name}", summary="시뮬레이터 데이터 조회")
 async def get_simulator_data(
     user_id: str = Path(..., description="사용자 ID"),
-    simulator_name: str = Path(..., description="시뮬레이터 이름"),
-    db: Session = Depends(get_db)
+    simulator_name: str = Path(..., description="시뮬레이터 이름")
 ):
     """
     시뮬레이터의 설정된 파라미터 데이터를 반환합니다.
@@ -287,7 +681,12 @@ async def get_simulator_data(
     응답 예시 (비활성화): {"message": "해당 시뮬레이터는 비활성화 상태 입니다."}
     """
     try:
-        result = SimulatorService.get_simulator_data(db, user_id, simulator_name)
+        # 같은 시뮬레이터에 대한 동시 요청은 마이크로캐시에서 하나의 계산으로 병합
+        # (DATA_MICROCACHE_TTL_MS=0이면 요청마다 새로 계산)
+        result = await data_microcache.get_or_compute(
+            (user_id.lower(), simulator_name),
+            lambda: run_in_threadpool(_run_with_session, SimulatorService.get_simulator_data, user_id, simulator_name)
+        )
         
         # type 정보 없이 data만 직접 반환
         return result["data"]
@@ -301,4 +700,41 @@ async def get_simulator_data(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="데이터 조회 중 오류가 발생했습니다"
-        )
\ No newline at end of file
+        )
+
+@data_router.get("/{user_id}/{simulator_name}/{instance}", summary="플릿 인스턴스 데이터 조회")
+async def get_fleet_instance_data(
+    user_id: str = Path(..., description="사용자 ID"),
+    simulator_name: str = Path(..., description="플릿 템플릿 시뮬레이터 이름"),
+    instance: int = Path(..., ge=0, description="인스턴스 번호 (0부터)")
+):
+    """
+    플릿 템플릿 인스턴스 하나의 데이터를 반환합니다.
+    
+    템플릿의 모든 인스턴스 값은 한 번의 벡터화 연산으로 함께 생성되어 잠시(FLEET_FRAME_TTL_MS) 공유되며,
+    인스턴스별 변경분(overrides)이 있으면 그 값이 적용됩니다.
+    
+    예시: /api/data/rlawogur816/pump-fleet/17
+    응답 예시 (활성화): {"flow_rate": 48.12, "pressure": 2.1}
+    응답 예시 (비활성화): {"message": "해당 시뮬레이터는 비활성화 상태 입니다."}
+    """
+    try:
+        result = await data_microcache.get_or_compute(
+            (user_id.lower(), simulator_name, instance),
+            lambda: run_in_threadpool(
+                _run_with_session, SimulatorService.get_fleet_instance_data, user_id, simulator_name, instance
+            )
+        )
+        
+        return result["data"]
+    
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="데이터 조회 중 오류가 발생했습니다"
+        )
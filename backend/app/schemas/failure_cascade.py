@@ -0,0 +1,88 @@
+from pydantic import BaseModel, Field, field_validator, model_validator, ConfigDict
+from typing import Optional, List, Literal
+from datetime import datetime
+
+
+class FailureCascadeBase(BaseModel):
+    """고장 전파 간선 기본 스키마"""
+    source_simulator_id: int = Field(..., description="원인 시뮬레이터 ID (적용된 고장 시나리오가 전파의 시작점)")
+    target_simulator_id: int = Field(..., description="영향을 받는 시뮬레이터 ID")
+    target_parameter: str = Field(..., min_length=1, max_length=255, description="영향을 받는 파라미터 (숫자 값)")
+    effect: Literal["offset", "scale"] = Field(default="offset", description="offset: 값 + magnitude, scale: 값 × magnitude")
+    magnitude: float = Field(..., description="최대 영향 크기")
+    delay_seconds: float = Field(default=0.0, ge=0, description="원인 고장 발생 후 영향이 시작되기까지의 시간(초)")
+    ramp_seconds: float = Field(default=0.0, ge=0, description="영향 시작 후 최대 영향까지 선형으로 증가하는 시간(초, 0이면 즉시)")
+    is_active: bool = Field(default=True, description="활성화 상태")
+    
+    @field_validator('target_parameter')
+    @classmethod
+    def validate_target_parameter(cls, v: str) -> str:
+        return v.strip()
+    
+    @model_validator(mode='after')
+    def validate_endpoints(self) -> "FailureCascadeBase":
+        """자기 자신으로의 전파 금지"""
+        if self.source_simulator_id == self.target_simulator_id:
+            raise ValueError('원인 시뮬레이터와 대상 시뮬레이터가 같을 수 없습니다.')
+        return self
+    
+    model_config = ConfigDict(
+        str_strip_whitespace=True,
+        json_schema_extra={
+            "examples": [
+                {
+                    "source_simulator_id": 1,
+                    "target_simulator_id": 2,
+                    "target_parameter": "tank_level",
+                    "effect": "offset",
+                    "magnitude": 35.0,
+                    "delay_seconds": 300,
+                    "ramp_seconds": 120,
+                    "is_active": True
+                }
+            ]
+        }
+    )
+
+
+class FailureCascadeCreate(FailureCascadeBase):
+    """고장 전파 간선 생성용 스키마"""
+    pass
+
+
+class FailureCascadeUpdate(BaseModel):
+    """고장 전파 간선 업데이트용 스키마 (연결된 시뮬레이터는 바꿀 수 없음)"""
+    target_parameter: Optional[str] = Field(None, min_length=1, max_length=255)
+    effect: Optional[Literal["offset", "scale"]] = None
+    magnitude: Optional[float] = None
+    delay_seconds: Optional[float] = Field(None, ge=0)
+    ramp_seconds: Optional[float] = Field(None, ge=0)
+    is_active: Optional[bool] = None
+    
+    model_config = ConfigDict(
+        str_strip_whitespace=True
+    )
+
+
+class FailureCascadeResponse(BaseModel):
+    """고장 전파 간선 응답용 스키마"""
+    id: int
+    user_id: int
+    source_simulator_id: int
+    target_simulator_id: int
+    target_parameter: str
+    effect: str
+    magnitude: float
+    delay_seconds: float
+    ramp_seconds: float
+    is_active: bool
+    created_at: datetime
+    updated_at: datetime
+    
+    model_config = ConfigDict(from_attributes=True)
+
+
+class CascadePlanResponse(BaseModel):
+    """컴파일된 전파 계획 - 위상 정렬 단계별 시뮬레이터 ID"""
+    levels: List[List[int]] = Field(..., description="단계별 시뮬레이터 ID (앞 단계의 고장이 다음 단계로 전파)")
+    edge_count: int = Field(..., description="활성 간선 수")
@@ -1,9 +1,11 @@
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+from pydantic import BaseModel, Field, field_validator, model_validator, ConfigDict
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 import json
 from enum import Enum
 
+from ..utils.covariance import cholesky_factor, covariance_from_correlation
+
 
 class FailureScenarioBase(BaseModel):
     """기본 고장 시나리오 스키마"""
@@ -62,7 +64,10 @@ class FailureScenarioBase(BaseModel):
 
 class FailureScenarioCreate(FailureScenarioBase):
     """고장 시나리오 생성용 스키마"""
-    pass
+    advanced_config: Optional["AdvancedFailureConfig"] = Field(
+        None,
+        description="NumPy 기반 고급 고장 설정 (상관 노이즈는 저장 시 촐레스키 분해)"
+    )
 
 
 class FailureScenarioUpdate(BaseModel):
@@ -70,6 +75,7 @@ class FailureScenarioUpdate(BaseModel):
     name: Optional[str] = Field(None, min_length=1, max_length=255)
     description: Optional[str] = None
     failure_parameters: Optional[Dict[str, Any]] = None
+    advanced_config: Optional["AdvancedFailureConfig"] = None
     is_active: Optional[bool] = None
     
     @field_validator('name')
@@ -106,12 +112,22 @@ class FailureScenarioResponse(BaseModel):
     name: str
     description: Optional[str]
     failure_parameters: Dict[str, Any]
+    advanced_config: Optional[Dict[str, Any]] = None
     is_active: bool
     is_applied: bool
+    source_scenario_id: Optional[int] = Field(default=None, description="일괄 적용 복사본이면 원본 시나리오 ID")
     created_at: datetime
     updated_at: datetime
     applied_at: Optional[datetime]
     
+    @field_validator('advanced_config', mode='before')
+    @classmethod
+    def parse_advanced_config(cls, v: Any) -> Any:
+        """DB에 JSON 문자열로 저장된 고급 설정 파싱"""
+        if isinstance(v, str):
+            return json.loads(v)
+        return v
+    
     model_config = ConfigDict(
         from_attributes=True,
         json_schema_extra={
@@ -152,6 +168,49 @@ class FailureScenarioApply(BaseModel):
     )
 
 
+class SimulatorSelector(BaseModel):
+    """일괄 적용/해제 대상 시뮬레이터 선택 - 현재 사용자의 시뮬레이터 중 하나의 방식으로 지정"""
+    simulator_ids: Optional[List[int]] = Field(None, min_length=1, description="시뮬레이터 ID 목록")
+    name_prefix: Optional[str] = Field(None, min_length=1, description="이름이 이 접두어로 시작하는 시뮬레이터")
+    all_simulators: bool = Field(default=False, description="현재 사용자의 모든 시뮬레이터")
+    
+    @model_validator(mode='after')
+    def validate_selector(self) -> "SimulatorSelector":
+        """선택 방식은 정확히 하나"""
+        selected = sum([self.simulator_ids is not None, self.name_prefix is not None, self.all_simulators])
+        if selected != 1:
+            raise ValueError('simulator_ids, name_prefix, all_simulators 중 하나만 지정해야 합니다.')
+        return self
+
+
+class FailureScenarioBulkApply(SimulatorSelector):
+    """고장 시나리오 일괄 적용 요청"""
+    scenario_id: int = Field(..., description="적용할 시나리오 ID")
+    
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {"scenario_id": 1, "name_prefix": "pump-"},
+                {"scenario_id": 1, "simulator_ids": [1, 2, 3]}
+            ]
+        }
+    )
+
+
+class FailureScenarioBulkRelease(SimulatorSelector):
+    """고장 시나리오 일괄 해제 요청"""
+    scenario_id: Optional[int] = Field(None, description="지정하면 이 시나리오(와 일괄 적용 복사본)만 해제")
+    
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {"all_simulators": True},
+                {"scenario_id": 1, "name_prefix": "pump-"}
+            ]
+        }
+    )
+
+
 class FailureTypeEnum(str, Enum):
     """고장 유형"""
     SUDDEN = "sudden"
@@ -160,6 +219,7 @@ class FailureTypeEnum(str, Enum):
     CYCLIC = "cyclic"
     RANDOM_WALK = "random_walk"
     DRIFT = "drift"
+    MARKOV = "markov"
 
 
 class NoiseTypeEnum(str, Enum):
@@ -168,11 +228,62 @@ class NoiseTypeEnum(str, Enum):
     UNIFORM = "uniform"
     EXPONENTIAL = "exponential"
     POISSON = "poisson"
+    PINK = "pink"
+    BROWN = "brown"
+    ARMA = "arma"
+
+
+class CorrelatedNoiseConfig(BaseModel):
+    """
+    여러 파라미터에 함께 더하는 상관 가우시안 노이즈
+    
+    covariance(공분산 행렬) 또는 correlation(상관 행렬) + std(표준편차) 중 하나로 지정합니다.
+    행렬은 저장 시 한 번 촐레스키 분해하여 cholesky에 보관하고, 요청마다
+    표준 정규 난수 벡터에 곱해 노이즈를 만듭니다. PSD가 아닌 행렬은 저장 시 거부됩니다.
+    relative가 true면 표준편차를 현재 값 크기에 대한 비율로 해석합니다 (noise.intensity와 같은 방식).
+    """
+    parameters: List[str] = Field(..., min_length=2, description="노이즈를 더할 파라미터 (행렬 행/열 순서)")
+    covariance: Optional[List[List[float]]] = Field(None, description="공분산 행렬")
+    correlation: Optional[List[List[float]]] = Field(None, description="상관 행렬 (std와 함께 사용)")
+    std: Optional[List[float]] = Field(None, description="파라미터별 표준편차")
+    relative: bool = Field(default=False, description="표준편차를 값 크기 대비 비율로 해석")
+    cholesky: Optional[List[List[float]]] = Field(None, description="저장 시 계산되는 하삼각 촐레스키 인자 (입력값은 무시)")
+    
+    @model_validator(mode='after')
+    def factorize(self) -> "CorrelatedNoiseConfig":
+        """행렬 형식 확인 후 촐레스키 분해"""
+        size = len(self.parameters)
+        if len(set(self.parameters)) != size:
+            raise ValueError('상관 노이즈 파라미터 이름이 중복되었습니다.')
+        
+        if (self.covariance is None) == (self.correlation is None):
+            raise ValueError('covariance와 correlation 중 하나만 지정해야 합니다.')
+        
+        matrix = self.covariance if self.covariance is not None else self.correlation
+        if len(matrix) != size or any(len(row) != size for row in matrix):
+            raise ValueError(f'행렬은 파라미터 수와 같은 {size}×{size} 크기여야 합니다.')
+        
+        if self.correlation is not None:
+            if self.std is None or len(self.std) != size:
+                raise ValueError(f'correlation을 쓰면 std에 표준편차 {size}개를 지정해야 합니다.')
+            matrix = covariance_from_correlation(self.correlation, self.std)
+        
+        self.cholesky = cholesky_factor(matrix)
+        return self
 
 
 class AdvancedFailureConfig(BaseModel):
     """고급 고장 시나리오 설정"""
     probability: Optional[float] = Field(None, ge=0.0, le=1.0, description="고장 발생 확률")
+    correlated_noise: Optional[CorrelatedNoiseConfig] = Field(
+        None,
+        description="파라미터 간 상관 노이즈",
+        example={
+            "parameters": ["temperature", "pressure"],
+            "correlation": [[1.0, 0.8], [0.8, 1.0]],
+            "std": [0.5, 2.0]
+        }
+    )
     parameters: Optional[Dict[str, Dict[str, Any]]] = Field(
         None,
         description="파라미터별 고급 설정",
@@ -193,6 +304,67 @@ class AdvancedFailureConfig(BaseModel):
         }
     )
     
+    @field_validator('parameters')
+    @classmethod
+    def validate_markov(cls, v: Optional[Dict[str, Dict[str, Any]]]) -> Optional[Dict[str, Dict[str, Any]]]:
+        """마르코프 유형 설정 검증 (상태 이름, 전이율 형식, 초기 상태와 변환 대상)"""
+        for name, config in (v or {}).items():
+            if config.get('failure_type') != FailureTypeEnum.MARKOV.value:
+                continue
+            states = config.get('states')
+            if states is not None and (len(set(states)) != len(states) or len(states) < 2):
+                raise ValueError(f"'{name}': 마르코프 상태는 서로 다른 이름 2개 이상이어야 합니다.")
+            rates = config.get('rates')
+            if states is not None and rates is None:
+                raise ValueError(f"'{name}': 상태를 직접 지정하면 rates도 지정해야 합니다.")
+            states = states or ["normal", "degraded", "failing", "failed", "repaired"]
+            
+            if isinstance(rates, dict):
+                entries = [
+                    (source, target, rate)
+                    for source, targets in rates.items()
+                    for target, rate in (targets or {}).items()
+                ]
+            elif rates is not None:
+                if len(rates) != len(states) or any(len(row) != len(states) for row in rates):
+                    raise ValueError(f"'{name}': rates는 {len(states)}×{len(states)} 행렬이어야 합니다.")
+                entries = [(None, None, rate) for row in rates for rate in row]
+            else:
+                entries = []
+            for source, target, rate in entries:
+                if source is not None and (source not in states or target not in states):
+                    raise ValueError(f"'{name}': 알 수 없는 마르코프 상태: {source} → {target}")
+                if not isinstance(rate, (int, float)) or rate < 0:
+                    raise ValueError(f"'{name}': 마르코프 전이율은 0 이상의 숫자여야 합니다.")
+            
+            unknown = [
+                state for state in [config.get('initial_state', states[0]), *(config.get('transforms') or {})]
+                if state not in states
+            ]
+            if unknown:
+                raise ValueError(f"'{name}': 알 수 없는 마르코프 상태: {unknown}")
+        return v
+    
+    @field_validator('parameters')
+    @classmethod
+    def validate_colored_noise(cls, v: Optional[Dict[str, Dict[str, Any]]]) -> Optional[Dict[str, Dict[str, Any]]]:
+        """유색 노이즈 설정 검증 (brown leak 범위, arma 계수의 정상성)"""
+        for name, config in (v or {}).items():
+            noise = config.get('noise') or {}
+            if noise.get('type') == NoiseTypeEnum.BROWN.value:
+                leak = noise.get('leak', 0.999)
+                if not isinstance(leak, (int, float)) or not 0 < leak < 1:
+                    raise ValueError(f"'{name}': brown 노이즈의 leak은 0과 1 사이여야 합니다.")
+            elif noise.get('type') == NoiseTypeEnum.ARMA.value:
+                ar, ma = noise.get('ar') or [], noise.get('ma') or []
+                if not ar and not ma:
+                    raise ValueError(f"'{name}': arma 노이즈에는 ar 또는 ma 계수가 필요합니다.")
+                if not all(isinstance(c, (int, float)) for c in [*ar, *ma]):
+                    raise ValueError(f"'{name}': arma 계수는 숫자여야 합니다.")
+                if not _is_stationary(ar):
+                    raise ValueError(f"'{name}': AR 계수가 정상(stationary) 과정을 만들지 않습니다.")
+        return v
+    
     model_config = ConfigDict(
         json_schema_extra={
             "examples": [
@@ -216,6 +388,25 @@ class AdvancedFailureConfig(BaseModel):
     )
 
 
+def _is_stationary(ar: List[float]) -> bool:
+    """
+    AR 계수(x_t = Σ ar_i·x_{t-i} + e_t)의 정상성 - 특성 다항식의 근이 모두 단위원 안에 있는지
+    
+    단계 축소(step-down, Schur-Cohn) 재귀로 반사 계수가 모두 |k| < 1인지 확인합니다.
+    """
+    coefficients = [-float(c) for c in ar]
+    while coefficients:
+        k = coefficients[-1]
+        if abs(k) >= 1:
+            return False
+        m = len(coefficients)
+        coefficients = [
+            (coefficients[i] - k * coefficients[m - 2 - i]) / (1 - k * k)
+            for i in range(m - 1)
+        ]
+    return True
+
+
 class FailureScenarioWithAdvanced(FailureScenarioBase):
     """고급 기능이 포함된 고장 시나리오"""
     advanced_config: Optional[AdvancedFailureConfig] = Field(
@@ -260,4 +451,8 @@ class SimulatorWithFailureResponse(BaseModel):
                 }
             ]
         }
-    )
\ No newline at end of file
+    )
+
+
+FailureScenarioCreate.model_rebuild()
+FailureScenarioUpdate.model_rebuild()
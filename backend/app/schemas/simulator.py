@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field, field_validator, ConfigDict
-from typing import Optional, Dict, Any, Literal
+from pydantic import BaseModel, Field, field_validator, model_validator, ConfigDict
+from typing import Optional, Dict, Any, List, Literal
 from datetime import datetime
 import json
 import re
@@ -37,6 +37,63 @@ class ParameterConfig(BaseModel):
     )
 
 
+class ReplayOptions(BaseModel):
+    """재생 시뮬레이터 옵션 - 어느 행을 내보낼지와 끝에 도달한 뒤의 동작"""
+    advance: Literal["request", "clock"] = Field(
+        default="request",
+        description="request: 요청마다 다음 행, clock: 시뮬레이터 시계의 경과 시간 / interval_seconds 번째 행"
+    )
+    wrap: Literal["loop", "ping_pong", "hold"] = Field(
+        default="loop",
+        description="끝에 도달한 뒤 loop: 처음부터 반복, ping_pong: 역순으로 되돌아옴, hold: 마지막 행 유지"
+    )
+    interval_seconds: float = Field(default=1.0, gt=0, description="clock 모드에서 한 행이 차지하는 가상 시간(초)")
+
+
+class FleetInstanceOverride(BaseModel):
+    """플릿 인스턴스 하나의 템플릿 대비 변경분 - 지정한 항목만 템플릿 정의를 덮어씀"""
+    parameters: Dict[str, Any] = Field(default_factory=dict, description="고정 값으로 바꿀 파라미터 (템플릿의 랜덤 설정보다 우선)")
+    parameter_config: Dict[str, ParameterConfig] = Field(default_factory=dict, description="바꿀 파라미터 설정 (랜덤 범위 등)")
+    is_active: Optional[bool] = Field(default=None, description="인스턴스 활성화 상태 (없으면 템플릿을 따름)")
+
+
+class FleetConfig(BaseModel):
+    """플릿 템플릿 설정 - 인스턴스 수와 인스턴스 번호(0부터)별 변경분"""
+    instance_count: int = Field(..., ge=1, description="인스턴스 수 (/api/data/{user_id}/{name}/0 ~ instance_count-1)")
+    overrides: Dict[int, FleetInstanceOverride] = Field(default_factory=dict, description="인스턴스 번호 → 변경분")
+
+    @model_validator(mode='after')
+    def validate_overrides(self) -> "FleetConfig":
+        """변경분의 인스턴스 번호가 범위 안인지 확인"""
+        invalid = sorted(index for index in self.overrides if not 0 <= index < self.instance_count)
+        if invalid:
+            raise ValueError(f'인스턴스 번호는 0 이상 {self.instance_count} 미만이어야 합니다: {invalid[:10]}')
+        return self
+
+    def unknown_parameters(self, parameters: Dict[str, Any]) -> List[str]:
+        """템플릿 파라미터에 없는 변경분 파라미터 이름"""
+        unknown = set()
+        for override in self.overrides.values():
+            unknown.update(name for name in override.parameters if name not in parameters)
+            unknown.update(name for name in override.parameter_config if name not in parameters)
+        return sorted(unknown)
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {
+                    "instance_count": 10000,
+                    "overrides": {
+                        "17": {"parameters": {"flow_rate": 0}},
+                        "42": {"parameter_config": {"pressure": {"is_random": True, "type": "float", "min": 3.0, "max": 4.0}}},
+                        "99": {"is_active": False}
+                    }
+                }
+            ]
+        }
+    )
+
+
 class SimulatorBase(BaseModel):
     """기본 시뮬레이터 스키마 - 공통 속성 정의"""
     name: str = Field(..., min_length=1, max_length=255, description="시뮬레이터 이름")
@@ -93,6 +150,17 @@ class SimulatorBase(BaseModel):
 
 class SimulatorCreate(SimulatorBase):
     """시뮬레이터 생성용 스키마"""
+    fleet: Optional[FleetConfig] = Field(default=None, description="플릿 템플릿 설정 (지정하면 인스턴스별로 서비스)")
+
+    @model_validator(mode='after')
+    def validate_fleet(self) -> "SimulatorCreate":
+        """플릿 변경분이 템플릿 파라미터만 다루는지 확인"""
+        if self.fleet is not None:
+            unknown = self.fleet.unknown_parameters(self.parameters)
+            if unknown:
+                raise ValueError(f'플릿 변경분에 템플릿에 없는 파라미터가 있습니다: {", ".join(unknown)}')
+        return self
+
     model_config = ConfigDict(
         json_schema_extra={
             "examples": [
@@ -112,12 +180,29 @@ class SimulatorCreate(SimulatorBase):
     )
 
 
+class ReplaySimulatorCreate(BaseModel):
+    """재생 시뮬레이터 생성용 스키마 - 파라미터는 업로드 파일의 컬럼에서 정해짐"""
+    name: str = Field(..., min_length=1, max_length=255, description="시뮬레이터 이름")
+    is_active: bool = Field(default=True, description="시뮬레이터 활성화 상태")
+    replay: ReplayOptions = Field(default_factory=ReplayOptions, description="재생 옵션")
+
+    @field_validator('name')
+    @classmethod
+    def validate_name(cls, v: str) -> str:
+        """시뮬레이터 이름 검증 - 영문자, 숫자, 하이픈만 허용"""
+        if not re.match(r'^[a-zA-Z0-9-]+$', v):
+            raise ValueError('시뮬레이터 이름은 영문자, 숫자, 하이픈(-)만 포함할 수 있습니다.')
+        return v.strip()
+
+
 class SimulatorUpdate(BaseModel):
     """시뮬레이터 업데이트용 스키마"""
     name: Optional[str] = Field(None, min_length=1, max_length=255, description="시뮬레이터 이름")
     parameters: Optional[Dict[str, Any]] = Field(None, description="시뮬레이터 파라미터")
     parameter_config: Optional[Dict[str, ParameterConfig]] = Field(None, description="파라미터 설정 (랜덤 값 생성용)")
     is_active: Optional[bool] = Field(None, description="시뮬레이터 활성화 상태")
+    replay: Optional[ReplayOptions] = Field(None, description="재생 옵션 (재생 시뮬레이터만)")
+    fleet: Optional[FleetConfig] = Field(None, description="플릿 템플릿 설정 (null이면 일반 시뮬레이터로 전환)")
 
     @field_validator('name')
     @classmethod
@@ -178,6 +263,9 @@ class SimulatorResponse(BaseModel):
     parameters: Dict[str, Any]
     parameter_config: Optional[Dict[str, ParameterConfig]] = Field(default_factory=dict)
     is_active: bool
+    mode: str = Field(default="static", description="값 생성 방식 (static | replay | fleet)")
+    replay_config: Optional[Dict[str, Any]] = Field(default=None, description="재생 설정 (재생 시뮬레이터만)")
+    fleet_config: Optional[Dict[str, Any]] = Field(default=None, description="플릿 설정 (플릿 템플릿만)")
     created_at: datetime
     updated_at: datetime
 
@@ -248,4 +336,166 @@ class SimulatorInactiveResponse(BaseModel):
                 }
             ]
         }
-    )
\ No newline at end of file
+    )
+
+class SimulatorClockUpdate(BaseModel):
+    """시뮬레이션 시계 설정 요청 스키마 - 시간 기반 고장 패턴의 배속 재생용"""
+    speed: Optional[float] = Field(None, gt=0, description="배속 (1.0 = 실제 시간, 3600 = 1초에 1시간)")
+    paused: Optional[bool] = Field(None, description="일시정지 여부")
+    seek_to: Optional[datetime] = Field(None, description="이동할 가상 시각 (UTC)")
+    advance_seconds: Optional[float] = Field(None, description="가상 시각을 앞(음수면 뒤)으로 이동할 초")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {
+                    "speed": 3600
+                },
+                {
+                    "paused": True,
+                    "advance_seconds": 21600
+                }
+            ]
+        }
+    )
+
+
+class SimulatorClockResponse(BaseModel):
+    """시뮬레이션 시계 상태 응답 스키마"""
+    simulator_id: int
+    is_custom: bool = Field(..., description="전용 시계 사용 여부 (false면 실제 시간)")
+    speed: float = Field(..., description="배속")
+    paused: bool = Field(..., description="일시정지 여부")
+    current_time: datetime = Field(..., description="현재 가상 시각 (UTC)")
+    offset_seconds: float = Field(..., description="실제 시각 대비 가상 시각 차이(초)")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {
+                    "simulator_id": 1,
+                    "is_custom": True,
+                    "speed": 3600.0,
+                    "paused": False,
+                    "current_time": "2025-01-01T06:00:00",
+                    "offset_seconds": 21600.0
+                }
+            ]
+        }
+    )
+
+
+class ColumnProfile(BaseModel):
+    """업로드 파일 컬럼 통계 스키마"""
+    name: str = Field(..., description="파일의 컬럼명")
+    key: str = Field(..., description="파라미터 키 (컬럼명을 키 규칙에 맞게 변환)")
+    type: Literal["integer", "float", "boolean", "string"] = Field(..., description="추론된 타입")
+    count: int = Field(..., description="값이 있는 행 수 (숫자 컬럼은 숫자로 변환된 값만)")
+    null_count: int = Field(..., description="빈 값(숫자 컬럼은 숫자가 아닌 값 포함) 행 수")
+    min: Optional[float] = Field(default=None, description="최소값 (숫자 타입)")
+    max: Optional[float] = Field(default=None, description="최대값 (숫자 타입)")
+    mean: Optional[float] = Field(default=None, description="평균 (숫자 타입)")
+    std: Optional[float] = Field(default=None, description="표본 표준편차 (숫자 타입)")
+    quantiles: Optional[Dict[str, float]] = Field(default=None, description="분위수 p05/p25/p50/p75/p95 (숫자 타입, 큰 파일은 표본 기준)")
+    distinct_values: Optional[List[str]] = Field(default=None, description="고유값 목록 (문자열/불린 타입, 한도 초과 시 null)")
+    distinct_truncated: bool = Field(default=False, description="고유값이 한도를 넘어 목록을 생략했는지 여부")
+
+
+class UploadProfileResponse(BaseModel):
+    """업로드 파일 통계 응답 스키마 - parameters/parameter_config는 SimulatorCreate에 그대로 사용 가능"""
+    header_row: Optional[int] = Field(default=None, description="감지된 헤더 행 인덱스 (0-based, 없으면 null)")
+    row_count: int = Field(..., description="데이터 행 수")
+    columns: List[ColumnProfile]
+    parameters: Dict[str, Any] = Field(..., description="컬럼별 기본 파라미터 값")
+    parameter_config: Dict[str, ParameterConfig] = Field(..., description="컬럼별 파라미터 설정 (숫자 컬럼은 관측 범위의 랜덤 값)")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {
+                    "header_row": 0,
+                    "row_count": 86400,
+                    "columns": [
+                        {
+                            "name": "water_qty",
+                            "key": "water_qty",
+                            "type": "float",
+                            "count": 86400,
+                            "null_count": 0,
+                            "min": 10.2,
+                            "max": 24.8,
+                            "mean": 17.5,
+                            "std": 3.1,
+                            "quantiles": {"p05": 12.4, "p25": 15.3, "p50": 17.5, "p75": 19.6, "p95": 22.7}
+                        },
+                        {
+                            "name": "tool",
+                            "key": "tool",
+                            "type": "string",
+                            "count": 86400,
+                            "null_count": 0,
+                            "distinct_values": ["sensor_v1", "sensor_v2"]
+                        }
+                    ],
+                    "parameters": {"water_qty": 17.5, "tool": "sensor_v1"},
+                    "parameter_config": {
+                        "water_qty": {"is_random": True, "type": "float", "min": 10.2, "max": 24.8},
+                        "tool": {"is_random": False, "type": "string"}
+                    }
+                }
+            ]
+        }
+    )
+
+
+class SheetSimulator(BaseModel):
+    """시트별 생성 결과 - 시트 이름과 생성된 시뮬레이터"""
+    sheet: str = Field(..., description="Excel 시트 이름")
+    header_row: Optional[int] = Field(default=None, description="감지된 헤더 행 인덱스 (0-based, 없으면 null)")
+    simulator: SimulatorResponse
+
+
+class SkippedSheet(BaseModel):
+    """시뮬레이터를 만들지 않은 시트와 사유"""
+    sheet: str = Field(..., description="Excel 시트 이름")
+    detail: str = Field(..., description="건너뛴 사유")
+
+
+class SheetUploadResponse(BaseModel):
+    """시트별 시뮬레이터 일괄 생성 응답 스키마"""
+    simulators: List[SheetSimulator]
+    skipped: List[SkippedSheet] = Field(default_factory=list, description="빈 시트 등 건너뛴 시트")
+
+
+class SimulatorBulkCreate(BaseModel):
+    """시뮬레이터 일괄 생성 요청 스키마 - 항목별로 SimulatorCreate 검증 (잘못된 항목만 실패 처리)"""
+    simulators: List[Dict[str, Any]] = Field(..., min_length=1, description="SimulatorCreate 형식의 항목 목록")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {
+                    "simulators": [
+                        {"name": "pump-001", "parameters": {"flow_rate": 50, "pressure": 2.1}},
+                        {"name": "pump-002", "parameters": {"flow_rate": 48, "pressure": 2.0}, "is_active": False}
+                    ]
+                }
+            ]
+        }
+    )
+
+
+class SimulatorBulkItemResult(BaseModel):
+    """일괄 생성 항목별 결과"""
+    index: int = Field(..., description="요청 목록에서의 위치 (0-based)")
+    name: Optional[str] = Field(default=None, description="시뮬레이터 이름")
+    status: Literal["created", "conflict", "invalid"] = Field(..., description="created: 생성됨, conflict: 이름 중복, invalid: 검증 실패")
+    simulator_id: Optional[int] = Field(default=None, description="생성된 시뮬레이터 ID")
+    detail: Optional[str] = Field(default=None, description="실패 사유")
+
+
+class SimulatorBulkCreateResponse(BaseModel):
+    """시뮬레이터 일괄 생성 응답 스키마"""
+    created: int = Field(..., description="생성된 시뮬레이터 수")
+    failed: int = Field(..., description="생성하지 못한 항목 수")
+    results: List[SimulatorBulkItemResult]
@@ -0,0 +1,183 @@
+"""
+캐시 무효화 버스 - Postgres LISTEN/NOTIFY로 여러 인스턴스의 프로세스 내 캐시를 동기화
+
+시뮬레이터/시나리오를 변경하는 쓰기 경로는 커밋 전에 notify()로 변경된 시뮬레이터 ID를 알립니다.
+- 같은 프로세스의 구독자(틱 스케줄러, 마이크로캐시 등)는 커밋 직후 호출되고
+- 같은 트랜잭션에서 pg_notify로 'simulator_changed' 채널에 보낸 메시지는 커밋 시 전달되어
+- 다른 인스턴스(레플리카/워커)의 리스너 스레드가 받아 자신의 구독자를 호출합니다.
+
+리스너 연결이 끊겼다가 다시 연결되면 그 사이의 알림을 놓쳤을 수 있으므로
+구독자에게 전체 무효화(None)를 전달합니다.
+
+환경 변수:
+    CACHE_INVALIDATION_ENABLED: false면 리스너를 시작하지 않음 (기본값: true, Postgres일 때만 동작)
+"""
+import json
+import logging
+import os
+import select
+import threading
+import uuid
+from typing import Callable, Iterable, List, Optional
+
+from sqlalchemy import event, func
+from sqlalchemy import select as sql_select
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "simulator_changed"
+
+# 커밋 대기 중인 변경 시뮬레이터 ID (Session.info 키)
+PENDING_KEY = "invalidated_simulator_ids"
+
+# pg_notify payload 한도(8000B) 안에 들어가도록 메시지당 ID 수 제한
+MAX_IDS_PER_MESSAGE = 500
+
+# 구독자: 변경된 시뮬레이터 ID 목록 (None이면 전체 무효화)
+Handler = Callable[[Optional[List[int]]], None]
+
+
+class InvalidationBus:
+    """프로세스 내 구독자 호출 + Postgres NOTIFY 전파"""
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        # 자신이 보낸 알림은 이미 로컬에서 처리했으므로 리스너에서 건너뜀
+        self.origin = uuid.uuid4().hex
+        self._handlers: List[Handler] = []
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    @classmethod
+    def from_env(cls) -> "InvalidationBus":
+        return cls(enabled=os.getenv("CACHE_INVALIDATION_ENABLED", "true").lower() == "true")
+
+    def subscribe(self, handler: Handler) -> None:
+        self._handlers.append(handler)
+
+    def unsubscribe(self, handler: Handler) -> None:
+        if handler in self._handlers:
+            self._handlers.remove(handler)
+
+    def _dispatch(self, simulator_ids: Optional[List[int]]) -> None:
+        for handler in self._handlers:
+            try:
+                handler(simulator_ids)
+            except Exception as e:
+                logger.error(f"캐시 무효화 처리 중 오류: {e}")
+
+    def notify(self, db: Session, simulator_ids: Iterable[int]) -> None:
+        """
+        시뮬레이터 변경 알림 - 쓰기 트랜잭션 커밋 전에 호출
+
+        pg_notify는 트랜잭션에 포함되어 커밋될 때만 전달되고,
+        같은 프로세스의 구독자는 세션 커밋 직후(after_commit) 호출됩니다.
+        롤백되면 어느 쪽도 알림을 받지 않습니다.
+
+        Args:
+            db: 쓰기에 사용 중인 데이터베이스 세션
+            simulator_ids: 변경된 시뮬레이터 ID 목록
+        """
+        ids = sorted({int(i) for i in simulator_ids if i is not None})
+        if not ids:
+            return
+
+        # 아직 시작된 트랜잭션이 없으면 rollback()이 아무 일도 하지 않아 대기 ID가 다음 커밋까지 남으므로
+        # 트랜잭션을 먼저 시작해 롤백 시 함께 버려지게 함
+        db.connection()
+        db.info.setdefault(PENDING_KEY, set()).update(ids)
+
+        if not self.enabled or db.get_bind().dialect.name != "postgresql":
+            return
+
+        for start in range(0, len(ids), MAX_IDS_PER_MESSAGE):
+            payload = json.dumps({
+                "origin": self.origin,
+                "ids": ids[start:start + MAX_IDS_PER_MESSAGE]
+            })
+            db.execute(sql_select(func.pg_notify(CHANNEL, payload)))
+
+    def start_listener(self, engine) -> None:
+        """다른 인스턴스의 알림을 받는 리스너 스레드 시작 (Postgres 전용)"""
+        if not self.enabled or engine.dialect.name != "postgresql":
+            return
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._listen_forever,
+            args=(engine,),
+            name="cache-invalidation-listener",
+            daemon=True
+        )
+        self._thread.start()
+
+    def stop_listener(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _listen_forever(self, engine) -> None:
+        backoff = 1.0
+        first_connect = True
+        while not self._stop.is_set():
+            try:
+                connection = engine.raw_connection()
+                try:
+                    dbapi_connection = connection.dbapi_connection
+                    dbapi_connection.autocommit = True
+                    with dbapi_connection.cursor() as cursor:
+                        cursor.execute(f"LISTEN {CHANNEL}")
+
+                    logger.info(f"캐시 무효화 리스너 연결: 채널 '{CHANNEL}'")
+                    if not first_connect:
+                        # 연결이 끊긴 동안의 알림을 놓쳤을 수 있음
+                        self._dispatch(None)
+                    first_connect = False
+                    backoff = 1.0
+
+                    self._poll(dbapi_connection)
+                finally:
+                    connection.invalidate()
+            except Exception as e:
+                logger.error(f"캐시 무효화 리스너 오류: {e} ({backoff:.0f}초 후 재연결)")
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, 30.0)
+
+    def _poll(self, dbapi_connection) -> None:
+        while not self._stop.is_set():
+            readable, _, _ = select.select([dbapi_connection], [], [], 1.0)
+            if not readable:
+                continue
+
+            dbapi_connection.poll()
+            while dbapi_connection.notifies:
+                notify = dbapi_connection.notifies.pop(0)
+                try:
+                    message = json.loads(notify.payload)
+                except json.JSONDecodeError:
+                    logger.warning(f"잘못된 캐시 무효화 메시지: {notify.payload!r}")
+                    continue
+
+                if message.get("origin") == self.origin:
+                    continue
+                self._dispatch(message.get("ids"))
+
+
+# 프로세스 전역 무효화 버스
+invalidation_bus = InvalidationBus.from_env()
+
+
+@event.listens_for(Session, "after_commit")
+def _dispatch_after_commit(session: Session) -> None:
+    ids = session.info.pop(PENDING_KEY, None)
+    if ids:
+        invalidation_bus._dispatch(sorted(ids))
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop(PENDING_KEY, None)
@@ -0,0 +1,177 @@
+"""
+시작 시 캐시 워밍업 - 배포/재시작 직후 첫 요청들이 모두 DB로 몰리지 않도록 미리 적재
+
+1. 디스크 스냅샷(COMPILED_SNAPSHOT_PATH)이 있으면 읽어서 컴파일 캐시를 즉시 채움
+   → DB 조회가 끝나기 전부터 DB 없이 응답
+2. 백그라운드 스레드에서 전체 시뮬레이터/적용 시나리오를 한 번의 쿼리로 읽어
+   (ORM 객체 대신 컬럼 튜플로 읽어 행 변환 비용을 줄임) 컴파일한 뒤 캐시를 교체
+   (그 사이 삭제된 시뮬레이터는 제거)
+3. 새 컴파일 결과를 스냅샷 파일로 저장 (임시 파일에 쓴 뒤 원자적으로 교체)
+
+컴파일은 이 스레드에서 순서대로 실행합니다. 컴파일은 대부분 JSON 파싱과 딕셔너리
+생성이라 스레드로는 GIL 때문에 병렬화되지 않고, 프로세스 풀에서 컴파일하면
+결과 객체를 이 프로세스로 가져오는 역직렬화(pickle.loads) 비용이 컴파일 자체와
+비슷해 이득이 없습니다. 워밍업은 앱 시작을 막지 않는 백그라운드 스레드이고,
+그동안의 요청은 스냅샷이나 요청별 조회로 응답합니다.
+
+스냅샷 파일은 형식 버전(SNAPSHOT_FORMAT_VERSION)이 다르거나
+COMPILED_SNAPSHOT_MAX_AGE_SECONDS보다 오래되었으면 사용하지 않습니다.
+스냅샷은 json.loads에 bytes 전체가 필요하므로 mmap 대신 f.read() 한 번으로 읽습니다
+(mmap 영역을 bytes로 옮기는 복사가 추가로 생기지 않도록).
+
+환경 변수:
+    CACHE_WARMUP_ENABLED: false면 워밍업하지 않음 (기본값: true)
+    COMPILED_SNAPSHOT_PATH: 스냅샷 파일 경로 (기본값: 빈 값 = 스냅샷 미사용)
+    COMPILED_SNAPSHOT_MAX_AGE_SECONDS: 사용할 수 있는 스냅샷의 최대 나이 (기본값: 86400)
+"""
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import List, Optional
+
+from ..database import SessionLocal
+from .compiled_cache import compiled_cache
+from .compiled_simulator import CompiledSimulator, compile_rows, load_simulator_rows
+
+logger = logging.getLogger(__name__)
+
+# CompiledSimulator.to_dict() 구조가 바뀌면 올려서 이전 스냅샷을 무시하게 함
+SNAPSHOT_FORMAT_VERSION = 2
+
+# 스냅샷 항목을 DB 확인 없이 신뢰하는 최대 시간 (워밍업 조회가 끝나면 교체됨)
+SNAPSHOT_TRUST_SECONDS = 60.0
+
+
+def read_snapshot(path: str, max_age_seconds: float) -> Optional[List[CompiledSimulator]]:
+    """스냅샷 파일을 읽어 컴파일 결과 목록 반환 (없거나 사용할 수 없으면 None)"""
+    try:
+        # json.loads는 bytes 전체가 필요하므로 mmap 대신 한 번에 읽음 (복사 1회)
+        with open(path, "rb") as f:
+            data = f.read()
+        if not data:
+            return None
+        document = json.loads(data)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"컴파일 스냅샷을 읽을 수 없습니다: {path}: {e}")
+        return None
+
+    if document.get("version") != SNAPSHOT_FORMAT_VERSION:
+        logger.info(f"컴파일 스냅샷 형식 버전 불일치로 무시: {document.get('version')}")
+        return None
+
+    age = time.time() - document.get("created_at", 0)
+    if age > max_age_seconds:
+        logger.info(f"컴파일 스냅샷이 너무 오래되어 무시: {age:.0f}초 전")
+        return None
+
+    try:
+        return [CompiledSimulator.from_dict(d) for d in document["simulators"]]
+    except (KeyError, TypeError, ValueError) as e:
+        logger.warning(f"컴파일 스냅샷 항목이 손상되었습니다: {e}")
+        return None
+
+
+def write_snapshot(path: str, compiled_simulators: List[CompiledSimulator]) -> None:
+    """스냅샷 파일 저장 - 같은 디렉터리의 임시 파일에 쓴 뒤 os.replace로 교체"""
+    document = {
+        "version": SNAPSHOT_FORMAT_VERSION,
+        "created_at": time.time(),
+        "simulators": [compiled.to_dict() for compiled in compiled_simulators]
+    }
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=".compiled_snapshot_", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(document, f, ensure_ascii=False, default=str)
+        os.replace(tmp_path, path)
+    except Exception:
+        os.unlink(tmp_path)
+        raise
+
+
+class CacheWarmup:
+    """스냅샷 적재 → DB 일괄 로드 → 스냅샷 저장"""
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        snapshot_path: str = "",
+        snapshot_max_age_seconds: float = 86400.0
+    ):
+        self.enabled = enabled
+        self.snapshot_path = snapshot_path
+        self.snapshot_max_age_seconds = snapshot_max_age_seconds
+        self._thread: Optional[threading.Thread] = None
+        self.completed_at: Optional[float] = None
+
+    @classmethod
+    def from_env(cls) -> "CacheWarmup":
+        return cls(
+            enabled=os.getenv("CACHE_WARMUP_ENABLED", "true").lower() == "true",
+            snapshot_path=os.getenv("COMPILED_SNAPSHOT_PATH", ""),
+            snapshot_max_age_seconds=float(os.getenv("COMPILED_SNAPSHOT_MAX_AGE_SECONDS", "86400"))
+        )
+
+    def start(self) -> None:
+        """스냅샷은 즉시 적재하고, DB 로드는 백그라운드 스레드에서 진행 (앱 시작을 막지 않음)"""
+        if not self.enabled or not compiled_cache.enabled:
+            return
+
+        if self.snapshot_path:
+            started = time.monotonic()
+            compiled_simulators = read_snapshot(self.snapshot_path, self.snapshot_max_age_seconds)
+            if compiled_simulators:
+                compiled_cache.store_many(compiled_simulators, fresh_seconds=SNAPSHOT_TRUST_SECONDS)
+                logger.info(
+                    f"컴파일 스냅샷 적재: {len(compiled_simulators)}개 "
+                    f"({(time.monotonic() - started) * 1000:.0f}ms)"
+                )
+
+        self._thread = threading.Thread(target=self.run, name="cache-warmup", daemon=True)
+        self._thread.start()
+
+    def run(self) -> None:
+        started = time.monotonic()
+        db = SessionLocal()
+        try:
+            rows = load_simulator_rows(db)
+        except Exception as e:
+            # 스냅샷 항목은 남겨두되 만료시켜 요청마다 재검증(실패 시 허용 기간 내 대체 응답)
+            logger.error(f"캐시 워밍업 실패: {e}")
+            compiled_cache.expire(None)
+            return
+        finally:
+            db.close()
+
+        loaded = time.monotonic()
+        compiled_simulators = compile_rows(rows)
+        compiled_cache.replace_all(compiled_simulators)
+        self.completed_at = time.time()
+        logger.info(
+            f"캐시 워밍업 완료: 시뮬레이터 {len(compiled_simulators)}개 "
+            f"(조회 {(loaded - started) * 1000:.0f}ms, 컴파일 {(time.monotonic() - loaded) * 1000:.0f}ms)"
+        )
+
+        self.save_snapshot(compiled_simulators)
+
+    def save_snapshot(self, compiled_simulators: Optional[List[CompiledSimulator]] = None) -> None:
+        """현재 컴파일 캐시(또는 주어진 목록)를 스냅샷 파일로 저장"""
+        if not self.snapshot_path:
+            return
+        if compiled_simulators is None:
+            compiled_simulators = compiled_cache.snapshot()
+        try:
+            write_snapshot(self.snapshot_path, compiled_simulators)
+        except Exception as e:
+            logger.error(f"컴파일 스냅샷 저장 실패: {self.snapshot_path}: {e}")
+
+
+# 프로세스 전역 워밍업
+cache_warmup = CacheWarmup.from_env()
@@ -0,0 +1,315 @@
+"""
+고장 전파 계획 - 시뮬레이터 간 전파 간선(FailureCascade)을 위상 정렬된 평가 계획으로 컴파일
+
+원인 시뮬레이터에 적용된 고장 시나리오는 간선을 따라 delay_seconds 뒤에 대상 시뮬레이터의
+파라미터를 바꾸고(offset/scale, ramp_seconds 동안 선형 증가), 대상이 다시 다른 시뮬레이터의
+원인이 되어 연쇄적으로 전파됩니다. 순환이 있으면 전파 시점이 정의되지 않으므로
+간선을 저장할 때 거부합니다(topological_levels).
+
+계획은 사용자별로 만들며(간선은 같은 사용자의 시뮬레이터끼리만 연결됨), 한 사용자의 간선에
+문제가 있어도 다른 사용자의 전파에는 영향이 없습니다. apply는 결과에 다음 순서로 적용합니다.
+    1. 고장 시나리오가 적용된 시뮬레이터의 경과 시간(시뮬레이터 시계 기준)을 시작점으로
+    2. 위상 단계 순서로 대상 경과 시간 = max(원인 경과 시간 - delay)를 단계별 한 번의 NumPy 연산으로 전파
+    3. 경과 시간이 0 이상인 간선의 영향만 대상 값에 반영
+틱 스케줄러는 목록을 읽을 때 전체 사용자의 계획을 한 번의 쿼리로 만들고, 사용자 스냅샷과
+단건 /api/data 요청은 cascade_plans 캐시의 사용자 계획을 사용합니다. 단건 요청은 대상 시뮬레이터로
+들어오는 간선이 있을 때만 상류 시뮬레이터의 적용 시나리오를 한 번 조회합니다.
+"""
+import logging
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import and_, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from ..models.failure_cascade import FailureCascade
+from ..models.failure_scenario import FailureScenario
+from ..models.simulator import Simulator
+from .cache_invalidation import invalidation_bus
+from .compiled_simulator import CompiledSimulator, elapsed_since, scenario_elapsed_seconds
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CascadeEdge:
+    """계획에 포함된 활성 간선"""
+    cascade_id: int
+    source: int
+    target: int
+    parameter: str
+    effect: str
+    magnitude: float
+    delay_seconds: float
+    ramp_seconds: float
+
+
+def topological_levels(edges: Iterable[Tuple[int, int]]) -> Dict[int, int]:
+    """
+    (원인, 대상) 간선으로 시뮬레이터별 위상 단계 계산 (Kahn 알고리즘)
+
+    Returns:
+        시뮬레이터 ID → 단계 (들어오는 간선이 없으면 0, 그 외는 원인 단계 최댓값 + 1)
+
+    Raises:
+        ValueError: 순환이 있는 경우
+    """
+    outgoing: Dict[int, List[int]] = defaultdict(list)
+    indegree: Dict[int, int] = defaultdict(int)
+    for source, target in edges:
+        outgoing[source].append(target)
+        indegree[target] += 1
+        indegree.setdefault(source, 0)
+
+    depth: Dict[int, int] = defaultdict(int)
+    queue = [node for node, degree in indegree.items() if degree == 0]
+    for node in queue:
+        for target in outgoing[node]:
+            depth[target] = max(depth[target], depth[node] + 1)
+            indegree[target] -= 1
+            if indegree[target] == 0:
+                queue.append(target)
+
+    if len(queue) < len(indegree):
+        # 남은 노드 중 순환 뒤에만 있는 노드(남은 노드로 나가는 간선이 없음)는 제외
+        remaining = {node for node, degree in indegree.items() if degree > 0}
+        while True:
+            tails = {node for node in remaining if not remaining.intersection(outgoing[node])}
+            if not tails:
+                break
+            remaining -= tails
+        raise ValueError(f"고장 전파 간선이 순환을 만듭니다 (순환에 포함된 시뮬레이터: {sorted(remaining)})")
+    return {node: depth[node] for node in queue}
+
+
+class CascadePlan:
+    """위상 정렬된 전파 간선과 틱마다 재사용하는 NumPy 배열"""
+
+    def __init__(self, edges: List[CascadeEdge]):
+        levels = topological_levels((edge.source, edge.target) for edge in edges)
+        # 원인 단계 순서로 정렬 - 같은 단계의 간선은 한 번에 전파
+        self.edges = sorted(edges, key=lambda edge: levels[edge.source])
+        self.nodes = sorted(levels, key=lambda node: (levels[node], node))
+        self.levels: List[List[int]] = []
+        for node in self.nodes:
+            if levels[node] == len(self.levels):
+                self.levels.append([])
+            self.levels[levels[node]].append(node)
+        self._position = {node: i for i, node in enumerate(self.nodes)}
+        self._edge_levels = [levels[edge.source] for edge in self.edges]
+        self._arrays: Optional[Dict[str, Any]] = None
+        self._sources: Dict[int, List[int]] = defaultdict(list)
+        for edge in self.edges:
+            self._sources[edge.target].append(edge.source)
+        self._upstream: Dict[int, Set[int]] = {}
+
+    def upstream(self, target: int) -> Set[int]:
+        """대상으로 전파될 수 있는 모든 상류 시뮬레이터 ID (들어오는 간선이 없으면 빈 집합)"""
+        cached = self._upstream.get(target)
+        if cached is not None:
+            return cached
+        found: Set[int] = set()
+        stack = list(self._sources.get(target, ()))
+        while stack:
+            node = stack.pop()
+            if node not in found:
+                found.add(node)
+                stack.extend(self._sources.get(node, ()))
+        self._upstream[target] = found
+        return found
+
+    def _build_arrays(self) -> Dict[str, Any]:
+        import numpy as np
+
+        edge_levels = np.array(self._edge_levels, dtype=np.int64)
+        return {
+            "source": np.array([self._position[edge.source] for edge in self.edges], dtype=np.int64),
+            "target": np.array([self._position[edge.target] for edge in self.edges], dtype=np.int64),
+            "delay": np.array([edge.delay_seconds for edge in self.edges], dtype=float),
+            "ramp": np.array([edge.ramp_seconds for edge in self.edges], dtype=float),
+            "magnitude": np.array([edge.magnitude for edge in self.edges], dtype=float),
+            "is_scale": np.array([edge.effect == "scale" for edge in self.edges], dtype=bool),
+            # 단계별 간선 구간 [start, end)
+            "bounds": np.searchsorted(edge_levels, np.arange(len(self.levels) + 1))
+        }
+
+    def apply(self, triggers: Dict[int, float], results: Dict[int, Dict[str, Any]]) -> None:
+        """
+        평가 결과(시뮬레이터 ID → 응답)에 전파 영향을 반영
+
+        Args:
+            triggers: 고장 시나리오가 적용된 시뮬레이터 ID → 시나리오 경과 시간(초) (cascade_triggers)
+            results: 영향을 반영할 응답 (계획의 일부 대상만 있어도 됨)
+
+        scale 영향을 먼저 곱한 뒤 offset 영향을 더하며, 대상이 결과에 없거나 비활성화 상태이거나
+        대상 파라미터 값이 숫자가 아니면 건너뜁니다.
+        """
+        if not self.edges:
+            return
+
+        import numpy as np
+
+        if self._arrays is None:
+            self._arrays = self._build_arrays()
+        arrays = self._arrays
+
+        # 고장 시나리오가 적용된 시뮬레이터가 전파의 시작점
+        triggered = np.full(len(self.nodes), -np.inf)
+        for node, position in self._position.items():
+            elapsed = triggers.get(node)
+            if elapsed is not None:
+                triggered[position] = elapsed
+
+        bounds = arrays["bounds"]
+        for level in range(len(self.levels)):
+            start, end = bounds[level], bounds[level + 1]
+            if start == end:
+                continue
+            np.maximum.at(
+                triggered,
+                arrays["target"][start:end],
+                triggered[arrays["source"][start:end]] - arrays["delay"][start:end]
+            )
+
+        elapsed = triggered[arrays["source"]] - arrays["delay"]
+        started = elapsed >= 0
+        if not started.any():
+            return
+
+        ramp = arrays["ramp"]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            factor = np.where(ramp > 0, np.clip(elapsed / np.where(ramp > 0, ramp, 1.0), 0.0, 1.0), 1.0)
+        multiplier = 1.0 + (arrays["magnitude"] - 1.0) * factor
+        offset = arrays["magnitude"] * factor
+
+        is_scale = arrays["is_scale"]
+        for i in np.concatenate([np.flatnonzero(started & is_scale), np.flatnonzero(started & ~is_scale)]).tolist():
+            edge = self.edges[i]
+            response = results.get(edge.target)
+            if response is None or response["type"] != "active":
+                continue
+            data = response["data"]
+            value = data.get(edge.parameter)
+            if not isinstance(value, (int, float)) or isinstance(value, bool):
+                continue
+            if is_scale[i]:
+                data[edge.parameter] = value * float(multiplier[i])
+            else:
+                data[edge.parameter] = value + float(offset[i])
+
+
+def cascade_triggers(simulators: Iterable[CompiledSimulator]) -> Dict[int, float]:
+    """고장 시나리오가 적용된 시뮬레이터 ID → 시나리오 경과 시간(초)"""
+    return {
+        compiled.simulator_id: scenario_elapsed_seconds(compiled)
+        for compiled in simulators
+        if compiled.failure_config is not None
+    }
+
+
+def _edges(db: Session, user_id: Optional[int] = None) -> Dict[int, List[CascadeEdge]]:
+    """활성 간선을 한 번의 쿼리로 읽어 사용자별로 분류"""
+    stmt = select(FailureCascade).where(FailureCascade.is_active == True)
+    if user_id is not None:
+        stmt = stmt.where(FailureCascade.user_id == user_id)
+
+    edges: Dict[int, List[CascadeEdge]] = defaultdict(list)
+    for cascade in db.scalars(stmt):
+        edges[cascade.user_id].append(CascadeEdge(
+            cascade_id=cascade.id,
+            source=cascade.source_simulator_id,
+            target=cascade.target_simulator_id,
+            parameter=cascade.target_parameter,
+            effect=cascade.effect,
+            magnitude=cascade.magnitude,
+            delay_seconds=cascade.delay_seconds,
+            ramp_seconds=cascade.ramp_seconds
+        ))
+    return edges
+
+
+def _build_plan(user_id: int, edges: List[CascadeEdge]) -> CascadePlan:
+    """저장 시 순환을 거부하지만, 그래도 순환이 있으면 로그를 남기고 그 사용자만 빈 계획으로"""
+    try:
+        return CascadePlan(edges)
+    except ValueError as e:
+        logger.error(f"고장 전파 계획 생성 실패 (user_id={user_id}): {e}")
+        return CascadePlan([])
+
+
+def load_cascade_plan(db: Session, user_id: int) -> CascadePlan:
+    """특정 사용자의 활성 전파 간선으로 계획 생성"""
+    return _build_plan(user_id, _edges(db, user_id).get(user_id, []))
+
+
+def load_cascade_plans(db: Session) -> Dict[int, CascadePlan]:
+    """모든 사용자의 활성 전파 간선을 한 번의 쿼리로 읽어 사용자별 계획 생성"""
+    return {user_id: _build_plan(user_id, edges) for user_id, edges in _edges(db).items()}
+
+
+class CascadePlanCache:
+    """사용자 ID → 전파 계획 (간선/시뮬레이터가 바뀌면 무효화 버스로 비움)"""
+
+    def __init__(self):
+        self._plans: Dict[int, CascadePlan] = {}
+        self._lock = threading.Lock()
+
+    def get(self, db: Session, user_id: int) -> CascadePlan:
+        plan = self._plans.get(user_id)
+        if plan is None:
+            plan = load_cascade_plan(db, user_id)
+            with self._lock:
+                self._plans[user_id] = plan
+        return plan
+
+    def invalidate(self, simulator_ids: Optional[List[int]]) -> None:
+        # 무효화 메시지에는 사용자 정보가 없고 계획은 다시 만드는 비용이 작으므로 전체를 비움
+        with self._lock:
+            self._plans.clear()
+
+    def apply_to_response(self, db: Session, compiled: CompiledSimulator, response: Dict[str, Any]) -> None:
+        """
+        단건 응답에 전파 영향을 반영 - 들어오는 간선이 없으면 조회 없이 반환
+
+        상류 시뮬레이터의 적용 시나리오 시작 시각만 한 번 조회하며, DB 오류가 나면
+        로그만 남기고 전파 없이 응답합니다 (컴파일 캐시의 장애 대응과 같은 원칙).
+        """
+        if response["type"] != "active":
+            return
+        try:
+            plan = self.get(db, compiled.user_id)
+            upstream = plan.upstream(compiled.simulator_id)
+            if not upstream:
+                return
+            # 일괄 평가와 같이 활성화된 시뮬레이터의 시나리오만 시작점
+            stmt = (
+                select(FailureScenario.simulator_id, FailureScenario.applied_at)
+                .join(Simulator, Simulator.id == FailureScenario.simulator_id)
+                .where(
+                    and_(
+                        FailureScenario.simulator_id.in_(upstream),
+                        FailureScenario.is_applied == True,
+                        Simulator.is_active == True
+                    )
+                )
+            )
+            triggers = {
+                simulator_id: elapsed_since(simulator_id, applied_at)
+                for simulator_id, applied_at in db.execute(stmt)
+            }
+        except SQLAlchemyError as e:
+            logger.error(f"고장 전파 조회 실패, 전파 없이 응답: simulator_id={compiled.simulator_id}: {e}")
+            return
+        plan.apply(triggers, {compiled.simulator_id: response})
+
+
+# 프로세스 전역 사용자별 전파 계획 캐시
+cascade_plans = CascadePlanCache()
+
+invalidation_bus.subscribe(cascade_plans.invalidate)
@@ -0,0 +1,230 @@
+"""
+컴파일된 시뮬레이터 캐시 - DB가 느리거나 장애일 때 마지막으로 알려진 값으로 응답 (stale-while-revalidate)
+
+/api/data 요청마다 DB에서 시뮬레이터를 다시 읽으면 Postgres가 잠깐만 멈춰도
+모든 요청이 500으로 실패합니다. 이 캐시는 시뮬레이터별로 마지막 컴파일 결과를 보관하고,
+
+- 신선 기간(COMPILED_CACHE_FRESH_SECONDS) 안이면 DB 없이 바로 반환
+- 그 이후에는 DB에서 다시 읽되, 지연 예산(COMPILED_CACHE_LATENCY_BUDGET_MS) 안에 끝나지 않거나
+  DB 오류가 나면 허용 기간(COMPILED_CACHE_STALE_SECONDS) 안의 이전 값으로 응답
+- 예산을 넘긴 조회는 백그라운드에서 계속 진행되어 끝나면 캐시를 갱신
+- 대체할 이전 값이 없으면 기다릴 이유가 없으므로 스레드 풀을 거치지 않고 요청 스레드에서 바로 조회
+
+같은 시뮬레이터에 대한 동시 조회는 하나로 합쳐집니다(single-flight).
+시뮬레이터/시나리오가 변경되면 무효화 버스를 통해 항목이 만료 처리되어 다음 요청에서 다시 읽습니다.
+만료된 항목도 허용 기간 동안은 DB 장애 시 대체 응답으로 사용됩니다.
+
+환경 변수:
+    COMPILED_CACHE_ENABLED: false면 요청마다 요청 세션으로 직접 조회 (기본값: true)
+    COMPILED_CACHE_FRESH_SECONDS: DB를 다시 읽지 않는 기간 (기본값: 0 = 매 요청 재검증)
+    COMPILED_CACHE_STALE_SECONDS: 장애 시 이전 값을 사용할 수 있는 최대 기간 (기본값: 300)
+    COMPILED_CACHE_LATENCY_BUDGET_MS: 이전 값이 있을 때 DB 조회를 기다리는 최대 시간 (기본값: 200)
+    COMPILED_CACHE_REFRESH_WORKERS: DB 조회 스레드 수 (기본값: 4)
+"""
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from .cache_invalidation import invalidation_bus
+from .compiled_simulator import CompiledSimulator
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[str, str]
+
+# DB 상태 문제로 보고 이전 값으로 대체할 수 있는 오류
+# (ValueError 등 "없음/권한" 같은 확정된 결과는 그대로 전달)
+TRANSIENT_ERRORS = (SQLAlchemyError, OSError)
+
+
+@dataclass
+class _Entry:
+    compiled: CompiledSimulator
+    loaded_at: float
+    fresh_until: float
+
+
+class CompiledSimulatorCache:
+    """(user_id, 시뮬레이터 이름) → CompiledSimulator, 지연 예산과 허용 기간을 둔 stale-while-revalidate"""
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        fresh_seconds: float = 0.0,
+        stale_seconds: float = 300.0,
+        latency_budget_seconds: float = 0.2,
+        refresh_workers: int = 4
+    ):
+        self.enabled = enabled
+        self.fresh_seconds = fresh_seconds
+        self.stale_seconds = stale_seconds
+        self.latency_budget_seconds = latency_budget_seconds
+        self.refresh_workers = refresh_workers
+
+        self._entries: Dict[CacheKey, _Entry] = {}
+        self._inflight: Dict[CacheKey, Future] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @classmethod
+    def from_env(cls) -> "CompiledSimulatorCache":
+        return cls(
+            enabled=os.getenv("COMPILED_CACHE_ENABLED", "true").lower() == "true",
+            fresh_seconds=float(os.getenv("COMPILED_CACHE_FRESH_SECONDS", "0")),
+            stale_seconds=float(os.getenv("COMPILED_CACHE_STALE_SECONDS", "300")),
+            latency_budget_seconds=int(os.getenv("COMPILED_CACHE_LATENCY_BUDGET_MS", "200")) / 1000,
+            refresh_workers=int(os.getenv("COMPILED_CACHE_REFRESH_WORKERS", "4"))
+        )
+
+    @staticmethod
+    def make_key(user_key: str, simulator_name: str) -> CacheKey:
+        return (user_key.lower(), simulator_name)
+
+    def get(self, key: CacheKey, loader: Callable[[], CompiledSimulator]) -> CompiledSimulator:
+        """
+        컴파일된 시뮬레이터 조회
+
+        Args:
+            key: make_key()로 만든 캐시 키
+            loader: DB에서 시뮬레이터를 읽어 컴파일하는 함수 (자체 세션 사용, 이전 값이 있으면 백그라운드 스레드에서 실행)
+
+        Raises:
+            ValueError: 사용자/시뮬레이터가 없는 경우 (loader가 발생시킨 그대로)
+            SQLAlchemyError: DB 오류이고 허용 기간 안의 이전 값도 없는 경우
+        """
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and entry.fresh_until > now:
+            return entry.compiled
+
+        usable = entry if entry is not None and now - entry.loaded_at <= self.stale_seconds else None
+
+        if usable is None:
+            # 대체할 값이 없으면 DB 응답을 끝까지 기다려야 하므로 요청 스레드에서 직접 조회
+            # (같은 키의 진행 중인 조회가 있으면 그 결과를 함께 사용)
+            return self._refresh(key, loader, inline=True).result()
+
+        future = self._refresh(key, loader)
+        try:
+            return future.result(timeout=self.latency_budget_seconds)
+        except FutureTimeoutError:
+            logger.warning(
+                f"시뮬레이터 조회 지연 예산 초과 - 이전 값 사용: {key} "
+                f"({now - usable.loaded_at:.1f}초 전)"
+            )
+            return usable.compiled
+        except TRANSIENT_ERRORS as e:
+            logger.warning(
+                f"시뮬레이터 조회 실패 - 이전 값 사용: {key} "
+                f"({now - usable.loaded_at:.1f}초 전): {e}"
+            )
+            return usable.compiled
+
+    def _refresh(self, key: CacheKey, loader: Callable[[], CompiledSimulator], inline: bool = False) -> Future:
+        """
+        진행 중인 조회가 있으면 그 Future를, 없으면 새 조회를 시작하여 반환
+
+        inline이면 새 조회를 현재 스레드에서 끝까지 실행한 뒤 완료된 Future를 반환합니다.
+        """
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                return future
+
+            if inline:
+                future = Future()
+                future.set_running_or_notify_cancel()
+            else:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.refresh_workers,
+                        thread_name_prefix="compiled-cache-refresh"
+                    )
+                future = self._executor.submit(self._load, key, loader)
+            self._inflight[key] = future
+
+        if inline:
+            try:
+                future.set_result(self._load(key, loader))
+            except BaseException as e:
+                future.set_exception(e)
+        return future
+
+    def _load(self, key: CacheKey, loader: Callable[[], CompiledSimulator]) -> CompiledSimulator:
+        try:
+            compiled = loader()
+        except ValueError:
+            # 삭제되었거나 존재하지 않는 시뮬레이터 - 이전 값으로 응답하면 안 됨
+            self._entries.pop(key, None)
+            raise
+        else:
+            self.store(compiled)
+            return compiled
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def store(self, compiled: CompiledSimulator, fresh_seconds: Optional[float] = None) -> None:
+        now = time.monotonic()
+        self._entries[self.make_key(compiled.user_key, compiled.name)] = _Entry(
+            compiled=compiled,
+            loaded_at=now,
+            fresh_until=now + (self.fresh_seconds if fresh_seconds is None else fresh_seconds)
+        )
+
+    def store_many(
+        self,
+        compiled_simulators: Iterable[CompiledSimulator],
+        fresh_seconds: Optional[float] = None
+    ) -> None:
+        for compiled in compiled_simulators:
+            self.store(compiled, fresh_seconds)
+
+    def replace_all(self, compiled_simulators: Iterable[CompiledSimulator]) -> None:
+        """전체 시뮬레이터 목록으로 캐시를 교체 (목록에 없는 항목은 삭제된 것으로 보고 제거)"""
+        now = time.monotonic()
+        self._entries = {
+            self.make_key(compiled.user_key, compiled.name): _Entry(
+                compiled=compiled,
+                loaded_at=now,
+                fresh_until=now + self.fresh_seconds
+            )
+            for compiled in compiled_simulators
+        }
+
+    def snapshot(self) -> List[CompiledSimulator]:
+        """현재 캐시된 컴파일 결과 목록"""
+        return [entry.compiled for entry in list(self._entries.values())]
+
+    def expire(self, simulator_ids: Optional[List[int]]) -> None:
+        """
+        변경된 시뮬레이터 항목을 만료 처리 (None이면 전체)
+
+        항목을 지우지 않고 신선 기간만 끝내므로 다음 요청은 DB를 다시 읽되,
+        DB 장애 중이면 허용 기간 안에서 이전 값으로 응답할 수 있습니다.
+        """
+        ids = None if simulator_ids is None else set(simulator_ids)
+        for entry in list(self._entries.values()):
+            if ids is None or entry.compiled.simulator_id in ids:
+                entry.fresh_until = 0.0
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+# 프로세스 전역 컴파일 캐시
+compiled_cache = CompiledSimulatorCache.from_env()
+
+invalidation_bus.subscribe(compiled_cache.expire)
@@ -0,0 +1,661 @@
+"""
+컴파일된 시뮬레이터 - 요청/틱마다 JSON 파싱과 DB 조회를 반복하지 않도록
+시뮬레이터와 적용된 고장 시나리오를 한 번 파싱해 둔 실행용 표현
+
+단건 평가(evaluate_compiled)는 /api/data의 기존 동작과 동일하며,
+배치 평가(evaluate_batch)는 구조가 같은 시뮬레이터들을 묶어 NumPy 한 번의 연산으로
+랜덤 값을 생성하고 고장 시나리오를 벡터화 엔진으로 적용합니다.
+
+재생(replay) 시뮬레이터는 파라미터 값 위에 재생 데이터셋의 현재 행을 덮어쓴 뒤
+일반 시뮬레이터와 같은 방식으로 고장 시나리오를 적용합니다.
+
+플릿(fleet) 템플릿은 정의 하나를 N개 인스턴스로 서비스합니다. evaluate_fleet이
+(인스턴스 수 × 랜덤 파라미터 수) 행렬을 한 번에 뽑고 인스턴스별 변경분만 덮어써
+파라미터별 길이 N 배열(FleetFrame)을 만들며, 인스턴스 요청은 그중 한 행을 꺼냅니다.
+
+NumPy와 FailureEngine은 배치 평가나 고급 시나리오 적용 시에만 import합니다.
+정적/단순 랜덤 시뮬레이터만 서비스하는 워커는 NumPy를 로드하지 않습니다.
+"""
+import json
+import logging
+import random
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Tuple, Union
+
+from sqlalchemy import and_, select
+from sqlalchemy.orm import Session
+
+from ..models.failure_scenario import FailureScenario
+from ..models.simulator import Simulator
+from ..models.user import User
+from .simulation_clock import clock_registry
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger(__name__)
+
+INACTIVE_MESSAGE = "해당 시뮬레이터는 비활성화 상태 입니다."
+
+
+@dataclass
+class CompiledSimulator:
+    """파싱이 끝난 시뮬레이터 + 적용된 고장 시나리오"""
+    simulator_id: int
+    user_id: int
+    user_key: str
+    name: str
+    is_active: bool
+    parameters: Dict[str, Any] = field(default_factory=dict)
+    parameter_config: Dict[str, Any] = field(default_factory=dict)
+    # 랜덤 생성 대상 파라미터 → (min, max)
+    random_ranges: Dict[str, Tuple[float, float]] = field(default_factory=dict)
+    scenario_id: Optional[int] = None
+    # {'failure_parameters': {...}, 'advanced_config': {...}} (advanced_config는 선택)
+    failure_config: Optional[Dict[str, Any]] = None
+    applied_at: Optional[datetime] = None
+    # 재생 시뮬레이터 설정 (dataset_id, advance, wrap, interval_seconds, started_at)
+    replay_config: Optional[Dict[str, Any]] = None
+    # 플릿 템플릿 설정 (instance_count, overrides - 키는 인스턴스 번호 문자열)
+    fleet_config: Optional[Dict[str, Any]] = None
+    # 시뮬레이션 시계 상태 (SimulationClock.to_state, 없으면 실제 시간)
+    clock_config: Optional[Dict[str, Any]] = None
+
+    @property
+    def structure_key(self) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """배치 평가 그룹 키 - 파라미터 구성과 랜덤 파라미터 구성이 같으면 같은 그룹"""
+        return tuple(self.parameters.keys()), tuple(self.random_ranges.keys())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 직렬화 가능한 딕셔너리로 변환 (공유 메모리/스냅샷 파일용)"""
+        return {
+            "simulator_id": self.simulator_id,
+            "user_id": self.user_id,
+            "user_key": self.user_key,
+            "name": self.name,
+            "is_active": self.is_active,
+            "parameters": self.parameters,
+            "parameter_config": self.parameter_config,
+            "random_ranges": {name: list(bounds) for name, bounds in self.random_ranges.items()},
+            "scenario_id": self.scenario_id,
+            "failure_config": self.failure_config,
+            "applied_at": self.applied_at.isoformat() if self.applied_at else None,
+            "replay_config": self.replay_config,
+            "fleet_config": self.fleet_config,
+            "clock_config": self.clock_config
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CompiledSimulator":
+        """to_dict 결과로부터 복원"""
+        return cls(
+            simulator_id=data["simulator_id"],
+            user_id=data["user_id"],
+            user_key=data["user_key"],
+            name=data["name"],
+            is_active=data["is_active"],
+            parameters=data["parameters"],
+            parameter_config=data["parameter_config"],
+            random_ranges={name: tuple(bounds) for name, bounds in data["random_ranges"].items()},
+            scenario_id=data["scenario_id"],
+            failure_config=data["failure_config"],
+            applied_at=datetime.fromisoformat(data["applied_at"]) if data["applied_at"] else None,
+            replay_config=data["replay_config"],
+            # 이전 버전 스냅샷 파일에는 없음
+            fleet_config=data.get("fleet_config"),
+            clock_config=data.get("clock_config")
+        )
+
+
+def compile_simulator(
+    simulator: Union[Simulator, "SimulatorRow"],
+    user_key: str,
+    scenario: Optional[Union[FailureScenario, "ScenarioRow"]] = None
+) -> CompiledSimulator:
+    """시뮬레이터 엔티티(또는 같은 컬럼의 행)와 적용된 시나리오를 실행용 표현으로 변환
+
+    Raises:
+        ValueError: 활성화된 시뮬레이터의 파라미터 JSON이 잘못된 경우
+    """
+    compiled = CompiledSimulator(
+        simulator_id=simulator.id,
+        user_id=simulator.user_id,
+        user_key=user_key,
+        name=simulator.name,
+        is_active=simulator.is_active
+    )
+
+    # 인스턴스 번호 확인에 필요하므로 비활성화 상태여도 플릿 설정은 파싱
+    if simulator.mode == "fleet" and simulator.fleet_config:
+        try:
+            compiled.fleet_config = json.loads(simulator.fleet_config)
+        except json.JSONDecodeError:
+            raise ValueError("플릿 설정 파싱 오류가 발생했습니다.")
+
+    if simulator.clock_config:
+        try:
+            compiled.clock_config = json.loads(simulator.clock_config)
+        except json.JSONDecodeError:
+            logger.error(f"시뮬레이션 시계 설정 파싱 오류 - 실제 시간 사용: simulator_id={simulator.id}")
+    sync_clock(compiled)
+
+    # 비활성화 시뮬레이터는 메시지만 반환하므로 파싱하지 않음
+    if not simulator.is_active:
+        return compiled
+
+    try:
+        compiled.parameters = json.loads(simulator.parameters)
+        compiled.parameter_config = json.loads(simulator.parameter_config or '{}')
+        if simulator.mode == "replay" and simulator.replay_config:
+            compiled.replay_config = json.loads(simulator.replay_config)
+    except json.JSONDecodeError:
+        raise ValueError("시뮬레이터 파라미터 파싱 오류가 발생했습니다.")
+
+    for param_name, config in compiled.parameter_config.items():
+        if param_name in compiled.parameters and config.get('is_random', False):
+            min_val = config.get('min')
+            max_val = config.get('max')
+            if min_val is not None and max_val is not None:
+                compiled.random_ranges[param_name] = (min_val, max_val)
+
+    if scenario is not None:
+        try:
+            failure_config = {
+                'failure_parameters': json.loads(scenario.failure_parameters)
+            }
+        except json.JSONDecodeError:
+            logger.error(f"고장 시나리오 파라미터 파싱 오류: scenario_id={scenario.id}")
+            return compiled
+
+        if scenario.advanced_config:
+            try:
+                failure_config['advanced_config'] = json.loads(scenario.advanced_config)
+            except json.JSONDecodeError as e:
+                # 기본 고장 파라미터만 적용
+                logger.error(f"고급 고장 시나리오 적용 오류: {e}")
+
+        compiled.scenario_id = scenario.id
+        compiled.failure_config = failure_config
+        compiled.applied_at = scenario.applied_at
+
+    return compiled
+
+
+def sync_clock(compiled: CompiledSimulator) -> None:
+    """저장된 시계 상태를 이 프로세스의 시계 저장소에 반영 (다른 워커/인스턴스에서 바꾼 설정 포함)"""
+    try:
+        clock_registry.sync(compiled.simulator_id, compiled.clock_config)
+    except (KeyError, TypeError, ValueError) as e:
+        logger.error(f"시뮬레이션 시계 상태 반영 실패: simulator_id={compiled.simulator_id}: {e}")
+
+
+class SimulatorRow(NamedTuple):
+    """컴파일에 필요한 시뮬레이터 컬럼 (ORM 객체 생성 없이 읽는 행)"""
+    id: int
+    user_id: int
+    name: str
+    is_active: bool
+    mode: Optional[str]
+    parameters: str
+    parameter_config: Optional[str]
+    replay_config: Optional[str]
+    fleet_config: Optional[str]
+    clock_config: Optional[str]
+
+
+class ScenarioRow(NamedTuple):
+    """컴파일에 필요한 적용된 고장 시나리오 컬럼"""
+    id: int
+    failure_parameters: str
+    advanced_config: Optional[str]
+    applied_at: Optional[datetime]
+
+
+CompileRow = Tuple[SimulatorRow, str, Optional[ScenarioRow]]
+
+
+def load_simulator_rows(db: Session, user_id: Optional[int] = None) -> List[CompileRow]:
+    """모든(또는 특정 사용자의) 시뮬레이터와 적용된 시나리오를 한 번의 쿼리로 읽어
+    (시뮬레이터, 사용자 ID 문자열, 시나리오) 튜플 목록으로 반환 (시뮬레이터당 한 행)"""
+    simulator_columns = [getattr(Simulator, name) for name in SimulatorRow._fields]
+    scenario_columns = [getattr(FailureScenario, name) for name in ScenarioRow._fields]
+    stmt = (
+        select(*simulator_columns, User.user_id, *scenario_columns)
+        .join(User, User.id == Simulator.user_id)
+        .outerjoin(
+            FailureScenario,
+            and_(
+                FailureScenario.simulator_id == Simulator.id,
+                FailureScenario.is_applied == True
+            )
+        )
+    )
+    if user_id is not None:
+        stmt = stmt.where(Simulator.user_id == user_id)
+
+    width = len(simulator_columns)
+    rows: Dict[int, CompileRow] = {}
+    for row in db.execute(stmt):
+        if row[0] in rows:
+            continue
+        scenario = ScenarioRow(*row[width + 1:]) if row[width + 1] is not None else None
+        rows[row[0]] = (SimulatorRow(*row[:width]), row[width], scenario)
+    return list(rows.values())
+
+
+def compile_rows(rows: List[CompileRow]) -> List[CompiledSimulator]:
+    """load_simulator_rows 결과를 컴파일 (DB 세션 불필요)
+
+    파라미터가 손상된 시뮬레이터는 로그만 남기고 건너뜁니다.
+    """
+    compiled = []
+    for simulator, user_key, scenario in rows:
+        try:
+            compiled.append(compile_simulator(simulator, user_key, scenario))
+        except ValueError as e:
+            logger.error(f"시뮬레이터 컴파일 실패: simulator_id={simulator.id}: {e}")
+    return compiled
+
+
+def load_compiled_simulators(
+    db: Session,
+    user_id: Optional[int] = None
+) -> List[CompiledSimulator]:
+    """모든(또는 특정 사용자의) 시뮬레이터와 적용된 시나리오를 한 번의 쿼리로 로드
+
+    파라미터가 손상된 시뮬레이터는 로그만 남기고 건너뜁니다.
+    """
+    return compile_rows(load_simulator_rows(db, user_id))
+
+
+def generate_random_values(parameters: Dict[str, Any], parameter_config: Dict[str, Any]) -> Dict[str, Any]:
+    """파라미터 설정에 따라 랜덤 값을 생성 (모든 랜덤 값은 소수점 2자리 실수)"""
+    result = parameters.copy()
+
+    for param_name, config in parameter_config.items():
+        if param_name in result and config.get('is_random', False):
+            min_val = config.get('min')
+            max_val = config.get('max')
+
+            # 모든 랜덤 값을 실수로 반환
+            if min_val is not None and max_val is not None:
+                result[param_name] = round(random.uniform(min_val, max_val), 2)
+            # string 타입은 향후 확장 가능
+
+    return result
+
+
+def generate_random_columns(
+    parameters: Dict[str, Any],
+    parameter_config: Dict[str, Any],
+    size: int,
+    rng: Optional["np.random.Generator"] = None
+) -> Dict[str, "np.ndarray"]:
+    """generate_random_values의 배치 버전 - 파라미터별 길이 size의 배열 생성"""
+    import numpy as np
+
+    if rng is None:
+        rng = np.random.default_rng()
+
+    columns = {}
+    for param_name, value in parameters.items():
+        config = parameter_config.get(param_name) or {}
+        min_val = config.get('min')
+        max_val = config.get('max')
+
+        if config.get('is_random', False) and min_val is not None and max_val is not None:
+            columns[param_name] = np.round(rng.uniform(min_val, max_val, size), 2)
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            columns[param_name] = np.full(size, value)
+        else:
+            column = np.empty(size, dtype=object)
+            column.fill(value)
+            columns[param_name] = column
+
+    return columns
+
+
+def inactive_response() -> Dict[str, Any]:
+    """비활성화 상태 응답 - 메시지만 반환"""
+    return {
+        "type": "inactive",
+        "data": {"message": INACTIVE_MESSAGE}
+    }
+
+
+def evaluate_compiled(compiled: CompiledSimulator) -> Dict[str, Any]:
+    """컴파일된 시뮬레이터 하나의 현재 응답 생성"""
+    if not compiled.is_active:
+        return inactive_response()
+
+    result_parameters = generate_random_values(compiled.parameters, compiled.parameter_config)
+
+    if compiled.replay_config is not None:
+        result_parameters.update(replay_values(compiled))
+
+    if compiled.failure_config is not None:
+        result_parameters = _apply_scenario(compiled, result_parameters)
+
+    return {
+        "type": "active",
+        "data": result_parameters
+    }
+
+
+def replay_values(compiled: CompiledSimulator) -> Dict[str, Any]:
+    """재생 시뮬레이터의 이번 행 값 (데이터셋을 열 수 없으면 파라미터 값 그대로 사용)"""
+    from .replay_store import replay_registry
+
+    try:
+        return replay_registry.current_values(compiled.simulator_id, compiled.replay_config)
+    except (OSError, ValueError, KeyError) as e:
+        logger.error(f"재생 데이터 조회 오류: simulator_id={compiled.simulator_id}: {e}")
+        return {}
+
+
+def _apply_scenario(compiled: CompiledSimulator, result_parameters: Dict[str, Any]) -> Dict[str, Any]:
+    """적용된 고장 시나리오로 파라미터 값 덮어쓰기"""
+    failure_config = compiled.failure_config
+    failure_params = failure_config['failure_parameters']
+
+    # 고급 설정이 있는 경우 NumPy 엔진 사용
+    if 'advanced_config' not in failure_config:
+        result_parameters.update(failure_params)
+        return result_parameters
+
+    try:
+        from .failure_engine import FailureEngine
+
+        # 시간 기반 패턴은 시나리오 적용 시점부터 시뮬레이터 시계 기준으로 계산
+        clock = clock_registry.get(compiled.simulator_id)
+        engine = FailureEngine(
+            clock=clock,
+            start_time=compiled.applied_at or clock.now(),
+            state_key=compiled.simulator_id
+        )
+        result_parameters = engine.apply_failure_scenario(result_parameters, failure_config)
+        logger.info(f"NumPy 엔진으로 고급 고장 시나리오 적용: scenario_id={compiled.scenario_id}")
+    except Exception as e:
+        logger.error(f"고급 고장 시나리오 적용 오류: {e}")
+        # 기본 고장 파라미터만 적용
+        result_parameters.update(failure_params)
+
+    return result_parameters
+
+
+def evaluate_batch(
+    simulators: List[CompiledSimulator],
+    rng: Optional["np.random.Generator"] = None
+) -> Dict[int, Dict[str, Any]]:
+    """
+    여러 시뮬레이터의 현재 응답을 한 번에 생성
+
+    파라미터 구성이 같은 시뮬레이터끼리 묶어 (시뮬레이터 수 × 랜덤 파라미터 수)
+    행렬로 랜덤 값을 한 번에 뽑고, 같은 고장 시나리오가 적용된 시뮬레이터들은
+    FailureEngine.apply_failure_scenario_batch로 함께 변환합니다.
+
+    Returns:
+        시뮬레이터 ID → {"type": ..., "data": ...}
+    """
+    import numpy as np
+
+    if rng is None:
+        rng = np.random.default_rng()
+
+    results: Dict[int, Dict[str, Any]] = {}
+    groups: Dict[Any, List[CompiledSimulator]] = defaultdict(list)
+
+    for compiled in simulators:
+        if not compiled.is_active:
+            results[compiled.simulator_id] = inactive_response()
+        else:
+            groups[compiled.structure_key].append(compiled)
+
+    for (_, random_names), group in groups.items():
+        rows = [dict(compiled.parameters) for compiled in group]
+
+        if random_names:
+            bounds = np.array(
+                [[compiled.random_ranges[name] for name in random_names] for compiled in group],
+                dtype=float
+            )
+            low, high = bounds[..., 0], bounds[..., 1]
+            drawn = np.round(low + (high - low) * rng.random(low.shape), 2).tolist()
+            for row, values in zip(rows, drawn):
+                row.update(zip(random_names, values))
+
+        for compiled, row in zip(group, rows):
+            if compiled.replay_config is not None:
+                row.update(replay_values(compiled))
+
+        _apply_scenarios_batch(group, rows, rng)
+
+        for compiled, row in zip(group, rows):
+            results[compiled.simulator_id] = {"type": "active", "data": row}
+
+    return results
+
+
+@dataclass
+class FleetFrame:
+    """플릿 템플릿 한 번의 평가 결과 - 파라미터별 길이 N(인스턴스 수) 배열"""
+    columns: Dict[str, "np.ndarray"]
+    active: "np.ndarray"
+
+    def instance(self, index: int) -> Dict[str, Any]:
+        """인스턴스 하나의 응답 ({"type": ..., "data": ...})"""
+        if not self.active[index]:
+            return inactive_response()
+        return {
+            "type": "active",
+            "data": {name: _scalar(column[index]) for name, column in self.columns.items()}
+        }
+
+
+def evaluate_fleet(
+    compiled: CompiledSimulator,
+    rng: Optional["np.random.Generator"] = None
+) -> FleetFrame:
+    """
+    플릿 템플릿의 모든 인스턴스 값을 한 번에 생성
+
+    템플릿 값으로 채운 파라미터별 배열에 인스턴스 변경분을 덮어쓰고, 랜덤 파라미터는
+    (인스턴스 수 × 랜덤 파라미터 수) 범위 행렬로 한 번에 뽑습니다. 인스턴스의 parameters 변경분은
+    고정 값이 되고(같은 인스턴스의 parameter_config 변경분이 랜덤이면 랜덤 우선),
+    적용된 고장 시나리오는 모든 인스턴스에 FailureEngine.apply_failure_scenario_batch로 적용됩니다.
+    """
+    import numpy as np
+
+    if rng is None:
+        rng = np.random.default_rng()
+
+    size = compiled.fleet_config["instance_count"]
+    active = np.full(size, compiled.is_active)
+    columns = {name: _full_column(value, size) for name, value in compiled.parameters.items()}
+
+    overrides = {
+        int(index): override
+        for index, override in (compiled.fleet_config.get("overrides") or {}).items()
+        if 0 <= int(index) < size
+    }
+
+    # 템플릿 또는 변경분에서 랜덤인 파라미터 → 범위 행렬의 열 (랜덤이 아닌 칸은 NaN)
+    random_names = list(compiled.random_ranges)
+    for override in overrides.values():
+        random_names += [
+            name for name in (override.get("parameter_config") or {})
+            if name in columns and name not in random_names
+        ]
+    position = {name: j for j, name in enumerate(random_names)}
+    low = np.full((size, len(random_names)), np.nan)
+    high = np.full((size, len(random_names)), np.nan)
+    for name, (min_val, max_val) in compiled.random_ranges.items():
+        low[:, position[name]] = min_val
+        high[:, position[name]] = max_val
+
+    for index, override in overrides.items():
+        if override.get("is_active") is not None:
+            active[index] = compiled.is_active and override["is_active"]
+        for name, value in (override.get("parameters") or {}).items():
+            if name in columns:
+                columns[name] = _set_value(columns[name], index, value)
+                if name in position:
+                    low[index, position[name]] = high[index, position[name]] = np.nan
+        for name, config in (override.get("parameter_config") or {}).items():
+            if name not in position:
+                continue
+            min_val, max_val = config.get('min'), config.get('max')
+            if config.get('is_random', False) and min_val is not None and max_val is not None:
+                low[index, position[name]], high[index, position[name]] = min_val, max_val
+            else:
+                low[index, position[name]] = high[index, position[name]] = np.nan
+
+    if random_names:
+        drawn = np.round(low + (high - low) * rng.random(low.shape), 2)
+        for name, j in position.items():
+            mask = ~np.isnan(drawn[:, j])
+            if mask.all():
+                columns[name] = drawn[:, j]
+            elif mask.any():
+                column = columns[name]
+                column = column.astype(float if column.dtype.kind in "iuf" else object)
+                column[mask] = drawn[mask, j]
+                columns[name] = column
+
+    if compiled.failure_config is not None:
+        columns = _apply_scenario_fleet(compiled, columns, size, rng)
+
+    return FleetFrame(columns=columns, active=active)
+
+
+def _apply_scenario_fleet(
+    compiled: CompiledSimulator,
+    columns: Dict[str, "np.ndarray"],
+    size: int,
+    rng: "np.random.Generator"
+) -> Dict[str, "np.ndarray"]:
+    """플릿 전체에 고장 시나리오 적용 (모든 인스턴스가 템플릿의 시계를 공유)"""
+    import numpy as np
+
+    from .failure_engine import FailureEngine
+
+    failure_config = compiled.failure_config
+    if 'advanced_config' not in failure_config:
+        columns.update({
+            name: _full_column(value, size)
+            for name, value in failure_config['failure_parameters'].items()
+        })
+        return columns
+
+    try:
+        engine = FailureEngine()
+        engine.rng = rng
+        elapsed = np.full(size, scenario_elapsed_seconds(compiled))
+        # 마르코프 상태는 인스턴스마다 따로 진행
+        row_keys = [(compiled.simulator_id, i) for i in range(size)]
+        applied, _ = engine.apply_failure_scenario_batch(columns, failure_config, elapsed, row_keys)
+        return applied
+    except Exception as e:
+        logger.error(f"플릿 고장 시나리오 적용 오류: {e}")
+        columns.update({
+            name: _full_column(value, size)
+            for name, value in failure_config['failure_parameters'].items()
+        })
+        return columns
+
+
+def _apply_scenarios_batch(
+    group: List[CompiledSimulator],
+    rows: List[Dict[str, Any]],
+    rng: "np.random.Generator"
+) -> None:
+    """같은 구조의 시뮬레이터 행들에 고장 시나리오를 시나리오 단위로 일괄 적용"""
+    import numpy as np
+
+    from .failure_engine import FailureEngine
+
+    by_scenario: Dict[int, List[int]] = defaultdict(list)
+
+    for i, compiled in enumerate(group):
+        if compiled.failure_config is None:
+            continue
+        if 'advanced_config' in compiled.failure_config:
+            by_scenario[compiled.scenario_id].append(i)
+        else:
+            rows[i].update(compiled.failure_config['failure_parameters'])
+
+    for indices in by_scenario.values():
+        failure_config = group[indices[0]].failure_config
+        try:
+            elapsed = np.array([
+                scenario_elapsed_seconds(group[i]) for i in indices
+            ], dtype=float)
+            columns = {
+                name: _column([rows[i][name] for i in indices])
+                for name in rows[indices[0]]
+            }
+
+            engine = FailureEngine()
+            engine.rng = rng
+            row_keys = [group[i].simulator_id for i in indices]
+            applied, _ = engine.apply_failure_scenario_batch(columns, failure_config, elapsed, row_keys)
+
+            for name, values in applied.items():
+                for i, value in zip(indices, values.tolist()):
+                    rows[i][name] = value
+        except Exception as e:
+            logger.error(f"고급 고장 시나리오 일괄 적용 오류: {e}")
+            for i in indices:
+                rows[i].update(failure_config['failure_parameters'])
+
+
+def scenario_elapsed_seconds(compiled: CompiledSimulator) -> float:
+    """시나리오 적용 시점부터 시뮬레이터 시계 기준 경과 시간(초)"""
+    return elapsed_since(compiled.simulator_id, compiled.applied_at)
+
+
+def elapsed_since(simulator_id: int, applied_at: Optional[datetime]) -> float:
+    """applied_at부터 시뮬레이터 시계 기준 경과 시간(초) (applied_at이 없으면 0)"""
+    now = clock_registry.get(simulator_id).now()
+    return (now - (applied_at or now)).total_seconds()
+
+
+def _full_column(value: Any, size: int) -> "np.ndarray":
+    """스칼라 값을 길이 size의 상수 배열로 변환 - 숫자는 숫자 배열, 그 외는 object 배열"""
+    import numpy as np
+
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return np.full(size, value)
+    column = np.empty(size, dtype=object)
+    column.fill(value)
+    return column
+
+
+def _set_value(column: "np.ndarray", index: int, value: Any) -> "np.ndarray":
+    """배열의 한 칸을 바꿈 - 값이 배열 타입에 맞지 않으면 float/object 배열로 바꾼 사본에 기록"""
+    is_number = isinstance(value, (int, float)) and not isinstance(value, bool)
+    if column.dtype.kind in "iu" and not isinstance(value, int) and is_number:
+        column = column.astype(float)
+    elif column.dtype.kind in "iuf" and not is_number:
+        column = column.astype(object)
+    column[index] = value
+    return column
+
+
+def _scalar(value: Any) -> Any:
+    """NumPy 스칼라를 JSON 직렬화 가능한 파이썬 값으로 변환"""
+    return value.item() if hasattr(value, "item") else value
+
+
+def _column(values: List[Any]) -> "np.ndarray":
+    """값 리스트를 배열로 변환 - 숫자만 있으면 숫자 배열, 아니면 object 배열"""
+    import numpy as np
+
+    if all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in values):
+        return np.array(values)
+    column = np.empty(len(values), dtype=object)
+    for i, value in enumerate(values):
+        column[i] = value
+    return column
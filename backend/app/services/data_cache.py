@@ -0,0 +1,99 @@
+"""
+데이터 엔드포인트 마이크로캐시 - 같은 시뮬레이터에 대한 순간적인 동시 요청 병합
+
+수백 개의 클라이언트가 같은 /api/data/{user_id}/{simulator_name}을 수십 ms 안에 호출하면
+요청마다 DB 조회와 값 생성이 반복됩니다. 짧은 TTL(예: 100ms) 동안 결과를 재사용하고,
+캐시 미스가 동시에 발생하면 진행 중인 계산 하나를 함께 기다립니다(single-flight).
+
+시뮬레이터/시나리오가 변경되면 무효화 버스(cache_invalidation)를 통해 캐시를 비우므로
+다른 인스턴스에서 수정한 내용도 TTL을 기다리지 않고 반영됩니다.
+TTL이 0이면(기본값) 캐시를 사용하지 않고 요청마다 새 랜덤 값을 생성합니다.
+
+환경 변수:
+    DATA_MICROCACHE_TTL_MS: 캐시 유지 시간 (기본값: 0 = 비활성화)
+    DATA_MICROCACHE_MAX_ENTRIES: 최대 캐시 항목 수 (기본값: 10000)
+"""
+import asyncio
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+from .cache_invalidation import invalidation_bus
+
+
+class MicroCache:
+    """TTL + single-flight 비동기 캐시 (이벤트 루프 단위)"""
+
+    def __init__(self, ttl_seconds: float = 0.0, max_entries: int = 10000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    @classmethod
+    def from_env(cls) -> "MicroCache":
+        return cls(
+            ttl_seconds=int(os.getenv("DATA_MICROCACHE_TTL_MS", "0")) / 1000,
+            max_entries=int(os.getenv("DATA_MICROCACHE_MAX_ENTRIES", "10000"))
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    async def get_or_compute(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        캐시된 값을 반환하거나, 없으면 compute()로 계산
+
+        같은 키의 계산이 진행 중이면 새로 계산하지 않고 그 결과를 함께 기다립니다.
+        계산은 요청과 분리된 태스크에서 실행되므로 처음 요청한 클라이언트가 연결을 끊어도
+        (요청이 취소되어도) 나머지 대기자는 결과를 받습니다.
+        계산 중 발생한 예외는 대기 중인 모든 요청에 전달되며 캐시되지 않습니다.
+        """
+        if not self.enabled:
+            return await compute()
+
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._compute(key, compute))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(task)
+
+    async def _compute(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Any:
+        value = await compute()
+        self._store(key, value)
+        return value
+
+    def _finish(self, key: Hashable, task: "asyncio.Future") -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # 모든 대기자가 취소되어 결과를 가져가지 않아도 'exception was never retrieved' 경고 방지
+            task.exception()
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        now = time.monotonic()
+        if len(self._entries) >= self.max_entries:
+            # 만료된 항목 정리 후에도 가득 차 있으면 전부 비움
+            self._entries = {k: v for k, v in self._entries.items() if v[0] > now}
+            if len(self._entries) >= self.max_entries:
+                self._entries.clear()
+        self._entries[key] = (now + self.ttl_seconds, value)
+
+    def invalidate(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+# 프로세스 전역 /api/data 마이크로캐시
+data_microcache = MicroCache.from_env()
+
+# 캐시 키가 (user_id, simulator_name)이라 ID로 항목을 찾을 수 없으므로 변경 시 전체를 비움
+invalidation_bus.subscribe(lambda simulator_ids: data_microcache.clear())
@@ -0,0 +1,167 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, select
+from typing import List, Optional, Tuple
+import json
+
+from ..models.failure_cascade import FailureCascade
+from ..models.simulator import Simulator
+from ..models.user import User
+from .cache_invalidation import invalidation_bus
+from .cascade_plan import load_cascade_plan, topological_levels
+from ..schemas.failure_cascade import (
+    FailureCascadeCreate,
+    FailureCascadeUpdate,
+)
+
+
+class FailureCascadeService:
+    """고장 전파 간선 관련 비즈니스 로직"""
+
+    @staticmethod
+    def create_cascade(
+        db: Session,
+        cascade_data: FailureCascadeCreate,
+        user_id: int
+    ) -> FailureCascade:
+        """새로운 고장 전파 간선 생성 (순환을 만들면 ValueError)"""
+        FailureCascadeService._check_simulators(
+            db, user_id, cascade_data.source_simulator_id,
+            cascade_data.target_simulator_id, cascade_data.target_parameter
+        )
+
+        if cascade_data.is_active:
+            FailureCascadeService._check_acyclic(
+                db, user_id, (cascade_data.source_simulator_id, cascade_data.target_simulator_id)
+            )
+
+        new_cascade = FailureCascade(user_id=user_id, **cascade_data.model_dump())
+
+        db.add(new_cascade)
+        db.flush()
+        invalidation_bus.notify(db, [new_cascade.target_simulator_id])
+        db.commit()
+        db.refresh(new_cascade)
+        return new_cascade
+
+    @staticmethod
+    def get_cascade(db: Session, cascade_id: int, user_id: int) -> Optional[FailureCascade]:
+        """고장 전파 간선 조회"""
+        stmt = select(FailureCascade).where(
+            and_(
+                FailureCascade.id == cascade_id,
+                FailureCascade.user_id == user_id
+            )
+        )
+        return db.scalar(stmt)
+
+    @staticmethod
+    def get_cascades_by_user(
+        db: Session,
+        user_id: int,
+        simulator_id: Optional[int] = None
+    ) -> List[FailureCascade]:
+        """사용자의 고장 전파 간선 목록 (simulator_id를 주면 그 시뮬레이터에 연결된 간선만)"""
+        stmt = select(FailureCascade).where(FailureCascade.user_id == user_id)
+        if simulator_id is not None:
+            stmt = stmt.where(
+                (FailureCascade.source_simulator_id == simulator_id)
+                | (FailureCascade.target_simulator_id == simulator_id)
+            )
+        return list(db.scalars(stmt.order_by(FailureCascade.id)).all())
+
+    @staticmethod
+    def update_cascade(
+        db: Session,
+        cascade_id: int,
+        cascade_data: FailureCascadeUpdate,
+        user_id: int
+    ) -> Optional[FailureCascade]:
+        """고장 전파 간선 업데이트 (다시 활성화할 때도 순환 여부 확인)"""
+        cascade = FailureCascadeService.get_cascade(db, cascade_id, user_id)
+        if not cascade:
+            return None
+
+        update_data = cascade_data.model_dump(exclude_unset=True, exclude_none=True)
+
+        if "target_parameter" in update_data:
+            FailureCascadeService._check_simulators(
+                db, user_id, cascade.source_simulator_id,
+                cascade.target_simulator_id, update_data["target_parameter"]
+            )
+
+        if update_data.get("is_active") and not cascade.is_active:
+            FailureCascadeService._check_acyclic(
+                db, user_id, (cascade.source_simulator_id, cascade.target_simulator_id)
+            )
+
+        for field, value in update_data.items():
+            setattr(cascade, field, value)
+
+        invalidation_bus.notify(db, [cascade.target_simulator_id])
+        db.commit()
+        db.refresh(cascade)
+        return cascade
+
+    @staticmethod
+    def delete_cascade(db: Session, cascade_id: int, user_id: int) -> bool:
+        """고장 전파 간선 삭제"""
+        cascade = FailureCascadeService.get_cascade(db, cascade_id, user_id)
+        if not cascade:
+            return False
+
+        db.delete(cascade)
+        invalidation_bus.notify(db, [cascade.target_simulator_id])
+        db.commit()
+        return True
+
+    @staticmethod
+    def get_plan_levels(db: Session, user_id: int) -> Tuple[List[List[int]], int]:
+        """사용자의 활성 간선으로 만든 전파 계획의 위상 단계와 간선 수"""
+        plan = load_cascade_plan(db, user_id=user_id)
+        return plan.levels, len(plan.edges)
+
+    @staticmethod
+    def _check_simulators(
+        db: Session,
+        user_id: int,
+        source_simulator_id: int,
+        target_simulator_id: int,
+        target_parameter: str
+    ) -> None:
+        """두 시뮬레이터의 소유권과 대상 파라미터 존재 여부 확인"""
+        stmt = select(Simulator.id, Simulator.parameters).where(
+            and_(
+                Simulator.id.in_([source_simulator_id, target_simulator_id]),
+                Simulator.user_id == user_id
+            )
+        )
+        parameters = {simulator_id: raw for simulator_id, raw in db.execute(stmt)}
+
+        if source_simulator_id not in parameters or target_simulator_id not in parameters:
+            raise ValueError("해당 시뮬레이터에 대한 권한이 없습니다.")
+
+        try:
+            target_parameters = json.loads(parameters[target_simulator_id])
+        except json.JSONDecodeError:
+            target_parameters = {}
+        if target_parameter not in target_parameters:
+            raise ValueError(f"대상 시뮬레이터에 '{target_parameter}' 파라미터가 없습니다.")
+
+    @staticmethod
+    def _check_acyclic(db: Session, user_id: int, new_edge: Tuple[int, int]) -> None:
+        """
+        기존 활성 간선에 새 간선을 더해도 순환이 없는지 확인 (순환이면 ValueError)
+
+        같은 사용자의 동시 요청이 서로의 간선을 보지 못한 채 각각 통과하지 않도록
+        사용자 행을 SELECT ... FOR UPDATE로 잠가 커밋까지 직렬화합니다
+        (SQLite처럼 행 잠금이 없는 DB에서는 무시됨).
+        """
+        db.execute(select(User.id).where(User.id == user_id).with_for_update())
+        stmt = select(FailureCascade.source_simulator_id, FailureCascade.target_simulator_id).where(
+            and_(
+                FailureCascade.user_id == user_id,
+                FailureCascade.is_active == True
+            )
+        )
+        edges = [tuple(row) for row in db.execute(stmt)]
+        topological_levels(edges + [new_edge])
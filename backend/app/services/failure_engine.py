@@ -1,14 +1,31 @@
 """
 NumPy 기반 고장 시나리오 엔진
 확률적 고장 발생, 시간 기반 패턴, 노이즈 생성 등의 고급 시뮬레이션 기능 제공
+
+마르코프(markov) 고장 유형은 상태를 가지는 유일한 유형입니다. 장비마다 건강 상태
+(기본: normal → degraded → failing → failed → repaired)를 전이율 행렬 Q(초당)에 따라 옮기고
+상태별 값 변환(scale/offset/value)을 적용합니다. 경과 시간 dt의 전이 확률은 expm(Q·dt)의
+누적 확률표로 만들어 두고, 모든 장비의 다음 상태를 난수 한 번과 표 비교로 한꺼번에 뽑습니다.
+장비별 현재 상태는 MarkovStateStore(기본: 프로세스 전역 markov_states)에 키별로 보관되며,
+키가 없으면(파일 변환 등) 시나리오 시작 시점의 초기 상태에서 경과 시간만큼 진행한 분포로 뽑습니다.
 """
 
 import numpy as np
-from typing import Dict, Any, Optional, List, Tuple
+from bisect import bisect_left
+from itertools import repeat
+from functools import lru_cache
+from typing import Dict, Any, Hashable, Optional, List, Sequence, Tuple
 from datetime import datetime, timedelta
 import json
 import logging
 from enum import Enum
+from typing import TYPE_CHECKING
+
+from ..utils.covariance import cholesky_factor, covariance_from_correlation
+from .noise_process import COLORED_NOISE_TYPES, NoiseBufferStore, noise_buffers, noise_process, sequence
+
+if TYPE_CHECKING:
+    from .simulation_clock import SimulationClock
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +38,7 @@ class FailureType(Enum):
     CYCLIC = "cyclic"          # 주기적 고장
     RANDOM_WALK = "random_walk"  # 랜덤 워크
     DRIFT = "drift"            # 드리프트 (점진적 이탈)
+    MARKOV = "markov"          # 마르코프 건강 상태 전이 (상태 유지)
 
 
 class NoiseType(Enum):
@@ -29,21 +47,112 @@ class NoiseType(Enum):
     UNIFORM = "uniform"        # 균일 분포 노이즈
     EXPONENTIAL = "exponential"  # 지수 분포 노이즈
     POISSON = "poisson"        # 포아송 분포 노이즈
+    PINK = "pink"              # 1/f 핑크 노이즈 (키별 상태 유지)
+    BROWN = "brown"            # 브라운 노이즈 (키별 상태 유지)
+    ARMA = "arma"              # AR(p)/ARMA 과정 (키별 상태 유지)
+
+
+# 마르코프 고장 유형 기본값 - 상태 목록, 전이율(초당), 상태별 값 변환
+DEFAULT_MARKOV_STATES = ["normal", "degraded", "failing", "failed", "repaired"]
+DEFAULT_MARKOV_RATES = {
+    "normal": {"degraded": 1 / 600},
+    "degraded": {"failing": 1 / 300, "normal": 1 / 1200},
+    "failing": {"failed": 1 / 120},
+    "failed": {"repaired": 1 / 300},
+    "repaired": {"normal": 1 / 60}
+}
+DEFAULT_MARKOV_TRANSFORMS = {
+    "degraded": {"scale": 0.9},
+    "failing": {"scale": 0.6},
+    "failed": {"value": 0}
+}
+
+# 전이 확률 누적표 캐시 (생성 행렬, dt) 최대 항목 수
+MARKOV_TABLE_CACHE_SIZE = 1024
+
+
+class MarkovStateStore:
+    """
+    마르코프 고장 유형의 장비별 현재 상태 (키 → (상태 번호, 마지막 경과 시간, 저장 회차))
+
+    max_entries를 넘으면 가장 오래 저장하지 않은 키부터 max_entries의 90%까지 버리되,
+    방금 저장한 키들은 max_entries 안에 들어가는 한 남깁니다.
+    """
+
+    def __init__(self, max_entries: int = 1_000_000):
+        self.max_entries = max_entries
+        self._states: Dict[Hashable, Tuple[int, float, int]] = {}
+        self._saves = 0
+
+    def load(self, keys: Sequence[Hashable]) -> Tuple[np.ndarray, np.ndarray]:
+        """키별 (상태 번호, 마지막 경과 시간) 배열 - 상태가 없으면 -1"""
+        missing = (-1, 0.0, 0)
+        entries = [self._states.get(key, missing) for key in keys]
+        states = np.fromiter((entry[0] for entry in entries), dtype=np.int64, count=len(entries))
+        elapsed = np.fromiter((entry[1] for entry in entries), dtype=float, count=len(entries))
+        return states, elapsed
+
+    def save(self, keys: Sequence[Hashable], states: np.ndarray, elapsed: np.ndarray) -> None:
+        self._saves += 1
+        self._states.update(zip(keys, zip(states.tolist(), elapsed.tolist(), repeat(self._saves))))
+        if len(self._states) > self.max_entries:
+            # 삭제된 시뮬레이터 등 오래 저장하지 않은 키부터 버림 (다음 평가에서 초기 상태로 시작)
+            keep = max(self.max_entries - self.max_entries // 10, min(len(keys), self.max_entries))
+            by_age = sorted(self._states.items(), key=lambda item: item[1][2])
+            for key, _ in by_age[:len(by_age) - keep]:
+                del self._states[key]
+
+    def clear(self) -> None:
+        self._states.clear()
+
+
+# 프로세스 전역 마르코프 상태 (요청/틱 평가가 공유)
+markov_states = MarkovStateStore()
 
 
 class FailureEngine:
     """NumPy 기반 고장 시나리오 엔진"""
     
-    def __init__(self, seed: Optional[int] = None):
+    def __init__(
+        self,
+        seed: Optional[int] = None,
+        clock: Optional["SimulationClock"] = None,
+        start_time: Optional[datetime] = None,
+        state_key: Optional[Hashable] = None,
+        state_store: Optional[MarkovStateStore] = None,
+        noise_store: Optional[NoiseBufferStore] = None
+    ):
         """
         Args:
             seed: 랜덤 시드 (재현 가능한 결과를 위해)
+            clock: 현재 시각을 제공하는 시뮬레이션 시계 (없으면 실제 시간)
+            start_time: 시간 기반 패턴의 기준 시각 (없으면 현재 시각)
+            state_key: 단건 적용(apply_failure_scenario)에서 마르코프 상태를 보관할 장비 키 (예: 시뮬레이터 ID)
+            state_store: 마르코프 상태 저장소 (없으면 프로세스 전역 markov_states)
+            noise_store: 유색 노이즈 버퍼 (없으면 프로세스 전역 noise_buffers)
         """
         if seed is not None:
             np.random.seed(seed)
         
+        # 배치(벡터화) 경로에서 사용하는 독립 난수 생성기
+        self.rng = np.random.default_rng(seed)
+        
         self.failure_history = []
-        self.start_time = datetime.now()
+        self.clock = clock
+        self.start_time = start_time if start_time is not None else self.now()
+        self.state_key = state_key
+        self.state_store = state_store if state_store is not None else markov_states
+        self.noise_store = noise_store if noise_store is not None else noise_buffers
+        # 키 없이 적용할 때 파라미터별 유색 노이즈 필터 상태 (같은 엔진의 호출끼리 이어짐)
+        self._noise_sequences: Dict[str, Tuple[Any, np.ndarray]] = {}
+        # 키 없이 적용할 때 (파라미터, 상태, 생성 행렬)별 마르코프 (상태 번호, 마지막 경과 시간)
+        self._markov_sequences: Dict[Tuple[Any, ...], Tuple[int, float]] = {}
+    
+    def now(self) -> datetime:
+        """현재 시각 - 시계가 주입되어 있으면 가상 시각"""
+        if self.clock is not None:
+            return self.clock.now()
+        return datetime.now()
     
     def apply_failure_scenario(
         self,
@@ -57,13 +166,13 @@ class FailureEngine:
         Args:
             original_params: 원본 파라미터 값들
             failure_config: 고장 시나리오 설정
-            current_time: 현재 시간 (시간 기반 패턴용)
+            current_time: 현재 시간 (시간 기반 패턴용, 없으면 시계의 현재 시각)
             
         Returns:
             고장이 적용된 파라미터 값들
         """
         if current_time is None:
-            current_time = datetime.now()
+            current_time = self.now()
         
         result = original_params.copy()
         
@@ -102,8 +211,21 @@ class FailureEngine:
             
             original_value = result[param_name]
             
+            # 마르코프 유형은 장비 키별 상태를 이어서 진행
+            if param_config.get('failure_type') == FailureType.MARKOV.value:
+                values, labels = self._apply_markov_batch(
+                    _full_column(original_value, 1),
+                    param_config,
+                    np.array([(current_time - self.start_time).total_seconds()]),
+                    None if self.state_key is None else [(self.state_key, param_name)],
+                    param_name
+                )
+                result[param_name] = values.tolist()[0]
+                if param_config.get('state_parameter'):
+                    result[param_config['state_parameter']] = labels[0]
+            
             # 고장 유형별 처리
-            if 'failure_type' in param_config:
+            elif 'failure_type' in param_config:
                 result[param_name] = self._apply_failure_type(
                     original_value,
                     param_config['failure_type'],
@@ -111,8 +233,15 @@ class FailureEngine:
                     current_time
                 )
             
-            # 노이즈 추가
-            if 'noise' in param_config:
+            # 노이즈 추가 (유색 노이즈는 장비 키별 필터 상태를 이어서 진행)
+            if 'noise' in param_config and param_config['noise'].get('type') in COLORED_NOISE_TYPES:
+                result[param_name] = self._add_colored_noise_batch(
+                    _full_column(result[param_name], 1),
+                    param_config['noise'],
+                    param_name,
+                    None if self.state_key is None else [self.state_key]
+                ).tolist()[0]
+            elif 'noise' in param_config:
                 result[param_name] = self._add_noise(
                     result[param_name],
                     param_config['noise']
@@ -125,6 +254,16 @@ class FailureEngine:
                     param_config['clamp']
                 )
         
+        # 파라미터 간 상관 노이즈 (한 행짜리 배치로 계산)
+        if 'correlated_noise' in config:
+            names = [name for name in config['correlated_noise']['parameters'] if name in result]
+            columns = self._add_correlated_noise_batch(
+                {name: _full_column(result[name], 1) for name in names},
+                config,
+                np.ones(1, dtype=bool)
+            )
+            result.update({name: columns[name].tolist()[0] for name in names})
+        
         return result
     
     def _should_fail(self, probability: float) -> bool:
@@ -187,6 +326,14 @@ class FailureEngine:
             drift_rate = config.get('drift_rate', 0.1)  # per second
             return value * (1 + drift_rate * elapsed_time)
         
+        elif failure_type == FailureType.MARKOV:
+            # 마르코프: 장비 키가 없으므로 같은 엔진의 이전 호출에서 이어서 진행
+            elapsed_time = (current_time - self.start_time).total_seconds()
+            values, _ = self._apply_markov_batch(
+                _full_column(value, 1), config, np.array([elapsed_time]), None
+            )
+            return values.tolist()[0]
+        
         return value
     
     def _add_noise(self, value: Any, noise_config: Dict[str, Any]) -> Any:
@@ -234,6 +381,366 @@ class FailureEngine:
         
         return np.clip(value, min_val, max_val)
     
+    def apply_failure_scenario_batch(
+        self,
+        columns: Dict[str, np.ndarray],
+        failure_config: Dict[str, Any],
+        elapsed_seconds: np.ndarray,
+        row_keys: Optional[Sequence[Hashable]] = None
+    ) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+        """
+        고장 시나리오를 여러 샘플(행)에 한 번에 적용하는 벡터화 버전
+        
+        apply_failure_scenario와 같은 규칙을 따르되, 행마다 호출하는 대신
+        파라미터별 배열 전체에 NumPy 연산을 적용합니다.
+        
+        Args:
+            columns: 파라미터별 값 배열 (모든 배열의 길이가 같아야 함)
+            failure_config: 고장 시나리오 설정
+            elapsed_seconds: 행별 고장 시작 후 경과 시간(초) 배열
+            row_keys: 행별 장비 키 (마르코프 상태 유지용, 없으면 행마다 초기 상태에서 시작)
+            
+        Returns:
+            (고장이 적용된 컬럼들, 고장이 적용된 행 마스크)
+        """
+        elapsed_seconds = np.asarray(elapsed_seconds, dtype=float)
+        size = len(elapsed_seconds)
+        result = dict(columns)
+        
+        # 기본 고장 파라미터 적용 (상수 컬럼)
+        for param_name, value in failure_config.get('failure_parameters', {}).items():
+            result[param_name] = _full_column(value, size)
+        
+        active = np.ones(size, dtype=bool)
+        
+        # 고급 기능 적용
+        if failure_config.get('advanced_config'):
+            result, gate = self._apply_advanced_features_batch(
+                result,
+                failure_config['advanced_config'],
+                elapsed_seconds,
+                row_keys
+            )
+            # 기본 고장 파라미터는 확률과 무관하게 항상 적용됨
+            if not failure_config.get('failure_parameters'):
+                active = gate
+        
+        return result, active
+    
+    def _apply_advanced_features_batch(
+        self,
+        columns: Dict[str, np.ndarray],
+        config: Dict[str, Any],
+        elapsed_seconds: np.ndarray,
+        row_keys: Optional[Sequence[Hashable]] = None
+    ) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+        """고급 고장 기능 배치 적용"""
+        size = len(elapsed_seconds)
+        
+        # 확률적 고장 발생 (행마다 독립 시행)
+        if 'probability' in config:
+            active = self.rng.random(size) < config['probability']
+        else:
+            active = np.ones(size, dtype=bool)
+        
+        if not active.any():
+            return columns, active
+        
+        result = dict(columns)
+        
+        for param_name, param_config in config.get('parameters', {}).items():
+            if param_name not in result:
+                continue
+            
+            original = result[param_name]
+            values = original
+            
+            if param_config.get('failure_type') == FailureType.MARKOV.value:
+                values, labels = self._apply_markov_batch(
+                    values,
+                    param_config,
+                    elapsed_seconds,
+                    None if row_keys is None else [(key, param_name) for key in row_keys],
+                    param_name
+                )
+                if param_config.get('state_parameter'):
+                    result[param_config['state_parameter']] = labels
+            
+            elif 'failure_type' in param_config:
+                values = self._apply_failure_type_batch(
+                    values,
+                    param_config['failure_type'],
+                    param_config,
+                    elapsed_seconds
+                )
+            
+            if 'noise' in param_config and param_config['noise'].get('type') in COLORED_NOISE_TYPES:
+                values = self._add_colored_noise_batch(values, param_config['noise'], param_name, row_keys)
+            elif 'noise' in param_config:
+                values = self._add_noise_batch(values, param_config['noise'])
+            
+            if 'clamp' in param_config:
+                values = self._clamp_batch(values, param_config['clamp'])
+            
+            # 고장 미발생 행은 원본 값 유지
+            result[param_name] = _where(active, values, original)
+        
+        if 'correlated_noise' in config:
+            result = self._add_correlated_noise_batch(result, config, active)
+        
+        return result, active
+    
+    def _apply_failure_type_batch(
+        self,
+        values: np.ndarray,
+        failure_type: str,
+        config: Dict[str, Any],
+        elapsed_seconds: np.ndarray
+    ) -> np.ndarray:
+        """고장 유형별 값 변환 (배치)"""
+        size = len(values)
+        
+        # 숫자가 아닌 경우 고장 값 또는 원본 반환
+        if not _is_numeric(values):
+            if 'failure_value' in config:
+                return _full_column(config['failure_value'], size)
+            return values
+        
+        values = values.astype(float)
+        failure_type = FailureType(failure_type)
+        
+        if failure_type == FailureType.SUDDEN:
+            return _config_or(config, 'failure_value', values * 10, size)
+        
+        elif failure_type == FailureType.GRADUAL:
+            duration = config.get('duration_seconds', 60)
+            progress = np.minimum(elapsed_seconds / duration, 1.0)
+            target = _config_or(config, 'failure_value', values * 10, size)
+            return values + (target - values) * progress
+        
+        elif failure_type == FailureType.INTERMITTENT:
+            failure_prob = config.get('failure_probability', 0.3)
+            hit = self.rng.random(size) < failure_prob
+            target = _config_or(config, 'failure_value', values * 10, size)
+            return np.where(hit, target, values)
+        
+        elif failure_type == FailureType.CYCLIC:
+            period = config.get('period_seconds', 60)
+            amplitude = _config_or(config, 'amplitude', values * 0.5, size)
+            phase = 2 * np.pi * elapsed_seconds / period
+            return values + amplitude * np.sin(phase)
+        
+        elif failure_type == FailureType.RANDOM_WALK:
+            step_size = _config_or(config, 'step_size', values * 0.1, size)
+            return values + self.rng.standard_normal(size) * step_size
+        
+        elif failure_type == FailureType.DRIFT:
+            drift_rate = config.get('drift_rate', 0.1)
+            return values * (1 + drift_rate * elapsed_seconds)
+        
+        elif failure_type == FailureType.MARKOV:
+            return self._apply_markov_batch(values, config, elapsed_seconds, None)[0]
+        
+        return values
+    
+    def _apply_markov_batch(
+        self,
+        values: np.ndarray,
+        config: Dict[str, Any],
+        elapsed_seconds: np.ndarray,
+        state_keys: Optional[Sequence[Hashable]],
+        sequence_key: Optional[str] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        마르코프 건강 상태를 한 단계 진행하고 상태별 값 변환 적용 (배치)
+        
+        state_keys가 있으면 행마다 다른 장비이므로, 장비마다 마지막 평가 이후 경과 시간 dt가
+        다를 수 있어 dt(ms 단위 반올림)별로 누적 전이 확률표를 하나씩 만들어 같은 dt의 행들을
+        한 번에 뽑습니다. 저장된 상태가 없거나, 경과 시간이 줄었거나(시나리오 재적용 등),
+        상태 수가 바뀌었으면 초기 상태에서 다시 시작합니다.
+        
+        state_keys가 없으면 행을 한 장비의 시계열로 보고 상태를 행에서 행으로 이어갑니다
+        (_apply_markov_sequence, 같은 엔진의 다음 호출도 sequence_key별로 이어짐).
+        
+        Returns:
+            (변환된 값 배열, 상태 이름 배열)
+        """
+        states, generator, initial = _markov_model(config)
+        size = len(elapsed_seconds)
+        elapsed_seconds = np.asarray(elapsed_seconds, dtype=float)
+        
+        if state_keys is None:
+            following = self._apply_markov_sequence(states, generator, initial, elapsed_seconds, sequence_key)
+            labels = np.array(states, dtype=object)[following]
+            return _markov_transform(values, following, states, config), labels
+        
+        current, last = self.state_store.load(state_keys)
+        reset = (current < 0) | (current >= len(states)) | (elapsed_seconds < last)
+        current = np.where(reset, initial, current)
+        dt = np.where(reset, elapsed_seconds, elapsed_seconds - last)
+        
+        dt = np.round(np.maximum(dt, 0.0), 3)
+        steps, inverse = np.unique(dt, return_inverse=True)
+        draws = self.rng.random(size)
+        following = current.copy()
+        
+        # dt가 같은 행끼리 묶어 누적표 비교 한 번으로 다음 상태 결정
+        order = np.argsort(inverse, kind="stable")
+        for step, rows in zip(steps, np.split(order, np.cumsum(np.bincount(inverse))[:-1])):
+            if step <= 0:
+                continue
+            table = _cumulative_transition_table(generator, float(step))
+            following[rows] = (draws[rows, None] > table[current[rows]]).sum(axis=1)
+        following = np.minimum(following, len(states) - 1)
+        
+        self.state_store.save(state_keys, following, elapsed_seconds)
+        
+        labels = np.array(states, dtype=object)[following]
+        return _markov_transform(values, following, states, config), labels
+    
+    def _apply_markov_sequence(
+        self,
+        states: List[str],
+        generator: np.ndarray,
+        initial: int,
+        elapsed_seconds: np.ndarray,
+        sequence_key: Optional[str]
+    ) -> np.ndarray:
+        """
+        시계열 행의 마르코프 상태 - 직전 행의 상태에서 그 행의 dt만큼 전이
+        
+        전이는 순차적이므로 행마다 한 번씩 진행하되, dt별 누적표는 미리 만들고
+        다음 상태는 누적표에서 이진 탐색으로 찾습니다. 경과 시간이 줄어든 행에서는
+        초기 상태에서 다시 시작합니다.
+        """
+        if len(elapsed_seconds) == 0:
+            return np.empty(0, dtype=np.int64)
+        
+        # 같은 파라미터라도 설정이 다른 시나리오끼리 번갈아 호출될 수 있으므로 설정별로 보관
+        sequence = (sequence_key, tuple(states), generator.tobytes())
+        state, last = self._markov_sequences.get(sequence, (initial, 0.0))
+        
+        steps = np.empty(len(elapsed_seconds))
+        steps[0] = elapsed_seconds[0] - last
+        steps[1:] = np.diff(elapsed_seconds)
+        restart = steps < 0
+        steps = np.round(np.where(restart, elapsed_seconds, steps), 3)
+        unique_steps, inverse = np.unique(steps, return_inverse=True)
+        tables = [
+            _cumulative_transition_table(generator, float(step)).tolist() if step > 0 else None
+            for step in unique_steps
+        ]
+        
+        draws = self.rng.random(len(steps)).tolist()
+        following = np.empty(len(steps), dtype=np.int64)
+        last_state = len(states) - 1
+        for i, (table_index, draw, reset) in enumerate(zip(inverse.tolist(), draws, restart.tolist())):
+            if reset:
+                state = initial
+            table = tables[table_index]
+            if table is not None:
+                state = min(bisect_left(table[state], draw), last_state)
+            following[i] = state
+        
+        self._markov_sequences[sequence] = (state, float(elapsed_seconds[-1]))
+        return following
+    
+    def _add_noise_batch(self, values: np.ndarray, noise_config: Dict[str, Any]) -> np.ndarray:
+        """값 배열에 노이즈 추가 (배치)"""
+        if not _is_numeric(values):
+            return values
+        
+        values = values.astype(float)
+        noise_type = NoiseType(noise_config.get('type', 'gaussian'))
+        intensity = noise_config.get('intensity', 0.1)
+        scale = intensity * np.abs(values)
+        
+        if noise_type == NoiseType.GAUSSIAN:
+            return values + self.rng.normal(0, scale)
+        
+        elif noise_type == NoiseType.UNIFORM:
+            return values + self.rng.uniform(-scale, scale)
+        
+        elif noise_type == NoiseType.EXPONENTIAL:
+            return values + self.rng.exponential(scale)
+        
+        elif noise_type == NoiseType.POISSON:
+            positive = values > 0
+            return np.where(positive, self.rng.poisson(np.where(positive, values, 0)), values)
+        
+        return values
+    
+    def _add_colored_noise_batch(
+        self,
+        values: np.ndarray,
+        noise_config: Dict[str, Any],
+        param_name: str,
+        row_keys: Optional[Sequence[Hashable]]
+    ) -> np.ndarray:
+        """
+        유색 노이즈(pink/brown/arma) 추가 (배치)
+        
+        row_keys가 있으면 행마다 (키, 파라미터) 버퍼에서 다음 값을 꺼내고,
+        없으면 행을 시간 순서로 보고 하나의 연속된 과정으로 생성합니다.
+        """
+        if not _is_numeric(values):
+            return values
+        
+        process = noise_process(noise_config)
+        if row_keys is None:
+            previous = self._noise_sequences.get(param_name)
+            zi = previous[1] if previous is not None and previous[0] == process else None
+            samples, final = sequence(process, len(values), self.rng, zi)
+            self._noise_sequences[param_name] = (process, final)
+        else:
+            samples = self.noise_store.draw([(key, param_name) for key in row_keys], process, self.rng)
+        
+        values = values.astype(float)
+        intensity = noise_config.get('intensity', 0.1)
+        return values + intensity * np.abs(values) * samples
+    
+    def _add_correlated_noise_batch(
+        self,
+        columns: Dict[str, np.ndarray],
+        config: Dict[str, Any],
+        active: np.ndarray
+    ) -> Dict[str, np.ndarray]:
+        """
+        상관 가우시안 노이즈 추가 (배치)
+        
+        표준 정규 난수 행렬(행 수 × 파라미터 수)에 촐레스키 인자 Lᵀ를 한 번 곱해
+        모든 행의 상관 노이즈를 만들고, 숫자 파라미터에만 더한 뒤 clamp 설정을 다시 적용합니다.
+        """
+        noise_config = config['correlated_noise']
+        names = noise_config['parameters']
+        factor = _correlated_noise_factor(noise_config)
+        noise = self.rng.standard_normal((len(active), len(names))) @ factor.T
+        
+        result = dict(columns)
+        for j, name in enumerate(names):
+            original = result.get(name)
+            if original is None or not _is_numeric(original):
+                continue
+            values = original.astype(float)
+            scale = np.abs(values) if noise_config.get('relative') else 1.0
+            values = values + noise[:, j] * scale
+            clamp_config = config.get('parameters', {}).get(name, {}).get('clamp')
+            if clamp_config:
+                values = self._clamp_batch(values, clamp_config)
+            result[name] = _where(active, values, original)
+        
+        return result
+    
+    def _clamp_batch(self, values: np.ndarray, clamp_config: Dict[str, Any]) -> np.ndarray:
+        """값 배열을 특정 범위로 제한 (배치)"""
+        if not _is_numeric(values):
+            return values
+        
+        min_val = clamp_config.get('min', float('-inf'))
+        max_val = clamp_config.get('max', float('inf'))
+        
+        return np.clip(values, min_val, max_val)
+    
     def generate_failure_pattern(
         self,
         base_value: float,
@@ -372,4 +879,177 @@ class FailureEngine:
         failures = np.sum(future_values > threshold)
         probability = failures / future_steps
         
-        return float(np.clip(probability, 0, 1))
\ No newline at end of file
+        return float(np.clip(probability, 0, 1))
+
+
+def _is_numeric(values: np.ndarray) -> bool:
+    """숫자형(정수/실수) 배열 여부"""
+    return values.dtype.kind in 'iuf'
+
+
+def _full_column(value: Any, size: int) -> np.ndarray:
+    """스칼라 값을 길이 size의 상수 배열로 변환"""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return np.full(size, value)
+    column = np.empty(size, dtype=object)
+    column.fill(value)
+    return column
+
+
+def _config_or(config: Dict[str, Any], key: str, default: np.ndarray, size: int) -> np.ndarray:
+    """설정 값이 있으면 상수 배열, 없으면 행별 기본값 배열 반환"""
+    if key in config:
+        return _full_column(config[key], size)
+    return default
+
+
+def _correlated_noise_factor(noise_config: Dict[str, Any]) -> np.ndarray:
+    """저장된 촐레스키 인자 (저장 전 형식의 설정이면 행렬에서 계산, 행렬별 캐시)"""
+    factor = noise_config.get('cholesky')
+    if factor is not None:
+        return np.asarray(factor, dtype=float)
+    
+    return _cholesky_from_config(
+        _matrix_key(noise_config.get('covariance')),
+        _matrix_key(noise_config.get('correlation')),
+        None if noise_config.get('std') is None else tuple(noise_config['std'])
+    )
+
+
+def _matrix_key(matrix: Optional[List[List[float]]]) -> Optional[Tuple[Tuple[float, ...], ...]]:
+    return None if matrix is None else tuple(map(tuple, matrix))
+
+
+@lru_cache(maxsize=256)
+def _cholesky_from_config(
+    covariance: Optional[Tuple[Tuple[float, ...], ...]],
+    correlation: Optional[Tuple[Tuple[float, ...], ...]],
+    std: Optional[Tuple[float, ...]]
+) -> np.ndarray:
+    matrix = covariance if covariance is not None else covariance_from_correlation(correlation, std)
+    return np.array(cholesky_factor(matrix), dtype=float)
+
+
+def _markov_model(config: Dict[str, Any]) -> Tuple[List[str], np.ndarray, int]:
+    """
+    마르코프 설정을 (상태 목록, 생성 행렬 Q, 초기 상태 번호)로 변환
+    
+    rates는 상태 수×상태 수 행렬(행: 현재 상태, 열: 다음 상태) 또는
+    {현재 상태: {다음 상태: 초당 전이율}} 형식이며, 대각 성분은 행의 합이 0이 되도록 다시 계산됩니다.
+    
+    Raises:
+        ValueError: 상태/전이율/초기 상태가 잘못된 경우
+    """
+    states = list(config.get('states') or DEFAULT_MARKOV_STATES)
+    if len(set(states)) != len(states) or len(states) < 2:
+        raise ValueError("마르코프 상태는 서로 다른 이름 2개 이상이어야 합니다.")
+    
+    rates = config.get('rates')
+    if rates is None:
+        if states != DEFAULT_MARKOV_STATES:
+            raise ValueError("상태를 직접 지정하면 rates도 지정해야 합니다.")
+        rates = DEFAULT_MARKOV_RATES
+    
+    size = len(states)
+    if isinstance(rates, dict):
+        generator = np.zeros((size, size))
+        index = {state: i for i, state in enumerate(states)}
+        for source, targets in rates.items():
+            for target, rate in (targets or {}).items():
+                if source not in index or target not in index:
+                    raise ValueError(f"알 수 없는 마르코프 상태: {source} → {target}")
+                generator[index[source], index[target]] = rate
+    else:
+        generator = np.array(rates, dtype=float)
+        if generator.shape != (size, size):
+            raise ValueError(f"rates는 {size}×{size} 행렬이어야 합니다.")
+    
+    np.fill_diagonal(generator, 0.0)
+    if not np.isfinite(generator).all() or (generator < 0).any():
+        raise ValueError("마르코프 전이율은 0 이상의 유한한 값이어야 합니다.")
+    np.fill_diagonal(generator, -generator.sum(axis=1))
+    
+    initial_state = config.get('initial_state', states[0])
+    if initial_state not in states:
+        raise ValueError(f"알 수 없는 초기 상태: {initial_state}")
+    
+    return states, generator, states.index(initial_state)
+
+
+_transition_tables: Dict[Tuple[bytes, float], np.ndarray] = {}
+
+
+def _cumulative_transition_table(generator: np.ndarray, dt: float) -> np.ndarray:
+    """dt초 동안의 전이 확률 행렬 expm(Q·dt)의 행별 누적합 (캐시)"""
+    key = (generator.tobytes(), dt)
+    table = _transition_tables.get(key)
+    if table is None:
+        probabilities = np.clip(_expm(generator * dt), 0.0, None)
+        probabilities /= probabilities.sum(axis=1, keepdims=True)
+        table = np.cumsum(probabilities, axis=1)
+        if len(_transition_tables) >= MARKOV_TABLE_CACHE_SIZE:
+            _transition_tables.clear()
+        _transition_tables[key] = table
+    return table
+
+
+def _expm(matrix: np.ndarray, terms: int = 12) -> np.ndarray:
+    """행렬 지수 함수 - scaling and squaring + 테일러 급수 (상태 수가 작은 생성 행렬용)"""
+    norm = np.abs(matrix).sum(axis=1).max()
+    # 노름이 0.5 이하가 되도록 나눈 뒤 급수를 계산하고 제곱으로 되돌림
+    squarings = max(0, int(np.ceil(np.log2(norm))) + 1) if norm > 0 else 0
+    scaled = matrix / (2 ** squarings)
+    
+    result = np.eye(len(matrix))
+    term = np.eye(len(matrix))
+    for k in range(1, terms + 1):
+        term = term @ scaled / k
+        result = result + term
+    for _ in range(squarings):
+        result = result @ result
+    return result
+
+
+def _markov_transform(
+    values: np.ndarray,
+    states: np.ndarray,
+    names: List[str],
+    config: Dict[str, Any]
+) -> np.ndarray:
+    """상태별 값 변환 - 숫자 값은 값 × scale + offset, value가 있으면 그 값으로 대체"""
+    transforms = config.get('transforms')
+    if transforms is None:
+        transforms = DEFAULT_MARKOV_TRANSFORMS if names == DEFAULT_MARKOV_STATES else {}
+    
+    per_state = [transforms.get(name) or {} for name in names]
+    result = values
+    
+    if _is_numeric(values):
+        scale = np.array([float(t.get('scale', 1.0)) for t in per_state])
+        offset = np.array([float(t.get('offset', 0.0)) for t in per_state])
+        result = values.astype(float) * scale[states] + offset[states]
+    
+    replaced = [i for i, t in enumerate(per_state) if 'value' in t]
+    if replaced:
+        mask = np.isin(states, replaced)
+        if mask.any():
+            replacement = np.empty(len(names), dtype=object)
+            for i in replaced:
+                replacement[i] = per_state[i]['value']
+            numeric = all(
+                isinstance(per_state[i]['value'], (int, float)) and not isinstance(per_state[i]['value'], bool)
+                for i in replaced
+            )
+            if numeric and _is_numeric(result):
+                result = np.where(mask, replacement[states].astype(float), result)
+            else:
+                result = np.where(mask, replacement[states], result.astype(object))
+    
+    return result
+
+
+def _where(mask: np.ndarray, values: np.ndarray, original: np.ndarray) -> np.ndarray:
+    """마스크에 따라 값 선택 (dtype이 다르면 object로 합침)"""
+    if _is_numeric(values) and _is_numeric(original):
+        return np.where(mask, values, original)
+    return np.where(mask, values.astype(object), original.astype(object))
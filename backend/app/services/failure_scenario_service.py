@@ -1,14 +1,17 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, select
+from sqlalchemy import and_, delete, func, insert, literal, or_, select, update
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 import json
 
 from ..models.failure_scenario import FailureScenario
 from ..models.simulator import Simulator
+from .cache_invalidation import invalidation_bus
 from ..schemas.failure_scenario import (
+    AdvancedFailureConfig,
     FailureScenarioCreate,
     FailureScenarioUpdate,
+    SimulatorSelector,
 )
 
 
@@ -41,6 +44,7 @@ class FailureScenarioService:
             name=scenario_data.name,
             description=scenario_data.description,
             failure_parameters=json.dumps(scenario_data.failure_parameters),
+            advanced_config=FailureScenarioService._dump_advanced_config(scenario_data.advanced_config),
             is_active=scenario_data.is_active
         )
         
@@ -79,9 +83,12 @@ class FailureScenarioService:
         skip: int = 0,
         limit: int = 100
     ) -> List[FailureScenario]:
-        """사용자의 모든 고장 시나리오 조회"""
+        """사용자의 모든 고장 시나리오 조회 (일괄 적용 복사본 제외)"""
         stmt = select(FailureScenario).where(
-            FailureScenario.user_id == user_id
+            and_(
+                FailureScenario.user_id == user_id,
+                FailureScenario.source_scenario_id.is_(None)
+            )
         ).offset(skip).limit(limit)
         scenarios = list(db.scalars(stmt).all())
         
@@ -147,9 +154,13 @@ class FailureScenarioService:
             scenario.description = scenario_data.description
         if scenario_data.failure_parameters is not None:
             scenario.failure_parameters = json.dumps(scenario_data.failure_parameters)
+        if "advanced_config" in scenario_data.model_fields_set:
+            # null이면 고급 설정 제거
+            scenario.advanced_config = FailureScenarioService._dump_advanced_config(scenario_data.advanced_config)
         if scenario_data.is_active is not None:
             scenario.is_active = scenario_data.is_active
         
+        invalidation_bus.notify(db, [scenario.simulator_id])
         db.commit()
         db.refresh(scenario)
         
@@ -157,6 +168,13 @@ class FailureScenarioService:
         scenario.failure_parameters = json.loads(scenario.failure_parameters)
         return scenario
     
+    @staticmethod
+    def _dump_advanced_config(advanced_config: Optional[AdvancedFailureConfig]) -> Optional[str]:
+        """고급 설정을 JSON 문자열로 (상관 노이즈 촐레스키 인자는 스키마 검증에서 이미 계산됨)"""
+        if advanced_config is None:
+            return None
+        return json.dumps(advanced_config.model_dump(exclude_none=True))
+    
     @staticmethod
     def delete_scenario(
         db: Session,
@@ -179,6 +197,22 @@ class FailureScenarioService:
         if scenario.is_applied:
             raise ValueError("적용 중인 시나리오는 삭제할 수 없습니다. 먼저 해제해주세요.")
         
+        # 일괄 적용 복사본이 아직 적용 중이면 삭제 불가 (목록에 보이지 않는 복사본이 고장을 계속 일으키지 않도록)
+        applied_copies = db.scalar(
+            select(func.count()).select_from(FailureScenario).where(
+                and_(
+                    FailureScenario.source_scenario_id == scenario.id,
+                    FailureScenario.is_applied == True
+                )
+            )
+        )
+        if applied_copies:
+            raise ValueError(
+                f"일괄 적용된 복사본 {applied_copies}개가 아직 적용 중입니다. 먼저 일괄 해제해주세요."
+            )
+        
+        # 해제된 복사본은 원본과 같은 트랜잭션에서 삭제 (DB의 ON DELETE CASCADE와 같은 결과)
+        db.execute(delete(FailureScenario).where(FailureScenario.source_scenario_id == scenario.id))
         db.delete(scenario)
         db.commit()
         return True
@@ -231,11 +265,15 @@ class FailureScenarioService:
             existing_applied.is_applied = False
             existing_applied.applied_at = None
         
+        # 다른 시뮬레이터에 적용 중이던 시나리오를 옮기는 경우 이전 시뮬레이터도 무효화
+        previous_simulator_id = scenario.simulator_id if scenario.is_applied else None
+        
         # 새 시나리오 적용
         scenario.simulator_id = simulator_id
         scenario.is_applied = True
         scenario.applied_at = datetime.utcnow()
         
+        invalidation_bus.notify(db, [simulator_id, previous_simulator_id])
         db.commit()
         
         return {
@@ -280,6 +318,7 @@ class FailureScenarioService:
         applied_scenario.is_applied = False
         applied_scenario.applied_at = None
         
+        invalidation_bus.notify(db, [simulator_id])
         db.commit()
         
         return {
@@ -288,6 +327,168 @@ class FailureScenarioService:
             "simulator_id": simulator_id
         }
     
+    @staticmethod
+    def _selected_simulators(user_id: int, selector: SimulatorSelector):
+        """선택 조건에 맞는 사용자 시뮬레이터 ID 조회문 (일괄 UPDATE/DELETE의 서브쿼리로도 사용)"""
+        stmt = select(Simulator.id).where(Simulator.user_id == user_id)
+        if selector.simulator_ids is not None:
+            stmt = stmt.where(Simulator.id.in_(selector.simulator_ids))
+        elif selector.name_prefix is not None:
+            stmt = stmt.where(Simulator.name.startswith(selector.name_prefix, autoescape=True))
+        return stmt
+    
+    @staticmethod
+    def _resolve_simulator_ids(db: Session, user_id: int, selector: SimulatorSelector) -> List[int]:
+        """선택된 시뮬레이터 ID 목록 (ID로 지정했는데 권한이 없는 시뮬레이터가 있으면 ValueError)"""
+        simulator_ids = list(db.scalars(FailureScenarioService._selected_simulators(user_id, selector)))
+        
+        if selector.simulator_ids is not None:
+            missing = sorted(set(selector.simulator_ids) - set(simulator_ids))
+            if missing:
+                raise ValueError(f"해당 시뮬레이터에 대한 권한이 없습니다: {missing}")
+        if not simulator_ids:
+            raise ValueError("선택된 시뮬레이터가 없습니다.")
+        
+        return simulator_ids
+    
+    @staticmethod
+    def bulk_apply_scenario(
+        db: Session,
+        scenario_id: int,
+        selector: SimulatorSelector,
+        user_id: int
+    ) -> Dict[str, Any]:
+        """
+        고장 시나리오를 여러 시뮬레이터에 한 트랜잭션으로 적용
+        
+        시나리오 하나는 시뮬레이터 하나에만 적용되므로 대상마다 원본의 복사본
+        (source_scenario_id = 원본 ID)을 INSERT ... SELECT 한 번으로 만들고,
+        대상의 기존 적용은 UPDATE/DELETE 한 번씩으로 해제합니다.
+        모든 복사본은 같은 applied_at을 가지므로 시간 기반 고장 패턴이 동시에 시작됩니다.
+        복사본은 적용 시점의 원본 설정을 복사한 것이며, 원본을 수정한 뒤에는 다시 적용해야 반영됩니다.
+        """
+        stmt = select(FailureScenario).where(
+            and_(
+                FailureScenario.id == scenario_id,
+                FailureScenario.user_id == user_id
+            )
+        )
+        scenario = db.scalar(stmt)
+        
+        if not scenario:
+            raise ValueError("해당 고장 시나리오를 찾을 수 없습니다.")
+        
+        if not scenario.is_active:
+            raise ValueError("비활성화된 시나리오는 적용할 수 없습니다.")
+        
+        if scenario.source_scenario_id is not None:
+            raise ValueError("일괄 적용으로 만든 복사본은 다시 적용할 수 없습니다. 원본 시나리오를 적용해주세요.")
+        
+        simulator_ids = FailureScenarioService._resolve_simulator_ids(db, user_id, selector)
+        targets = FailureScenarioService._selected_simulators(user_id, selector)
+        applied_at = datetime.utcnow()
+        
+        columns = FailureScenario.__table__.c
+        copies = select(
+            literal(user_id, columns.user_id.type),
+            Simulator.id,
+            literal(scenario.name, columns.name.type),
+            literal(scenario.description, columns.description.type),
+            literal(scenario.failure_parameters, columns.failure_parameters.type),
+            literal(scenario.advanced_config, columns.advanced_config.type),
+            literal(True, columns.is_active.type),
+            literal(True, columns.is_applied.type),
+            literal(applied_at, columns.applied_at.type),
+            literal(scenario.id, columns.source_scenario_id.type)
+        ).where(Simulator.id.in_(targets))
+        
+        try:
+            # 대상 시뮬레이터의 이전 일괄 적용 복사본은 삭제, 그 밖의 적용 중인 시나리오는 해제
+            db.execute(
+                delete(FailureScenario)
+                .where(FailureScenario.simulator_id.in_(targets), FailureScenario.source_scenario_id.is_not(None))
+                .execution_options(synchronize_session=False)
+            )
+            db.execute(
+                update(FailureScenario)
+                .where(FailureScenario.simulator_id.in_(targets), FailureScenario.is_applied == True)
+                .values(is_applied=False, applied_at=None)
+                .execution_options(synchronize_session=False)
+            )
+            db.execute(insert(FailureScenario).from_select(
+                ["user_id", "simulator_id", "name", "description", "failure_parameters", "advanced_config",
+                 "is_active", "is_applied", "applied_at", "source_scenario_id"],
+                copies
+            ))
+            invalidation_bus.notify(db, simulator_ids)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        
+        return {
+            "message": f"고장 시나리오가 시뮬레이터 {len(simulator_ids)}개에 적용되었습니다.",
+            "scenario_id": scenario_id,
+            "simulator_count": len(simulator_ids),
+            "simulator_ids": simulator_ids,
+            "applied_at": applied_at
+        }
+    
+    @staticmethod
+    def bulk_release_scenarios(
+        db: Session,
+        selector: SimulatorSelector,
+        user_id: int,
+        scenario_id: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        여러 시뮬레이터의 고장 시나리오를 한 트랜잭션으로 해제
+        
+        일괄 적용 복사본은 삭제하고 일반 시나리오는 적용 상태만 해제합니다.
+        scenario_id를 지정하면 그 시나리오와 그 복사본만 해제합니다.
+        """
+        FailureScenarioService._resolve_simulator_ids(db, user_id, selector)
+        targets = FailureScenarioService._selected_simulators(user_id, selector)
+        
+        condition = and_(
+            FailureScenario.simulator_id.in_(targets),
+            FailureScenario.is_applied == True
+        )
+        if scenario_id is not None:
+            condition = and_(
+                condition,
+                or_(FailureScenario.id == scenario_id, FailureScenario.source_scenario_id == scenario_id)
+            )
+        
+        released_ids = sorted(set(db.scalars(select(FailureScenario.simulator_id).where(condition))))
+        if not released_ids:
+            raise ValueError("현재 적용된 고장 시나리오가 없습니다.")
+        
+        try:
+            db.execute(
+                delete(FailureScenario)
+                .where(condition, FailureScenario.source_scenario_id.is_not(None))
+                .execution_options(synchronize_session=False)
+            )
+            db.execute(
+                update(FailureScenario)
+                .where(condition)
+                .values(is_applied=False, applied_at=None)
+                .execution_options(synchronize_session=False)
+            )
+            invalidation_bus.notify(db, released_ids)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        
+        return {
+            "message": f"시뮬레이터 {len(released_ids)}개의 고장 시나리오가 해제되었습니다.",
+            "scenario_id": scenario_id,
+            "simulator_count": len(released_ids),
+            "simulator_ids": released_ids
+        }
+    
     @staticmethod
     def get_simulator_with_failure(
         db: Session,
@@ -0,0 +1,221 @@
+"""
+고장 주입 일괄 변환 - 기록된 CSV/Excel 전체에 고장 시나리오를 적용한 CSV 생성
+
+파일을 FileParser.iter_rows로 청크 단위로 읽어 시나리오가 다루는 컬럼만
+FailureEngine.apply_failure_scenario_batch(벡터화 커널)로 변환하고,
+고장이 적용된 행 여부를 라벨 컬럼으로 붙여 청크마다 바로 CSV로 내보냅니다.
+메모리 사용량은 청크 크기로 제한되며 변환 결과는 만들어지는 대로 전송됩니다.
+
+경과 시간(GRADUAL, CYCLIC, DRIFT 등 시간 기반 패턴의 기준):
+    time_column이 없으면 행 번호 × interval_seconds
+    time_column이 있으면 첫 행 대비 경과 초 (숫자로 읽히면 초 단위 값, 그 외는 날짜/시각으로 해석)
+"""
+import logging
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+from fastapi import HTTPException
+
+from ..utils.column_profiler import parameter_keys
+from ..utils.file_parser import FileParser
+from .failure_engine import FailureEngine
+
+logger = logging.getLogger(__name__)
+
+# 청크 하나에 담을 최대 셀 수
+CHUNK_CELLS = 1_000_000
+
+
+class FailureTransform:
+    """업로드 파일 하나에 대한 고장 주입 변환 (prepare → iter_csv 순서로 사용)"""
+
+    def __init__(
+        self,
+        stream: BinaryIO,
+        filename: str,
+        size: int,
+        failure_config: Dict[str, Any],
+        interval_seconds: float = 1.0,
+        time_column: Optional[str] = None,
+        label_column: str = "failure_active",
+        seed: Optional[int] = None
+    ):
+        self.stream = stream
+        self.filename = filename
+        self.size = size
+        self.failure_config = failure_config
+        self.interval_seconds = interval_seconds
+        self.time_column = time_column
+        self.label_column = label_column
+        self.seed = seed
+
+        self.header_row: Optional[int] = None
+        self.headers: List[str] = []
+        # 시나리오 파라미터 이름 → 컬럼 위치
+        self.targets: Dict[str, int] = {}
+        self._time_position: Optional[int] = None
+
+    def prepare(self) -> None:
+        """
+        헤더를 찾고 시나리오 파라미터를 컬럼에 연결 (응답을 시작하기 전에 호출)
+
+        시나리오 파라미터는 컬럼명 또는 컬럼명을 파라미터 키로 변환한 이름과 일치하면 연결되며,
+        일치하는 컬럼이 없는 파라미터는 무시합니다.
+
+        Raises:
+            HTTPException: 파일/옵션이 잘못되었거나 연결되는 컬럼이 없는 경우 (400)
+        """
+        self.header_row, self.headers = FileParser.locate_header(self.stream, self.filename, self.size)
+
+        if self.label_column in self.headers:
+            raise HTTPException(
+                status_code=400,
+                detail=f"라벨 컬럼 '{self.label_column}'이(가) 이미 파일에 있습니다. 다른 이름을 지정해주세요."
+            )
+
+        if self.time_column is not None:
+            if self.time_column not in self.headers:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"시간 컬럼 '{self.time_column}'을(를) 파일에서 찾을 수 없습니다."
+                )
+            self._time_position = self.headers.index(self.time_column)
+
+        positions: Dict[str, int] = {}
+        for position, (name, key) in enumerate(zip(self.headers, parameter_keys(self.headers))):
+            positions.setdefault(name, position)
+            positions.setdefault(key, position)
+
+        names = list(self.failure_config.get('failure_parameters', {}))
+        advanced_config = self.failure_config.get('advanced_config', {})
+        names += list(advanced_config.get('parameters', {}))
+        names += list((advanced_config.get('correlated_noise') or {}).get('parameters', []))
+        names = list(dict.fromkeys(names))
+        self.targets = {name: positions[name] for name in names if name in positions}
+
+        if not self.targets:
+            raise HTTPException(
+                status_code=400,
+                detail="고장 시나리오의 파라미터와 일치하는 컬럼이 없습니다."
+            )
+
+        ignored = [name for name in names if name not in positions]
+        if ignored:
+            logger.info(f"파일에 없는 시나리오 파라미터는 무시: {ignored}")
+
+    def iter_csv(self) -> Iterator[bytes]:
+        """변환된 CSV를 청크 단위 바이트로 생성 (첫 청크에 UTF-8 BOM과 헤더 포함)"""
+        width = len(self.headers)
+        # 변환하지 않는 셀은 원본 표기 그대로 내보내도록 CSV는 문자열로 읽음
+        chunks = FileParser.iter_rows(
+            self.stream, self.filename, self.size,
+            skip_rows=0 if self.header_row is None else self.header_row + 1,
+            chunk_rows=max(1000, CHUNK_CELLS // max(width, 1)),
+            as_text=True
+        )
+
+        engine = FailureEngine()
+        engine.rng = np.random.default_rng(self.seed)
+        numeric: Optional[Dict[int, bool]] = None
+        row_offset = 0
+        time_state: Dict[str, Any] = {}
+
+        # 행이 없어도 헤더만 있는 CSV를 돌려줌
+        header = self.headers + [self.label_column]
+        yield ("\ufeff" + pd.DataFrame(columns=header).to_csv(index=False)).encode("utf-8")
+
+        for chunk in chunks:
+            chunk = chunk.iloc[:, :width].reindex(columns=range(width))
+            if numeric is None:
+                types = FileParser.infer_column_types(chunk)
+                numeric = {position: types[position] == 'number' for position in set(self.targets.values())}
+
+            elapsed = self._elapsed(chunk, row_offset, time_state)
+            columns = {
+                name: self._column(chunk.iloc[:, position], numeric[position])
+                for name, position in self.targets.items()
+            }
+
+            result, active = engine.apply_failure_scenario_batch(columns, self.failure_config, elapsed)
+
+            for name, position in self.targets.items():
+                chunk.isetitem(position, result[name])
+            self._restore_integers(chunk)
+            chunk[width] = active.astype(np.int8)
+
+            row_offset += len(chunk)
+            yield chunk.to_csv(index=False, header=False).encode("utf-8")
+
+    @staticmethod
+    def _column(series: pd.Series, is_numeric: bool) -> np.ndarray:
+        if is_numeric:
+            return FileParser.numeric_values(series.to_frame())[:, 0]
+        return series.to_numpy(dtype=object)
+
+    @staticmethod
+    def _restore_integers(chunk: pd.DataFrame) -> None:
+        """
+        값이 모두 정수인 실수 컬럼을 정수로 되돌림 (10 → 10.0으로 바뀌지 않도록)
+
+        Excel 청크의 빈 셀이나 변환되지 않은 고장 대상 컬럼은 float64가 되므로
+        빈 값을 허용하는 Int64로 바꿔 원래 표기대로 내보냅니다.
+        """
+        for position in range(chunk.shape[1]):
+            column = chunk.iloc[:, position]
+            if not pd.api.types.is_float_dtype(column.dtype):
+                continue
+            values = column.to_numpy()
+            finite = values[~np.isnan(values)]
+            if np.isinf(finite).any() or not np.array_equal(finite, np.floor(finite)):
+                continue
+            if finite.size and np.abs(finite).max() >= 2 ** 53:
+                continue
+            chunk.isetitem(position, column.astype("Int64"))
+
+    @staticmethod
+    def _to_timestamps(column: pd.Series) -> pd.Series:
+        """
+        날짜/시각 값을 UTC 기준 시각으로 해석 (해석할 수 없는 값은 NaT)
+
+        시간대가 있는 값(+09:00 등)은 UTC로 변환하고 시간대가 없는 값은 UTC로 간주하므로,
+        시간대 표기가 섞여 있어도 한 열의 값을 서로 뺄 수 있습니다.
+        """
+        return pd.to_datetime(column, errors='coerce', format='mixed', utc=True)
+
+    def _elapsed(self, chunk: pd.DataFrame, row_offset: int, state: Dict[str, Any]) -> np.ndarray:
+        """
+        행별 경과 시간(초) - 시간 값이 비어 있으면 직전 행의 값을 사용
+
+        시간 컬럼은 먼저 숫자(초)로 해석하고, 숫자로 읽히는 값이 하나도 없을 때만
+        날짜/시각으로 해석합니다. 해석 방식은 처음 결정한 뒤 모든 청크에 같게 적용합니다.
+        """
+        if self._time_position is None:
+            return (row_offset + np.arange(len(chunk))) * self.interval_seconds
+
+        column = chunk.iloc[:, self._time_position]
+        if "mode" not in state:
+            if pd.to_numeric(column, errors='coerce').notna().any():
+                state["mode"] = "numeric"
+            elif self._to_timestamps(column).notna().any():
+                state["mode"] = "datetime"
+            else:
+                # 아직 유효한 시간이 없으면 이 청크는 0초로 처리
+                return np.zeros(len(chunk))
+
+        if state["mode"] == "numeric":
+            seconds = pd.to_numeric(column, errors='coerce').astype(float)
+        else:
+            seconds = (self._to_timestamps(column) - pd.Timestamp(0, tz="UTC")).dt.total_seconds()
+
+        if "origin" not in state:
+            valid = seconds.dropna()
+            if valid.empty:
+                # 아직 유효한 시간이 없으면 이 청크는 0초로 처리
+                return np.zeros(len(chunk))
+            state["origin"] = float(valid.iloc[0])
+
+        elapsed = (seconds - state["origin"]).ffill().fillna(state.get("last", 0.0))
+        state["last"] = float(elapsed.iloc[-1])
+        return elapsed.to_numpy(dtype=float)
+
@@ -0,0 +1,74 @@
+"""
+플릿 프레임 캐시 - 플릿 템플릿의 인스턴스 요청들이 한 번의 벡터화 생성 결과를 공유
+
+인스턴스 N개가 각자 /api/data/{user_id}/{template}/{instance}를 호출할 때 요청마다
+N×P 프레임을 새로 만들면 전체 비용이 O(N²)이 됩니다. 템플릿별로 마지막 프레임을
+TTL 동안 보관하여 그 사이의 인스턴스 요청은 프레임에서 한 행만 꺼냅니다.
+프레임이 만료되면 첫 요청 하나만 다시 생성하고 동시에 들어온 요청은 그 결과를 기다립니다.
+
+템플릿/시나리오가 변경되면 무효화 버스(cache_invalidation)를 통해 해당 프레임을 버립니다.
+TTL이 0이면 요청마다 새 프레임을 생성합니다 (인스턴스 수가 적을 때만 권장).
+
+환경 변수:
+    FLEET_FRAME_TTL_MS: 프레임 재사용 시간 (기본값: 1000)
+"""
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from .cache_invalidation import invalidation_bus
+from .compiled_simulator import CompiledSimulator, FleetFrame, evaluate_fleet
+
+
+class FleetFrameCache:
+    """시뮬레이터 ID → (만료 시각, 컴파일 결과, 프레임)"""
+
+    def __init__(self, ttl_seconds: float = 1.0):
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[int, Tuple[float, CompiledSimulator, FleetFrame]] = {}
+        self._locks: Dict[int, threading.Lock] = {}
+
+    @classmethod
+    def from_env(cls) -> "FleetFrameCache":
+        return cls(ttl_seconds=int(os.getenv("FLEET_FRAME_TTL_MS", "1000")) / 1000)
+
+    def get(self, compiled: CompiledSimulator) -> FleetFrame:
+        """템플릿의 현재 프레임 (만료되었거나 템플릿 정의가 바뀌었으면 새로 생성)"""
+        frame = self._lookup(compiled)
+        if frame is not None:
+            return frame
+
+        # 같은 템플릿의 동시 생성은 하나로 합침 (setdefault는 GIL 아래에서 원자적)
+        lock = self._locks.setdefault(compiled.simulator_id, threading.Lock())
+        with lock:
+            frame = self._lookup(compiled)
+            if frame is not None:
+                return frame
+
+            frame = evaluate_fleet(compiled)
+            if self.ttl_seconds > 0:
+                self._entries[compiled.simulator_id] = (time.monotonic() + self.ttl_seconds, compiled, frame)
+            return frame
+
+    def _lookup(self, compiled: CompiledSimulator) -> Optional[FleetFrame]:
+        entry = self._entries.get(compiled.simulator_id)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        # 컴파일 캐시를 쓰지 않으면 요청마다 새 객체이므로 내용으로 비교
+        if entry[1] is not compiled and entry[1] != compiled:
+            return None
+        return entry[2]
+
+    def invalidate(self, simulator_ids: Optional[List[int]]) -> None:
+        if simulator_ids is None:
+            self._entries.clear()
+            return
+        for simulator_id in simulator_ids:
+            self._entries.pop(simulator_id, None)
+
+
+# 프로세스 전역 플릿 프레임 캐시
+fleet_frames = FleetFrameCache.from_env()
+
+invalidation_bus.subscribe(fleet_frames.invalidate)
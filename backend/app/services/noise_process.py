@@ -0,0 +1,247 @@
+"""
+유색(colored) 노이즈와 ARMA 신호 과정 - 키별로 미리 채운 버퍼에서 O(1)로 값을 꺼냄
+
+백색 노이즈(gaussian 등)와 달리 pink(1/f), brown(브라운), arma 노이즈는 이전 값에 의존하므로
+장비(시뮬레이터 × 파라미터)마다 필터 상태를 이어가야 합니다. 요청마다 필터를 처음부터 돌리는 대신
+키별로 block_size개 값을 한 번에 필터링해 두고, 값을 요청할 때마다 버퍼에서 하나씩 꺼냅니다.
+버퍼가 비면 마지막 필터 상태(zi)에서 다음 블록을 만들며, 함께 비워진 키들은 한 번의 2차원
+필터 호출로 같이 채웁니다. 새 키는 워밍업 구간을 버려 처음부터 정상 상태 분포에서 시작합니다.
+
+모든 과정은 분산 1로 정규화되며, 엔진에서 intensity × |값|을 곱해 더합니다.
+값은 요청(제공된 값) 단위로 진행하며 벽시계 시간과는 무관합니다.
+
+필터는 scipy.signal.lfilter가 설치되어 있으면 사용하고, 없으면 같은 점화식(전치 직접형 II)을
+시간축으로 돌면서 키 방향으로 벡터화한 NumPy 구현을 사용합니다.
+
+환경 변수:
+    NOISE_BUFFER_BLOCK_SIZE: 키별로 미리 채우는 값 개수 (기본값: 128)
+    NOISE_BUFFER_MAX_ENTRIES: 보관할 최대 키 수, 넘으면 가장 오래 쓰지 않은 키부터 삭제 (기본값: 100000)
+        - 플릿 인스턴스 수 × 유색 노이즈 파라미터 수보다 크게 잡아야 키가 매번 새로 시작하지 않음
+"""
+import math
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    from scipy.signal import lfilter as _scipy_lfilter
+except ImportError:  # scipy는 선택 의존성
+    _scipy_lfilter = None
+
+
+# 유색 노이즈 유형 (NoiseType 값)
+COLORED_NOISE_TYPES = ("pink", "brown", "arma")
+
+# 1/f 근사 필터 (3극/3영점, -10dB/decade)
+PINK_B = (0.049922035, -0.095993537, 0.050612699, -0.004408786)
+PINK_A = (1.0, -2.494956002, 2.017265875, -0.522189400)
+
+# 브라운 노이즈 - 무한히 발산하지 않도록 누설 적분기(1극)로 근사
+DEFAULT_BROWN_LEAK = 0.999
+
+# 새 키의 워밍업 최대 길이 (필터 메모리가 1/1000로 줄어드는 길이, 이 값으로 제한)
+MAX_WARMUP = 4096
+
+
+@dataclass(frozen=True)
+class NoiseProcess:
+    """정규화된 선형 필터 (y = gain × lfilter(b, a, 백색 노이즈))"""
+    b: Tuple[float, ...]
+    a: Tuple[float, ...]
+    gain: float
+    warmup: int
+
+    @property
+    def order(self) -> int:
+        return max(len(self.a), len(self.b)) - 1
+
+
+def noise_process(noise_config: Dict[str, Any]) -> NoiseProcess:
+    """
+    노이즈 설정으로 필터 생성 (같은 설정은 캐시)
+
+    arma: x_t = Σ ar_i·x_{t-i} + e_t + Σ ma_j·e_{t-j} (ma 생략 시 AR(p))
+
+    Raises:
+        ValueError: 알 수 없는 유형이거나 AR 계수가 정상(stationary) 과정이 아닌 경우
+    """
+    noise_type = noise_config.get('type')
+    if noise_type == "pink":
+        return _build_process(PINK_B, PINK_A)
+    if noise_type == "brown":
+        leak = float(noise_config.get('leak', DEFAULT_BROWN_LEAK))
+        if not 0 < leak < 1:
+            raise ValueError("brown 노이즈의 leak은 0과 1 사이여야 합니다.")
+        return _build_process((1.0,), (1.0, -leak))
+    if noise_type == "arma":
+        ar = tuple(float(c) for c in noise_config.get('ar') or ())
+        ma = tuple(float(c) for c in noise_config.get('ma') or ())
+        return _build_process((1.0,) + ma, (1.0,) + tuple(-c for c in ar))
+    raise ValueError(f"유색 노이즈 유형이 아닙니다: {noise_type}")
+
+
+@lru_cache(maxsize=256)
+def _build_process(b: Tuple[float, ...], a: Tuple[float, ...]) -> NoiseProcess:
+    poles = np.abs(np.roots(a)) if len(a) > 1 else np.zeros(1)
+    radius = float(poles.max()) if poles.size else 0.0
+    if radius >= 1.0:
+        raise ValueError("AR 계수가 정상(stationary) 과정을 만들지 않습니다 (특성근이 단위원 밖).")
+
+    warmup = MAX_WARMUP if radius > 0 else len(b)
+    if 0 < radius:
+        warmup = min(MAX_WARMUP, max(len(b), math.ceil(math.log(1e-3) / math.log(radius))))
+
+    # 임펄스 응답 에너지로 정상 상태 분산을 구해 분산 1로 정규화
+    impulse = np.zeros((1, max(warmup, len(b)) * 2))
+    impulse[0, 0] = 1.0
+    response, _ = lfilter(b, a, impulse, np.zeros((1, max(len(a), len(b)) - 1)))
+    gain = 1.0 / math.sqrt(float(np.sum(response ** 2)))
+    return NoiseProcess(b=b, a=a, gain=gain, warmup=warmup)
+
+
+def lfilter(
+    b: Sequence[float],
+    a: Sequence[float],
+    x: np.ndarray,
+    zi: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    행별 독립 IIR 필터 (scipy.signal.lfilter(b, a, x, axis=1, zi=zi)와 같은 결과)
+
+    Args:
+        x: (행 수, 샘플 수) 입력
+        zi: (행 수, 차수) 초기 필터 상태
+
+    Returns:
+        (출력, 마지막 필터 상태)
+    """
+    if _scipy_lfilter is not None:
+        return _scipy_lfilter(b, a, x, axis=1, zi=zi)
+
+    order = max(len(a), len(b)) - 1
+    b = np.pad(np.asarray(b, dtype=float), (0, order + 1 - len(b))) / a[0]
+    a = np.pad(np.asarray(a, dtype=float), (0, order + 1 - len(a))) / a[0]
+    z = np.array(zi, dtype=float, copy=True)
+    y = np.empty_like(x, dtype=float)
+
+    # 전치 직접형 II - 시간축은 순차, 행 방향은 벡터 연산
+    for t in range(x.shape[1]):
+        xt = x[:, t]
+        yt = b[0] * xt + (z[:, 0] if order else 0.0)
+        for k in range(order - 1):
+            z[:, k] = b[k + 1] * xt + z[:, k + 1] - a[k + 1] * yt
+        if order:
+            z[:, order - 1] = b[order] * xt - a[order] * yt
+        y[:, t] = yt
+    return y, z
+
+
+class NoiseBufferStore:
+    """
+    키 → [미리 필터링한 블록, 다음 위치, 필터 상태, 필터, 마지막 사용 회차]
+
+    max_entries를 넘으면 가장 오래 쓰지 않은 키부터 버리므로, 큰 플릿과 다른 시뮬레이터가
+    함께 있어도 최근에 쓴 키의 필터 상태는 유지됩니다. 사용 회차는 항목에 숫자로만 기록하고
+    (키를 다시 해싱하는 LRU 순서 갱신 없음) 넘쳤을 때만 정렬하여 max_entries의 90%까지 줄이되,
+    방금 쓴 키들은 max_entries 안에 들어가는 한 남깁니다.
+    """
+
+    def __init__(self, block_size: int = 128, max_entries: int = 100_000):
+        self.block_size = block_size
+        self.max_entries = max_entries
+        self._entries: Dict[Hashable, List[Any]] = {}
+        self._draws = 0
+
+    @classmethod
+    def from_env(cls) -> "NoiseBufferStore":
+        return cls(
+            block_size=int(os.getenv("NOISE_BUFFER_BLOCK_SIZE", "128")),
+            max_entries=int(os.getenv("NOISE_BUFFER_MAX_ENTRIES", "100000"))
+        )
+
+    def draw(self, keys: Sequence[Hashable], process: NoiseProcess, rng: np.random.Generator) -> np.ndarray:
+        """키별 다음 값 (분산 1) - 버퍼가 빈 키와 새 키만 모아서 한 번에 다시 채움"""
+        result = np.empty(len(keys))
+        fresh: List[int] = []
+        exhausted: List[int] = []
+
+        self._draws += 1
+        draw = self._draws
+
+        for i, key in enumerate(keys):
+            entry = self._entries.get(key)
+            if entry is None or entry[3] != process:
+                fresh.append(i)
+            elif entry[1] >= len(entry[0]):
+                exhausted.append(i)
+            else:
+                result[i] = entry[0][entry[1]]
+                entry[1] += 1
+                entry[4] = draw
+
+        if fresh:
+            self._fill(keys, fresh, process, rng, result, np.zeros((len(fresh), process.order)), process.warmup)
+        if exhausted:
+            zi = np.stack([self._entries[keys[i]][2] for i in exhausted])
+            self._fill(keys, exhausted, process, rng, result, zi, 0)
+
+        if len(self._entries) > self.max_entries:
+            self._evict(min(len(keys), self.max_entries))
+        return result
+
+    def _evict(self, in_use: int) -> None:
+        """삭제된 시뮬레이터 등 오래 쓰지 않은 키부터 버림 (이번 회차에 쓴 in_use개 키는 유지)"""
+        keep = max(self.max_entries - self.max_entries // 10, in_use)
+        by_age = sorted(self._entries.items(), key=lambda item: item[1][4])
+        for key, _ in by_age[:len(by_age) - keep]:
+            del self._entries[key]
+
+    def _fill(
+        self,
+        keys: Sequence[Hashable],
+        rows: List[int],
+        process: NoiseProcess,
+        rng: np.random.Generator,
+        result: np.ndarray,
+        zi: np.ndarray,
+        warmup: int
+    ) -> None:
+        white = rng.standard_normal((len(rows), warmup + self.block_size))
+        filtered, final = lfilter(process.b, process.a, white, zi)
+        blocks = filtered[:, warmup:] * process.gain
+        for j, i in enumerate(rows):
+            self._entries[keys[i]] = [blocks[j], 1, final[j], process, self._draws]
+            result[i] = blocks[j, 0]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def sequence(
+    process: NoiseProcess,
+    size: int,
+    rng: np.random.Generator,
+    zi: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    연속된 size개 값 (분산 1) - 키 없이 행이 시간 순서인 경우(파일 변환, 데이터셋 생성)
+
+    Args:
+        zi: 이전 호출의 마지막 필터 상태 (없으면 워밍업 후 시작)
+
+    Returns:
+        (값 배열, 마지막 필터 상태)
+    """
+    warmup = process.warmup if zi is None else 0
+    if zi is None:
+        zi = np.zeros(process.order)
+    white = rng.standard_normal((1, warmup + size))
+    filtered, final = lfilter(process.b, process.a, white, zi[None, :])
+    return filtered[0, warmup:] * process.gain, final[0]
+
+
+# 프로세스 전역 노이즈 버퍼 (요청/틱 평가가 공유)
+noise_buffers = NoiseBufferStore.from_env()
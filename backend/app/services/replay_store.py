@@ -0,0 +1,310 @@
+"""
+재생(replay) 데이터 저장소 - 업로드한 CSV/Excel을 컬럼별 .npy 파일로 한 번 변환해 두고
+/api/data 요청마다 파일을 다시 읽지 않고 메모리 맵으로 한 행씩 꺼내 씀
+
+디렉터리 구조 ({REPLAY_DATA_DIR}/{dataset_id}/):
+    manifest.json  행 수, 컬럼 목록(이름/파라미터 키/종류/dtype/범주 값)
+    {key}.npy      컬럼 값 - 숫자는 float64(빈 값 NaN, 빈 값이 없는 정수 컬럼은 int64),
+                   문자열/불린은 범주 코드 int32(빈 값 -1)이고 실제 값은 manifest의 categories
+
+.npy는 np.load(mmap_mode='r')로 열기 때문에 한 행 조회는 O(컬럼 수)이고,
+같은 파일을 여는 워커 프로세스들은 OS 페이지 캐시를 공유하므로 시뮬레이터당 추가 메모리가 거의 없습니다.
+여러 인스턴스에서 서비스하려면 REPLAY_DATA_DIR을 공유 스토리지에 두어야 합니다.
+
+재생 위치:
+    advance=request: 요청(또는 틱)마다 다음 행 - 프로세스별 커서이므로 워커마다 따로 진행
+    advance=clock: 시뮬레이터 시계 기준 (현재 가상 시각 - started_at) / interval_seconds 번째 행
+                   - 워커와 무관하게 같은 시각이면 같은 행이며 시계 배속/일시정지/이동을 따름
+끝에 도달한 뒤:
+    wrap=loop: 처음부터 반복, wrap=ping_pong: 역순으로 되돌아옴, wrap=hold: 마지막 행 유지
+
+환경 변수:
+    REPLAY_DATA_DIR: 재생 데이터 디렉터리 (기본값: ./replay_data)
+"""
+import itertools
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+from datetime import datetime
+from typing import Any, BinaryIO, Dict, List, Optional
+
+import numpy as np
+from fastapi import HTTPException
+
+from ..utils.column_profiler import parameter_keys
+from ..utils.file_parser import FileParser, ParseProfile
+from .simulation_clock import clock_registry
+
+logger = logging.getLogger(__name__)
+
+REPLAY_DATA_DIR = os.getenv("REPLAY_DATA_DIR", "./replay_data")
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+# 청크 하나에 담을 최대 셀 수 / .npy로 옮길 때 한 번에 복사할 행 수
+CHUNK_CELLS = 2_000_000
+COPY_ROWS = 1_000_000
+
+
+def build_replay_dataset(
+    stream: BinaryIO,
+    filename: str,
+    size: int,
+    data_dir: str = REPLAY_DATA_DIR,
+    profile: Optional[ParseProfile] = None
+) -> Dict[str, Any]:
+    """
+    업로드 파일을 컬럼별 .npy 데이터셋으로 변환 (동기, 스레드/프로세스에서 실행 가능)
+
+    파일을 청크 단위로 한 번 읽으면서 컬럼별 임시 바이너리 파일에 이어 쓰고,
+    끝나면 행 수를 알게 되므로 .npy로 옮깁니다. 임시 디렉터리에서 만든 뒤
+    이름을 바꾸므로 실패하거나 중단되어도 반쯤 만들어진 데이터셋이 남지 않습니다.
+
+    Returns:
+        manifest (dataset_id 포함)
+
+    Raises:
+        HTTPException: 빈 파일이거나 데이터 행이 없는 경우 (400)
+    """
+    profile = profile or ParseProfile()
+    header_row, headers = FileParser.locate_header(stream, filename, size, profile)
+
+    os.makedirs(data_dir, exist_ok=True)
+    dataset_id = uuid.uuid4().hex
+    work_dir = tempfile.mkdtemp(prefix=f".{dataset_id}.", dir=data_dir)
+    try:
+        manifest = _write_columns(stream, filename, size, header_row, headers, work_dir, profile)
+        manifest["dataset_id"] = dataset_id
+        with open(os.path.join(work_dir, MANIFEST_NAME), "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False)
+        os.replace(work_dir, os.path.join(data_dir, dataset_id))
+    except BaseException:
+        shutil.rmtree(work_dir, ignore_errors=True)
+        raise
+
+    return manifest
+
+
+def _write_columns(
+    stream: BinaryIO,
+    filename: str,
+    size: int,
+    header_row: Optional[int],
+    headers: List[str],
+    work_dir: str,
+    profile: ParseProfile
+) -> Dict[str, Any]:
+    width = len(headers)
+    chunks = FileParser.iter_rows(
+        stream, filename, size,
+        skip_rows=0 if header_row is None else header_row + 1,
+        chunk_rows=max(1000, CHUNK_CELLS // max(width, 1))
+    )
+
+    keys = parameter_keys(headers)
+    types: Optional[List[str]] = None
+    raw_files = [open(os.path.join(work_dir, f"{key}.raw"), "wb") for key in keys]
+    # 숫자 컬럼: 정수값만 있는지 / 빈 값이 있는지, 범주 컬럼: 값 → 코드
+    integral = [True] * width
+    has_null = [False] * width
+    categories: List[Dict[Any, int]] = [{} for _ in range(width)]
+    row_count = 0
+
+    try:
+        while True:
+            with profile.stage("read_rows"):
+                chunk = next(chunks, None)
+            if chunk is None:
+                break
+
+            with profile.stage("write_columns"):
+                chunk = chunk.iloc[:, :width].reindex(columns=range(width))
+                if types is None:
+                    # 첫 청크로 컬럼 타입을 정하고 이후 청크의 숫자가 아닌 값은 빈 값으로 저장
+                    types = FileParser.infer_column_types(chunk)
+                numeric = [i for i, t in enumerate(types) if t == 'number']
+
+                if numeric:
+                    values = FileParser.numeric_values(chunk.iloc[:, numeric])
+                    present = ~np.isnan(values)
+                    whole = (~present | (np.where(present, values, 0.0) % 1 == 0)).all(axis=0)
+                    nulls = (~present).any(axis=0)
+                    for j, position in enumerate(numeric):
+                        values[:, j].tofile(raw_files[position])
+                        integral[position] = integral[position] and bool(whole[j])
+                        has_null[position] = has_null[position] or bool(nulls[j])
+
+                for position, data_type in enumerate(types):
+                    if data_type != 'number':
+                        codes = _encode(chunk.iloc[:, position], data_type, categories[position])
+                        codes.tofile(raw_files[position])
+
+                row_count += len(chunk)
+    finally:
+        for f in raw_files:
+            f.close()
+
+    if not row_count:
+        raise HTTPException(
+            status_code=400,
+            detail="재생할 데이터 행이 없습니다."
+        )
+
+    columns = []
+    with profile.stage("build_npy"):
+        for position, (name, key, data_type) in enumerate(zip(headers, keys, types)):
+            if data_type == 'number':
+                source_dtype = np.float64
+                target_dtype = np.int64 if integral[position] and not has_null[position] else np.float64
+            else:
+                source_dtype = target_dtype = np.int32
+            _raw_to_npy(work_dir, key, source_dtype, target_dtype, row_count)
+
+            column = {"name": name, "key": key, "dtype": np.dtype(target_dtype).name}
+            if data_type == 'number':
+                column["kind"] = "number"
+            else:
+                column["kind"] = "category"
+                column["categories"] = list(categories[position])
+            columns.append(column)
+
+    return {
+        "version": MANIFEST_VERSION,
+        "row_count": row_count,
+        "header_row": header_row,
+        "columns": columns
+    }
+
+
+def _encode(column, data_type: str, mapping: Dict[Any, int]) -> np.ndarray:
+    """문자열/불린 컬럼을 범주 코드(int32, 빈 값 -1)로 변환하며 새 범주를 mapping에 추가"""
+    present = column.notna().to_numpy()
+    text = column[present].astype(str)
+    lookup = {}
+    for value in text.unique():
+        lookup[value] = mapping.setdefault(FileParser.convert_value(value, data_type), len(mapping))
+
+    codes = np.full(len(column), -1, dtype=np.int32)
+    codes[present] = text.map(lookup).to_numpy(dtype=np.int32)
+    return codes
+
+
+def _raw_to_npy(work_dir: str, key: str, source_dtype, target_dtype, row_count: int) -> None:
+    """임시 바이너리 파일을 .npy로 옮김 (COPY_ROWS 단위로 복사하여 메모리 사용량 제한)"""
+    raw_path = os.path.join(work_dir, f"{key}.raw")
+    target = np.lib.format.open_memmap(
+        os.path.join(work_dir, f"{key}.npy"), mode="w+", dtype=target_dtype, shape=(row_count,)
+    )
+    source = np.memmap(raw_path, dtype=source_dtype, mode="r", shape=(row_count,))
+    for start in range(0, row_count, COPY_ROWS):
+        target[start:start + COPY_ROWS] = source[start:start + COPY_ROWS]
+    target.flush()
+    del source, target
+    os.unlink(raw_path)
+
+
+def remove_replay_dataset(dataset_id: str, data_dir: str = REPLAY_DATA_DIR) -> None:
+    """데이터셋 디렉터리 삭제 (없으면 무시)"""
+    replay_registry.forget(dataset_id)
+    shutil.rmtree(os.path.join(data_dir, dataset_id), ignore_errors=True)
+
+
+class ReplayDataset:
+    """메모리 맵으로 연 재생 데이터셋"""
+
+    def __init__(self, directory: str):
+        with open(os.path.join(directory, MANIFEST_NAME), encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("version") != MANIFEST_VERSION:
+            raise ValueError(f"지원하지 않는 재생 데이터 형식입니다: {manifest.get('version')}")
+
+        self.row_count: int = manifest["row_count"]
+        self.columns: List[Dict[str, Any]] = manifest["columns"]
+        self._arrays = [
+            np.load(os.path.join(directory, f"{column['key']}.npy"), mmap_mode="r")
+            for column in self.columns
+        ]
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """index번째 행 (빈 값은 None)"""
+        values = {}
+        for column, array in zip(self.columns, self._arrays):
+            value = array[index].item()
+            if column["kind"] == "category":
+                value = column["categories"][value] if value >= 0 else None
+            elif value != value:
+                # NaN
+                value = None
+            values[column["key"]] = value
+        return values
+
+
+def row_position(step: int, row_count: int, wrap: str) -> int:
+    """재생 단계(0, 1, 2, ...)를 끝 처리 방식에 따라 행 인덱스로 변환"""
+    if row_count <= 1 or step <= 0:
+        return 0
+    if wrap == "hold":
+        return min(step, row_count - 1)
+    if wrap == "ping_pong":
+        period = 2 * (row_count - 1)
+        phase = step % period
+        return phase if phase < row_count else period - phase
+    return step % row_count
+
+
+class ReplayRegistry:
+    """프로세스 전역 데이터셋 핸들 + 요청 단위 재생 커서"""
+
+    def __init__(self, data_dir: str = REPLAY_DATA_DIR):
+        self.data_dir = data_dir
+        self._lock = threading.Lock()
+        self._datasets: Dict[str, ReplayDataset] = {}
+        self._cursors: Dict[int, "itertools.count"] = {}
+
+    def dataset(self, dataset_id: str) -> ReplayDataset:
+        dataset = self._datasets.get(dataset_id)
+        if dataset is None:
+            with self._lock:
+                dataset = self._datasets.get(dataset_id)
+                if dataset is None:
+                    dataset = ReplayDataset(os.path.join(self.data_dir, dataset_id))
+                    self._datasets[dataset_id] = dataset
+        return dataset
+
+    def forget(self, dataset_id: str) -> None:
+        with self._lock:
+            self._datasets.pop(dataset_id, None)
+
+    def next_step(self, simulator_id: int) -> int:
+        cursor = self._cursors.get(simulator_id)
+        if cursor is None:
+            with self._lock:
+                cursor = self._cursors.setdefault(simulator_id, itertools.count())
+        # itertools.count의 next는 GIL 아래에서 원자적
+        return next(cursor)
+
+    def reset_cursor(self, simulator_id: int) -> None:
+        with self._lock:
+            self._cursors.pop(simulator_id, None)
+
+    def current_values(self, simulator_id: int, replay_config: Dict[str, Any]) -> Dict[str, Any]:
+        """재생 설정에 따라 이번에 내보낼 행의 값"""
+        dataset = self.dataset(replay_config["dataset_id"])
+
+        if replay_config.get("advance") == "clock":
+            started_at = datetime.fromisoformat(replay_config["started_at"])
+            elapsed = (clock_registry.get(simulator_id).now() - started_at).total_seconds()
+            step = int(elapsed // replay_config.get("interval_seconds", 1.0))
+        else:
+            step = self.next_step(simulator_id)
+
+        return dataset.row(row_position(step, dataset.row_count, replay_config.get("wrap", "loop")))
+
+
+# 프로세스 전역 재생 데이터 저장소
+replay_registry = ReplayRegistry()
@@ -0,0 +1,240 @@
+"""
+공유 메모리 값 보드 - 멀티 워커 배포에서 최신 시뮬레이터 값을 프로세스 간에 공유
+
+uvicorn/gunicorn 워커가 여러 개면 워커마다 캐시와 랜덤 값이 따로 생깁니다.
+워커 중 하나(리더)만 틱 스케줄러로 값을 생성하여 multiprocessing.shared_memory
+영역에 게시하고, 나머지 워커(팔로워)는 락 없이 읽기만 합니다.
+
+영역 레이아웃 (seqlock):
+    [magic 8B][sequence uint64][length uint64][payload ...]
+
+쓰기: sequence를 홀수로 올림 → payload/length 기록 → sequence를 짝수로 올림
+읽기: sequence가 짝수인 것을 확인 → payload 복사 → sequence가 그대로인지 재확인
+      (쓰기 도중이었거나 그 사이에 바뀌었으면 다시 읽음)
+
+항목 단위 payload (write_entries / read_entries):
+    [tag uint64][count uint64][offsets uint64 × (count + 1)][항목 바이트 ...]
+
+독자는 오프셋 표로 필요한 항목만 공유 메모리에서 바로 복사하므로, 항목이 많아도
+전체 payload를 복사하거나 디코딩하지 않습니다. tag는 작성자가 붙이는 버전 표식입니다.
+
+리더는 잠금 파일에 대한 fcntl.flock으로 선출되며, 리더 프로세스가 종료되면
+잠금이 풀려 다른 워커가 리더를 이어받습니다.
+"""
+import fcntl
+import logging
+import os
+import struct
+import time
+from multiprocessing import resource_tracker, shared_memory
+from typing import List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class SharedBoard:
+    """seqlock 방식의 단일 작성자/다중 독자 공유 메모리 영역"""
+
+    MAGIC = b"SIMBOARD"
+    HEADER = struct.Struct("<8sQQ")
+    ENTRIES_HEADER = struct.Struct("<QQ")
+    OFFSET = struct.Struct("<Q")
+    SEQUENCE_OFFSET = 8
+    MAX_READ_RETRIES = 100
+
+    def __init__(self, shm: shared_memory.SharedMemory):
+        self._shm = shm
+        self.capacity = shm.size - self.HEADER.size
+        self._last_sequence = 0
+        self._last_payload: Optional[bytes] = None
+
+    @classmethod
+    def create(cls, name: str, size: int) -> "SharedBoard":
+        """영역 생성 (이전 리더가 남긴 영역이 있으면 크기가 맞을 때 재사용)"""
+        total = size + cls.HEADER.size
+        try:
+            shm = shared_memory.SharedMemory(name=name, create=True, size=total)
+        except FileExistsError:
+            shm = shared_memory.SharedMemory(name=name)
+            if shm.size < total:
+                shm.close()
+                shm.unlink()
+                shm = shared_memory.SharedMemory(name=name, create=True, size=total)
+
+        # 리더가 바뀌어도 같은 영역을 이어 쓰도록 resource_tracker의 자동 삭제 대상에서 제외
+        resource_tracker.unregister(shm._name, "shared_memory")
+
+        board = cls(shm)
+        # 새 짝수 sequence로 올려 독자가 이전 리더의 payload를 캐시에서 다시 쓰지 않도록 함
+        # (이전 리더가 쓰기 도중 종료되어 홀수로 남았으면 짝수로 맞춰 독자가 멈추지 않도록 함)
+        sequence = board.sequence
+        sequence += 2 - sequence % 2
+        cls.HEADER.pack_into(shm.buf, 0, cls.MAGIC, sequence, 0)
+        return board
+
+    @classmethod
+    def attach(cls, name: str) -> Optional["SharedBoard"]:
+        """기존 영역에 연결 (아직 없으면 None)"""
+        try:
+            shm = shared_memory.SharedMemory(name=name)
+        except FileNotFoundError:
+            return None
+
+        # 독자는 영역의 소유자가 아니므로 종료 시 resource_tracker가 영역을 지우지 않도록 해제
+        resource_tracker.unregister(shm._name, "shared_memory")
+        return cls(shm)
+
+    @property
+    def sequence(self) -> int:
+        return struct.unpack_from("<Q", self._shm.buf, self.SEQUENCE_OFFSET)[0]
+
+    def write(self, payload: bytes) -> int:
+        """payload 게시 - 단일 작성자 전용. 새 sequence 반환"""
+        if len(payload) > self.capacity:
+            raise ValueError(
+                f"공유 보드 용량 부족: {len(payload)}B > {self.capacity}B "
+                f"(SHARED_BOARD_SIZE_MB를 늘려주세요)"
+            )
+
+        buf = self._shm.buf
+        sequence = self.sequence + 1
+        struct.pack_into("<Q", buf, self.SEQUENCE_OFFSET, sequence)  # 홀수: 쓰는 중
+
+        start = self.HEADER.size
+        buf[start:start + len(payload)] = payload
+        struct.pack_into("<Q", buf, self.SEQUENCE_OFFSET + 8, len(payload))
+
+        sequence += 1
+        struct.pack_into("<Q", buf, self.SEQUENCE_OFFSET, sequence)  # 짝수: 완료
+        return sequence
+
+    def read(self) -> Tuple[int, Optional[bytes]]:
+        """
+        최신 payload 읽기 - (sequence, payload). 변경이 없으면 이전 payload를 그대로 반환
+
+        아직 게시된 값이 없으면 (0, None)을 반환합니다.
+        """
+        buf = self._shm.buf
+        for _ in range(self.MAX_READ_RETRIES):
+            magic, before, length = self.HEADER.unpack_from(buf, 0)
+            if magic != self.MAGIC or before == 0:
+                return 0, None
+            if before == self._last_sequence:
+                return before, self._last_payload
+            if before % 2:
+                time.sleep(0)
+                continue
+            if length == 0:
+                # create() 직후 첫 게시 전 상태 (이전 리더의 sequence가 남아 있어도 payload 없음)
+                return 0, None
+
+            start = self.HEADER.size
+            payload = bytes(buf[start:start + length])
+
+            if self.sequence == before:
+                self._last_sequence = before
+                self._last_payload = payload
+                return before, payload
+
+        logger.warning("공유 보드 읽기 재시도 한도 초과 - 이전 값을 사용합니다.")
+        return self._last_sequence, self._last_payload
+
+    def write_entries(self, tag: int, entries: Sequence[bytes]) -> int:
+        """항목 목록을 오프셋 표와 함께 게시 - 단일 작성자 전용. 새 sequence 반환"""
+        offsets = [0]
+        for entry in entries:
+            offsets.append(offsets[-1] + len(entry))
+        payload = b"".join([
+            self.ENTRIES_HEADER.pack(tag, len(entries)),
+            struct.pack(f"<{len(offsets)}Q", *offsets),
+            *entries
+        ])
+        return self.write(payload)
+
+    def read_entries(
+        self,
+        indices: Optional[Sequence[int]] = None
+    ) -> Tuple[int, Optional[List[bytes]]]:
+        """
+        write_entries로 게시된 항목 중 indices 위치의 항목만 읽기 - (tag, 항목 목록)
+
+        indices가 None이면 전체 항목을 읽습니다. 모든 항목은 같은 게시본에서 읽히며
+        (seqlock 재확인), 범위를 벗어난 위치는 None입니다.
+        아직 게시된 값이 없으면 (0, None)을 반환합니다.
+        """
+        buf = self._shm.buf
+        start = self.HEADER.size
+        for _ in range(self.MAX_READ_RETRIES):
+            magic, before, length = self.HEADER.unpack_from(buf, 0)
+            if magic != self.MAGIC or before == 0:
+                return 0, None
+            if before % 2:
+                time.sleep(0)
+                continue
+            if length == 0:
+                return 0, None
+
+            try:
+                tag, count = self.ENTRIES_HEADER.unpack_from(buf, start)
+                table = start + self.ENTRIES_HEADER.size
+                data = table + self.OFFSET.size * (count + 1)
+                if data > start + length:
+                    raise ValueError("오프셋 표가 payload를 벗어남")
+
+                entries: List[Optional[bytes]] = []
+                for index in (range(count) if indices is None else indices):
+                    if not 0 <= index < count:
+                        entries.append(None)
+                        continue
+                    first, = self.OFFSET.unpack_from(buf, table + self.OFFSET.size * index)
+                    last, = self.OFFSET.unpack_from(buf, table + self.OFFSET.size * (index + 1))
+                    entries.append(bytes(buf[data + first:data + last]))
+            except (struct.error, ValueError):
+                # 쓰기와 겹쳐 헤더/오프셋이 깨진 경우 - sequence 재확인 후 다시 읽음
+                if self.sequence == before:
+                    logger.warning("공유 보드 항목 형식이 잘못되었습니다.")
+                    return 0, None
+                continue
+
+            if self.sequence == before:
+                return tag, entries
+
+        logger.warning("공유 보드 읽기 재시도 한도 초과")
+        return 0, None
+
+    def close(self) -> None:
+        # 다음 리더가 재사용할 수 있도록 영역 자체는 지우지 않음
+        self._shm.close()
+
+
+class LeaderLock:
+    """잠금 파일 기반 리더 선출 (프로세스 종료 시 자동 해제)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._fd: Optional[int] = None
+
+    @property
+    def acquired(self) -> bool:
+        return self._fd is not None
+
+    def try_acquire(self) -> bool:
+        """논블로킹으로 리더 잠금 획득 시도"""
+        if self._fd is not None:
+            return True
+
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+
+        self._fd = fd
+        return True
+
+    def release(self) -> None:
+        if self._fd is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = None
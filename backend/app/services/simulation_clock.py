@@ -0,0 +1,217 @@
+"""
+시뮬레이션 시계 - 시간 기반 고장 패턴의 배속 재생, 일시정지, 시점 이동
+
+GRADUAL, CYCLIC, DRIFT 고장은 시나리오 적용 시점부터의 경과 시간으로 값을 계산하므로
+실제 시간(wall clock)에 묶여 있으면 6시간짜리 열화 시나리오를 보는 데 6시간이 걸립니다.
+시뮬레이터마다 가상 시계를 두고 배속(speed)을 지정하면 경과 시간이 그만큼 빨리 흐릅니다.
+
+시계 설정은 시뮬레이터 행(clock_config)에 기준점으로 저장됩니다. 기준점은 실제 UTC 시각이므로
+어느 워커/인스턴스든 같은 상태에서 같은 가상 시각을 계산하며, 각 프로세스는 시뮬레이터를
+컴파일할 때(요청 경로, 틱 스케줄러 목록 갱신) ClockRegistry.sync로 행의 상태를 반영합니다.
+"""
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Optional, Any
+
+
+class SimulationClock:
+    """배속/일시정지/시점 이동을 지원하는 가상 시계 (UTC 기준 naive datetime)
+
+    가상 시각 = 기준 가상 시각 + (현재 실제 시각 - 기준 실제 시각) × 배속
+    배속이나 일시정지 상태가 바뀔 때마다 기준점을 현재 시각으로 다시 잡습니다.
+    """
+
+    def __init__(
+        self,
+        speed: float = 1.0,
+        wall_clock: Callable[[], datetime] = datetime.utcnow
+    ):
+        """
+        Args:
+            speed: 배속 (1.0 = 실제 시간, 3600.0 = 1초에 1시간)
+            wall_clock: 실제 시각 함수
+        """
+        if speed <= 0:
+            raise ValueError("배속은 0보다 커야 합니다.")
+
+        self._lock = threading.Lock()
+        self._wall_clock = wall_clock
+        self._speed = float(speed)
+        self._paused = False
+        self._wall_anchor = wall_clock()
+        self._sim_anchor = self._wall_anchor
+
+    def _now_unlocked(self) -> datetime:
+        if self._paused:
+            return self._sim_anchor
+        wall_elapsed = (self._wall_clock() - self._wall_anchor).total_seconds()
+        return self._sim_anchor + timedelta(seconds=wall_elapsed * self._speed)
+
+    def _rebase(self, sim_time: Optional[datetime] = None) -> None:
+        """기준점을 현재 시각(또는 지정한 가상 시각)으로 재설정"""
+        self._sim_anchor = sim_time if sim_time is not None else self._now_unlocked()
+        self._wall_anchor = self._wall_clock()
+
+    def now(self) -> datetime:
+        """현재 가상 시각"""
+        with self._lock:
+            return self._now_unlocked()
+
+    @property
+    def speed(self) -> float:
+        return self._speed
+
+    @property
+    def paused(self) -> bool:
+        return self._paused
+
+    def set_speed(self, speed: float) -> None:
+        """배속 변경 - 지금까지 흐른 가상 시간은 유지"""
+        if speed <= 0:
+            raise ValueError("배속은 0보다 커야 합니다.")
+        with self._lock:
+            self._rebase()
+            self._speed = float(speed)
+
+    def pause(self) -> None:
+        """가상 시간 정지"""
+        with self._lock:
+            if not self._paused:
+                self._rebase()
+                self._paused = True
+
+    def resume(self) -> None:
+        """가상 시간 재개"""
+        with self._lock:
+            if self._paused:
+                self._rebase(self._sim_anchor)
+                self._paused = False
+
+    def seek(self, sim_time: datetime) -> None:
+        """가상 시각을 지정한 시점으로 이동"""
+        with self._lock:
+            self._rebase(_to_naive_utc(sim_time))
+
+    def advance(self, seconds: float) -> None:
+        """가상 시각을 지정한 초만큼 앞(음수면 뒤)으로 이동"""
+        with self._lock:
+            self._rebase(self._now_unlocked() + timedelta(seconds=seconds))
+
+    def to_state(self) -> Dict[str, Any]:
+        """저장용 상태 (기준점과 배속/일시정지 - from_state로 같은 시계를 복원)"""
+        with self._lock:
+            return {
+                "speed": self._speed,
+                "paused": self._paused,
+                "sim_anchor": self._sim_anchor.isoformat(),
+                "wall_anchor": self._wall_anchor.isoformat()
+            }
+
+    @classmethod
+    def from_state(
+        cls,
+        state: Dict[str, Any],
+        wall_clock: Callable[[], datetime] = datetime.utcnow
+    ) -> "SimulationClock":
+        """to_state 결과로부터 시계 복원
+
+        Raises:
+            ValueError: 배속이 0 이하이거나 시각 형식이 잘못된 경우
+        """
+        clock = cls(speed=float(state["speed"]), wall_clock=wall_clock)
+        clock._paused = bool(state["paused"])
+        clock._sim_anchor = datetime.fromisoformat(state["sim_anchor"])
+        clock._wall_anchor = datetime.fromisoformat(state["wall_anchor"])
+        return clock
+
+    def to_dict(self) -> Dict[str, Any]:
+        """시계 상태를 응답용 딕셔너리로 변환"""
+        with self._lock:
+            now = self._now_unlocked()
+            wall_now = self._wall_clock()
+        return {
+            "speed": self._speed,
+            "paused": self._paused,
+            "current_time": now,
+            "offset_seconds": (now - wall_now).total_seconds()
+        }
+
+
+class ClockRegistry:
+    """시뮬레이터 ID별 가상 시계 저장소
+
+    별도로 설정하지 않은 시뮬레이터는 실제 시간(배속 1.0) 시계를 공유합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._clocks: Dict[int, SimulationClock] = {}
+        # 시뮬레이터 ID → 마지막으로 반영한 저장 상태 (같은 상태면 시계를 다시 만들지 않음)
+        self._states: Dict[int, Dict[str, Any]] = {}
+        self._realtime = SimulationClock()
+
+    def get(self, simulator_id: int) -> SimulationClock:
+        """시뮬레이터의 시계 조회 (없으면 실제 시간 시계)"""
+        return self._clocks.get(simulator_id, self._realtime)
+
+    def get_or_create(self, simulator_id: int) -> SimulationClock:
+        """시뮬레이터 전용 시계 조회, 없으면 실제 시간에서 시작하는 시계 생성"""
+        with self._lock:
+            clock = self._clocks.get(simulator_id)
+            if clock is None:
+                clock = SimulationClock()
+                self._clocks[simulator_id] = clock
+            return clock
+
+    def is_custom(self, simulator_id: int) -> bool:
+        return simulator_id in self._clocks
+
+    def reset(self, simulator_id: int) -> None:
+        """시뮬레이터 시계를 실제 시간으로 되돌림"""
+        with self._lock:
+            self._clocks.pop(simulator_id, None)
+            self._states.pop(simulator_id, None)
+
+    def clear(self) -> None:
+        """모든 시뮬레이터 시계를 실제 시간으로 되돌림"""
+        with self._lock:
+            self._clocks.clear()
+            self._states.clear()
+
+    def sync(self, simulator_id: int, state: Optional[Dict[str, Any]]) -> None:
+        """
+        저장된 상태(시뮬레이터 행의 clock_config)를 반영 - None이면 실제 시간 시계로
+
+        다른 프로세스에서 바꾼 설정도 이 프로세스가 시뮬레이터를 다시 읽을 때 반영됩니다.
+
+        Raises:
+            ValueError: 상태 형식이 잘못된 경우 (기존 시계 유지)
+        """
+        with self._lock:
+            if state is None:
+                self._clocks.pop(simulator_id, None)
+                self._states.pop(simulator_id, None)
+            elif self._states.get(simulator_id) != state:
+                self._clocks[simulator_id] = SimulationClock.from_state(state)
+                self._states[simulator_id] = state
+
+    def persisted(self, simulator_id: int) -> Optional[Dict[str, Any]]:
+        """시뮬레이터 전용 시계의 저장용 상태 (실제 시간 시계면 None) - 반영한 상태로 기록"""
+        with self._lock:
+            clock = self._clocks.get(simulator_id)
+            if clock is None:
+                return None
+            state = clock.to_state()
+            self._states[simulator_id] = state
+            return state
+
+
+def _to_naive_utc(value: datetime) -> datetime:
+    """timezone 정보가 있으면 UTC naive datetime으로 변환"""
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+# 프로세스 전역 시계 저장소
+clock_registry = ClockRegistry()
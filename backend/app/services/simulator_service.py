@@ -1,27 +1,57 @@
 """
 시뮬레이터 서비스 - 시뮬레이터 CRUD 및 동적 API 관리 비즈니스 로직
+
+환경 변수:
+    SIMULATOR_BULK_MAX_ITEMS: 일괄 생성 요청 하나의 최대 시뮬레이터 수 (기본값: 10000)
+    FLEET_MAX_INSTANCES: 플릿 템플릿 하나의 최대 인스턴스 수 (기본값: 100000)
 """
 import logging
-import random
-from typing import Optional, List, Dict, Any
+import os
+from collections import Counter
+from typing import TYPE_CHECKING, Optional, List, Dict, Any
 from sqlalchemy.orm import Session
 from sqlalchemy import select, and_
 import json
 from datetime import datetime
 
+from ..database import SessionLocal
 from ..models.simulator import Simulator
 from ..models.user import User
 from ..models.failure_scenario import FailureScenario
-from .failure_engine import FailureEngine
+from .compiled_simulator import (
+    CompiledSimulator,
+    compile_simulator,
+    evaluate_batch,
+    evaluate_compiled,
+    inactive_response,
+    generate_random_values,
+    generate_random_columns,
+    load_compiled_simulators
+)
+from .simulation_clock import clock_registry
+from .cache_invalidation import invalidation_bus
+from .compiled_cache import compiled_cache
+from .fleet_cache import fleet_frames
+from .cascade_plan import cascade_plans, cascade_triggers
+from .tick_scheduler import tick_scheduler
 from ..schemas.simulator import (
     SimulatorCreate, 
     SimulatorUpdate, 
     SimulatorResponse,
     SimulatorDataResponse,
     SimulatorInactiveResponse,
-    ParameterConfig
+    SimulatorClockUpdate,
+    ReplaySimulatorCreate,
+    ParameterConfig,
+    FleetConfig
 )
 
+if TYPE_CHECKING:
+    import numpy as np
+
+BULK_CREATE_MAX_ITEMS = int(os.getenv("SIMULATOR_BULK_MAX_ITEMS", "10000"))
+FLEET_MAX_INSTANCES = int(os.getenv("FLEET_MAX_INSTANCES", "100000"))
+
 
 class SimulatorService:
     """시뮬레이터 관련 비즈니스 로직을 처리하는 서비스 클래스"""
@@ -51,14 +81,207 @@ class SimulatorService:
             name=simulator_create.name,
             parameters=parameters_json,
             parameter_config=parameter_config_json,
-            is_active=simulator_create.is_active
+            is_active=simulator_create.is_active,
+            **SimulatorService._fleet_values(simulator_create.fleet)
         )
         
         db.add(db_simulator)
+        db.flush()
+        invalidation_bus.notify(db, [db_simulator.id])
         db.commit()
         db.refresh(db_simulator)
         return db_simulator
     
+    @staticmethod
+    def create_simulators(db: Session, user_id: int, simulator_creates: List[SimulatorCreate]) -> List[Simulator]:
+        """여러 시뮬레이터를 한 트랜잭션으로 생성 (이름이 하나라도 겹치면 아무것도 생성하지 않음)"""
+        names = [simulator_create.name for simulator_create in simulator_creates]
+        stmt = select(Simulator.name).where(
+            and_(Simulator.user_id == user_id, Simulator.name.in_(names))
+        )
+        conflicts = set(db.scalars(stmt)) | {name for name, count in Counter(names).items() if count > 1}
+        if conflicts:
+            raise ValueError(f"이미 존재하거나 중복된 시뮬레이터 이름입니다: {', '.join(sorted(conflicts))}")
+        
+        db_simulators = [
+            Simulator(**SimulatorService._simulator_values(user_id, simulator_create))
+            for simulator_create in simulator_creates
+        ]
+        
+        try:
+            db.add_all(db_simulators)
+            db.flush()
+            invalidation_bus.notify(db, [db_simulator.id for db_simulator in db_simulators])
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        
+        return db_simulators
+    
+    @staticmethod
+    def bulk_create_simulators(
+        db: Session,
+        user_id: int,
+        simulator_creates: List[SimulatorCreate]
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 시뮬레이터를 집합 단위로 생성 - 이름 충돌 조회 1회와
+        다중 행 INSERT ... ON CONFLICT DO NOTHING RETURNING을 한 트랜잭션에서 실행
+        
+        이름이 겹치는 항목(기존 시뮬레이터, 요청 안의 중복, 조회 후 다른 요청이 먼저 생성)만
+        건너뛰고 나머지는 모두 생성합니다.
+        
+        Returns:
+            입력 순서대로 {"name", "status": "created" | "conflict" | "invalid", "simulator_id", "detail"}
+        """
+        names = {simulator_create.name for simulator_create in simulator_creates}
+        stmt = select(Simulator.name).where(
+            and_(Simulator.user_id == user_id, Simulator.name.in_(names))
+        )
+        existing = set(db.scalars(stmt))
+        
+        results: List[Dict[str, Any]] = []
+        rows: List[Dict[str, Any]] = []
+        requested = set()
+        for simulator_create in simulator_creates:
+            result = {"name": simulator_create.name, "status": "created", "simulator_id": None, "detail": None}
+            if simulator_create.name in existing:
+                result.update(status="conflict", detail="이미 존재하는 시뮬레이터 이름입니다.")
+            elif simulator_create.name in requested:
+                result.update(status="conflict", detail="요청 안에서 중복된 시뮬레이터 이름입니다.")
+            else:
+                try:
+                    # 설정 한도(FLEET_MAX_INSTANCES 등)를 넘는 항목은 그 항목만 invalid로 표시
+                    rows.append(SimulatorService._simulator_values(user_id, simulator_create))
+                    requested.add(simulator_create.name)
+                except ValueError as e:
+                    result.update(status="invalid", detail=str(e))
+            results.append(result)
+        
+        if not rows:
+            return results
+        
+        dialect = db.get_bind().dialect.name
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        elif dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            from sqlalchemy import insert
+        
+        stmt = insert(Simulator)
+        if dialect in ("postgresql", "sqlite"):
+            # 조회 이후 다른 요청이 같은 이름을 먼저 만든 경우는 건너뜀 (ix_simulators_user_id_name)
+            stmt = stmt.on_conflict_do_nothing(index_elements=["user_id", "name"])
+        
+        try:
+            # 행 목록을 넘기면 SQLAlchemy가 다중 행 VALUES로 묶어 실행하고 RETURNING 결과를 모음
+            inserted = {
+                name: simulator_id
+                for simulator_id, name in db.execute(stmt.returning(Simulator.id, Simulator.name), rows)
+            }
+            invalidation_bus.notify(db, list(inserted.values()))
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        
+        for result in results:
+            if result["status"] != "created":
+                continue
+            simulator_id = inserted.get(result["name"])
+            if simulator_id is None:
+                result.update(status="conflict", detail="같은 이름의 시뮬레이터가 동시에 생성되었습니다.")
+            else:
+                result["simulator_id"] = simulator_id
+        return results
+    
+    @staticmethod
+    def _simulator_values(user_id: int, simulator_create: SimulatorCreate) -> Dict[str, Any]:
+        """SimulatorCreate를 Simulator 컬럼 값으로 변환"""
+        return {
+            "user_id": user_id,
+            "name": simulator_create.name,
+            "parameters": json.dumps(simulator_create.parameters, ensure_ascii=False),
+            "parameter_config": json.dumps(
+                {k: v.model_dump() for k, v in (simulator_create.parameter_config or {}).items()},
+                ensure_ascii=False
+            ),
+            "is_active": simulator_create.is_active,
+            **SimulatorService._fleet_values(simulator_create.fleet)
+        }
+    
+    @staticmethod
+    def _fleet_values(fleet: Optional[FleetConfig]) -> Dict[str, Any]:
+        """플릿 설정을 mode/fleet_config 컬럼 값으로 변환 (None이면 일반 시뮬레이터)"""
+        if fleet is None:
+            return {"mode": "static", "fleet_config": None}
+        
+        if fleet.instance_count > FLEET_MAX_INSTANCES:
+            raise ValueError(f"플릿 인스턴스는 최대 {FLEET_MAX_INSTANCES}개까지 만들 수 있습니다.")
+        
+        # 변경분은 지정한 항목만 저장 (인스턴스 번호 키는 JSON 문자열)
+        fleet_config = {
+            "instance_count": fleet.instance_count,
+            "overrides": {
+                str(index): override.model_dump(exclude_none=True)
+                for index, override in sorted(fleet.overrides.items())
+            }
+        }
+        return {"mode": "fleet", "fleet_config": json.dumps(fleet_config, ensure_ascii=False)}
+    
+    @staticmethod
+    def create_replay_simulator(
+        db: Session,
+        user_id: int,
+        replay_create: ReplaySimulatorCreate,
+        manifest: Dict[str, Any]
+    ) -> Simulator:
+        """변환이 끝난 재생 데이터셋으로 재생 시뮬레이터 생성
+        
+        파라미터 기본값은 데이터셋의 첫 행이며, 생성에 실패하면 데이터셋을 삭제합니다.
+        """
+        from .replay_store import remove_replay_dataset, replay_registry
+        
+        try:
+            existing_simulator = SimulatorService.get_simulator_by_name_and_user(
+                db, str(user_id), replay_create.name
+            )
+            if existing_simulator:
+                raise ValueError(f"이미 '{replay_create.name}' 이름의 시뮬레이터가 존재합니다.")
+            
+            first_row = replay_registry.dataset(manifest["dataset_id"]).row(0)
+            replay_config = {
+                "dataset_id": manifest["dataset_id"],
+                "row_count": manifest["row_count"],
+                **replay_create.replay.model_dump(),
+                # clock 모드의 0번째 행 기준 시각 (시뮬레이터 시계와 같은 UTC naive)
+                "started_at": datetime.utcnow().isoformat()
+            }
+            
+            db_simulator = Simulator(
+                user_id=user_id,
+                name=replay_create.name,
+                parameters=json.dumps(first_row, ensure_ascii=False),
+                parameter_config='{}',
+                is_active=replay_create.is_active,
+                mode="replay",
+                replay_config=json.dumps(replay_config, ensure_ascii=False)
+            )
+            
+            db.add(db_simulator)
+            db.flush()
+            invalidation_bus.notify(db, [db_simulator.id])
+            db.commit()
+        except Exception:
+            db.rollback()
+            remove_replay_dataset(manifest["dataset_id"])
+            raise
+        
+        db.refresh(db_simulator)
+        return db_simulator
+    
     @staticmethod
     def get_simulator_by_id(db: Session, simulator_id: int) -> Optional[Simulator]:
         """ID로 시뮬레이터 조회"""
@@ -151,10 +374,34 @@ class SimulatorService:
                     ensure_ascii=False
                 )
 
+            # 재생 옵션은 기존 재생 설정(dataset_id 등)에 병합
+            if "replay" in update_data:
+                replay_options = update_data.pop("replay")
+                if replay_options is not None:
+                    if db_simulator.mode != "replay":
+                        raise ValueError("재생 시뮬레이터가 아니므로 재생 옵션을 설정할 수 없습니다.")
+                    replay_config = json.loads(db_simulator.replay_config or '{}')
+                    replay_config.update(replay_options)
+                    update_data["replay_config"] = json.dumps(replay_config, ensure_ascii=False)
+
+            # 플릿 설정은 통째로 교체 (null이면 일반 시뮬레이터로 전환)
+            if "fleet" in update_data:
+                update_data.pop("fleet")
+                if db_simulator.mode == "replay":
+                    raise ValueError("재생 시뮬레이터는 플릿 템플릿으로 바꿀 수 없습니다.")
+                fleet = simulator_update.fleet
+                if fleet is not None:
+                    parameters = simulator_update.parameters or json.loads(db_simulator.parameters)
+                    unknown = fleet.unknown_parameters(parameters)
+                    if unknown:
+                        raise ValueError(f"플릿 변경분에 템플릿에 없는 파라미터가 있습니다: {', '.join(unknown)}")
+                update_data.update(SimulatorService._fleet_values(fleet))
+
             # 업데이트 적용
             for field, value in update_data.items():
                 setattr(db_simulator, field, value)
 
+            invalidation_bus.notify(db, [simulator_id])
             db.commit()
             db.refresh(db_simulator)
             return db_simulator
@@ -175,8 +422,18 @@ class SimulatorService:
         if db_simulator.user_id != user_id:
             raise ValueError("해당 시뮬레이터를 삭제할 권한이 없습니다.")
         
+        replay_config = json.loads(db_simulator.replay_config or '{}') if db_simulator.mode == "replay" else None
+        
         db.delete(db_simulator)
+        invalidation_bus.notify(db, [simulator_id])
         db.commit()
+        clock_registry.reset(simulator_id)
+        
+        if replay_config and replay_config.get("dataset_id"):
+            from .replay_store import remove_replay_dataset, replay_registry
+            
+            replay_registry.reset_cursor(simulator_id)
+            remove_replay_dataset(replay_config["dataset_id"])
         return True
     
     @staticmethod
@@ -192,6 +449,127 @@ class SimulatorService:
         Returns:
             시뮬레이터 데이터 또는 비활성화 메시지
         """
+        # 틱 스케줄러가 실행 중이면 미리 계산된 스냅샷에서 바로 반환
+        snapshot = tick_scheduler.lookup(user_id_str, simulator_name)
+        if snapshot is not None:
+            return snapshot
+        
+        compiled = SimulatorService._get_compiled_simulator(db, user_id_str, simulator_name)
+        response = evaluate_compiled(compiled)
+        # 스냅샷 경로와 같은 값을 내도록 고장 전파 영향도 반영
+        cascade_plans.apply_to_response(db, compiled, response)
+        return response
+    
+    @staticmethod
+    def get_user_snapshot(db: Session, user_id_str: str, columnar: bool = False) -> Dict[str, Any]:
+        """
+        사용자의 모든 시뮬레이터 현재 값을 한 번에 조회 (SCADA 등 전체 주기 폴링용)
+        
+        틱 스케줄러가 실행 중이면 스냅샷의 사용자별 색인에서 바로 가져오고, 아니면
+        시뮬레이터와 적용된 시나리오를 한 번의 쿼리로 로드해 evaluate_batch로 일괄 평가한 뒤
+        고장 전파 계획을 적용합니다.
+        플릿 템플릿은 템플릿 자체 값이 포함됩니다 (인스턴스는 인스턴스 경로로 조회).
+        
+        Args:
+            columnar: True면 파라미터 구성이 같은 시뮬레이터끼리 묶어 파라미터별 값 배열로 반환
+            
+        Raises:
+            ValueError: 사용자가 없는 경우
+        """
+        responses = tick_scheduler.lookup_user(user_id_str)
+        
+        if not responses:
+            user = db.scalar(select(User).where(User.user_id == user_id_str.lower()))
+            if not user:
+                raise ValueError(f"사용자 '{user_id_str}'를 찾을 수 없습니다.")
+            
+            simulators = load_compiled_simulators(db, user_id=user.id)
+            results = evaluate_batch(simulators)
+            cascade_plans.get(db, user.id).apply(cascade_triggers(simulators), results)
+            responses = {
+                compiled.name: results[compiled.simulator_id]
+                for compiled in simulators
+                if compiled.simulator_id in results
+            }
+        
+        active = {}
+        inactive = []
+        for name in sorted(responses):
+            response = responses[name]
+            if response["type"] == "active":
+                active[name] = response["data"]
+            else:
+                inactive.append(name)
+        
+        snapshot: Dict[str, Any] = {
+            "user_id": user_id_str,
+            "timestamp": datetime.now().isoformat(),
+            "format": "columnar" if columnar else "document"
+        }
+        if not columnar:
+            snapshot["simulators"] = active
+        else:
+            # 파라미터 키 목록이 같은 시뮬레이터끼리 묶어 키를 한 번만 기록
+            groups: Dict[tuple, Dict[str, Any]] = {}
+            for name, data in active.items():
+                group = groups.get(tuple(data))
+                if group is None:
+                    group = groups[tuple(data)] = {"simulators": [], "columns": {key: [] for key in data}}
+                group["simulators"].append(name)
+                for key, value in data.items():
+                    group["columns"][key].append(value)
+            snapshot["groups"] = list(groups.values())
+        snapshot["inactive"] = inactive
+        return snapshot
+    
+    @staticmethod
+    def get_fleet_instance_data(db: Session, user_id_str: str, simulator_name: str, instance: int) -> Dict[str, Any]:
+        """
+        플릿 템플릿 인스턴스 하나의 데이터 조회
+        
+        템플릿의 모든 인스턴스 값은 한 번에 생성되어 FLEET_FRAME_TTL_MS 동안 공유되며,
+        이 인스턴스의 행만 꺼내 반환합니다.
+        
+        Raises:
+            ValueError: 사용자/시뮬레이터가 없거나, 플릿 템플릿이 아니거나, 인스턴스 번호가 범위 밖인 경우
+        """
+        compiled = SimulatorService._get_compiled_simulator(db, user_id_str, simulator_name)
+        
+        if compiled.fleet_config is None:
+            raise ValueError(f"시뮬레이터 '{simulator_name}'는 플릿 템플릿이 아닙니다.")
+        
+        instance_count = compiled.fleet_config["instance_count"]
+        if not 0 <= instance < instance_count:
+            raise ValueError(f"인스턴스 번호는 0 이상 {instance_count} 미만이어야 합니다.")
+        
+        if not compiled.is_active:
+            return inactive_response()
+        
+        return fleet_frames.get(compiled).instance(instance)
+    
+    @staticmethod
+    def _get_compiled_simulator(db: Session, user_id_str: str, simulator_name: str) -> CompiledSimulator:
+        """요청용 컴파일 결과 조회 (컴파일 캐시가 켜져 있으면 캐시 경유)"""
+        if compiled_cache.enabled:
+            # DB가 느리거나 장애면 허용 기간 안의 이전 컴파일 결과로 응답
+            return compiled_cache.get(
+                compiled_cache.make_key(user_id_str, simulator_name),
+                lambda: SimulatorService.load_compiled_simulator_detached(user_id_str, simulator_name)
+            )
+        return SimulatorService.load_compiled_simulator(db, user_id_str, simulator_name)
+    
+    @staticmethod
+    def load_compiled_simulator_detached(user_id_str: str, simulator_name: str) -> CompiledSimulator:
+        """요청 세션과 무관한 새 세션으로 조회 (요청이 끝난 뒤에도 백그라운드에서 계속될 수 있음)"""
+        db = SessionLocal()
+        try:
+            return SimulatorService.load_compiled_simulator(db, user_id_str, simulator_name)
+        finally:
+            db.close()
+    
+    @staticmethod
+    def load_compiled_simulator(db: Session, user_id_str: str, simulator_name: str) -> CompiledSimulator:
+        """URL의 사용자 ID/시뮬레이터 이름으로 시뮬레이터와 적용된 시나리오를 조회하여 컴파일"""
         # 사용자 조회
         logging.info(user_id_str)
         logging.info(simulator_name)
@@ -209,71 +587,18 @@ class SimulatorService:
         if not simulator:
             raise ValueError(f"시뮬레이터 '{simulator_name}'를 찾을 수 없습니다.")
         
-        # 활성화 상태 확인
-        if not simulator.is_active:
-            # 비활성화 상태 응답 - 메시지만 반환
-            return {
-                "type": "inactive",
-                "data": {"message": "해당 시뮬레이터는 비활성화 상태 입니다."}
-            }
-        
-        # 활성화 상태 - 파라미터 데이터 처리 (랜덤 값 생성 포함)
-        try:
-            parameters = json.loads(simulator.parameters)
-            parameter_config = json.loads(simulator.parameter_config or '{}')
-        except json.JSONDecodeError:
-            raise ValueError("시뮬레이터 파라미터 파싱 오류가 발생했습니다.")
-        
-        # 랜덤 값 생성 처리
-        result_parameters = SimulatorService._generate_random_values(parameters, parameter_config)
-        
-        # 고장 시나리오 확인 및 적용
-        stmt = select(FailureScenario).where(
-            and_(
-                FailureScenario.simulator_id == simulator.id,
-                FailureScenario.is_applied == True
+        # 적용된 고장 시나리오 확인 (비활성화 상태면 조회 불필요)
+        applied_scenario = None
+        if simulator.is_active:
+            stmt = select(FailureScenario).where(
+                and_(
+                    FailureScenario.simulator_id == simulator.id,
+                    FailureScenario.is_applied == True
+                )
             )
-        )
-        applied_scenario = db.scalar(stmt)
-        
-        if applied_scenario:
-            # 고장 파라미터로 덮어쓰기
-            try:
-                failure_params = json.loads(applied_scenario.failure_parameters)
-                
-                # 고급 설정이 있는 경우 NumPy 엔진 사용
-                if applied_scenario.advanced_config:
-                    try:
-                        advanced_config = json.loads(applied_scenario.advanced_config)
-                        failure_config = {
-                            'failure_parameters': failure_params,
-                            'advanced_config': advanced_config
-                        }
-                        
-                        # NumPy 엔진으로 고장 시나리오 적용
-                        engine = FailureEngine()
-                        result_parameters = engine.apply_failure_scenario(
-                            result_parameters,
-                            failure_config,
-                            datetime.utcnow()
-                        )
-                        
-                        logging.info(f"NumPy 엔진으로 고급 고장 시나리오 적용: scenario_id={applied_scenario.id}")
-                    except (json.JSONDecodeError, Exception) as e:
-                        logging.error(f"고급 고장 시나리오 적용 오류: {e}")
-                        # 기본 고장 파라미터만 적용
-                        result_parameters.update(failure_params)
-                else:
-                    # 기본 고장 파라미터만 적용
-                    result_parameters.update(failure_params)
-                    
-            except json.JSONDecodeError:
-                logging.error(f"고장 시나리오 파라미터 파싱 오류: scenario_id={applied_scenario.id}")
+            applied_scenario = db.scalar(stmt)
         
-        return {
-            "type": "active",
-            "data": result_parameters
-        }
+        return compile_simulator(simulator, user.user_id, applied_scenario)
     
     @staticmethod
     def _generate_random_values(parameters: Dict[str, Any], parameter_config: Dict[str, Any]) -> Dict[str, Any]:
@@ -286,20 +611,27 @@ class SimulatorService:
         Returns:
             랜덤 값이 적용된 파라미터
         """
-        result = parameters.copy()
-        
-        for param_name, config in parameter_config.items():
-            if param_name in result and config.get('is_random', False):
-                param_type = config.get('type')
-                min_val = config.get('min')
-                max_val = config.get('max')
-                
-                # 모든 랜덤 값을 실수로 반환
-                if min_val is not None and max_val is not None:
-                    result[param_name] = round(random.uniform(min_val, max_val), 2)
-                # string 타입은 향후 확장 가능
-        
-        return result
+        return generate_random_values(parameters, parameter_config)
+    
+    @staticmethod
+    def generate_random_columns(
+        parameters: Dict[str, Any],
+        parameter_config: Dict[str, Any],
+        size: int,
+        rng: Optional["np.random.Generator"] = None
+    ) -> Dict[str, "np.ndarray"]:
+        """_generate_random_values의 배치 버전 - 파라미터별 길이 size의 배열 생성
+        
+        Args:
+            parameters: 원본 파라미터 값들
+            parameter_config: 랜덤 생성 설정
+            size: 생성할 샘플(행) 수
+            rng: NumPy 난수 생성기 (없으면 새로 생성)
+            
+        Returns:
+            파라미터 이름 → 값 배열
+        """
+        return generate_random_columns(parameters, parameter_config, size, rng)
     
     @staticmethod
     def toggle_simulator_status(db: Session, simulator_id: int, user_id: int) -> Optional[Simulator]:
@@ -315,10 +647,97 @@ class SimulatorService:
         # 상태 토글
         db_simulator.is_active = not db_simulator.is_active
         
+        invalidation_bus.notify(db, [simulator_id])
         db.commit()
         db.refresh(db_simulator)
         return db_simulator
     
+    @staticmethod
+    def _get_owned_simulator(db: Session, simulator_id: int, user_id: int) -> Optional[Simulator]:
+        """시뮬레이터 조회 및 소유권 확인"""
+        db_simulator = SimulatorService.get_simulator_by_id(db, simulator_id)
+        if not db_simulator:
+            return None
+        
+        if db_simulator.user_id != user_id:
+            raise ValueError("해당 시뮬레이터에 접근할 권한이 없습니다.")
+        
+        return db_simulator
+    
+    @staticmethod
+    def get_simulator_clock(db: Session, simulator_id: int, user_id: int) -> Optional[Dict[str, Any]]:
+        """시뮬레이터 시뮬레이션 시계 상태 조회"""
+        db_simulator = SimulatorService._get_owned_simulator(db, simulator_id, user_id)
+        if not db_simulator:
+            return None
+        
+        SimulatorService._sync_clock(db_simulator)
+        return SimulatorService._prepare_clock_response(simulator_id)
+    
+    @staticmethod
+    def update_simulator_clock(db: Session, simulator_id: int, user_id: int,
+                               clock_update: SimulatorClockUpdate) -> Optional[Dict[str, Any]]:
+        """
+        시뮬레이터 시계 배속/일시정지/시점 이동 설정
+        
+        다른 워커/인스턴스에서 바꾼 설정 위에 적용한 뒤 시뮬레이터 행에 저장하고,
+        무효화 버스로 다른 프로세스가 다음 조회에서 새 상태를 읽도록 합니다.
+        """
+        db_simulator = SimulatorService._get_owned_simulator(db, simulator_id, user_id)
+        if not db_simulator:
+            return None
+        
+        SimulatorService._sync_clock(db_simulator)
+        clock = clock_registry.get_or_create(simulator_id)
+        
+        if clock_update.speed is not None:
+            clock.set_speed(clock_update.speed)
+        if clock_update.seek_to is not None:
+            clock.seek(clock_update.seek_to)
+        if clock_update.advance_seconds is not None:
+            clock.advance(clock_update.advance_seconds)
+        if clock_update.paused is True:
+            clock.pause()
+        elif clock_update.paused is False:
+            clock.resume()
+        
+        db_simulator.clock_config = json.dumps(clock_registry.persisted(simulator_id))
+        invalidation_bus.notify(db, [simulator_id])
+        db.commit()
+        
+        return SimulatorService._prepare_clock_response(simulator_id)
+    
+    @staticmethod
+    def reset_simulator_clock(db: Session, simulator_id: int, user_id: int) -> Optional[Dict[str, Any]]:
+        """시뮬레이터 시계를 실제 시간으로 초기화"""
+        db_simulator = SimulatorService._get_owned_simulator(db, simulator_id, user_id)
+        if not db_simulator:
+            return None
+        
+        db_simulator.clock_config = None
+        invalidation_bus.notify(db, [simulator_id])
+        db.commit()
+        clock_registry.reset(simulator_id)
+        return SimulatorService._prepare_clock_response(simulator_id)
+    
+    @staticmethod
+    def _sync_clock(db_simulator: Simulator) -> None:
+        """시뮬레이터 행에 저장된 시계 상태를 이 프로세스의 시계에 반영"""
+        try:
+            state = json.loads(db_simulator.clock_config) if db_simulator.clock_config else None
+            clock_registry.sync(db_simulator.id, state)
+        except (KeyError, TypeError, ValueError) as e:
+            logging.error(f"시뮬레이션 시계 상태 반영 실패: simulator_id={db_simulator.id}: {e}")
+    
+    @staticmethod
+    def _prepare_clock_response(simulator_id: int) -> Dict[str, Any]:
+        """시계 상태를 응답 형식으로 변환"""
+        return {
+            "simulator_id": simulator_id,
+            "is_custom": clock_registry.is_custom(simulator_id),
+            **clock_registry.get(simulator_id).to_dict()
+        }
+    
     @staticmethod
     def count_user_simulators(db: Session, user_id: int) -> int:
         """사용자의 시뮬레이터 총 개수 조회"""
@@ -337,6 +756,16 @@ class SimulatorService:
         except json.JSONDecodeError:
             parameter_config = {}
         
+        try:
+            replay_config = json.loads(simulator.replay_config) if simulator.replay_config else None
+        except json.JSONDecodeError:
+            replay_config = None
+        
+        try:
+            fleet_config = json.loads(simulator.fleet_config) if simulator.fleet_config else None
+        except json.JSONDecodeError:
+            fleet_config = None
+        
         return {
             "id": simulator.id,
             "user_id": simulator.user_id,
@@ -344,6 +773,9 @@ class SimulatorService:
             "parameters": parameters,
             "parameter_config": parameter_config,
             "is_active": simulator.is_active,
+            "mode": simulator.mode,
+            "replay_config": replay_config,
+            "fleet_config": fleet_config,
             "created_at": simulator.created_at,
             "updated_at": simulator.updated_at
         }
\ No newline at end of file
@@ -0,0 +1,339 @@
+"""
+틱 스케줄러 - 모든 시뮬레이터의 값을 주기적으로 미리 계산하는 백그라운드 루프
+
+요청마다 시뮬레이터별로 값을 생성하는 대신, 설정된 주기(틱)마다 전체 시뮬레이터를
+evaluate_batch로 한 번에 평가하고 고장 전파 계획(cascade_plan)을 적용한 결과를
+메모리 스냅샷으로 게시합니다.
+/api/data는 스냅샷에서 O(1)로 값을 꺼내므로 요청 지연이 생성 비용과 무관해집니다.
+
+멀티 워커 배포에서 SHARED_BOARD_ENABLED=true이면 리더 워커 하나만 값을 생성하여
+공유 메모리 보드(shared_board)에 게시하고, 나머지 워커는 보드에서 읽기만 합니다.
+두 보드 모두 시뮬레이터 테이블 순서의 항목 단위(write_entries)로 기록됩니다.
+
+- 값 보드: 매 틱 갱신. 팔로워는 틱마다 보드를 디코딩하지 않고, 요청이 들어올 때
+  해당 시뮬레이터(또는 사용자의 시뮬레이터들)의 항목만 공유 메모리에서 읽어 디코딩합니다.
+  따라서 워커 수와 무관하게 값은 공유 메모리에 한 벌만 존재합니다.
+- 테이블 보드: 목록을 다시 읽을 때만 갱신. 팔로워는 테이블이 바뀐 경우에만 전체를
+  디코딩하여 (사용자, 이름) → 항목 위치 색인을 만들고, 컴파일 캐시(compiled_cache)를
+  그 테이블로 교체하므로 스냅샷에 없는 요청도 DB 조회 없이(또는 DB 장애 시 대체 값으로)
+  응답할 수 있습니다. 컴파일 캐시는 파이썬 객체이므로 이 부분은 워커마다 사본이 생깁니다.
+
+두 보드에는 같은 tag(테이블 버전)가 붙으며, 팔로워의 색인과 tag가 다른 값 보드는
+(리더가 목록을 막 다시 읽은 경우) 다음 테이블을 읽을 때까지 사용하지 않습니다.
+
+환경 변수:
+    TICK_SCHEDULER_ENABLED: true면 앱 시작 시 루프 실행 (기본값: false)
+    TICK_INTERVAL_MS: 틱 주기 (기본값: 1000)
+    TICK_RELOAD_SECONDS: DB에서 시뮬레이터 목록을 다시 읽는 주기 (기본값: 5)
+    SHARED_BOARD_ENABLED: true면 워커 간 공유 메모리 보드 사용 (기본값: false)
+    SHARED_BOARD_NAME: 공유 메모리 영역 이름 접두사 (기본값: simulator_board)
+    SHARED_BOARD_SIZE_MB: 영역별 최대 크기 (기본값: 16)
+    SHARED_BOARD_LOCK_PATH: 리더 선출용 잠금 파일 (기본값: /tmp/simulator_board.lock)
+"""
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from ..database import SessionLocal
+from .cache_invalidation import invalidation_bus
+from .cascade_plan import CascadePlan, cascade_triggers, load_cascade_plans
+from .compiled_cache import compiled_cache
+from .compiled_simulator import CompiledSimulator, evaluate_batch, load_compiled_simulators, sync_clock
+from .shared_board import LeaderLock, SharedBoard
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class TickScheduler:
+    """전체 시뮬레이터 값을 틱마다 일괄 생성하여 스냅샷으로 게시"""
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        interval_seconds: float = 1.0,
+        reload_seconds: float = 5.0,
+        shared_board: bool = False,
+        board_name: str = "simulator_board",
+        board_size: int = 16 * 1024 * 1024,
+        lock_path: str = "/tmp/simulator_board.lock"
+    ):
+        self.enabled = enabled
+        self.interval_seconds = interval_seconds
+        self.reload_seconds = reload_seconds
+
+        # 공유 메모리 보드 (멀티 워커)
+        self.board_name = board_name
+        self.board_size = board_size
+        self._leader_lock = LeaderLock(lock_path) if shared_board else None
+        self._values_board: Optional[SharedBoard] = None
+        self._table_board: Optional[SharedBoard] = None
+        self._table_version = 0
+        self._published_table_version = -1
+        self._published_tag = 0
+        self._table_sequence = 0
+        self._values_sequence = 0
+        # 팔로워 색인 (tag, (사용자, 이름) → 항목 위치, 사용자 → [(이름, 항목 위치)]) - 통째로 교체
+        self._board_index: Optional[Tuple[int, Dict[Tuple[str, str], int], Dict[str, List[Tuple[str, int]]]]] = None
+
+        self._task: Optional[asyncio.Task] = None
+        # NumPy는 첫 틱에서 로드 (스케줄러를 쓰지 않는 워커는 import하지 않음)
+        self._rng: Optional["np.random.Generator"] = None
+        self._dirty = threading.Event()
+
+        # 스냅샷은 매 틱 새 딕셔너리로 통째로 교체 (읽기 측은 락 불필요)
+        self._snapshot: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        # 같은 스냅샷의 사용자별 색인 (사용자 ID → 시뮬레이터 이름 → 응답)
+        self._by_user: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._simulators: List[CompiledSimulator] = []
+        # 사용자 ID → 고장 전파 계획 (목록을 다시 읽을 때 함께 컴파일)
+        self._cascade_plans: Dict[int, CascadePlan] = {}
+        self._loaded_at = 0.0
+        self.last_tick_at: Optional[float] = None
+        self.last_tick_duration: Optional[float] = None
+
+    @classmethod
+    def from_env(cls) -> "TickScheduler":
+        return cls(
+            enabled=os.getenv("TICK_SCHEDULER_ENABLED", "false").lower() == "true",
+            interval_seconds=int(os.getenv("TICK_INTERVAL_MS", "1000")) / 1000,
+            reload_seconds=float(os.getenv("TICK_RELOAD_SECONDS", "5")),
+            shared_board=os.getenv("SHARED_BOARD_ENABLED", "false").lower() == "true",
+            board_name=os.getenv("SHARED_BOARD_NAME", "simulator_board"),
+            board_size=int(os.getenv("SHARED_BOARD_SIZE_MB", "16")) * 1024 * 1024,
+            lock_path=os.getenv("SHARED_BOARD_LOCK_PATH", "/tmp/simulator_board.lock")
+        )
+
+    @property
+    def is_leader(self) -> bool:
+        """값을 직접 생성하는 프로세스인지 여부 (보드 미사용 시 항상 True)"""
+        return self._leader_lock is None or self._leader_lock.acquired
+
+    @property
+    def simulators(self) -> List[CompiledSimulator]:
+        """마지막으로 로드(또는 보드에서 수신)한 컴파일된 시뮬레이터 테이블"""
+        return self._simulators
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def _reads_board(self) -> bool:
+        """팔로워라서 값을 공유 보드에서 직접 읽는지 여부"""
+        return self._leader_lock is not None and not self._leader_lock.acquired
+
+    def lookup(self, user_key: str, simulator_name: str) -> Optional[Dict[str, Any]]:
+        """최신 스냅샷에서 시뮬레이터 응답 조회 (없으면 None)"""
+        if not self.running:
+            return None
+        if self._reads_board:
+            index = self._board_index
+            if index is None or (user_key.lower(), simulator_name) not in index[1]:
+                return None
+            responses = self._read_board(index, [index[1][(user_key.lower(), simulator_name)]])
+            return responses[0] if responses else None
+        return self._snapshot.get((user_key.lower(), simulator_name))
+
+    def lookup_user(self, user_key: str) -> Optional[Dict[str, Dict[str, Any]]]:
+        """최신 스냅샷에서 사용자의 모든 시뮬레이터 응답 조회 (없으면 None)"""
+        if not self.running:
+            return None
+        if self._reads_board:
+            index = self._board_index
+            if index is None or user_key.lower() not in index[2]:
+                return None
+            slots = index[2][user_key.lower()]
+            responses = self._read_board(index, [slot for _, slot in slots])
+            if responses is None:
+                return None
+            return {
+                name: response for (name, _), response in zip(slots, responses)
+                if response is not None
+            }
+        return self._by_user.get(user_key.lower())
+
+    def _read_board(
+        self,
+        index: Tuple[int, Dict[Tuple[str, str], int], Dict[str, List[Tuple[str, int]]]],
+        slots: List[int]
+    ) -> Optional[List[Optional[Dict[str, Any]]]]:
+        """값 보드에서 지정한 항목만 읽어 디코딩 (색인과 tag가 다르면 None)"""
+        board = self._values_board
+        if board is None:
+            return None
+        tag, entries = board.read_entries(slots)
+        if entries is None or tag != index[0]:
+            return None
+        return [json.loads(entry) if entry else None for entry in entries]
+
+    def _set_snapshot(self, snapshot: Dict[Tuple[str, str], Dict[str, Any]]) -> None:
+        by_user: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for (user_key, name), response in snapshot.items():
+            by_user.setdefault(user_key, {})[name] = response
+        self._snapshot = snapshot
+        self._by_user = by_user
+
+    def mark_dirty(self) -> None:
+        """다음 틱에서 DB의 시뮬레이터 목록을 다시 읽도록 표시"""
+        self._dirty.set()
+
+    def _reload(self) -> None:
+        db = SessionLocal()
+        try:
+            self._simulators = load_compiled_simulators(db)
+            self._cascade_plans = load_cascade_plans(db)
+        finally:
+            db.close()
+        self._loaded_at = time.monotonic()
+        self._table_version += 1
+
+    def tick(self) -> None:
+        """틱 1회 - 필요 시 목록을 다시 읽고 전체 시뮬레이터를 일괄 평가"""
+        started = time.monotonic()
+
+        if self._dirty.is_set() or started - self._loaded_at >= self.reload_seconds:
+            self._dirty.clear()
+            self._reload()
+
+        if self._rng is None:
+            import numpy as np
+            self._rng = np.random.default_rng()
+
+        results = evaluate_batch(self._simulators, self._rng)
+        triggers = cascade_triggers(self._simulators)
+        for plan in self._cascade_plans.values():
+            plan.apply(triggers, results)
+        self._set_snapshot({
+            (compiled.user_key.lower(), compiled.name): results[compiled.simulator_id]
+            for compiled in self._simulators
+            if compiled.simulator_id in results
+        })
+
+        self.last_tick_at = time.time()
+        self.last_tick_duration = time.monotonic() - started
+
+    def step(self) -> None:
+        """루프 1회 - 리더면 틱을 돌려 게시하고, 팔로워면 보드에서 최신 값을 읽음"""
+        if self._leader_lock is None:
+            self.tick()
+            return
+
+        if not self._leader_lock.acquired:
+            if self._leader_lock.try_acquire():
+                logger.info(f"공유 보드 리더로 선출되었습니다 (pid={os.getpid()})")
+                self._close_boards()
+                self._values_board = SharedBoard.create(f"{self.board_name}_values", self.board_size)
+                self._table_board = SharedBoard.create(f"{self.board_name}_table", self.board_size)
+                self._published_table_version = -1
+            else:
+                self._follow()
+                return
+
+        self.tick()
+        self._publish()
+
+    def _publish(self) -> None:
+        """스냅샷(매 틱)과 시뮬레이터 테이블(변경 시)을 같은 순서의 항목으로 공유 보드에 기록"""
+        if self._published_table_version != self._table_version:
+            # 리더가 바뀌어도 tag가 겹치지 않도록 게시 시각을 tag로 사용
+            self._published_tag = time.time_ns()
+            self._table_board.write_entries(self._published_tag, [
+                json.dumps(compiled.to_dict(), ensure_ascii=False, default=str).encode()
+                for compiled in self._simulators
+            ])
+            self._published_table_version = self._table_version
+
+        entries = []
+        for compiled in self._simulators:
+            response = self._snapshot.get((compiled.user_key.lower(), compiled.name))
+            entries.append(b"" if response is None else json.dumps(response, ensure_ascii=False, default=str).encode())
+        self._values_board.write_entries(self._published_tag, entries)
+
+    def _follow(self) -> None:
+        """
+        리더가 게시한 테이블이 바뀌었으면 색인과 컴파일 캐시 교체
+
+        값 보드는 여기서 디코딩하지 않습니다 (lookup 시 필요한 항목만 읽음).
+        """
+        if self._values_board is None:
+            self._values_board = SharedBoard.attach(f"{self.board_name}_values")
+        if self._table_board is None:
+            self._table_board = SharedBoard.attach(f"{self.board_name}_table")
+
+        # 리더가 보드를 막 만들고 아직 게시하지 않았으면 항목이 없음 (다음 루프에서 다시 확인)
+        if self._table_board is not None and self._table_board.sequence != self._table_sequence:
+            sequence = self._table_board.sequence
+            tag, entries = self._table_board.read_entries()
+            if entries:
+                self._simulators = [CompiledSimulator.from_dict(json.loads(entry)) for entry in entries]
+                by_key: Dict[Tuple[str, str], int] = {}
+                by_user: Dict[str, List[Tuple[str, int]]] = {}
+                for slot, compiled in enumerate(self._simulators):
+                    user_key = compiled.user_key.lower()
+                    by_key[(user_key, compiled.name)] = slot
+                    by_user.setdefault(user_key, []).append((compiled.name, slot))
+                self._board_index = (tag, by_key, by_user)
+                self._table_sequence = sequence
+                for compiled in self._simulators:
+                    sync_clock(compiled)
+                if compiled_cache.enabled:
+                    compiled_cache.replace_all(self._simulators)
+
+        if self._values_board is not None and self._values_board.sequence != self._values_sequence:
+            self._values_sequence = self._values_board.sequence
+            self.last_tick_at = time.time()
+
+    def _close_boards(self) -> None:
+        for board in (self._values_board, self._table_board):
+            if board is not None:
+                board.close()
+        self._values_board = None
+        self._table_board = None
+
+    async def _run(self) -> None:
+        logger.info(f"틱 스케줄러 시작: 주기 {self.interval_seconds * 1000:.0f}ms")
+        while True:
+            started = time.monotonic()
+            try:
+                # DB 조회/NumPy 연산이 이벤트 루프를 막지 않도록 스레드에서 실행
+                await asyncio.to_thread(self.step)
+            except Exception as e:
+                logger.error(f"틱 처리 중 오류: {e}")
+            elapsed = time.monotonic() - started
+            if elapsed > self.interval_seconds:
+                logger.warning(f"틱 처리 시간({elapsed * 1000:.0f}ms)이 주기를 초과했습니다.")
+            await asyncio.sleep(max(self.interval_seconds - elapsed, 0))
+
+    async def start(self) -> None:
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            self._set_snapshot({})
+            self._board_index = None
+            self._table_sequence = 0
+
+        self._close_boards()
+        if self._leader_lock is not None:
+            self._leader_lock.release()
+
+
+# 프로세스 전역 스케줄러
+tick_scheduler = TickScheduler.from_env()
+
+# 시뮬레이터/시나리오 변경(로컬 또는 다른 인스턴스) 시 다음 틱에서 목록을 다시 읽음
+invalidation_bus.subscribe(lambda simulator_ids: tick_scheduler.mark_dirty())
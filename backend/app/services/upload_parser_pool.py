@@ -0,0 +1,422 @@
+"""
+업로드 파싱 워커 풀 - CSV/Excel 파싱을 이벤트 루프 밖의 제한된 풀에서 실행
+
+파싱(pandas/openpyxl)을 이벤트 루프에서 직접 실행하면 큰 Excel 업로드 하나가
+같은 워커의 모든 /api/data 요청을 멈추게 합니다. 업로드는 아래 풀에서만 파싱하며,
+
+- 동시에 처리/대기할 수 있는 업로드 수를 제한하여 초과분은 즉시 503으로 거절하고
+- 업로드마다 제한 시간을 두어 초과하면 504로 응답합니다.
+  (이미 시작된 파싱은 중단할 수 없으므로 끝날 때까지 풀 슬롯을 계속 차지합니다)
+
+여러 시트로 된 Excel은 시트마다 별도 작업으로 나누어 풀에서 동시에 처리하므로
+전체 소요 시간은 시트 수의 합이 아니라 가장 느린 시트에 가깝습니다 (시트 하나가 슬롯 하나).
+
+모드:
+    auto: Excel은 프로세스 풀, CSV는 스레드 풀 (기본값)
+          - openpyxl은 순수 Python이라 파싱 내내 GIL을 잡고 있어 스레드에서 실행해도
+            같은 워커의 요청 처리가 멈추지만, pandas CSV 파서는 C 코드에서 GIL을 놓음
+    thread: 모두 스레드 풀 - 업로드 임시 파일 객체를 그대로 사용
+    process: 모두 spawn 방식 프로세스 풀 - GIL과 무관하게 격리되며,
+             업로드를 이름 있는 임시 파일로 복사해 경로를 전달
+
+환경 변수:
+    UPLOAD_PARSER_MODE: auto | thread | process (기본값: auto)
+    UPLOAD_PARSER_WORKERS: 풀 크기 (스레드/프로세스 풀 각각, 기본값: 2)
+    UPLOAD_PARSER_QUEUE_LIMIT: 풀이 가득 찼을 때 대기할 수 있는 업로드 수 (기본값: 8)
+    UPLOAD_PARSE_TIMEOUT_SECONDS: 업로드당 파싱 제한 시간 (기본값: 30)
+    UPLOAD_PROFILE_TIMEOUT_SECONDS: 파일 전체를 읽는 작업(컬럼 통계, 재생 데이터 변환)의 제한 시간 (기본값: 300)
+"""
+import asyncio
+import functools
+import logging
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple
+
+from fastapi import HTTPException, UploadFile, status
+from starlette.concurrency import iterate_in_threadpool
+
+if TYPE_CHECKING:
+    from ..utils.file_parser import ParseProfile
+
+logger = logging.getLogger(__name__)
+
+
+class _ParseRejected(Exception):
+    """프로세스 경계를 넘겨 전달하는 HTTPException 대체 - args: (status_code, detail)"""
+
+
+def _parse_headers(stream: BinaryIO, filename: str, size: int) -> Tuple[List[str], "ParseProfile"]:
+    """풀 작업 - 헤더 파싱 결과와 단계별 소요 시간 반환"""
+    from ..utils.file_parser import FileParser, ParseProfile
+
+    profile = ParseProfile()
+    headers = FileParser.parse_headers(stream, filename, size, profile)
+    return headers, profile
+
+
+def _profile_columns(stream: BinaryIO, filename: str, size: int) -> Tuple[Dict[str, Any], "ParseProfile"]:
+    """풀 작업 - 컬럼 통계와 단계별 소요 시간 반환"""
+    from ..utils.column_profiler import profile_columns
+    from ..utils.file_parser import ParseProfile
+
+    profile = ParseProfile()
+    result = profile_columns(stream, filename, size, profile)
+    return result, profile
+
+
+def _build_replay(stream: BinaryIO, filename: str, size: int) -> Tuple[Dict[str, Any], "ParseProfile"]:
+    """풀 작업 - 재생 데이터셋 변환 결과(manifest)와 단계별 소요 시간 반환"""
+    from ..utils.file_parser import ParseProfile
+    from .replay_store import build_replay_dataset
+
+    profile = ParseProfile()
+    manifest = build_replay_dataset(stream, filename, size, profile=profile)
+    return manifest, profile
+
+
+def _describe_sheet(stream: BinaryIO, filename: str, size: int, sheet: str) -> Tuple[Dict[str, Any], "ParseProfile"]:
+    """풀 작업 - 시트 하나의 헤더/타입/기본 파라미터(앞부분만 읽음)와 단계별 소요 시간 반환"""
+    from ..utils.column_profiler import describe_columns
+    from ..utils.file_parser import ParseProfile
+
+    profile = ParseProfile()
+    result = describe_columns(stream, filename, size, profile, sheet=sheet)
+    return result, profile
+
+
+def _profile_sheet(stream: BinaryIO, filename: str, size: int, sheet: str) -> Tuple[Dict[str, Any], "ParseProfile"]:
+    """풀 작업 - 시트 하나의 컬럼 통계와 단계별 소요 시간 반환"""
+    from ..utils.column_profiler import profile_columns
+    from ..utils.file_parser import ParseProfile
+
+    profile = ParseProfile()
+    result = profile_columns(stream, filename, size, profile, sheet=sheet)
+    return result, profile
+
+
+def _run_from_path(job: Callable, path: str, filename: str, size: int) -> Tuple[Any, "ParseProfile"]:
+    """프로세스 풀 작업 - 임시 파일 경로를 열어 job 실행"""
+    try:
+        with open(path, "rb") as stream:
+            return job(stream, filename, size)
+    except HTTPException as e:
+        # HTTPException은 pickle 후 복원되지 않아 풀이 깨지므로 단순 예외로 변환
+        raise _ParseRejected(e.status_code, e.detail)
+
+
+class UploadParserPool:
+    """동시 업로드 수와 업로드당 시간을 제한하는 파싱 실행기"""
+
+    def __init__(
+        self,
+        mode: str = "auto",
+        workers: int = 2,
+        queue_limit: int = 8,
+        timeout_seconds: float = 30.0,
+        profile_timeout_seconds: float = 300.0
+    ):
+        self.mode = mode
+        self.workers = workers
+        self.queue_limit = queue_limit
+        self.timeout_seconds = timeout_seconds
+        self.profile_timeout_seconds = profile_timeout_seconds
+        self._thread_executor: Optional[Executor] = None
+        self._process_executor: Optional[Executor] = None
+        # 실행 중 + 대기 중인 작업 수 (이벤트 루프 스레드에서만 변경)
+        self._pending = 0
+
+    @classmethod
+    def from_env(cls) -> "UploadParserPool":
+        return cls(
+            mode=os.getenv("UPLOAD_PARSER_MODE", "auto").lower(),
+            workers=int(os.getenv("UPLOAD_PARSER_WORKERS", "2")),
+            queue_limit=int(os.getenv("UPLOAD_PARSER_QUEUE_LIMIT", "8")),
+            timeout_seconds=float(os.getenv("UPLOAD_PARSE_TIMEOUT_SECONDS", "30")),
+            profile_timeout_seconds=float(os.getenv("UPLOAD_PROFILE_TIMEOUT_SECONDS", "300"))
+        )
+
+    @property
+    def capacity(self) -> int:
+        return self.workers + self.queue_limit
+
+    def uses_process(self, filename: str) -> bool:
+        """이 파일을 프로세스 풀에서 파싱하는지 여부 (auto 모드에서는 Excel만)"""
+        if self.mode == "auto":
+            return filename.lower().endswith(('.xlsx', '.xls'))
+        return self.mode == "process"
+
+    def _get_executor(self, process: bool) -> Executor:
+        if process:
+            if self._process_executor is None:
+                self._process_executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._process_executor
+
+        if self._thread_executor is None:
+            self._thread_executor = ThreadPoolExecutor(
+                max_workers=self.workers,
+                thread_name_prefix="upload-parser"
+            )
+        return self._thread_executor
+
+    async def parse_headers(self, file: UploadFile) -> Tuple[List[str], "ParseProfile"]:
+        """업로드 파일의 컬럼명 추출 - 풀에서 실행 (컬럼명, 단계별 소요 시간)"""
+        return await self._run(file, _parse_headers, self.timeout_seconds)
+
+    async def profile_columns(self, file: UploadFile) -> Tuple[Dict[str, Any], "ParseProfile"]:
+        """업로드 파일 전체의 컬럼 통계 계산 - 풀에서 실행 (통계, 단계별 소요 시간)"""
+        return await self._run(file, _profile_columns, self.profile_timeout_seconds)
+
+    async def build_replay_dataset(self, file: UploadFile) -> Tuple[Dict[str, Any], "ParseProfile"]:
+        """업로드 파일을 재생 데이터셋(컬럼별 .npy)으로 변환 - 풀에서 실행 (manifest, 단계별 소요 시간)"""
+        return await self._run(file, _build_replay, self.profile_timeout_seconds)
+
+    async def parse_sheets(
+        self,
+        file: UploadFile,
+        statistics: bool = False
+    ) -> Tuple[List[Tuple[str, Any]], "ParseProfile"]:
+        """
+        Excel 파일의 시트마다 헤더/타입을 병렬로 파싱
+
+        업로드를 이름 있는 임시 파일로 한 번 복사한 뒤, 시트마다 작업 하나를 풀에 제출하고
+        각 작업이 파일을 따로 열어 읽습니다 (thread 모드가 아니면 프로세스 풀).
+
+        Args:
+            statistics: True면 시트 전체를 읽어 컬럼 통계(profile_columns),
+                        False면 앞부분만 읽어 헤더/타입/첫 값(describe_columns)
+
+        Returns:
+            ([(시트 이름, 결과 또는 시트에서 발생한 HTTPException)], 단계별 소요 시간)
+            - 빈 시트처럼 400으로 거절된 시트는 전체를 실패시키지 않고 예외 객체로 반환
+        """
+        from ..utils.file_parser import FileParser, ParseProfile
+
+        size = FileParser.validate_upload(file)
+        filename = file.filename.lower()
+        if not filename.endswith(('.xlsx', '.xls')):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="시트별 처리는 Excel 파일(.xlsx, .xls)만 지원합니다."
+            )
+
+        profile = ParseProfile()
+        started = time.perf_counter()
+        path, sheets = await self._submit(
+            lambda: asyncio.to_thread(self._copy_and_list_sheets, file, filename),
+            self.timeout_seconds
+        )
+        profile.stages["list_sheets"] = (time.perf_counter() - started) * 1000
+
+        futures: List["asyncio.Future"] = []
+        try:
+            if not sheets:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="파일에 워크시트가 없습니다."
+                )
+            if len(sheets) > self.capacity:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"시트가 너무 많습니다. 최대 {self.capacity}개 시트까지 처리할 수 있습니다."
+                )
+            if self._pending + len(sheets) > self.capacity:
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="파일 처리 대기열이 가득 찼습니다. 잠시 후 다시 시도해주세요."
+                )
+
+            job = _profile_sheet if statistics else _describe_sheet
+            timeout = self.profile_timeout_seconds if statistics else self.timeout_seconds
+
+            started = time.perf_counter()
+            # 대기 없이 모든 시트의 슬롯을 잡고 제출하여 다른 요청이 중간에 끼어들지 않게 함
+            futures += [
+                self._start(functools.partial(
+                    self._execute_path, functools.partial(job, sheet=sheet), path, filename, size
+                ))
+                for sheet in sheets
+            ]
+            outcomes = await asyncio.gather(
+                *(self._wait(future, timeout) for future in futures),
+                return_exceptions=True
+            )
+            profile.stages["parse_sheets"] = (time.perf_counter() - started) * 1000
+        finally:
+            # 제한 시간을 넘겨 아직 실행 중인 작업이 있으면 그 작업이 끝난 뒤 삭제
+            pending = [future for future in futures if not future.done()]
+            if pending:
+                asyncio.ensure_future(asyncio.wait(pending)).add_done_callback(lambda _: os.unlink(path))
+            else:
+                os.unlink(path)
+
+        results: List[Tuple[str, Any]] = []
+        for sheet, outcome in zip(sheets, outcomes):
+            if isinstance(outcome, HTTPException) and outcome.status_code == status.HTTP_400_BAD_REQUEST:
+                results.append((sheet, outcome))
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                results.append((sheet, outcome[0]))
+        return results, profile
+
+    async def _run(self, file: UploadFile, job: Callable, timeout: float) -> Tuple[Any, "ParseProfile"]:
+        from ..utils.file_parser import FileParser
+
+        size = FileParser.validate_upload(file)
+        filename = file.filename.lower()
+
+        if self.uses_process(filename):
+            # 임시 파일 복사도 디스크 I/O이므로 풀 슬롯을 잡은 뒤 스레드에서 수행
+            return await self._submit(lambda: self._run_in_process(job, file, filename, size), timeout)
+
+        executor = self._get_executor(process=False)
+        loop = asyncio.get_running_loop()
+        return await self._submit(
+            lambda: loop.run_in_executor(executor, job, file.file, filename, size),
+            timeout
+        )
+
+    def acquire(self) -> None:
+        """풀 슬롯 하나를 차지 (가득 찼으면 503) - 이벤트 루프 스레드에서 호출"""
+        if self._pending >= self.capacity:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="파일 처리 대기열이 가득 찼습니다. 잠시 후 다시 시도해주세요."
+            )
+        self._pending += 1
+
+    def release(self) -> None:
+        self._pending -= 1
+
+    def streaming(self, chunks: Iterator[bytes]) -> Tuple[AsyncIterator[bytes], Callable[[], Awaitable[None]]]:
+        """
+        acquire()로 잡은 슬롯을 응답이 끝날 때까지 유지하며 동기 이터레이터를 스레드에서 순회
+
+        스트리밍 응답은 제한 시간을 두지 않고(이미 일부를 보낸 뒤에는 504로 바꿀 수 없음),
+        모드와 관계없이 스레드에서 실행됩니다.
+
+        Returns:
+            (StreamingResponse 본문, 응답 background로 넘길 슬롯 반환 함수)
+            - 본문 순회가 끝나거나 중단되면 슬롯을 반환하고, 순회가 시작되기 전에
+              연결이 끊긴 경우를 위해 background에서도 반환 (한 번만 반환됨)
+        """
+        released = False
+
+        async def release_once() -> None:
+            nonlocal released
+            if not released:
+                released = True
+                self.release()
+
+        async def body() -> AsyncIterator[bytes]:
+            try:
+                async for chunk in iterate_in_threadpool(chunks):
+                    yield chunk
+            finally:
+                await release_once()
+
+        return body(), release_once
+
+    async def _submit(self, start: Callable[[], "asyncio.Future"], timeout: float) -> Tuple[Any, "ParseProfile"]:
+        return await self._wait(self._start(start), timeout)
+
+    def _start(self, start: Callable[[], "asyncio.Future"]) -> "asyncio.Future":
+        """슬롯을 잡고 작업 시작 - 제한 시간이 지나도 실제 작업이 끝날 때까지 슬롯을 반환하지 않음"""
+        self.acquire()
+        future = asyncio.ensure_future(start())
+        future.add_done_callback(self._release)
+        return future
+
+    async def _wait(self, future: "asyncio.Future", timeout: float) -> Tuple[Any, "ParseProfile"]:
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"파일 파싱 제한 시간({timeout:.0f}초) 초과")
+            raise HTTPException(
+                status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+                detail="파일 처리 시간이 초과되었습니다."
+            )
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"파일 파싱 중 오류가 발생했습니다: {str(e)}"
+            )
+
+    def _release(self, future: "asyncio.Future") -> None:
+        self.release()
+        if not future.cancelled():
+            # 제한 시간 초과로 결과를 기다리는 쪽이 없어도 'exception was never retrieved' 경고 방지
+            future.exception()
+
+    async def _run_in_process(
+        self,
+        job: Callable,
+        file: UploadFile,
+        filename: str,
+        size: int
+    ) -> Tuple[Any, "ParseProfile"]:
+        suffix = os.path.splitext(filename)[1]
+        started = time.perf_counter()
+        path = await asyncio.to_thread(self._copy_to_named_file, file, suffix)
+        copy_ms = (time.perf_counter() - started) * 1000
+        try:
+            result, profile = await self._execute_path(job, path, filename, size)
+            profile.stages = {"copy": copy_ms, **profile.stages}
+            return result, profile
+        finally:
+            os.unlink(path)
+
+    async def _execute_path(self, job: Callable, path: str, filename: str, size: int) -> Tuple[Any, "ParseProfile"]:
+        """임시 파일 경로로 job을 풀(파일 형식에 맞는 스레드/프로세스 풀)에서 실행"""
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._get_executor(self.uses_process(filename)), _run_from_path, job, path, filename, size
+            )
+        except _ParseRejected as e:
+            raise HTTPException(status_code=e.args[0], detail=e.args[1])
+        except BrokenProcessPool:
+            # 작업 프로세스가 비정상 종료되면 다음 업로드에서 풀을 새로 만듦
+            self._process_executor = None
+            raise
+
+    @staticmethod
+    def _copy_and_list_sheets(file: UploadFile, filename: str) -> Tuple[str, List[str]]:
+        from ..utils.file_parser import FileParser
+
+        path = UploadParserPool._copy_to_named_file(file, os.path.splitext(filename)[1])
+        try:
+            with open(path, "rb") as stream:
+                return path, FileParser.sheet_names(stream, filename)
+        except BaseException:
+            os.unlink(path)
+            raise
+
+    @staticmethod
+    def _copy_to_named_file(file: UploadFile, suffix: str) -> str:
+        file.file.seek(0)
+        with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as target:
+            shutil.copyfileobj(file.file, target, 1024 * 1024)
+            return target.name
+
+    def shutdown(self) -> None:
+        for executor in (self._thread_executor, self._process_executor):
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+        self._thread_executor = None
+        self._process_executor = None
+
+
+# 프로세스 전역 업로드 파싱 풀
+upload_parser_pool = UploadParserPool.from_env()
@@ -0,0 +1,528 @@
+"""
+오프라인 라벨링 데이터셋 생성 CLI
+
+/api/data를 HTTP로 반복 호출하는 대신, 시뮬레이터와 고장 시나리오를
+DB 또는 JSON export에서 직접 읽어 가상의 타임라인 위에서 N개의 행을
+벡터화 엔진(FailureEngine.apply_failure_scenario_batch)으로 생성합니다.
+각 행에는 어떤 고장이 활성화되어 있었는지 나타내는 정답 라벨 컬럼이 붙습니다.
+
+타임라인은 --episode-seconds 길이의 에피소드로 나뉘며, 각 에피소드는
+--failure-ratio 확률로 시나리오 하나가 적용된 고장 구간이 됩니다.
+시간 기반 고장(gradual, cyclic, drift)의 경과 시간은 에피소드 시작 기준입니다.
+
+출력은 시간 구간(shard)별 파일(part-00000.csv / .parquet)로 나뉘어
+여러 프로세스에서 병렬로 생성되며, 각 shard는 --chunk-rows 단위로
+기록되므로 메모리 사용량은 전체 행 수와 무관합니다.
+
+사용 예:
+    python -m app.tools.generate_dataset --simulator-id 3 --rows 100000000 \\
+        --output-dir ./dataset --format parquet
+
+    python -m app.tools.generate_dataset --from-json export.json --rows 1000000
+
+JSON export 형식:
+    {
+        "simulator": {"name": "...", "parameters": {...}, "parameter_config": {...}},
+        "scenarios": [
+            {"name": "...", "failure_parameters": {...}, "advanced_config": {...}}
+        ]
+    }
+"""
+import argparse
+import json
+import logging
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from ..services.failure_engine import FailureEngine
+from ..services.simulator_service import SimulatorService
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+NORMAL_LABEL = "normal"
+
+
+@dataclass
+class ShardTask:
+    """하나의 시간 구간(shard) 생성 작업"""
+    shard_index: int
+    start_row: int
+    num_rows: int
+    definition: Dict[str, Any]
+    episode_plan: np.ndarray
+    first_episode: int
+    sample_rate: float
+    episode_seconds: float
+    start_time: datetime
+    chunk_rows: int
+    output_dir: str
+    output_format: str
+    label_column: str
+    seed: Optional[int]
+
+
+def _load_json_field(value: Any, default: Any) -> Any:
+    """DB(문자열) / export(객체) 양쪽 형식의 JSON 필드를 객체로 변환"""
+    if value is None or value == "":
+        return default
+    if isinstance(value, str):
+        return json.loads(value)
+    return value
+
+
+def normalize_definition(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """시뮬레이터/시나리오 정의를 엔진 입력 형식으로 정규화"""
+    simulator = raw["simulator"]
+    scenarios = []
+    for scenario in raw.get("scenarios", []):
+        failure_config = {
+            "failure_parameters": _load_json_field(scenario.get("failure_parameters"), {}),
+        }
+        advanced_config = _load_json_field(scenario.get("advanced_config"), None)
+        if advanced_config:
+            failure_config["advanced_config"] = advanced_config
+        scenarios.append({
+            "name": scenario.get("name") or f"scenario_{len(scenarios) + 1}",
+            "failure_config": failure_config
+        })
+
+    return {
+        "name": simulator.get("name", "simulator"),
+        "parameters": _load_json_field(simulator.get("parameters"), {}),
+        "parameter_config": _load_json_field(simulator.get("parameter_config"), {}),
+        "scenarios": scenarios
+    }
+
+
+def load_definition_from_json(path: str) -> Dict[str, Any]:
+    """JSON export 파일에서 시뮬레이터 정의 로드"""
+    with open(path, encoding="utf-8") as f:
+        return normalize_definition(json.load(f))
+
+
+def load_definition_from_db(
+    simulator_id: Optional[int] = None,
+    user_id: Optional[str] = None,
+    simulator_name: Optional[str] = None
+) -> Dict[str, Any]:
+    """DB에서 시뮬레이터와 해당 시뮬레이터의 활성화된 고장 시나리오 로드"""
+    from sqlalchemy import and_, select
+
+    from ..database import SessionLocal
+    from ..models.failure_scenario import FailureScenario
+
+    db = SessionLocal()
+    try:
+        if simulator_id is not None:
+            simulator = SimulatorService.get_simulator_by_id(db, simulator_id)
+        else:
+            simulator = SimulatorService.get_simulator_by_name_and_user(db, user_id, simulator_name)
+
+        if not simulator:
+            raise ValueError("시뮬레이터를 찾을 수 없습니다.")
+
+        stmt = select(FailureScenario).where(
+            and_(
+                FailureScenario.simulator_id == simulator.id,
+                FailureScenario.is_active == True
+            )
+        ).order_by(FailureScenario.id)
+        scenarios = list(db.scalars(stmt).all())
+
+        return normalize_definition({
+            "simulator": {
+                "name": simulator.name,
+                "parameters": simulator.parameters,
+                "parameter_config": simulator.parameter_config
+            },
+            "scenarios": [
+                {
+                    "name": scenario.name,
+                    "failure_parameters": scenario.failure_parameters,
+                    "advanced_config": scenario.advanced_config
+                }
+                for scenario in scenarios
+            ]
+        })
+    finally:
+        db.close()
+
+
+def build_episode_plan(
+    num_episodes: int,
+    num_scenarios: int,
+    failure_ratio: float,
+    seed: Optional[int]
+) -> np.ndarray:
+    """
+    에피소드별 적용 시나리오 인덱스 배열 생성 (-1은 정상 구간)
+
+    shard 분할과 무관하게 같은 시드에서 같은 타임라인이 나오도록
+    전체 계획을 한 번에 생성합니다.
+    """
+    if num_scenarios == 0:
+        return np.full(num_episodes, -1, dtype=np.int32)
+
+    rng = np.random.default_rng(seed)
+    is_failure = rng.random(num_episodes) < failure_ratio
+    choices = rng.integers(0, num_scenarios, num_episodes, dtype=np.int32)
+    return np.where(is_failure, choices, -1).astype(np.int32)
+
+
+def _output_columns(definition: Dict[str, Any]) -> List[str]:
+    """출력 컬럼 목록 - 시뮬레이터 파라미터 + 시나리오가 추가하는 파라미터"""
+    columns = list(definition["parameters"].keys())
+    for scenario in definition["scenarios"]:
+        for key in scenario["failure_config"]["failure_parameters"]:
+            if key not in columns:
+                columns.append(key)
+    return columns
+
+
+def column_types(definition: Dict[str, Any]) -> Dict[str, str]:
+    """
+    출력 컬럼별 고정 타입 ('float' | 'bool' | 'string') - 정의에 나오는 값으로 결정
+
+    청크마다 pandas가 추론하는 dtype은 값에 따라 달라지므로(int64/float64, 전부 None 등)
+    parquet처럼 파일 전체가 한 스키마여야 하는 출력은 이 타입으로 맞춥니다.
+    시뮬레이터 값, 시나리오 고장 값, 마르코프 상태 변환 값이 모두 숫자면 float,
+    모두 bool이면 bool, 그 외(문자열 섞임, 값 없음)는 string입니다.
+    """
+    candidates: Dict[str, List[Any]] = {name: [] for name in _output_columns(definition)}
+    for name, value in definition["parameters"].items():
+        candidates[name].append(value)
+    for name in definition["parameter_config"]:
+        if name in candidates:
+            # 랜덤 범위가 있는 파라미터는 실수로 생성됨
+            candidates[name].append(0.0)
+    for scenario in definition["scenarios"]:
+        failure_config = scenario["failure_config"]
+        for name, value in failure_config["failure_parameters"].items():
+            candidates[name].append(value)
+        for name, config in failure_config.get("advanced_config", {}).get("parameters", {}).items():
+            for transform in (config.get("transforms") or {}).values():
+                if name in candidates and "value" in (transform or {}):
+                    candidates[name].append(transform["value"])
+
+    types = {}
+    for name, values in candidates.items():
+        values = [value for value in values if value is not None]
+        if values and all(isinstance(value, bool) for value in values):
+            types[name] = "bool"
+        elif values and all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in values):
+            types[name] = "float"
+        else:
+            types[name] = "string"
+    return types
+
+
+def coerce_frame(frame: pd.DataFrame, types: Dict[str, str]) -> pd.DataFrame:
+    """청크의 컬럼을 column_types의 고정 타입으로 변환 (변환할 수 없는 값은 null)"""
+    for name, kind in types.items():
+        column = frame[name]
+        if kind == "float":
+            frame[name] = pd.to_numeric(column, errors="coerce").astype("float64")
+        elif kind == "bool":
+            frame[name] = column.map(lambda value: value if isinstance(value, bool) else None).astype("boolean")
+        else:
+            frame[name] = column.map(lambda value: None if value is None or value != value else str(value)).astype(object)
+    return frame
+
+
+def arrow_schema(definition: Dict[str, Any], label_column: str) -> "pa.Schema":
+    """parquet 출력의 고정 스키마 (모든 청크에 같은 스키마 사용)"""
+    import pyarrow as pa
+
+    arrow_types = {"float": pa.float64(), "bool": pa.bool_(), "string": pa.string()}
+    fields = [pa.field("timestamp", pa.timestamp("us"))]
+    fields += [pa.field(name, arrow_types[kind]) for name, kind in column_types(definition).items()]
+    fields.append(pa.field(label_column, pa.string()))
+    return pa.schema(fields)
+
+
+def _assign(column: np.ndarray, mask: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """마스크 위치에 값 대입 (dtype이 맞지 않으면 object로 승격)"""
+    if column.dtype != values.dtype and not (
+        column.dtype.kind in "iuf" and values.dtype.kind in "iuf"
+    ):
+        column = column.astype(object)
+    elif column.dtype.kind in "iu" and values.dtype.kind == "f":
+        column = column.astype(float)
+    column[mask] = values
+    return column
+
+
+def generate_chunk(
+    definition: Dict[str, Any],
+    engine: FailureEngine,
+    episode_plan: np.ndarray,
+    first_episode: int,
+    start_row: int,
+    num_rows: int,
+    sample_rate: float,
+    episode_seconds: float,
+    start_time: datetime,
+    label_column: str
+) -> pd.DataFrame:
+    """연속된 num_rows개 행을 벡터화 연산으로 생성"""
+    rows = np.arange(start_row, start_row + num_rows, dtype=np.int64)
+    seconds = rows / sample_rate
+    episodes = (seconds // episode_seconds).astype(np.int64)
+    elapsed = seconds - episodes * episode_seconds
+    scenario_idx = episode_plan[episodes - first_episode]
+
+    columns = SimulatorService.generate_random_columns(
+        definition["parameters"],
+        definition["parameter_config"],
+        num_rows,
+        engine.rng
+    )
+    for name in _output_columns(definition):
+        if name not in columns:
+            columns[name] = np.full(num_rows, None, dtype=object)
+
+    labels = np.full(num_rows, NORMAL_LABEL, dtype=object)
+
+    for idx in np.unique(scenario_idx):
+        if idx < 0:
+            continue
+        scenario = definition["scenarios"][idx]
+        mask = scenario_idx == idx
+
+        subset = {name: column[mask] for name, column in columns.items()}
+        applied, active = engine.apply_failure_scenario_batch(
+            subset,
+            scenario["failure_config"],
+            elapsed[mask]
+        )
+        for name, values in applied.items():
+            columns[name] = _assign(columns[name], mask, values)
+
+        scenario_labels = np.where(active, scenario["name"], NORMAL_LABEL).astype(object)
+        labels[mask] = scenario_labels
+
+    timestamps = np.datetime64(start_time, "us") + (seconds * 1_000_000).astype("timedelta64[us]")
+
+    frame = pd.DataFrame({"timestamp": timestamps})
+    for name in _output_columns(definition):
+        frame[name] = columns[name]
+    frame[label_column] = labels
+    return frame
+
+
+def generate_shard(task: ShardTask) -> Dict[str, Any]:
+    """shard 하나를 chunk 단위로 생성하여 파일로 기록 (워커 프로세스에서 실행)"""
+    engine = FailureEngine()
+    engine.rng = np.random.default_rng(
+        None if task.seed is None else [task.seed, task.shard_index]
+    )
+
+    extension = "parquet" if task.output_format == "parquet" else "csv"
+    path = os.path.join(task.output_dir, f"part-{task.shard_index:05d}.{extension}")
+
+    writer = None
+    written = 0
+    try:
+        while written < task.num_rows:
+            chunk_size = min(task.chunk_rows, task.num_rows - written)
+            frame = generate_chunk(
+                task.definition,
+                engine,
+                task.episode_plan,
+                task.first_episode,
+                task.start_row + written,
+                chunk_size,
+                task.sample_rate,
+                task.episode_seconds,
+                task.start_time,
+                task.label_column
+            )
+
+            if task.output_format == "parquet":
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+
+                # 청크마다 추론 dtype이 달라도 ParquetWriter가 거부하지 않도록 고정 스키마로 변환
+                if writer is None:
+                    types = column_types(task.definition)
+                    schema = arrow_schema(task.definition, task.label_column)
+                    writer = pq.ParquetWriter(path, schema)
+                table = pa.Table.from_pandas(coerce_frame(frame, types), schema=schema, preserve_index=False)
+                writer.write_table(table)
+            else:
+                frame.to_csv(path, mode="a" if written else "w", header=not written, index=False)
+
+            written += chunk_size
+    finally:
+        if writer is not None:
+            writer.close()
+
+    return {"path": path, "rows": written}
+
+
+def plan_shards(
+    definition: Dict[str, Any],
+    total_rows: int,
+    shard_rows: int,
+    sample_rate: float,
+    episode_seconds: float,
+    failure_ratio: float,
+    start_time: datetime,
+    chunk_rows: int,
+    output_dir: str,
+    output_format: str,
+    label_column: str,
+    seed: Optional[int]
+) -> List[ShardTask]:
+    """전체 타임라인을 shard_rows 단위 시간 구간으로 분할"""
+    total_seconds = total_rows / sample_rate
+    num_episodes = int(math.floor(total_seconds / episode_seconds)) + 1
+    episode_plan = build_episode_plan(
+        num_episodes, len(definition["scenarios"]), failure_ratio, seed
+    )
+
+    tasks = []
+    for shard_index, start_row in enumerate(range(0, total_rows, shard_rows)):
+        num_rows = min(shard_rows, total_rows - start_row)
+        first_episode = int((start_row / sample_rate) // episode_seconds)
+        last_episode = int(((start_row + num_rows - 1) / sample_rate) // episode_seconds)
+
+        tasks.append(ShardTask(
+            shard_index=shard_index,
+            start_row=start_row,
+            num_rows=num_rows,
+            definition=definition,
+            # 워커에 전달되는 데이터를 줄이기 위해 해당 구간의 계획만 전달
+            episode_plan=episode_plan[first_episode:last_episode + 1],
+            first_episode=first_episode,
+            sample_rate=sample_rate,
+            episode_seconds=episode_seconds,
+            start_time=start_time,
+            chunk_rows=chunk_rows,
+            output_dir=output_dir,
+            output_format=output_format,
+            label_column=label_column,
+            seed=seed
+        ))
+    return tasks
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.tools.generate_dataset",
+        description="시뮬레이터 + 고장 시나리오로부터 라벨링된 데이터셋을 생성합니다."
+    )
+
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--simulator-id", type=int, help="DB의 시뮬레이터 ID")
+    source.add_argument("--simulator-name", help="DB의 시뮬레이터 이름 (--user-id와 함께 사용)")
+    source.add_argument("--from-json", help="시뮬레이터/시나리오 JSON export 경로")
+    parser.add_argument("--user-id", help="시뮬레이터 소유자 user_id (--simulator-name과 함께 사용)")
+
+    parser.add_argument("--rows", type=int, required=True, help="생성할 전체 행 수")
+    parser.add_argument("--output-dir", default="./dataset", help="출력 디렉토리")
+    parser.add_argument("--format", choices=["csv", "parquet"], default="csv", help="출력 형식")
+    parser.add_argument("--sample-rate", type=float, default=1.0, help="초당 샘플(행) 수")
+    parser.add_argument("--start-time", default=None, help="타임라인 시작 시각 (ISO 8601, 기본값: 현재)")
+    parser.add_argument("--episode-seconds", type=float, default=600.0, help="에피소드 길이(초)")
+    parser.add_argument("--failure-ratio", type=float, default=0.3, help="고장 에피소드 비율 (0.0 ~ 1.0)")
+    parser.add_argument("--chunk-rows", type=int, default=500_000, help="한 번에 메모리에 생성할 행 수")
+    parser.add_argument("--shard-rows", type=int, default=5_000_000, help="출력 파일(shard) 하나당 행 수")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="병렬 워커 프로세스 수")
+    parser.add_argument("--label-column", default="failure_label", help="정답 라벨 컬럼 이름")
+    parser.add_argument("--seed", type=int, default=None, help="재현 가능한 결과를 위한 랜덤 시드")
+
+    args = parser.parse_args(argv)
+
+    if args.simulator_name and not args.user_id:
+        parser.error("--simulator-name은 --user-id와 함께 사용해야 합니다.")
+    if args.rows <= 0 or args.chunk_rows <= 0 or args.shard_rows <= 0:
+        parser.error("--rows, --chunk-rows, --shard-rows는 양수여야 합니다.")
+    if args.sample_rate <= 0 or args.episode_seconds <= 0:
+        parser.error("--sample-rate, --episode-seconds는 양수여야 합니다.")
+    if not 0.0 <= args.failure_ratio <= 1.0:
+        parser.error("--failure-ratio는 0.0 ~ 1.0 사이여야 합니다.")
+
+    return args
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    args = parse_args(argv)
+
+    if args.format == "parquet":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            logger.error("parquet 출력에는 pyarrow 패키지가 필요합니다.")
+            return 1
+
+    if args.from_json:
+        definition = load_definition_from_json(args.from_json)
+    else:
+        definition = load_definition_from_db(args.simulator_id, args.user_id, args.simulator_name)
+
+    start_time = datetime.fromisoformat(args.start_time) if args.start_time else datetime.now()
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    tasks = plan_shards(
+        definition,
+        total_rows=args.rows,
+        shard_rows=args.shard_rows,
+        sample_rate=args.sample_rate,
+        episode_seconds=args.episode_seconds,
+        failure_ratio=args.failure_ratio,
+        start_time=start_time,
+        chunk_rows=args.chunk_rows,
+        output_dir=args.output_dir,
+        output_format=args.format,
+        label_column=args.label_column,
+        seed=args.seed
+    )
+
+    logger.info(
+        f"시뮬레이터 '{definition['name']}': 시나리오 {len(definition['scenarios'])}개, "
+        f"{args.rows}행을 shard {len(tasks)}개로 생성합니다 (workers={args.workers})"
+    )
+
+    started = time.perf_counter()
+    total_written = 0
+
+    if args.workers <= 1 or len(tasks) == 1:
+        for task in tasks:
+            result = generate_shard(task)
+            total_written += result["rows"]
+            logger.info(f"{result['path']}: {result['rows']}행")
+    else:
+        with ProcessPoolExecutor(max_workers=args.workers) as executor:
+            futures = [executor.submit(generate_shard, task) for task in tasks]
+            for future in as_completed(futures):
+                result = future.result()
+                total_written += result["rows"]
+                logger.info(f"{result['path']}: {result['rows']}행")
+
+    elapsed = time.perf_counter() - started
+    logger.info(
+        f"✅ {total_written}행 생성 완료: {elapsed:.1f}초 "
+        f"({total_written / max(elapsed, 1e-9):,.0f} rows/s) → {args.output_dir}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,330 @@
+"""
+업로드 파일 컬럼 통계 - 파일 전체를 청크 단위로 한 번 순회하며 컬럼별 통계를 누적
+
+업로드로 컬럼명만 얻으면 ParameterConfig의 min/max를 컬럼마다 직접 입력해야 합니다.
+이 모듈은 FileParser.iter_rows로 파일을 청크 단위로 읽으면서
+
+- 숫자 컬럼: 개수/최소/최대는 청크별 축 방향 집계로, 평균/표준편차는 청크 통계를
+  병합(Chan 방식)하여 누적하고, 분위수는 고정 크기 행 표본(reservoir sampling)에서 계산
+  (전체 행 수가 표본 크기 이하이면 정확한 값)
+- 문자열/불린 컬럼: 서로 다른 값 집합을 DISTINCT_LIMIT개까지 수집
+
+하므로 처리 시간은 파일 크기에 선형이고 메모리 사용량은 청크/표본 크기로 제한됩니다.
+결과는 SimulatorCreate에 그대로 넣을 수 있는 parameters / parameter_config를 포함합니다.
+통계 없이 빠르게 시뮬레이터를 만들 때는 앞부분만 읽는 describe_columns를 사용합니다.
+
+환경 변수:
+    UPLOAD_PROFILE_SAMPLE_ROWS: 분위수 계산용 표본 행 수 (기본값: 10000)
+    UPLOAD_PROFILE_DISTINCT_LIMIT: 문자열 컬럼별로 수집할 최대 고유값 수 (기본값: 50)
+"""
+import math
+import os
+import re
+import warnings
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .file_parser import FileParser, ParseProfile
+
+SAMPLE_ROWS = int(os.getenv("UPLOAD_PROFILE_SAMPLE_ROWS", "10000"))
+DISTINCT_LIMIT = int(os.getenv("UPLOAD_PROFILE_DISTINCT_LIMIT", "50"))
+
+# 청크 하나에 담을 최대 셀 수 (컬럼이 많을수록 청크당 행 수를 줄임)
+CHUNK_CELLS = 2_000_000
+
+QUANTILES = {"p05": 0.05, "p25": 0.25, "p50": 0.5, "p75": 0.75, "p95": 0.95}
+
+
+def to_parameter_key(name: str, position: int) -> str:
+    """컬럼명을 파라미터 키 규칙(영문자로 시작, 영문자/숫자/언더스코어)에 맞게 변환"""
+    key = re.sub(r'[^a-zA-Z0-9_]+', '_', name).strip('_')
+    if not key:
+        return f"column_{position + 1}"
+    if not key[0].isalpha():
+        return f"col_{key}"
+    return key
+
+
+def parameter_keys(headers: List[str]) -> List[str]:
+    """컬럼명 목록을 서로 겹치지 않는 파라미터 키 목록으로 변환 (변환 후 겹치면 _2, _3 ...)"""
+    keys: List[str] = []
+    for position, name in enumerate(headers):
+        key = base = to_parameter_key(name, position)
+        suffix = 2
+        while key in keys:
+            key = f"{base}_{suffix}"
+            suffix += 1
+        keys.append(key)
+    return keys
+
+
+class ColumnProfiler:
+    """청크를 받아 컬럼별 통계를 누적하는 집계기"""
+
+    def __init__(
+        self,
+        headers: List[str],
+        types: List[str],
+        sample_rows: int = SAMPLE_ROWS,
+        distinct_limit: int = DISTINCT_LIMIT,
+        seed: Optional[int] = None
+    ):
+        self.headers = headers
+        self.types = types
+        self.sample_rows = sample_rows
+        self.distinct_limit = distinct_limit
+        self.row_count = 0
+
+        self.numeric_positions = [i for i, t in enumerate(types) if t == 'number']
+        self.category_positions = [i for i, t in enumerate(types) if t != 'number']
+
+        width = len(self.numeric_positions)
+        self._count = np.zeros(width, dtype=np.int64)
+        self._mean = np.zeros(width)
+        self._m2 = np.zeros(width)
+        self._min = np.full(width, np.inf)
+        self._max = np.full(width, -np.inf)
+        self._integral = np.ones(width, dtype=bool)
+
+        self._rng = np.random.default_rng(seed)
+        self._sample = np.empty((sample_rows, width))
+        self._sample_filled = 0
+
+        # 컬럼 위치 → 처음 나온 순서를 유지한 고유값 (한도를 넘으면 None)
+        self._distinct: Dict[int, Optional[Dict[str, None]]] = {i: {} for i in self.category_positions}
+        self._category_count: Dict[int, int] = {i: 0 for i in self.category_positions}
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        """청크 하나를 누적 (컬럼 수가 헤더보다 적으면 빈 값으로 간주)"""
+        if chunk.shape[1] < len(self.headers):
+            chunk = chunk.reindex(columns=range(len(self.headers)))
+        if chunk.empty:
+            return
+
+        if self.numeric_positions:
+            self._update_numeric(FileParser.numeric_values(chunk.iloc[:, self.numeric_positions]))
+        for position in self.category_positions:
+            self._update_category(position, chunk.iloc[:, position])
+        self.row_count += len(chunk)
+
+    def _update_numeric(self, values: np.ndarray) -> None:
+        present = ~np.isnan(values)
+        count = present.sum(axis=0)
+        filled = np.where(present, values, 0.0)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.where(count > 0, filled.sum(axis=0) / count, 0.0)
+        m2 = (np.where(present, values - mean, 0.0) ** 2).sum(axis=0)
+
+        # 이전 누적값과 청크 통계를 병합 (Chan et al.)
+        total = self._count + count
+        delta = mean - self._mean
+        with np.errstate(invalid='ignore', divide='ignore'):
+            weight = np.where(total > 0, count / total, 0.0)
+            self._m2 = self._m2 + m2 + np.where(total > 0, delta ** 2 * self._count * count / total, 0.0)
+        self._mean = self._mean + delta * weight
+        self._count = total
+
+        self._min = np.minimum(self._min, np.where(present, values, np.inf).min(axis=0))
+        self._max = np.maximum(self._max, np.where(present, values, -np.inf).max(axis=0))
+        self._integral &= (~present | (filled == np.floor(filled))).all(axis=0)
+
+        self._update_sample(values)
+
+    def _update_sample(self, values: np.ndarray) -> None:
+        """행 단위 reservoir sampling (Algorithm R을 청크 단위로 벡터화)"""
+        take = min(self.sample_rows - self._sample_filled, len(values))
+        if take > 0:
+            self._sample[self._sample_filled:self._sample_filled + take] = values[:take]
+            self._sample_filled += take
+
+        rest = values[take:]
+        if not len(rest):
+            return
+
+        # 전체에서 i번째(0-based) 행은 확률 sample_rows / (i + 1)로 표본의 임의 위치를 대체
+        seen = self.row_count + take
+        slots = self._rng.integers(0, np.arange(seen + 1, seen + len(rest) + 1))
+        accepted = np.flatnonzero(slots < self.sample_rows)
+        if not len(accepted):
+            return
+
+        # 같은 위치가 여러 번 뽑히면 마지막 행이 남아야 순차 처리와 같음
+        reversed_slots = slots[accepted][::-1]
+        unique_slots, last = np.unique(reversed_slots, return_index=True)
+        self._sample[unique_slots] = rest[accepted[::-1][last]]
+
+    def _update_category(self, position: int, column: pd.Series) -> None:
+        present = column.dropna()
+        self._category_count[position] += len(present)
+
+        distinct = self._distinct[position]
+        if distinct is None:
+            return
+        for value in pd.unique(present.astype(str)):
+            distinct.setdefault(value, None)
+            if len(distinct) > self.distinct_limit:
+                self._distinct[position] = None
+                break
+
+    def _quantiles(self) -> np.ndarray:
+        """표본에서 계산한 (분위수 × 숫자 컬럼) 배열"""
+        sample = self._sample[:self._sample_filled]
+        if not len(sample):
+            return np.full((len(QUANTILES), sample.shape[1]), np.nan)
+        with warnings.catch_warnings():
+            # 값이 하나도 없는 컬럼은 NaN
+            warnings.simplefilter("ignore", RuntimeWarning)
+            return np.nanquantile(sample, list(QUANTILES.values()), axis=0)
+
+    def result(self) -> Dict[str, Any]:
+        """컬럼별 통계와 SimulatorCreate용 parameters / parameter_config"""
+        columns: List[Optional[Dict[str, Any]]] = [None] * len(self.headers)
+        quantiles = self._quantiles() if self.numeric_positions else None
+
+        for j, position in enumerate(self.numeric_positions):
+            count = int(self._count[j])
+            stats: Dict[str, Any] = {
+                "type": "integer" if self._integral[j] else "float",
+                "count": count,
+                "null_count": self.row_count - count
+            }
+            if count:
+                stats.update(
+                    min=float(self._min[j]),
+                    max=float(self._max[j]),
+                    mean=float(self._mean[j]),
+                    std=math.sqrt(self._m2[j] / (count - 1)) if count > 1 else 0.0,
+                    quantiles={name: float(quantiles[k, j]) for k, name in enumerate(QUANTILES)}
+                )
+            columns[position] = stats
+
+        for position in self.category_positions:
+            distinct = self._distinct[position]
+            count = self._category_count[position]
+            columns[position] = {
+                "type": "boolean" if self.types[position] == 'boolean' else "string",
+                "count": count,
+                "null_count": self.row_count - count,
+                "distinct_values": list(distinct) if distinct is not None else None,
+                "distinct_truncated": distinct is None
+            }
+
+        parameters: Dict[str, Any] = {}
+        parameter_config: Dict[str, Dict[str, Any]] = {}
+
+        for name, key, stats in zip(self.headers, parameter_keys(self.headers), columns):
+            stats.update(name=name, key=key)
+            parameters[key], parameter_config[key] = self._default_parameter(stats)
+
+        return {
+            "row_count": self.row_count,
+            "columns": columns,
+            "parameters": parameters,
+            "parameter_config": parameter_config
+        }
+
+    @staticmethod
+    def _default_parameter(stats: Dict[str, Any]) -> Tuple[Any, Dict[str, Any]]:
+        """컬럼 통계로 (기본값, ParameterConfig) 결정 - 숫자는 관측 범위의 랜덤 값"""
+        if stats["type"] in ("integer", "float"):
+            if not stats["count"]:
+                return "", {"is_random": False}
+            if stats["type"] == "integer":
+                default = int(round(stats["quantiles"]["p50"]))
+            else:
+                default = FileParser.convert_value(stats["mean"], 'number')
+            return default, {
+                "is_random": True,
+                "type": stats["type"],
+                "min": stats["min"],
+                "max": stats["max"]
+            }
+
+        values = stats["distinct_values"] or []
+        if stats["type"] == "boolean":
+            default = FileParser.convert_value(values[0], 'boolean') if values else False
+            return default, {"is_random": False}
+        return (values[0] if values else ""), {"is_random": False, "type": "string"}
+
+
+def profile_columns(
+    stream: BinaryIO,
+    filename: str,
+    size: int,
+    profile: Optional[ParseProfile] = None,
+    sheet: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    업로드 파일의 헤더를 찾은 뒤 데이터 행 전체를 청크 단위로 순회하여 컬럼 통계 계산
+    (동기, 스레드/프로세스에서 실행 가능)
+    """
+    profile = profile or ParseProfile()
+    header_row, headers = FileParser.locate_header(stream, filename, size, profile, sheet=sheet)
+
+    chunk_rows = max(1000, CHUNK_CELLS // max(len(headers), 1))
+    chunks = FileParser.iter_rows(
+        stream, filename, size,
+        skip_rows=0 if header_row is None else header_row + 1,
+        chunk_rows=chunk_rows,
+        sheet=sheet
+    )
+
+    profiler: Optional[ColumnProfiler] = None
+    while True:
+        with profile.stage("read_rows"):
+            chunk = next(chunks, None)
+        if chunk is None:
+            break
+        with profile.stage("statistics"):
+            if profiler is None:
+                # 첫 청크로 컬럼 타입을 정하고 이후 청크의 숫자가 아닌 값은 빈 값으로 집계
+                chunk = chunk.iloc[:, :len(headers)]
+                types = FileParser.infer_column_types(chunk.reindex(columns=range(len(headers))))
+                profiler = ColumnProfiler(headers, types)
+            profiler.update(chunk.iloc[:, :len(headers)])
+
+    if profiler is None:
+        profiler = ColumnProfiler(headers, ['string'] * len(headers))
+
+    return {"header_row": header_row, **profiler.result()}
+
+
+def describe_columns(
+    stream: BinaryIO,
+    filename: str,
+    size: int,
+    profile: Optional[ParseProfile] = None,
+    sheet: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    파일 앞부분(read_head)만으로 헤더와 컬럼 타입을 정하고, 컬럼별 첫 값을 기본값으로 하는
+    parameters 생성 (통계/랜덤 설정 없음, 동기, 스레드/프로세스에서 실행 가능)
+    """
+    profile = profile or ParseProfile()
+
+    with profile.stage("read_head"):
+        head = FileParser.read_head(stream, filename, size, sheet=sheet)
+
+    with profile.stage("detect_header"):
+        header_row, headers = FileParser.split_header(head)
+
+    with profile.stage("infer_types"):
+        data = head.iloc[0 if header_row is None else header_row + 1:, :len(headers)]
+        data = data.reindex(columns=range(len(headers)))
+        types = FileParser.infer_column_types(data)
+
+        parameters: Dict[str, Any] = {}
+        for position, key in enumerate(parameter_keys(headers)):
+            values = data.iloc[:, position].dropna()
+            parameters[key] = FileParser.convert_value(values.iloc[0], types[position]) if len(values) else ""
+
+    return {
+        "header_row": header_row,
+        "headers": headers,
+        "types": types,
+        "parameters": parameters,
+        "parameter_config": {}
+    }
@@ -0,0 +1,71 @@
+"""
+상관 노이즈용 공분산 행렬 검증/분해 (순수 Python)
+
+시나리오 저장 시점의 스키마 검증에서 사용하므로 NumPy 없이 동작합니다.
+파라미터 수가 적은 행렬(수십 개 이하)을 대상으로 합니다.
+"""
+import math
+from typing import List, Sequence
+
+
+def covariance_from_correlation(
+    correlation: Sequence[Sequence[float]],
+    std: Sequence[float]
+) -> List[List[float]]:
+    """상관 행렬과 표준편차로 공분산 행렬 생성 (cov[i][j] = corr[i][j] × std[i] × std[j])"""
+    for i, row in enumerate(correlation):
+        if abs(row[i] - 1.0) > 1e-9:
+            raise ValueError("상관 행렬의 대각 성분은 1이어야 합니다.")
+        if any(abs(value) > 1.0 + 1e-9 for value in row):
+            raise ValueError("상관 계수는 -1 이상 1 이하여야 합니다.")
+    if any(value < 0 for value in std):
+        raise ValueError("표준편차는 0 이상이어야 합니다.")
+    return [
+        [correlation[i][j] * std[i] * std[j] for j in range(len(std))]
+        for i in range(len(std))
+    ]
+
+
+def cholesky_factor(matrix: Sequence[Sequence[float]], tolerance: float = 1e-10) -> List[List[float]]:
+    """
+    양의 준정부호(PSD) 대칭 행렬의 하삼각 촐레스키 인자 L (matrix = L·Lᵀ)
+
+    완전 상관(특이 행렬)도 허용하기 위해 대각 성분이 허용 오차 안에서 0이면
+    그 열을 0으로 두고, 이때 남은 성분도 0이어야 PSD로 판단합니다.
+
+    Raises:
+        ValueError: 정사각/대칭이 아니거나 PSD가 아닌 경우
+    """
+    size = len(matrix)
+    if size == 0 or any(len(row) != size for row in matrix):
+        raise ValueError("공분산 행렬은 비어 있지 않은 정사각 행렬이어야 합니다.")
+    if not all(math.isfinite(value) for row in matrix for value in row):
+        raise ValueError("공분산 행렬의 성분은 유한한 숫자여야 합니다.")
+
+    scale = max(abs(matrix[i][i]) for i in range(size)) or 1.0
+    threshold = tolerance * scale
+    for i in range(size):
+        for j in range(i):
+            if abs(matrix[i][j] - matrix[j][i]) > threshold:
+                raise ValueError("공분산 행렬은 대칭이어야 합니다.")
+
+    factor = [[0.0] * size for _ in range(size)]
+    for j in range(size):
+        pivot = matrix[j][j] - sum(factor[j][k] ** 2 for k in range(j))
+        if pivot < -threshold:
+            raise ValueError("공분산 행렬이 양의 준정부호(PSD)가 아닙니다.")
+
+        if pivot <= threshold:
+            # 앞의 파라미터들로 완전히 설명되는 방향 - 이 열의 남은 성분도 0이어야 함
+            for i in range(j + 1, size):
+                residual = matrix[i][j] - sum(factor[i][k] * factor[j][k] for k in range(j))
+                if abs(residual) > math.sqrt(threshold * scale):
+                    raise ValueError("공분산 행렬이 양의 준정부호(PSD)가 아닙니다.")
+            continue
+
+        diagonal = math.sqrt(pivot)
+        factor[j][j] = diagonal
+        for i in range(j + 1, size):
+            factor[i][j] = (matrix[i][j] - sum(factor[i][k] * factor[j][k] for k in range(j))) / diagonal
+
+    return factor
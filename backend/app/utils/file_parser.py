@@ -1,20 +1,116 @@
 """
 CSV/Excel 파일 파싱 및 헤더 인식 유틸리티
+
+업로드 파일 전체를 메모리로 읽지 않습니다. 멀티파트 본문은 Starlette가 이미
+SpooledTemporaryFile(일정 크기 이상이면 디스크)로 받아두므로, 그 파일 객체에서
+헤더 감지에 필요한 앞부분만 읽습니다.
+- CSV: 앞부분(HEAD_BYTES)만 읽어 인코딩(UTF-8 → CP949)을 판별하고 완전한 줄만 파싱
+- XLSX: openpyxl read_only 모드로 앞쪽 행만 순회
+- XLS: 형식상 전체를 읽어야 하므로 pandas로 앞쪽 행만 변환
+
+Excel 파일은 sheet 인자로 시트를 지정할 수 있으며(기본값: 첫 번째/활성 시트),
+sheet_names로 워크시트 목록을 얻습니다.
+
+컬럼 통계처럼 데이터 행 전체가 필요한 경우에는 iter_rows로 청크 단위로 순회합니다.
+
+환경 변수:
+    UPLOAD_MAX_SIZE_MB: 업로드 최대 크기 (기본값: 1024)
 """
-import pandas as pd
+import codecs
+import io
+import os
+import time
+from contextlib import contextmanager
+from itertools import islice, product
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
 import numpy as np
-from typing import Optional, List, Any
+import pandas as pd
 from fastapi import UploadFile, HTTPException
-import io
-import re
+
+
+class ParseProfile:
+    """파싱 단계별 소요 시간(ms) - 업로드 응답의 Server-Timing 헤더로 노출"""
+
+    def __init__(self):
+        self.stages: Dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + (time.perf_counter() - started) * 1000
+
+    def server_timing(self) -> str:
+        """예: 'read_head;dur=12.3, detect_header;dur=0.8'"""
+        return ", ".join(f"{name};dur={duration:.1f}" for name, duration in self.stages.items())
 
 
 class FileParser:
     """CSV/Excel 파일 파싱 및 헤더 자동 인식 클래스"""
     
     SUPPORTED_EXTENSIONS = ['.csv', '.xlsx', '.xls']
-    MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+    MAX_FILE_SIZE = int(os.getenv("UPLOAD_MAX_SIZE_MB", "1024")) * 1024 * 1024
+
+    # 헤더 감지에 필요한 앞쪽 행 수 (detect_header_row의 max_rows + 다음 행 검증용 1행)
+    HEAD_ROWS = 11
+    # CSV 인코딩 판별 및 앞쪽 행 파싱에 사용할 최대 바이트 수
+    HEAD_BYTES = 4 * 1024 * 1024
+    CSV_ENCODINGS = ['utf-8-sig', 'cp949']
     
+    BOOL_VALUES = ['true', 'false', 'yes', 'no', '1', '0', 'y', 'n']
+    # 대소문자 조합을 미리 펼쳐 두어 셀마다 lower()를 호출하지 않고 isin으로 판단
+    BOOL_VARIANTS = sorted({
+        ''.join(chars)
+        for value in BOOL_VALUES
+        for chars in product(*[(c.lower(), c.upper()) for c in value])
+    })
+    # 타입 추론에 사용할 최대 표본 행 수
+    TYPE_SAMPLE_ROWS = 200
+
+    # 영문/한글이 하나라도 있으면 헤더 셀 후보 (이 경우 '.', '-'를 뺀 순수 숫자일 수 없음)
+    HEADER_CELL_PATTERN = r'[a-zA-Z가-힣]'
+    # '.', '-'를 제외한 나머지가 모두 숫자 (예: '-1.5', '2024-01-01')
+    NUMERIC_CELL_PATTERN = r'[.\-]*\d[\d.\-]*'
+
+    @staticmethod
+    def _cell_masks(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """
+        모든 셀을 한 번에 문자열 열로 펼쳐 헤더 판단용 마스크를 (행 × 열) 배열로 계산
+
+        Returns:
+            header_cell: 헤더 셀 조건(값 있음, 영문/한글 포함 → 공백/순수 숫자 아님) 만족 여부
+            numeric: str(값)에서 '.', '-'를 뺀 나머지가 숫자인지 여부
+            text: str(값) 배열 (중복 검사용)
+        """
+        shape = df.shape
+        flat = pd.Series(df.to_numpy(dtype=object).ravel(), dtype=object)
+        notna = flat.notna().to_numpy()
+        text = flat.astype(str)
+        strings = text.astype("string")
+
+        header_cell = strings.str.contains(FileParser.HEADER_CELL_PATTERN, regex=True)
+        numeric = strings.str.fullmatch(FileParser.NUMERIC_CELL_PATTERN)
+
+        return {
+            "header_cell": (notna & header_cell.to_numpy(dtype=bool, na_value=False)).reshape(shape),
+            "numeric": (notna & numeric.to_numpy(dtype=bool, na_value=False)).reshape(shape),
+            "text": text.to_numpy(dtype=object).reshape(shape)
+        }
+
+    @staticmethod
+    def _header_rows(masks: Dict[str, np.ndarray]) -> np.ndarray:
+        """행별 헤더 조건 만족 여부 (모든 셀이 헤더 셀이고 값 중복이 없어야 함)"""
+        header_cell = masks["header_cell"]
+        if header_cell.shape[1] == 0:
+            return np.zeros(header_cell.shape[0], dtype=bool)
+
+        ordered = np.sort(masks["text"].astype(str), axis=1)
+        has_duplicates = (ordered[:, 1:] == ordered[:, :-1]).any(axis=1)
+        return header_cell.all(axis=1) & ~has_duplicates
+
     @staticmethod
     def is_valid_header_row(row: pd.Series) -> bool:
         """
@@ -26,38 +122,17 @@ class FileParser:
         3. 빈 값이 없어야 함
         4. 특수문자나 숫자로만 이루어진 값 제외
         """
-        # 리스트로 변환
-        values = row.dropna().astype(str).tolist()
-        
-        # 빈 값이 있으면 헤더가 아님
-        if len(values) != len(row) or len(values) == 0:
-            return False
-        
-        # 중복된 값이 있으면 헤더가 아님
-        if len(values) != len(set(values)):
-            return False
-        
-        # 각 값에 대한 검증
-        for value in values:
-            # 빈 문자열이면 헤더가 아님
-            if not value.strip():
-                return False
-            
-            # 순수 숫자만 있으면 헤더가 아님
-            if value.strip().replace('.', '').replace('-', '').isdigit():
-                return False
-            
-            # 특수문자만 있으면 헤더가 아님
-            if not re.search(r'[a-zA-Z가-힣]', value):
-                return False
-        
-        return True
+        masks = FileParser._cell_masks(row.to_frame().T)
+        return bool(FileParser._header_rows(masks)[0])
     
     @staticmethod
     def detect_header_row(df: pd.DataFrame, max_rows: int = 10) -> Optional[int]:
         """
         데이터프레임에서 헤더 행을 자동으로 감지
         
+        검사 대상 행 전체의 셀 조건을 한 번에 계산한 뒤,
+        헤더 조건을 만족하는 첫 행 중 다음 행의 과반이 숫자인 행을 헤더로 봅니다.
+        
         Args:
             df: 파싱할 데이터프레임
             max_rows: 헤더를 찾기 위해 검사할 최대 행 수
@@ -65,26 +140,91 @@ class FileParser:
         Returns:
             헤더 행의 인덱스 (0-based), 없으면 None
         """
-        # 최대 검사 행 수만큼 순회
-        for i in range(min(max_rows, len(df))):
-            row = df.iloc[i]
-            
-            # 현재 행이 헤더 조건을 만족하는지 확인
-            if FileParser.is_valid_header_row(row):
-                # 다음 행이 데이터 행인지 추가 검증 (있다면)
-                if i + 1 < len(df):
-                    next_row = df.iloc[i + 1]
-                    # 다음 행에 숫자 데이터가 있으면 현재 행이 헤더일 가능성 높음
-                    numeric_count = sum(1 for val in next_row if pd.notna(val) and 
-                                      str(val).replace('.', '').replace('-', '').isdigit())
-                    if numeric_count > len(next_row) / 2:
-                        return i
-                else:
-                    # 마지막 행이면서 헤더 조건을 만족하면 헤더로 인정
-                    return i
+        # 다음 행 검증을 위해 한 행 더 포함
+        head = df.iloc[:max_rows + 1]
+        if head.empty:
+            return None
+
+        masks = FileParser._cell_masks(head)
+        candidates = FileParser._header_rows(masks)
+        # 다음 행에 숫자 데이터가 과반이면 현재 행이 헤더일 가능성 높음
+        numeric_majority = masks["numeric"].sum(axis=1) > head.shape[1] / 2
+
+        for i in np.flatnonzero(candidates[:min(max_rows, len(df))]):
+            if i + 1 < len(df):
+                if numeric_majority[i + 1]:
+                    return int(i)
+            else:
+                # 마지막 행이면서 헤더 조건을 만족하면 헤더로 인정
+                return int(i)
         
         return None
     
+    @staticmethod
+    def infer_column_types(df: pd.DataFrame, sample_rows: Optional[int] = None) -> List[str]:
+        """
+        모든 컬럼의 타입을 표본 행으로 한 번에 추론
+        
+        숫자/불린 dtype 컬럼은 dtype만으로 판단하고, object 컬럼들은 셀 전체를
+        하나의 열로 펼쳐 isin/to_numeric(errors='coerce')을 한 번씩만 수행한 뒤
+        (행 × 열) 마스크의 축 방향 집계로 컬럼별 타입을 정합니다.
+        
+        Returns:
+            컬럼별 'number', 'boolean', 'string'
+        """
+        sample = df.iloc[:sample_rows or FileParser.TYPE_SAMPLE_ROWS]
+        types = ['string'] * sample.shape[1]
+        object_positions = []
+
+        for position, dtype in enumerate(sample.dtypes):
+            if pd.api.types.is_bool_dtype(dtype):
+                types[position] = 'boolean'
+            elif pd.api.types.is_integer_dtype(dtype):
+                # str(값)이 '0'/'1'뿐이면 불린으로 보는 기존 규칙 유지
+                column = sample.iloc[:, position]
+                types[position] = 'boolean' if len(column) and column.isin([0, 1]).all() else 'number'
+            elif pd.api.types.is_float_dtype(dtype):
+                types[position] = 'number' if sample.iloc[:, position].notna().any() else 'string'
+            else:
+                object_positions.append(position)
+
+        if not object_positions:
+            return types
+
+        block = sample.iloc[:, object_positions]
+        shape = block.shape
+        flat = pd.Series(block.to_numpy(dtype=object).ravel(), dtype=object)
+        notna = flat.notna().to_numpy().reshape(shape)
+        text = flat.astype(str)
+
+        boolean = text.isin(FileParser.BOOL_VARIANTS).to_numpy().reshape(shape)
+        # 변환 후 null이 된 값이 있으면 숫자가 아님 (빈 문자열은 pd.to_numeric이 NaN으로 허용)
+        numeric = (pd.to_numeric(flat, errors='coerce').notna() | text.eq('')).to_numpy().reshape(shape)
+
+        has_values = notna.any(axis=0)
+        is_boolean = (boolean | ~notna).all(axis=0)
+        is_number = (numeric | ~notna).all(axis=0)
+
+        for position, present, boolean_col, number_col in zip(object_positions, has_values, is_boolean, is_number):
+            if not present:
+                types[position] = 'string'
+            elif boolean_col:
+                types[position] = 'boolean'
+            elif number_col:
+                types[position] = 'number'
+
+        return types
+
+    @staticmethod
+    def numeric_values(block: pd.DataFrame) -> np.ndarray:
+        """컬럼들을 (행 × 열) float 배열로 변환 (숫자가 아닌 값은 NaN)"""
+        if all(pd.api.types.is_numeric_dtype(d) and not pd.api.types.is_bool_dtype(d) for d in block.dtypes):
+            return block.to_numpy(dtype=float, na_value=np.nan)
+
+        # 셀 전체를 한 열로 펼쳐 to_numeric을 한 번만 수행
+        flat = pd.Series(block.to_numpy(dtype=object).ravel(), dtype=object)
+        return pd.to_numeric(flat, errors='coerce').to_numpy(dtype=float, na_value=np.nan).reshape(block.shape)
+
     @staticmethod
     def infer_data_types(series: pd.Series) -> str:
         """
@@ -93,23 +233,7 @@ class FileParser:
         Returns:
             'number', 'boolean', 'string' 중 하나
         """
-        # null이 아닌 값들만 추출
-        non_null_values = series.dropna()
-        
-        if len(non_null_values) == 0:
-            return 'string'
-        
-        # 불린 타입 체크
-        bool_values = {'true', 'false', 'yes', 'no', '1', '0', 'y', 'n'}
-        if all(str(val).lower() in bool_values for val in non_null_values):
-            return 'boolean'
-        
-        # 숫자 타입 체크
-        try:
-            pd.to_numeric(non_null_values)
-            return 'number'
-        except:
-            return 'string'
+        return FileParser.infer_column_types(series.to_frame(), sample_rows=len(series))[0]
     
     @staticmethod
     def convert_value(value: Any, data_type: str) -> Any:
@@ -141,15 +265,254 @@ class FileParser:
             return str(value)
     
     @staticmethod
-    async def parse_file(file: UploadFile) -> List[str]:
+    def decode_head(prefix: bytes, complete: bool) -> str:
         """
-        업로드된 파일을 파싱하여 컬럼명(파라미터 키) 리스트 반환
-        
+        CSV 앞부분의 인코딩을 판별하여 완전한 줄까지만 디코딩
+
         Args:
-            file: 업로드된 파일 객체
-            
-        Returns:
-            컬럼명 리스트 (예: ["water_qty", "saving", "depth_data"])
+            prefix: 파일 앞부분 바이트
+            complete: prefix가 파일 전체인지 여부 (아니면 잘린 마지막 줄을 버림)
+        """
+        return FileParser._decode_prefix(prefix, complete)[0]
+
+    @staticmethod
+    def detect_encoding(prefix: bytes, complete: bool) -> str:
+        """CSV 앞부분으로 인코딩 판별 (CSV_ENCODINGS 중 처음으로 디코딩되는 것)"""
+        return FileParser._decode_prefix(prefix, complete)[1]
+
+    @staticmethod
+    def _decode_prefix(prefix: bytes, complete: bool) -> Tuple[str, str]:
+        if not complete:
+            cut = prefix.rfind(b"\n")
+            if cut >= 0:
+                prefix = prefix[:cut + 1]
+
+        for encoding in FileParser.CSV_ENCODINGS:
+            # 증분 디코더로 prefix 끝의 잘린 멀티바이트 문자는 오류로 보지 않음
+            decoder = codecs.getincrementaldecoder(encoding)()
+            try:
+                return decoder.decode(prefix, final=complete), encoding
+            except UnicodeDecodeError:
+                continue
+
+        raise HTTPException(
+            status_code=400,
+            detail="파일 인코딩을 인식할 수 없습니다. UTF-8 또는 CP949로 저장해주세요."
+        )
+
+    @staticmethod
+    def sheet_names(stream: BinaryIO, filename: str) -> List[str]:
+        """Excel 파일의 워크시트 이름 목록 (차트 시트 제외, CSV는 빈 목록)"""
+        stream.seek(0)
+
+        if filename.endswith('.xlsx'):
+            from openpyxl import load_workbook
+
+            workbook = load_workbook(stream, read_only=True, data_only=True)
+            try:
+                return [sheet.title for sheet in workbook.worksheets]
+            finally:
+                workbook.close()
+
+        if filename.endswith('.xls'):
+            return [str(name) for name in pd.ExcelFile(stream).sheet_names]
+
+        return []
+
+    @staticmethod
+    def read_head(
+        stream: BinaryIO,
+        filename: str,
+        size: int,
+        rows: Optional[int] = None,
+        sheet: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        파일의 앞쪽 행만 header=None 데이터프레임으로 읽기
+
+        Args:
+            stream: 처음 위치로 이동 가능한 바이너리 파일 객체
+            filename: 원본 파일명 (확장자로 형식 판단)
+            size: 파일 크기 (바이트)
+            rows: 읽을 최대 행 수 (기본값: HEAD_ROWS)
+            sheet: Excel 시트 이름 (기본값: 활성/첫 번째 시트)
+        """
+        rows = rows or FileParser.HEAD_ROWS
+        stream.seek(0)
+
+        if filename.endswith('.csv'):
+            prefix = stream.read(FileParser.HEAD_BYTES)
+            text = FileParser.decode_head(prefix, complete=len(prefix) >= size)
+            if not text.strip():
+                return pd.DataFrame()
+            return pd.read_csv(io.StringIO(text), header=None, nrows=rows)
+
+        if filename.endswith('.xlsx'):
+            from openpyxl import load_workbook
+
+            workbook = load_workbook(stream, read_only=True, data_only=True)
+            try:
+                worksheet = workbook[sheet] if sheet is not None else workbook.active
+                head = [
+                    FileParser._trim_row(row)
+                    for row in islice(worksheet.iter_rows(values_only=True), rows)
+                ]
+            finally:
+                workbook.close()
+            # 서식만 남은 끝쪽 빈 행 제거 (중간의 빈 행은 iter_rows와 행 번호를 맞추기 위해 유지)
+            while head and not head[-1]:
+                head.pop()
+            return pd.DataFrame(head)
+
+        return pd.read_excel(stream, sheet_name=sheet if sheet is not None else 0, header=None, nrows=rows)
+
+    @staticmethod
+    def _trim_row(row: Tuple[Any, ...]) -> Tuple[Any, ...]:
+        """행 끝의 None 셀 제거 (서식만 지정된 열까지 돌려주는 read_only 시트의 폭을 실제 데이터로 맞춤)"""
+        end = len(row)
+        while end and row[end - 1] is None:
+            end -= 1
+        return row[:end]
+
+    @staticmethod
+    def iter_rows(
+        stream: BinaryIO,
+        filename: str,
+        size: int,
+        skip_rows: int = 0,
+        chunk_rows: int = 50000,
+        sheet: Optional[str] = None,
+        as_text: bool = False
+    ) -> Iterator[pd.DataFrame]:
+        """
+        파일 전체를 header=None 데이터프레임 청크로 순회 (메모리 사용량은 청크 크기에 비례)
+
+        행 번호는 read_head와 같은 기준(CSV는 빈 줄 제외)으로 세므로
+        detect_header_row가 찾은 헤더 행 인덱스 + 1을 skip_rows로 넘기면 데이터 행부터 읽습니다.
+
+        Args:
+            stream: 처음 위치로 이동 가능한 바이너리 파일 객체
+            filename: 원본 파일명 (확장자로 형식 판단)
+            size: 파일 크기 (바이트)
+            skip_rows: 건너뛸 앞쪽 행 수
+            chunk_rows: 청크당 최대 행 수
+            sheet: Excel 시트 이름 (기본값: 활성/첫 번째 시트)
+            as_text: CSV 셀을 타입 추론 없이 원본 문자열로 읽음 (빈 셀은 NaN)
+        """
+        stream.seek(0)
+
+        if filename.endswith('.csv'):
+            prefix = stream.read(FileParser.HEAD_BYTES)
+            encoding = FileParser.detect_encoding(prefix, complete=len(prefix) >= size)
+            stream.seek(0)
+            text = io.TextIOWrapper(stream, encoding=encoding, newline='')
+            try:
+                reader = pd.read_csv(
+                    text, header=None, chunksize=chunk_rows, low_memory=False,
+                    dtype=str if as_text else None
+                )
+                try:
+                    for chunk in reader:
+                        if skip_rows >= len(chunk):
+                            skip_rows -= len(chunk)
+                            continue
+                        yield chunk.iloc[skip_rows:].reset_index(drop=True)
+                        skip_rows = 0
+                finally:
+                    reader.close()
+            except UnicodeDecodeError:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"파일 인코딩이 일정하지 않습니다. 전체를 {encoding.upper()}로 저장해주세요."
+                )
+            finally:
+                # TextIOWrapper가 닫히면서 업로드 파일까지 닫지 않도록 분리
+                text.detach()
+            return
+
+        if filename.endswith('.xlsx'):
+            from openpyxl import load_workbook
+
+            workbook = load_workbook(stream, read_only=True, data_only=True)
+            try:
+                worksheet = workbook[sheet] if sheet is not None else workbook.active
+                rows = worksheet.iter_rows(min_row=skip_rows + 1, values_only=True)
+                while True:
+                    block = list(islice(rows, chunk_rows))
+                    if not block:
+                        break
+                    # read_only 시트는 서식만 남은 빈 행도 돌려주므로 제외
+                    yield pd.DataFrame(block).dropna(how='all').reset_index(drop=True)
+            finally:
+                workbook.close()
+            return
+
+        # XLS는 형식상 한 번에 읽은 뒤 청크로 나눔
+        df = pd.read_excel(stream, sheet_name=sheet if sheet is not None else 0, header=None, skiprows=skip_rows)
+        for start in range(0, len(df), chunk_rows):
+            yield df.iloc[start:start + chunk_rows].reset_index(drop=True)
+
+    @staticmethod
+    def locate_header(
+        stream: BinaryIO,
+        filename: str,
+        size: int,
+        profile: Optional[ParseProfile] = None,
+        sheet: Optional[str] = None
+    ) -> Tuple[Optional[int], List[str]]:
+        """
+        파일 앞부분에서 헤더 행을 찾아 (헤더 행 인덱스, 컬럼명 리스트) 반환
+
+        헤더 행을 찾지 못하면 (None, ["column_1", ...])을 반환합니다.
+        """
+        profile = profile or ParseProfile()
+
+        with profile.stage("read_head"):
+            df = FileParser.read_head(stream, filename, size, sheet=sheet)
+
+        with profile.stage("detect_header"):
+            return FileParser.split_header(df)
+
+    @staticmethod
+    def split_header(df: pd.DataFrame) -> Tuple[Optional[int], List[str]]:
+        """
+        read_head 결과에서 (헤더 행 인덱스, 컬럼명 리스트) 결정
+
+        Raises:
+            HTTPException: 읽은 행이 없는 경우 (400)
+        """
+        if df.empty:
+            raise HTTPException(
+                status_code=400,
+                detail="파일이 비어있습니다."
+            )
+
+        # 헤더 행 자동 감지
+        header_row_idx = FileParser.detect_header_row(df)
+
+        if header_row_idx is None:
+            # 헤더를 찾을 수 없으면 기본 컬럼명 사용
+            return None, [f"column_{i+1}" for i in range(len(df.columns))]
+
+        # 헤더 행 추출
+        return header_row_idx, df.iloc[header_row_idx].astype(str).tolist()
+
+    @staticmethod
+    def parse_headers(
+        stream: BinaryIO,
+        filename: str,
+        size: int,
+        profile: Optional[ParseProfile] = None
+    ) -> List[str]:
+        """
+        파일 앞부분에서 헤더 행을 찾아 컬럼명 리스트 반환 (동기, 스레드/프로세스에서 실행 가능)
+        """
+        return FileParser.locate_header(stream, filename, size, profile)[1]
+
+    @staticmethod
+    def validate_upload(file: UploadFile) -> int:
+        """
+        업로드 파일의 확장자/크기 검증 후 파일 크기(바이트) 반환
         """
         # 파일 확장자 검증
         filename = file.filename.lower()
@@ -158,58 +521,38 @@ class FileParser:
                 status_code=400,
                 detail=f"지원되지 않는 파일 형식입니다. 지원 형식: {', '.join(FileParser.SUPPORTED_EXTENSIONS)}"
             )
-        
-        # 파일 크기 검증
-        contents = await file.read()
-        if len(contents) > FileParser.MAX_FILE_SIZE:
+
+        # 파일 크기 검증 (본문은 이미 임시 파일에 있으므로 읽지 않고 끝으로 이동하여 확인)
+        size = file.size
+        if size is None:
+            file.file.seek(0, os.SEEK_END)
+            size = file.file.tell()
+        if size > FileParser.MAX_FILE_SIZE:
             raise HTTPException(
                 status_code=400,
                 detail=f"파일 크기가 너무 큽니다. 최대 크기: {FileParser.MAX_FILE_SIZE // (1024*1024)}MB"
             )
+        return size
+
+    @staticmethod
+    async def parse_file(file: UploadFile) -> List[str]:
+        """
+        업로드된 파일을 파싱하여 컬럼명(파라미터 키) 리스트 반환
         
-        try:
-            # 파일 내용을 메모리에서 읽기
-            file_buffer = io.BytesIO(contents)
-            
-            # 파일 형식에 따라 파싱
-            if filename.endswith('.csv'):
-                # CSV 파일 읽기 (인코딩 자동 감지 시도)
-                try:
-                    df = pd.read_csv(file_buffer, encoding='utf-8', header=None)
-                except UnicodeDecodeError:
-                    file_buffer.seek(0)
-                    df = pd.read_csv(file_buffer, encoding='cp949', header=None)
-            else:
-                # Excel 파일 읽기
-                df = pd.read_excel(file_buffer, header=None)
-            
-            if df.empty:
-                raise HTTPException(
-                    status_code=400,
-                    detail="파일이 비어있습니다."
-                )
-            
-            # 헤더 행 자동 감지
-            header_row_idx = FileParser.detect_header_row(df)
-            
-            if header_row_idx is None:
-                # 헤더를 찾을 수 없으면 첫 번째 행을 헤더로 사용
-                headers = [f"column_{i+1}" for i in range(len(df.columns))]
-                data_start_idx = 0
-                message = "헤더를 자동으로 인식할 수 없어 기본 컬럼명을 사용합니다."
-            else:
-                # 헤더 행 추출
-                headers = df.iloc[header_row_idx].astype(str).tolist()
-                data_start_idx = header_row_idx + 1
-                message = f"{header_row_idx + 1}번째 행을 헤더로 인식했습니다."
-            
-            # 컬럼명(헤더) 리스트만 반환
-            return headers
+        Args:
+            file: 업로드된 파일 객체
             
+        Returns:
+            컬럼명 리스트 (예: ["water_qty", "saving", "depth_data"])
+        """
+        size = FileParser.validate_upload(file)
+
+        try:
+            return FileParser.parse_headers(file.file, file.filename.lower(), size)
         except HTTPException:
             raise
         except Exception as e:
             raise HTTPException(
                 status_code=500,
                 detail=f"파일 파싱 중 오류가 발생했습니다: {str(e)}"
-            )
\ No newline at end of file
+            )
@@ -0,0 +1,114 @@
+"""
+import 시간 예산 점검 - 워커 시작 시 패키지별 import 비용을 측정하여 보고
+
+main.py가 앱 모듈을 import하는 동안 sys.meta_path에 측정용 finder를 끼워
+모듈마다 실행(exec_module) 시간을 재고, 하위 모듈 시간을 뺀 순수 시간을
+최상위 패키지(sqlalchemy, fastapi, app 등) 단위로 합산합니다.
+합계가 예산을 넘으면 경고를 남겨 무거운 의존성이 시작 경로에 다시 들어온 것을 알 수 있습니다.
+
+환경 변수 (.env가 로드되기 전에 읽으므로 프로세스 환경 변수로 설정):
+    IMPORT_TIME_BUDGET_MS: import 시간 예산 (기본값: 0 = 측정하지 않음)
+    IMPORT_TIME_REPORT_TOP: 보고할 상위 패키지 수 (기본값: 10)
+"""
+import logging
+import os
+import resource
+import sys
+import time
+from collections import defaultdict
+from importlib.abc import MetaPathFinder
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class ImportProfiler(MetaPathFinder):
+    """모듈 로더의 exec_module을 감싸 import 시간을 측정하는 meta path finder"""
+
+    def __init__(self, budget_ms: float = 0.0, report_top: int = 10):
+        self.budget_ms = budget_ms
+        self.report_top = report_top
+        self.self_times: Dict[str, float] = defaultdict(float)
+        self._stack: List[List[float]] = []
+        self._started_at: Optional[float] = None
+        self._elapsed: float = 0.0
+        self._rss_before = 0
+
+    @classmethod
+    def from_env(cls) -> "ImportProfiler":
+        return cls(
+            budget_ms=float(os.getenv("IMPORT_TIME_BUDGET_MS", "0")),
+            report_top=int(os.getenv("IMPORT_TIME_REPORT_TOP", "10"))
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.budget_ms > 0
+
+    def install(self) -> None:
+        if not self.enabled or self in sys.meta_path:
+            return
+        self._rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        self._started_at = time.perf_counter()
+        sys.meta_path.insert(0, self)
+
+    def uninstall(self) -> None:
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+            self._elapsed = time.perf_counter() - self._started_at
+
+    def find_spec(self, fullname, path, target=None):
+        # 나머지 finder로 실제 spec을 찾은 뒤 로더만 감쌈
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            loader = spec.loader
+            # 내장/frozen 모듈은 로더가 클래스 자체(공유)이고 비용도 무시할 만함
+            if loader is not None and not isinstance(loader, type) and hasattr(loader, "exec_module"):
+                try:
+                    loader.exec_module = self._timed(fullname, loader.exec_module)
+                except AttributeError:
+                    pass
+            return spec
+        return None
+
+    def _timed(self, fullname: str, exec_module):
+        def exec_module_timed(module):
+            # [시작 시각, 하위 모듈 누적 시간]
+            frame = [time.perf_counter(), 0.0]
+            self._stack.append(frame)
+            try:
+                exec_module(module)
+            finally:
+                self._stack.pop()
+                inclusive = time.perf_counter() - frame[0]
+                self.self_times[fullname.split(".")[0]] += inclusive - frame[1]
+                if self._stack:
+                    self._stack[-1][1] += inclusive
+        return exec_module_timed
+
+    def top(self) -> List[Tuple[str, float]]:
+        return sorted(self.self_times.items(), key=lambda item: item[1], reverse=True)[:self.report_top]
+
+    def report(self) -> None:
+        """측정 결과 로그 출력 (예산 초과 시 경고)"""
+        if not self.enabled or self._started_at is None:
+            return
+
+        elapsed_ms = self._elapsed * 1000
+        # ru_maxrss는 Linux에서 KB 단위
+        rss_mb = (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - self._rss_before) / 1024
+        breakdown = ", ".join(f"{name} {seconds * 1000:.0f}ms" for name, seconds in self.top())
+        message = f"앱 import 시간 {elapsed_ms:.0f}ms (예산 {self.budget_ms:.0f}ms, 최대 RSS +{rss_mb:.1f}MB): {breakdown}"
+
+        if elapsed_ms > self.budget_ms:
+            logger.warning(f"⚠️ import 시간 예산 초과 - {message}")
+        else:
+            logger.info(message)
+
+
+# 프로세스 전역 import 프로파일러
+import_profiler = ImportProfiler.from_env()
@@ -1,28 +1,224 @@
 """
 데이터베이스 스키마 자동 업데이트 유틸리티
 Spring JPA의 ddl_auto: update와 유사한 기능 제공
+
+apply_ddl_auto()는 앱 시작 시 한 번 호출되며,
+- Postgres에서는 advisory lock을 잡고 실행하여 여러 워커가 동시에 ALTER하지 않도록 하고
+- 모델 메타데이터의 지문(fingerprint)을 schema_state 테이블에 저장하여
+  지문이 같으면 스키마 조회(inspect) 자체를 건너뜁니다.
+
+DDL_AUTO=create도 같은 지문 검사를 거치므로 테이블 삭제/재생성은 지문마다 한 번만 일어납니다
+(워커마다 또는 재시작마다 데이터를 지우지 않음). create의 지문은 update와 구분되므로
+다른 모드에서 create로 바꾸면 한 번 재생성되며, 같은 모델로 다시 재생성하려면
+schema_state 테이블의 행을 지우면 됩니다.
+
+누락된 인덱스는 이름이 아니라 인덱싱된 컬럼 구성으로 판단합니다. init.sql처럼 다른 이름
+(idx_*)으로 같은 컬럼에 만든 인덱스, 유니크 제약, 기본 키가 있으면 ix_* 인덱스를 추가하지 않습니다.
 """
+import hashlib
 import logging
-from sqlalchemy import inspect, text
-from sqlalchemy.engine import Engine
-from sqlalchemy.schema import MetaData
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import Column, DateTime, Index, Integer, MetaData, String, Table, func, inspect, select, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.schema import AddConstraint
 
 logger = logging.getLogger(__name__)
 
+# 스키마 상태 기록용 테이블 (모델 메타데이터와 분리하여 지문/차이점 계산에 포함되지 않도록 함)
+_state_metadata = MetaData()
+schema_state = Table(
+    "schema_state",
+    _state_metadata,
+    Column("id", Integer, primary_key=True),
+    Column("fingerprint", String(64), nullable=False),
+    Column("updated_at", DateTime, nullable=False)
+)
+
+# 스키마 변경 직렬화용 Postgres advisory lock 키
+SCHEMA_LOCK_KEY = 0x53494D55
+
+
+def schema_fingerprint(metadata: MetaData) -> str:
+    """모델 메타데이터(테이블/컬럼/인덱스/외래 키 정의)의 SHA-256 지문"""
+    digest = hashlib.sha256()
+    for table in metadata.sorted_tables:
+        digest.update(f"table:{table.name}\n".encode())
+        for column in table.columns:
+            server_default = column.server_default.arg if column.server_default is not None else None
+            default = getattr(column.default, "arg", None)
+            digest.update(
+                f"column:{column.name}:{column.type!r}:{column.nullable}:{column.primary_key}:"
+                f"{server_default}:{default if not callable(default) else 'callable'}\n".encode()
+            )
+        for index in sorted(table.indexes, key=lambda i: i.name or ""):
+            columns = ",".join(column.name for column in index.columns)
+            digest.update(f"index:{index.name}:{columns}:{index.unique}\n".encode())
+        for constraint in sorted(table.foreign_key_constraints, key=lambda c: c.column_keys):
+            digest.update(
+                f"foreign_key:{','.join(constraint.column_keys)}:{constraint.referred_table.name}:"
+                f"{constraint.ondelete}\n".encode()
+            )
+    return digest.hexdigest()
+
+
+def _read_fingerprint(conn: Connection) -> Optional[str]:
+    """저장된 지문 조회 (상태 테이블이 없으면 None)"""
+    try:
+        with conn.begin_nested():
+            return conn.scalar(select(schema_state.c.fingerprint).where(schema_state.c.id == 1))
+    except SQLAlchemyError:
+        return None
+
+
+def _write_fingerprint(engine: Engine, fingerprint: str) -> None:
+    _state_metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(schema_state.delete())
+        conn.execute(schema_state.insert().values(id=1, fingerprint=fingerprint, updated_at=datetime.utcnow()))
+
+
+def apply_ddl_auto(engine: Engine, metadata: MetaData, ddl_auto: str) -> None:
+    """
+    DDL_AUTO 설정에 따라 테이블 생성/업데이트/검증 (앱 시작 시 1회)
+
+    Args:
+        engine: SQLAlchemy 엔진
+        metadata: 모델 MetaData (Base.metadata)
+        ddl_auto: create | update | validate | none
+    """
+    ddl_auto = ddl_auto.lower()
+    if ddl_auto == "none":
+        logger.info("ℹ️ DDL_AUTO=none: 테이블 자동 생성이 비활성화되었습니다.")
+        return
+    if ddl_auto not in ("create", "update", "validate"):
+        logger.warning(f"⚠️ 알 수 없는 DDL_AUTO 값: {ddl_auto}. 기본값 'update'를 사용합니다.")
+        ddl_auto = "update"
+
+    fingerprint = schema_fingerprint(metadata)
+    if ddl_auto == "create":
+        # update로 맞춘 스키마에서 create로 바꾸면 한 번은 재생성되도록 모드별로 구분
+        fingerprint = hashlib.sha256(f"create:{fingerprint}".encode()).hexdigest()
+    is_postgres = engine.dialect.name == "postgresql"
+
+    with engine.connect() as lock_conn:
+        # 빠른 경로: 지문이 같으면 잠금/스키마 조회 없이 종료 (create도 이미 재생성한 지문이면 건너뜀)
+        if _read_fingerprint(lock_conn) == fingerprint:
+            lock_conn.rollback()
+            logger.info(f"✅ DDL_AUTO={ddl_auto}: 스키마 지문이 일치하여 확인을 건너뜁니다.")
+            return
+        lock_conn.rollback()
 
-def auto_update_schema(engine: Engine, metadata: MetaData) -> None:
+        if ddl_auto == "validate":
+            differences = check_schema_differences(engine, metadata)
+            if differences['missing_tables'] or differences['missing_columns'] or differences['missing_indexes']:
+                logger.warning(f"⚠️ 스키마 불일치 감지: {differences}")
+            else:
+                logger.info("✅ DDL_AUTO=validate: 스키마가 일치합니다.")
+            return
+
+        if is_postgres:
+            # 세션 단위 잠금 - 다른 워커는 여기서 대기하다가 지문을 다시 확인
+            lock_conn.execute(select(func.pg_advisory_lock(SCHEMA_LOCK_KEY)))
+            lock_conn.commit()
+        try:
+            if _read_fingerprint(lock_conn) == fingerprint:
+                # 잠금을 기다리는 동안 다른 워커가 먼저 재생성/업데이트함
+                logger.info(f"✅ DDL_AUTO={ddl_auto}: 다른 워커가 스키마를 이미 반영했습니다.")
+                return
+            if ddl_auto == "create":
+                # 기존 테이블 삭제 후 재생성
+                metadata.drop_all(bind=engine)
+                metadata.create_all(bind=engine)
+                logger.info("✅ DDL_AUTO=create: 모든 테이블을 재생성했습니다.")
+            else:
+                inspector = inspect(engine)
+                differences = check_schema_differences(engine, metadata, inspector)
+
+                # 차이점 로깅
+                if differences['missing_tables']:
+                    logger.info(f"생성할 테이블: {differences['missing_tables']}")
+                if differences['missing_columns']:
+                    logger.info(f"추가할 컬럼: {differences['missing_columns']}")
+                if differences['missing_indexes']:
+                    logger.info(f"생성할 인덱스: {differences['missing_indexes']}")
+
+                # 자동 스키마 업데이트 실행
+                auto_update_schema(engine, metadata, inspector)
+                logger.info("✅ DDL_AUTO=update: 스키마를 자동으로 업데이트했습니다.")
+
+                # 일부 ALTER가 실패했으면 지문을 저장하지 않아 다음 시작 때 다시 시도
+                remaining = check_schema_differences(engine, metadata)
+                if remaining['missing_tables'] or remaining['missing_columns'] or remaining['missing_indexes']:
+                    logger.warning(f"⚠️ 스키마 업데이트 후에도 불일치가 남아 있습니다: {remaining}")
+                    return
+
+            _write_fingerprint(engine, fingerprint)
+        finally:
+            if is_postgres:
+                lock_conn.rollback()
+                lock_conn.execute(select(func.pg_advisory_unlock(SCHEMA_LOCK_KEY)))
+                lock_conn.commit()
+
+
+def _existing_index_columns(inspector: Inspector, table_name: str) -> Dict[Tuple[str, ...], bool]:
+    """테이블에 이미 있는 인덱스의 컬럼 구성 → 유니크 여부 (유니크 제약, 기본 키 포함)"""
+    covered: Dict[Tuple[str, ...], bool] = {}
+
+    def add(columns, unique: bool) -> None:
+        key = tuple(columns)
+        covered[key] = covered.get(key, False) or unique
+
+    for index in inspector.get_indexes(table_name):
+        add(index['column_names'], bool(index.get('unique')))
+    try:
+        for constraint in inspector.get_unique_constraints(table_name):
+            add(constraint['column_names'], True)
+    except NotImplementedError:
+        pass
+    primary_key = inspector.get_pk_constraint(table_name).get('constrained_columns')
+    if primary_key:
+        add(primary_key, True)
+    return covered
+
+
+def _missing_indexes(inspector: Inspector, table: Table) -> List[Index]:
+    """
+    모델 인덱스 중 DB에 없는 것 - 이름이 같거나, 같은 컬럼 구성의 인덱스/제약이 있으면 있는 것으로 봄
+
+    유니크 인덱스는 기존 인덱스도 유니크여야 같은 것으로 봅니다.
+    """
+    existing_names = {index['name'] for index in inspector.get_indexes(table.name)}
+    covered = _existing_index_columns(inspector, table.name)
+    missing = []
+    for index in table.indexes:
+        if index.name in existing_names:
+            continue
+        columns = tuple(column.name for column in index.columns)
+        if columns in covered and (covered[columns] or not index.unique):
+            continue
+        missing.append(index)
+    return missing
+
+
+def auto_update_schema(engine: Engine, metadata: MetaData, inspector: Optional[Inspector] = None) -> None:
     """
     데이터베이스 스키마를 자동으로 업데이트합니다.
     - 새 테이블 생성
     - 기존 테이블에 누락된 컬럼 추가
+    - 기존 테이블에 누락된 인덱스 생성 (유니크 인덱스는 중복 데이터가 있으면 실패하고 로그만 남김)
+    - 기존 테이블에 누락된 외래 키 추가 (참조가 깨진 행이 있거나 SQLite면 실패하고 로그만 남김)
     - 기존 데이터는 유지
     
     Args:
         engine: SQLAlchemy 엔진
         metadata: SQLAlchemy MetaData 객체
+        inspector: 이미 만든 Inspector (check_schema_differences와 조회 결과 공유)
     """
-    inspector = inspect(engine)
+    if inspector is None:
+        inspector = inspect(engine)
     existing_tables = inspector.get_table_names()
     
     # 1. 새 테이블 생성
@@ -92,25 +288,57 @@ def auto_update_schema(engine: Engine, metadata: MetaData) -> None:
                         except Exception as e2:
                             logger.error(f"컬럼 '{col_name}' 추가 완전 실패: {e2}")
     
+    # 3. 기존 테이블의 누락된 인덱스 생성 (인덱스마다 별도 트랜잭션이라 하나가 실패해도 나머지는 진행)
+    for table in metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        for index in _missing_indexes(inspector, table):
+            try:
+                with engine.begin() as conn:
+                    index.create(bind=conn)
+                logger.info(f"인덱스 '{index.name}'을(를) 테이블 '{table.name}'에 생성했습니다.")
+            except SQLAlchemyError as e:
+                logger.error(f"인덱스 '{index.name}' 생성 실패 (유니크 인덱스라면 중복 데이터를 정리해야 합니다): {e}")
+    
+    # 4. 기존 테이블의 누락된 외래 키 추가 (나중에 추가된 컬럼은 2단계에서 제약 조건 없이 만들어짐)
+    for table in metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        existing_keys = {
+            tuple(foreign_key['constrained_columns'])
+            for foreign_key in inspector.get_foreign_keys(table.name)
+        }
+        for constraint in table.foreign_key_constraints:
+            if tuple(constraint.column_keys) in existing_keys:
+                continue
+            try:
+                with engine.begin() as conn:
+                    conn.execute(AddConstraint(constraint))
+                logger.info(f"외래 키 {constraint.column_keys}을(를) 테이블 '{table.name}'에 추가했습니다.")
+            except (SQLAlchemyError, NotImplementedError) as e:
+                logger.error(f"외래 키 {constraint.column_keys} 추가 실패 (참조가 깨진 행을 정리해야 합니다): {e}")
+    
     logger.info("스키마 업데이트 완료")
 
 
-def check_schema_differences(engine: Engine, metadata: MetaData) -> dict:
+def check_schema_differences(engine: Engine, metadata: MetaData, inspector: Optional[Inspector] = None) -> dict:
     """
     현재 데이터베이스와 모델 간의 차이점을 확인합니다.
     
     Returns:
         dict: 차이점 정보
     """
-    inspector = inspect(engine)
-    existing_tables = set(inspector.get_table_names())
+    if inspector is None:
+        inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names()) - {schema_state.name}
     model_tables = {table.name for table in metadata.sorted_tables}
     
     differences = {
         'missing_tables': model_tables - existing_tables,
         'extra_tables': existing_tables - model_tables,
         'missing_columns': {},
-        'extra_columns': {}
+        'extra_columns': {},
+        'missing_indexes': {}
     }
     
     for table in metadata.sorted_tables:
@@ -125,5 +353,9 @@ def check_schema_differences(engine: Engine, metadata: MetaData) -> dict:
                 differences['missing_columns'][table.name] = list(missing)
             if extra:
                 differences['extra_columns'][table.name] = list(extra)
+            
+            missing_indexes = [index.name for index in _missing_indexes(inspector, table)]
+            if missing_indexes:
+                differences['missing_indexes'][table.name] = missing_indexes
     
     return differences
\ No newline at end of file
@@ -0,0 +1,54 @@
+"""시뮬레이터 일괄 생성 엔드포인트 - 항목별 결과 보고"""
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select
+
+from app.models import Simulator
+from app.routers import simulators as simulators_router
+from app.routers.simulators import bulk_create_simulators
+from app.schemas.simulator import SimulatorBulkCreate
+from app.services import simulator_service
+
+
+def test_bulk_create_reports_each_item(db, user, make_simulator):
+    make_simulator("existing")
+
+    response = bulk_create_simulators(SimulatorBulkCreate(simulators=[
+        {"name": "pump-1", "parameters": {"temperature": 25}},
+        {"name": "existing", "parameters": {"temperature": 25}},
+        {"name": "pump-1", "parameters": {"temperature": 30}},
+        {"name": "no-parameters"},
+        {"name": "pump-2", "parameters": {"temperature": 30}},
+    ]), user, db)
+
+    statuses = [result["status"] for result in response["results"]]
+    assert statuses == ["created", "conflict", "conflict", "invalid", "created"]
+    assert [result["index"] for result in response["results"]] == list(range(5))
+    assert response["created"] == 2
+    assert response["failed"] == 3
+
+    names = set(db.scalars(select(Simulator.name).where(Simulator.user_id == user.id)))
+    assert names == {"existing", "pump-1", "pump-2"}
+
+
+def test_bulk_create_limits_items_per_request(db, user, monkeypatch):
+    monkeypatch.setattr(simulators_router, "BULK_CREATE_MAX_ITEMS", 2)
+
+    with pytest.raises(HTTPException) as error:
+        bulk_create_simulators(SimulatorBulkCreate(simulators=[
+            {"name": f"pump-{i}", "parameters": {"temperature": 25}} for i in range(3)
+        ]), user, db)
+    assert error.value.status_code == 400
+    assert db.scalar(select(Simulator.id)) is None
+
+
+def test_bulk_create_reports_fleets_over_the_instance_limit(db, user, monkeypatch):
+    monkeypatch.setattr(simulator_service, "FLEET_MAX_INSTANCES", 10)
+
+    response = bulk_create_simulators(SimulatorBulkCreate(simulators=[
+        {"name": "fleet-big", "parameters": {"temperature": 25}, "fleet": {"instance_count": 50}},
+        {"name": "fleet-small", "parameters": {"temperature": 25}, "fleet": {"instance_count": 5}},
+    ]), user, db)
+
+    assert [result["status"] for result in response["results"]] == ["invalid", "created"]
+    assert set(db.scalars(select(Simulator.name))) == {"fleet-small"}
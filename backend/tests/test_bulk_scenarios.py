@@ -0,0 +1,58 @@
+"""고장 시나리오 일괄 적용/해제 엔드포인트"""
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select
+
+from app.models import FailureScenario
+from app.routers.failure_scenarios import bulk_apply_scenario, bulk_release_scenarios
+from app.schemas.failure_scenario import FailureScenarioBulkApply, FailureScenarioBulkRelease
+from app.services.simulator_service import SimulatorService
+
+
+def test_bulk_apply_and_release(db, user, make_simulator, make_scenario):
+    simulators = [make_simulator(f"pump-{i}") for i in range(3)]
+    other = make_simulator("valve-1")
+    scenario = make_scenario(failure_parameters={"temperature": 90.0})
+
+    response = bulk_apply_scenario(FailureScenarioBulkApply(scenario_id=scenario.id, name_prefix="pump-"), db, user)
+    assert response["simulator_ids"] == [simulator.id for simulator in simulators]
+
+    copies = db.scalars(select(FailureScenario).where(FailureScenario.source_scenario_id == scenario.id)).all()
+    assert sorted(copy.simulator_id for copy in copies) == response["simulator_ids"]
+    assert all(copy.is_applied for copy in copies)
+    # 모든 복사본이 같은 시각에 시작
+    assert len({copy.applied_at for copy in copies}) == 1
+
+    db.expire_all()
+    assert SimulatorService.get_simulator_data(db, "alice", "pump-0")["data"]["temperature"] == 90.0
+    db.expire_all()
+    assert SimulatorService.get_simulator_data(db, "alice", "valve-1")["data"]["temperature"] == 25.0
+
+    response = bulk_release_scenarios(
+        FailureScenarioBulkRelease(scenario_id=scenario.id, simulator_ids=[simulators[0].id, other.id]), db, user
+    )
+    assert response["simulator_ids"] == [simulators[0].id]
+
+    remaining = db.scalars(select(FailureScenario.simulator_id).where(FailureScenario.source_scenario_id == scenario.id))
+    assert sorted(remaining) == [simulators[1].id, simulators[2].id]
+    db.expire_all()
+    assert SimulatorService.get_simulator_data(db, "alice", "pump-0")["data"]["temperature"] == 25.0
+
+
+def test_bulk_apply_rejects_copies(db, user, make_simulator, make_scenario):
+    simulator = make_simulator("pump-1")
+    scenario = make_scenario()
+    bulk_apply_scenario(FailureScenarioBulkApply(scenario_id=scenario.id, simulator_ids=[simulator.id]), db, user)
+    copy_id = db.scalar(select(FailureScenario.id).where(FailureScenario.source_scenario_id == scenario.id))
+
+    with pytest.raises(HTTPException) as error:
+        bulk_apply_scenario(FailureScenarioBulkApply(scenario_id=copy_id, simulator_ids=[simulator.id]), db, user)
+    assert error.value.status_code == 400
+
+
+def test_bulk_release_without_applied_scenarios(db, user, make_simulator):
+    make_simulator("pump-1")
+
+    with pytest.raises(HTTPException) as error:
+        bulk_release_scenarios(FailureScenarioBulkRelease(all_simulators=True), db, user)
+    assert error.value.status_code == 400
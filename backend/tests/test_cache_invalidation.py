@@ -0,0 +1,93 @@
+"""캐시 무효화 버스 - 쓰기 커밋 시 구독자 호출, 캐시 항목 만료, 인스턴스 간 NOTIFY 전달"""
+import threading
+
+import pytest
+
+from app.database import SessionLocal, engine
+from app.schemas.simulator import SimulatorUpdate
+from app.services.cache_invalidation import InvalidationBus, invalidation_bus
+from app.services.compiled_cache import compiled_cache
+from app.services.failure_scenario_service import FailureScenarioService
+from app.services.simulator_service import SimulatorService
+
+from .conftest import postgres_only
+
+
+@pytest.fixture
+def received():
+    """invalidation_bus 구독자가 받은 시뮬레이터 ID 목록들"""
+    calls = []
+    invalidation_bus.subscribe(calls.append)
+    yield calls
+    invalidation_bus.unsubscribe(calls.append)
+
+
+def test_notify_dispatches_after_commit(db, received):
+    invalidation_bus.notify(db, [3, 1, 3])
+    assert received == []
+
+    db.commit()
+    assert received == [[1, 3]]
+
+
+def test_notify_discarded_on_rollback(db, received):
+    invalidation_bus.notify(db, [1])
+    db.rollback()
+    db.commit()
+    assert received == []
+
+
+def test_simulator_update_evicts_compiled_cache(db, user, make_simulator, received):
+    simulator = make_simulator("pump-1")
+    compiled = SimulatorService._get_compiled_simulator(db, "alice", "pump-1")
+    # 신선 기간이 길어도 변경 알림을 받으면 다음 조회에서 DB를 다시 읽어야 함
+    compiled_cache.store(compiled, fresh_seconds=3600)
+    assert SimulatorService._get_compiled_simulator(db, "alice", "pump-1") is compiled
+
+    SimulatorService.update_simulator(db, simulator.id, user.id, SimulatorUpdate(parameters={"temperature": 30.0}))
+
+    assert received == [[simulator.id]]
+    refreshed = SimulatorService._get_compiled_simulator(db, "alice", "pump-1")
+    assert refreshed is not compiled
+    assert refreshed.parameters == {"temperature": 30.0}
+
+
+def test_scenario_apply_and_release_notify(db, user, make_simulator, make_scenario, received):
+    simulator = make_simulator("pump-1")
+    scenario = make_scenario()
+
+    FailureScenarioService.apply_scenario_to_simulator(db, scenario.id, simulator.id, user.id)
+    db.expire_all()
+    FailureScenarioService.release_scenario_from_simulator(db, simulator.id, user.id)
+
+    assert received == [[simulator.id], [simulator.id]]
+
+
+@postgres_only
+def test_notify_reaches_other_instance(db):
+    """다른 인스턴스(별도 origin의 버스)의 리스너가 커밋된 알림을 받음"""
+    other = InvalidationBus(enabled=True)
+    arrived = threading.Event()
+    messages = []
+
+    def handler(simulator_ids):
+        messages.append(simulator_ids)
+        arrived.set()
+
+    other.subscribe(handler)
+    other.start_listener(engine)
+    try:
+        # 리스너가 LISTEN을 실행할 때까지 반복해서 보냄
+        for _ in range(20):
+            session = SessionLocal()
+            try:
+                invalidation_bus.notify(session, [42])
+                session.commit()
+            finally:
+                session.close()
+            if arrived.wait(0.5):
+                break
+    finally:
+        other.stop_listener()
+
+    assert messages and messages[0] == [42]
@@ -0,0 +1,100 @@
+"""시작 시 캐시 워밍업 - 스냅샷 파일, DB 일괄 로드, 실패 시 이전 값 유지"""
+import json
+import time
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app.services import cache_warmup as warmup_module
+from app.services.cache_warmup import SNAPSHOT_FORMAT_VERSION, CacheWarmup, read_snapshot, write_snapshot
+from app.services.compiled_cache import compiled_cache
+from app.services.compiled_simulator import CompiledSimulator, load_compiled_simulators
+from app.services.failure_scenario_service import FailureScenarioService
+
+
+def compiled(name: str, simulator_id: int = 1) -> CompiledSimulator:
+    return CompiledSimulator(
+        simulator_id=simulator_id, user_id=1, user_key="alice", name=name, is_active=True,
+        parameters={"temperature": 25.0}
+    )
+
+
+def test_snapshot_round_trip(tmp_path):
+    path = str(tmp_path / "snapshot.json")
+    write_snapshot(path, [compiled("pump-1"), compiled("pump-2", 2)])
+
+    loaded = read_snapshot(path, max_age_seconds=60)
+
+    assert [item.to_dict() for item in loaded] == [compiled("pump-1").to_dict(), compiled("pump-2", 2).to_dict()]
+    assert list(tmp_path.iterdir()) == [tmp_path / "snapshot.json"]
+
+
+@pytest.mark.parametrize("document", [
+    {"version": SNAPSHOT_FORMAT_VERSION - 1, "created_at": time.time(), "simulators": []},
+    {"version": SNAPSHOT_FORMAT_VERSION, "created_at": time.time() - 120, "simulators": []},
+    {"version": SNAPSHOT_FORMAT_VERSION, "created_at": time.time(), "simulators": [{"name": "broken"}]},
+])
+def test_unusable_snapshots_are_ignored(tmp_path, document):
+    path = tmp_path / "snapshot.json"
+    path.write_text(json.dumps(document))
+
+    assert read_snapshot(str(path), max_age_seconds=60) is None
+
+
+def test_missing_empty_or_corrupt_snapshot(tmp_path):
+    assert read_snapshot(str(tmp_path / "missing.json"), 60) is None
+    (tmp_path / "empty.json").write_bytes(b"")
+    assert read_snapshot(str(tmp_path / "empty.json"), 60) is None
+    (tmp_path / "corrupt.json").write_bytes(b"{not json")
+    assert read_snapshot(str(tmp_path / "corrupt.json"), 60) is None
+
+
+def test_rows_compile_like_orm_entities(db, user, make_simulator, make_scenario):
+    simulator = make_simulator("pump-1")
+    make_simulator("pump-2", is_active=False)
+    scenario = make_scenario()
+    FailureScenarioService.apply_scenario_to_simulator(db, scenario.id, simulator.id, user.id)
+
+    by_name = {item.name: item for item in load_compiled_simulators(db)}
+
+    assert set(by_name) == {"pump-1", "pump-2"}
+    assert by_name["pump-1"].failure_config == {"failure_parameters": {"temperature": 90.0}}
+    assert by_name["pump-1"].applied_at is not None
+    assert by_name["pump-1"].user_key == "alice"
+    assert not by_name["pump-2"].is_active and by_name["pump-2"].parameters == {}
+
+
+def test_run_replaces_cache_and_writes_snapshot(db, make_simulator, tmp_path):
+    make_simulator("pump-1")
+    compiled_cache.store(compiled("deleted", 99))
+    path = str(tmp_path / "snapshot.json")
+
+    warmup = CacheWarmup(snapshot_path=path)
+    warmup.run()
+
+    assert [item.name for item in compiled_cache.snapshot()] == ["pump-1"]
+    assert [item.name for item in read_snapshot(path, 60)] == ["pump-1"]
+    assert warmup.completed_at is not None
+
+
+def test_start_serves_snapshot_before_database_load(db, make_simulator, tmp_path, monkeypatch):
+    path = str(tmp_path / "snapshot.json")
+    write_snapshot(path, [compiled("from-snapshot")])
+    monkeypatch.setattr(CacheWarmup, "run", lambda self: None)
+
+    CacheWarmup(snapshot_path=path).start()
+
+    assert [item.name for item in compiled_cache.snapshot()] == ["from-snapshot"]
+
+
+def test_failed_load_keeps_entries_as_fallback(db, monkeypatch):
+    compiled_cache.store(compiled("pump-1"), fresh_seconds=60)
+
+    def unavailable(db, user_id=None):
+        raise OperationalError("SELECT 1", {}, Exception("connection refused"))
+
+    monkeypatch.setattr(warmup_module, "load_simulator_rows", unavailable)
+    CacheWarmup().run()
+
+    entry = compiled_cache._entries[("alice", "pump-1")]
+    assert entry.fresh_until == 0.0
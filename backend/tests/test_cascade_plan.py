@@ -0,0 +1,146 @@
+"""고장 전파 - 위상 단계, 순환 거부(사용자별), 계획 적용, /api/data 반영과 캐시 무효화"""
+import json
+
+import pytest
+
+from app.models import FailureCascade, Simulator, User
+from app.schemas.failure_cascade import FailureCascadeCreate, FailureCascadeUpdate
+from app.services.cascade_plan import CascadeEdge, CascadePlan, cascade_plans, load_cascade_plans, topological_levels
+from app.services.failure_cascade_service import FailureCascadeService
+from app.services.failure_scenario_service import FailureScenarioService
+from app.services.simulator_service import SimulatorService
+
+
+def edge(source, target, magnitude=10.0, effect="offset", delay=0.0, ramp=0.0, parameter="temperature"):
+    return CascadeEdge(
+        cascade_id=source * 100 + target, source=source, target=target, parameter=parameter,
+        effect=effect, magnitude=magnitude, delay_seconds=delay, ramp_seconds=ramp
+    )
+
+
+def active(**data):
+    return {"type": "active", "data": dict(data)}
+
+
+class TestTopologicalLevels:
+    def test_levels_follow_longest_path(self):
+        # 1 → 2 → 4, 1 → 3 → 4, 1 → 4
+        levels = topological_levels([(1, 2), (2, 4), (1, 3), (3, 4), (1, 4)])
+        assert levels == {1: 0, 2: 1, 3: 1, 4: 2}
+
+    def test_cycle_is_rejected_with_its_members(self):
+        with pytest.raises(ValueError) as error:
+            topological_levels([(1, 2), (2, 3), (3, 2), (3, 4)])
+        assert "[2, 3]" in str(error.value)
+
+    def test_plan_groups_nodes_by_level_and_finds_upstream(self):
+        plan = CascadePlan([edge(3, 4), edge(1, 2), edge(2, 3), edge(5, 4)])
+
+        assert plan.levels == [[1, 5], [2], [3], [4]]
+        assert [(e.source, e.target) for e in plan.edges][:2] == [(1, 2), (5, 4)]
+        assert plan.upstream(4) == {1, 2, 3, 5}
+        assert plan.upstream(1) == set()
+
+
+class TestApply:
+    def test_delay_propagates_through_levels(self):
+        plan = CascadePlan([edge(1, 2, delay=30), edge(2, 3, delay=60)])
+        results = {2: active(temperature=25.0), 3: active(temperature=25.0)}
+
+        plan.apply({1: 100.0}, results)
+
+        # 2는 70초 전, 3은 10초 전에 시작
+        assert results[2]["data"]["temperature"] == 35.0
+        assert results[3]["data"]["temperature"] == 35.0
+
+        results = {3: active(temperature=25.0)}
+        plan.apply({1: 80.0}, results)
+        assert results[3]["data"]["temperature"] == 25.0
+
+    def test_ramp_and_scale_before_offset(self):
+        plan = CascadePlan([
+            edge(1, 2, magnitude=4.0, ramp=100),
+            edge(3, 2, magnitude=2.0, effect="scale"),
+        ])
+        results = {2: active(temperature=10.0)}
+
+        plan.apply({1: 50.0, 3: 0.0}, results)
+
+        assert results[2]["data"]["temperature"] == pytest.approx(10.0 * 2.0 + 4.0 * 0.5)
+
+    def test_skips_inactive_missing_and_non_numeric_targets(self):
+        plan = CascadePlan([edge(1, 2), edge(1, 3), edge(1, 4, parameter="state")])
+        results = {2: {"type": "inactive", "data": {"temperature": 25.0}}, 4: active(state="run")}
+
+        plan.apply({1: 10.0}, results)
+
+        assert results[2]["data"]["temperature"] == 25.0
+        assert results[4]["data"]["state"] == "run"
+
+
+def cascade(source, target, **fields):
+    return FailureCascadeCreate(
+        source_simulator_id=source.id, target_simulator_id=target.id,
+        target_parameter="temperature", magnitude=10.0, **fields
+    )
+
+
+class TestService:
+    def test_cycle_is_rejected_on_create_and_reactivate(self, db, user, make_simulator):
+        a, b, c = (make_simulator(name) for name in "abc")
+        FailureCascadeService.create_cascade(db, cascade(a, b), user.id)
+        FailureCascadeService.create_cascade(db, cascade(b, c), user.id)
+
+        with pytest.raises(ValueError):
+            FailureCascadeService.create_cascade(db, cascade(c, a), user.id)
+
+        # 비활성 간선은 순환이어도 저장되지만 다시 활성화할 때 거부
+        closing = FailureCascadeService.create_cascade(db, cascade(c, a, is_active=False), user.id)
+        with pytest.raises(ValueError):
+            FailureCascadeService.update_cascade(db, closing.id, FailureCascadeUpdate(is_active=True), user.id)
+        assert FailureCascadeService.get_plan_levels(db, user.id) == ([[a.id], [b.id], [c.id]], 2)
+
+    def test_cycles_are_checked_per_user(self, db, user, make_simulator):
+        a, b = make_simulator("a"), make_simulator("b")
+        FailureCascadeService.create_cascade(db, cascade(a, b), user.id)
+
+        other = User(name="다른 사용자", user_id="bob", password="x")
+        db.add(other)
+        db.commit()
+        x, y = (Simulator(user_id=other.id, name=name, parameters=json.dumps({"temperature": 1.0}),
+                          parameter_config="{}") for name in "xy")
+        db.add_all([x, y])
+        db.commit()
+        FailureCascadeService.create_cascade(db, cascade(x, y), other.id)
+        FailureCascadeService.create_cascade(db, cascade(y, x, is_active=False), other.id)
+
+        with pytest.raises(ValueError):
+            FailureCascadeService.create_cascade(db, cascade(a, x), user.id)
+
+        # DB에 순환이 생겨도 그 사용자의 계획만 비움
+        db.add(FailureCascade(user_id=other.id, source_simulator_id=y.id, target_simulator_id=x.id,
+                              target_parameter="temperature", magnitude=1.0))
+        db.commit()
+        plans = load_cascade_plans(db)
+        assert plans[other.id].edges == []
+        assert [(e.source, e.target) for e in plans[user.id].edges] == [(a.id, b.id)]
+
+
+def test_data_endpoint_applies_cascades_and_follows_changes(db, user, make_simulator, make_scenario):
+    pump, tank = make_simulator("pump"), make_simulator("tank")
+    scenario = make_scenario()
+    FailureScenarioService.apply_scenario_to_simulator(db, scenario.id, pump.id, user.id)
+    created = FailureCascadeService.create_cascade(db, cascade(pump, tank), user.id)
+
+    def temperature():
+        db.expire_all()
+        return SimulatorService.get_simulator_data(db, "alice", "tank")["data"]["temperature"]
+
+    assert temperature() == 35.0
+    assert user.id in cascade_plans._plans
+
+    FailureCascadeService.update_cascade(db, created.id, FailureCascadeUpdate(magnitude=5.0), user.id)
+    assert temperature() == 30.0
+
+    FailureCascadeService.delete_cascade(db, created.id, user.id)
+    assert temperature() == 25.0
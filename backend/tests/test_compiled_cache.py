@@ -0,0 +1,145 @@
+"""컴파일 캐시 - 신선 기간, 지연 예산/DB 오류 시 이전 값, 단일 조회(single-flight)"""
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app.services.compiled_cache import CompiledSimulatorCache
+from app.services.simulator_service import SimulatorService
+
+KEY = ("alice", "pump-1")
+
+
+def compiled(version: int = 1):
+    """캐시가 사용하는 속성만 가진 컴파일 결과"""
+    return SimpleNamespace(user_key="alice", name="pump-1", simulator_id=1, version=version)
+
+
+class Loader:
+    """호출 횟수와 실행 스레드를 기록하는 loader (release 전까지 대기 가능)"""
+
+    def __init__(self, result=None, error: Exception = None, block: bool = False):
+        self.result = result or compiled()
+        self.error = error
+        self.calls = 0
+        self.threads = []
+        self.release = threading.Event()
+        if not block:
+            self.release.set()
+
+    def __call__(self):
+        self.calls += 1
+        self.threads.append(threading.current_thread().name)
+        self.release.wait(5)
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+@pytest.fixture
+def cache():
+    cache = CompiledSimulatorCache(fresh_seconds=0, stale_seconds=60, latency_budget_seconds=0.05)
+    yield cache
+    cache.shutdown()
+
+
+def db_error():
+    return OperationalError("SELECT 1", {}, Exception("connection refused"))
+
+
+def test_fresh_entry_skips_loader(cache):
+    cache.store(compiled(), fresh_seconds=60)
+    loader = Loader()
+
+    assert cache.get(KEY, loader).version == 1
+    assert loader.calls == 0
+
+
+def test_cold_key_loads_inline_in_the_request_thread(cache):
+    loader = Loader(result=compiled(2))
+
+    assert cache.get(KEY, loader).version == 2
+    assert loader.threads == [threading.current_thread().name]
+    assert cache._executor is None
+
+
+def test_slow_database_serves_previous_value_then_refreshes(cache):
+    cache.store(compiled(1))
+    loader = Loader(result=compiled(2), block=True)
+
+    started = time.monotonic()
+    assert cache.get(KEY, loader).version == 1
+    assert time.monotonic() - started < 1
+
+    # 예산을 넘긴 조회는 백그라운드에서 끝나 캐시를 갱신
+    loader.release.set()
+    deadline = time.monotonic() + 5
+    while cache._inflight and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert cache.get(KEY, Loader(result=compiled(3))).version == 3
+    assert loader.threads[0].startswith("compiled-cache-refresh")
+
+
+def test_database_error_uses_previous_value_within_stale_window(cache):
+    cache.store(compiled(1))
+
+    assert cache.get(KEY, Loader(error=db_error())).version == 1
+
+    cache.stale_seconds = 0
+    time.sleep(0.01)
+    with pytest.raises(OperationalError):
+        cache.get(KEY, Loader(error=db_error()))
+
+
+def test_missing_simulator_drops_the_entry(cache):
+    cache.store(compiled(1))
+
+    with pytest.raises(ValueError):
+        cache.get(KEY, Loader(error=ValueError("시뮬레이터를 찾을 수 없습니다.")))
+    assert KEY not in cache._entries
+
+
+def test_concurrent_cold_requests_load_once(cache):
+    loader = Loader(block=True)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get(KEY, loader))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    loader.release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert loader.calls == 1
+    assert len(results) == 8 and all(result is results[0] for result in results)
+
+
+def test_expire_keeps_the_value_as_fallback(cache):
+    cache.store(compiled(1), fresh_seconds=60)
+    cache.expire([1])
+
+    assert cache.get(KEY, Loader(error=db_error())).version == 1
+    assert cache.get(KEY, Loader(result=compiled(2))).version == 2
+
+
+def test_replace_all_drops_missing_simulators(cache):
+    cache.store(compiled(1))
+    other = SimpleNamespace(user_key="Bob", name="valve", simulator_id=2)
+
+    cache.replace_all([other])
+
+    assert cache.snapshot() == [other]
+    assert ("bob", "valve") in cache._entries
+
+
+def test_data_endpoint_survives_database_outage(db, make_simulator, monkeypatch):
+    make_simulator("pump-1")
+    assert SimulatorService.get_simulator_data(db, "alice", "pump-1")["data"]["temperature"] == 25.0
+
+    def unavailable(user_id_str, simulator_name):
+        raise db_error()
+
+    monkeypatch.setattr(SimulatorService, "load_compiled_simulator_detached", staticmethod(unavailable))
+    assert SimulatorService.get_simulator_data(db, "alice", "pump-1")["data"]["temperature"] == 25.0
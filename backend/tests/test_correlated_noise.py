@@ -0,0 +1,72 @@
+"""백색 노이즈와 다중 파라미터 상관 노이즈의 통계적 성질"""
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.failure_scenario import CorrelatedNoiseConfig
+from app.services.failure_engine import FailureEngine
+from app.utils.covariance import cholesky_factor, covariance_from_correlation
+
+
+class TestWhiteAndCorrelatedNoise:
+    def test_gaussian_noise_scales_with_value(self):
+        engine = FailureEngine(seed=12)
+        values = engine._add_noise_batch(np.full(50000, 200.0), {"type": "gaussian", "intensity": 0.05})
+
+        assert values.mean() == pytest.approx(200.0, abs=0.2)
+        assert values.std() == pytest.approx(10.0, rel=0.03)
+
+    def test_correlated_noise_follows_correlation_matrix(self):
+        engine = FailureEngine(seed=13)
+        config = {
+            "failure_parameters": {},
+            "advanced_config": {
+                "correlated_noise": {
+                    "parameters": ["temp", "pressure"],
+                    "correlation": [[1.0, 0.7], [0.7, 1.0]],
+                    "std": [2.0, 0.5]
+                }
+            }
+        }
+        size = 50000
+        columns, _ = engine.apply_failure_scenario_batch(
+            {"temp": np.full(size, 25.0), "pressure": np.full(size, 100.0)}, config, np.zeros(size)
+        )
+
+        assert np.corrcoef(columns["temp"], columns["pressure"])[0, 1] == pytest.approx(0.7, abs=0.02)
+        assert columns["temp"].std() == pytest.approx(2.0, rel=0.03)
+        assert columns["pressure"].std() == pytest.approx(0.5, rel=0.03)
+
+
+class TestCholeskyFactor:
+    def test_factor_reconstructs_matrix(self):
+        matrix = [[4.0, 1.2, -0.6], [1.2, 1.0, 0.3], [-0.6, 0.3, 2.0]]
+        factor = np.array(cholesky_factor(matrix))
+
+        assert np.allclose(np.triu(factor, 1), 0)
+        np.testing.assert_allclose(factor @ factor.T, matrix, atol=1e-12)
+
+    def test_perfect_correlation_is_allowed(self):
+        matrix = covariance_from_correlation([[1.0, 1.0], [1.0, 1.0]], [2.0, 3.0])
+        factor = np.array(cholesky_factor(matrix))
+
+        np.testing.assert_allclose(factor @ factor.T, matrix, atol=1e-12)
+
+    @pytest.mark.parametrize("matrix", [
+        [[1.0, 0.9, 0.9], [0.9, 1.0, -0.9], [0.9, -0.9, 1.0]],
+        [[1.0, 0.5], [0.4, 1.0]],
+        [[1.0, float("nan")], [float("nan"), 1.0]],
+    ])
+    def test_invalid_matrices_are_rejected(self, matrix):
+        with pytest.raises(ValueError):
+            cholesky_factor(matrix)
+
+    def test_factor_is_computed_when_the_scenario_is_saved(self):
+        config = CorrelatedNoiseConfig(
+            parameters=["temp", "pressure"], correlation=[[1.0, 0.6], [0.6, 1.0]], std=[2.0, 1.0],
+            cholesky=[[9.0, 0.0], [0.0, 9.0]]
+        )
+
+        np.testing.assert_allclose(config.cholesky, [[2.0, 0.0], [0.6, 0.8]])
+        with pytest.raises(ValidationError):
+            CorrelatedNoiseConfig(parameters=["temp", "pressure"], covariance=[[1.0, 2.0], [2.0, 1.0]])
@@ -0,0 +1,152 @@
+"""데이터 엔드포인트 마이크로캐시 - TTL, single-flight 병합, 예외/취소 처리"""
+import asyncio
+
+from app.routers.simulators import get_simulator_data
+from app.services import data_cache
+from app.services.cache_invalidation import invalidation_bus
+from app.services.data_cache import MicroCache, data_microcache
+
+
+class Counter:
+    """호출 횟수를 세는 비동기 계산 (gate가 열릴 때까지 대기)"""
+
+    def __init__(self, error: Exception = None):
+        self.calls = 0
+        self.gate = asyncio.Event()
+        self.error = error
+
+    async def __call__(self):
+        self.calls += 1
+        await self.gate.wait()
+        if self.error is not None:
+            raise self.error
+        return {"value": self.calls}
+
+
+def test_concurrent_misses_share_one_computation():
+    async def scenario():
+        cache = MicroCache(ttl_seconds=60)
+        compute = Counter()
+        waiters = [asyncio.ensure_future(cache.get_or_compute("key", compute)) for _ in range(50)]
+        await asyncio.sleep(0)
+        compute.gate.set()
+        results = await asyncio.gather(*waiters)
+        return compute.calls, results, cache._inflight
+
+    calls, results, inflight = asyncio.run(scenario())
+    assert calls == 1
+    assert all(result is results[0] for result in results)
+    assert inflight == {}
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(data_cache.time, "monotonic", lambda: now[0])
+
+    async def scenario():
+        cache = MicroCache(ttl_seconds=0.1)
+        compute = Counter()
+        compute.gate.set()
+        first = await cache.get_or_compute("key", compute)
+        now[0] += 0.05
+        second = await cache.get_or_compute("key", compute)
+        now[0] += 0.1
+        third = await cache.get_or_compute("key", compute)
+        return first, second, third
+
+    first, second, third = asyncio.run(scenario())
+    assert first is second
+    assert third == {"value": 2}
+
+
+def test_disabled_cache_computes_every_time():
+    async def scenario():
+        cache = MicroCache(ttl_seconds=0)
+        compute = Counter()
+        compute.gate.set()
+        return [await cache.get_or_compute("key", compute) for _ in range(3)]
+
+    assert [result["value"] for result in asyncio.run(scenario())] == [1, 2, 3]
+
+
+def test_errors_reach_all_waiters_and_are_not_cached():
+    async def scenario():
+        cache = MicroCache(ttl_seconds=60)
+        failing = Counter(error=RuntimeError("db down"))
+        waiters = [asyncio.ensure_future(cache.get_or_compute("key", failing)) for _ in range(3)]
+        await asyncio.sleep(0)
+        failing.gate.set()
+        errors = await asyncio.gather(*waiters, return_exceptions=True)
+
+        working = Counter()
+        working.gate.set()
+        return errors, await cache.get_or_compute("key", working)
+
+    errors, result = asyncio.run(scenario())
+    assert all(isinstance(error, RuntimeError) for error in errors)
+    assert result == {"value": 1}
+
+
+def test_cancelled_leader_does_not_cancel_followers():
+    async def scenario():
+        cache = MicroCache(ttl_seconds=60)
+        compute = Counter()
+        leader = asyncio.ensure_future(cache.get_or_compute("key", compute))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(cache.get_or_compute("key", compute))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        await asyncio.sleep(0)
+        compute.gate.set()
+        return leader.cancelled(), await follower, compute.calls
+
+    cancelled, result, calls = asyncio.run(scenario())
+    assert cancelled
+    assert result == {"value": 1}
+    assert calls == 1
+
+
+def test_full_cache_keeps_only_live_entries(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(data_cache.time, "monotonic", lambda: now[0])
+    cache = MicroCache(ttl_seconds=1, max_entries=3)
+
+    cache._store("a", 1)
+    now[0] = 0.5
+    cache._store("b", 2)
+    cache._store("c", 3)
+    now[0] = 1.2
+    cache._store("d", 4)
+
+    assert set(cache._entries) == {"b", "c", "d"}
+
+
+def test_endpoint_computes_with_its_own_session(db, make_simulator, monkeypatch):
+    """처음 요청이 취소되어도 함께 기다리던 요청은 계산 전용 세션으로 만든 결과를 받음"""
+    make_simulator("pump-1")
+    monkeypatch.setattr(data_microcache, "ttl_seconds", 60)
+    data_microcache.clear()
+
+    async def scenario():
+        leader = asyncio.ensure_future(get_simulator_data("alice", "pump-1"))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(get_simulator_data("alice", "pump-1"))
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await follower
+
+    try:
+        assert asyncio.run(scenario()) == {"temperature": 25.0, "pressure": 100.0}
+    finally:
+        data_microcache.clear()
+
+
+def test_invalidation_clears_the_data_cache(db, monkeypatch):
+    monkeypatch.setattr(data_microcache, "ttl_seconds", 60)
+    data_microcache._store(("alice", "pump-1"), {"data": {}})
+
+    invalidation_bus.notify(db, [1])
+    db.commit()
+
+    assert data_microcache._entries == {}
@@ -0,0 +1,97 @@
+"""고장 주입 일괄 변환 - 시간 컬럼 해석과 원본 셀 표기 유지"""
+import csv
+import io
+from datetime import datetime, timedelta, timezone
+
+import openpyxl
+import pytest
+
+from app.services.failure_transform import FailureTransform
+
+GRADUAL_TO_100 = {
+    "failure_parameters": {},
+    "advanced_config": {
+        "parameters": {
+            "temp": {"failure_type": "gradual", "failure_value": 100, "duration_seconds": 60}
+        }
+    }
+}
+
+
+def transform(data: bytes, filename: str, **options):
+    """변환 결과를 헤더 → 값 딕셔너리의 행 목록으로 반환"""
+    job = FailureTransform(io.BytesIO(data), filename, len(data), GRADUAL_TO_100, seed=0, **options)
+    job.prepare()
+    text = b"".join(job.iter_csv()).decode("utf-8-sig")
+    return list(csv.DictReader(io.StringIO(text)))
+
+
+def sample_csv() -> bytes:
+    lines = ["ts,temp,count,stamp"]
+    lines += [f"{i * 10},20,{i},2024-01-01 00:00:{i:02d}" for i in range(7)]
+    return ("\n".join(lines) + "\n").encode()
+
+
+def test_numeric_time_column_is_seconds():
+    rows = transform(sample_csv(), "data.csv", time_column="ts")
+
+    temps = [float(row["temp"]) for row in rows]
+    assert temps == pytest.approx([20 + 80 * i / 6 for i in range(7)])
+
+
+def test_datetime_time_column():
+    rows = transform(sample_csv(), "data.csv", time_column="stamp")
+
+    temps = [float(row["temp"]) for row in rows]
+    assert temps == pytest.approx([20 + 80 * i / 60 for i in range(7)])
+
+
+SEOUL = timezone(timedelta(hours=9))
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize("stamps", [
+    [(START + timedelta(seconds=i * 10)).astimezone(SEOUL).isoformat() for i in range(7)],
+    # 시간대 표기가 섞인 값 (object dtype으로 읽힘)
+    [(START + timedelta(seconds=i * 10)).astimezone(SEOUL if i % 2 else timezone.utc).isoformat() for i in range(7)],
+])
+def test_timezone_aware_time_column(stamps):
+    lines = ["stamp,temp,count"] + [f"{stamp},20,{i}" for i, stamp in enumerate(stamps)]
+    rows = transform(("\n".join(lines) + "\n").encode(), "data.csv", time_column="stamp")
+
+    assert [row["stamp"] for row in rows] == stamps
+    temps = [float(row["temp"]) for row in rows]
+    assert temps == pytest.approx([20 + 80 * i / 6 for i in range(7)])
+
+
+def test_row_number_without_time_column():
+    rows = transform(sample_csv(), "data.csv", interval_seconds=30)
+
+    temps = [float(row["temp"]) for row in rows]
+    assert temps[:3] == pytest.approx([20, 60, 100])
+    assert temps[3:] == pytest.approx([100] * 4)
+
+
+def test_untouched_cells_keep_original_text():
+    rows = transform(sample_csv(), "data.csv", time_column="ts")
+
+    assert [row["ts"] for row in rows] == [str(i * 10) for i in range(7)]
+    assert [row["count"] for row in rows] == [str(i) for i in range(7)]
+    assert rows[3]["stamp"] == "2024-01-01 00:00:03"
+    assert {row["failure_active"] for row in rows} == {"1"}
+
+
+def test_xlsx_integer_column_with_blanks_stays_integer():
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(["ts", "temp", "count"])
+    for i in range(4):
+        sheet.append([i * 20, 20.0, None if i == 1 else i])
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+
+    rows = transform(buffer.getvalue(), "data.xlsx", time_column="ts")
+
+    assert [row["count"] for row in rows] == ["0", "", "2", "3"]
+    assert [row["ts"] for row in rows] == ["0", "20", "40", "60"]
+    assert float(rows[-1]["temp"]) == pytest.approx(100)
@@ -0,0 +1,144 @@
+"""라벨링 데이터셋 생성 CLI - 라벨, 타임라인, shard 분할, 고정 출력 타입"""
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.tools.generate_dataset import (
+    NORMAL_LABEL,
+    build_episode_plan,
+    coerce_frame,
+    column_types,
+    load_definition_from_db,
+    main,
+    normalize_definition,
+    parse_args
+)
+
+EXPORT = {
+    "simulator": {
+        "name": "pump",
+        "parameters": {"temperature": 25, "status": "ok"},
+        "parameter_config": {"temperature": {"min": 20, "max": 30}}
+    },
+    "scenarios": [
+        {"name": "overheat", "failure_parameters": {"temperature": 90.5}},
+        {"name": "alarm", "failure_parameters": {"alarm": True}}
+    ]
+}
+
+
+@pytest.fixture
+def export_path(tmp_path):
+    path = tmp_path / "export.json"
+    path.write_text(json.dumps(EXPORT), encoding="utf-8")
+    return str(path)
+
+
+def generate(export_path, output_dir, *extra):
+    args = [
+        "--from-json", export_path, "--output-dir", str(output_dir), "--rows", "1000",
+        "--episode-seconds", "50", "--failure-ratio", "0.5", "--seed", "7",
+        "--start-time", "2024-01-01T00:00:00", "--workers", "1", *extra
+    ]
+    assert main(args) == 0
+    return pd.concat(
+        [pd.read_csv(path) for path in sorted(output_dir.glob("part-*.csv"))],
+        ignore_index=True
+    )
+
+
+def test_csv_rows_labels_and_timeline(export_path, tmp_path):
+    frame = generate(export_path, tmp_path / "out", "--shard-rows", "300", "--chunk-rows", "128")
+
+    assert len(list((tmp_path / "out").glob("part-*.csv"))) == 4
+    assert len(frame) == 1000
+    assert list(frame.columns) == ["timestamp", "temperature", "status", "alarm", "failure_label"]
+
+    timestamps = pd.to_datetime(frame["timestamp"])
+    assert timestamps.iloc[0] == pd.Timestamp("2024-01-01")
+    assert (timestamps.diff().iloc[1:] == pd.Timedelta(seconds=1)).all()
+
+    # 라벨은 에피소드(50행) 단위로 바뀌고, 라벨에 맞는 고장 값이 들어 있음
+    episodes = frame.groupby(np.arange(1000) // 50)["failure_label"].nunique()
+    assert (episodes == 1).all()
+    assert set(frame["failure_label"]) == {NORMAL_LABEL, "overheat", "alarm"}
+
+    overheat = frame[frame["failure_label"] == "overheat"]
+    normal = frame[frame["failure_label"] == NORMAL_LABEL]
+    assert (overheat["temperature"] == 90.5).all()
+    assert normal["temperature"].between(20, 30).all()
+    assert normal["alarm"].isna().all()
+    assert (frame[frame["failure_label"] == "alarm"]["alarm"] == True).all()  # noqa: E712
+
+
+def test_labels_do_not_depend_on_sharding(export_path, tmp_path):
+    one = generate(export_path, tmp_path / "one")
+    many = generate(export_path, tmp_path / "many", "--shard-rows", "170")
+
+    assert list(one["failure_label"]) == list(many["failure_label"])
+
+
+def test_same_seed_reproduces_output(export_path, tmp_path):
+    first = generate(export_path, tmp_path / "a", "--shard-rows", "400")
+    second = generate(export_path, tmp_path / "b", "--shard-rows", "400")
+
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_episode_plan_ratio():
+    plan = build_episode_plan(20000, 3, 0.25, seed=1)
+
+    assert np.mean(plan >= 0) == pytest.approx(0.25, abs=0.02)
+    assert set(np.unique(plan)) == {-1, 0, 1, 2}
+    assert set(build_episode_plan(10, 0, 1.0, seed=1)) == {-1}
+
+
+def test_column_types_fix_chunk_dtypes():
+    definition = normalize_definition(EXPORT)
+    types = column_types(definition)
+    assert types == {"temperature": "float", "status": "string", "alarm": "bool"}
+
+    # 값이 없는 청크도 같은 타입으로 변환됨
+    frame = pd.DataFrame({
+        "temperature": [25, None],
+        "status": [None, None],
+        "alarm": [None, True]
+    })
+    coerced = coerce_frame(frame, types)
+    assert coerced["temperature"].dtype == np.float64
+    assert coerced["alarm"].dtype == "boolean"
+    assert coerced["status"].isna().all()
+
+
+def test_parquet_uses_one_schema_across_chunks(export_path, tmp_path):
+    pytest.importorskip("pyarrow")
+    output_dir = tmp_path / "out"
+    assert main([
+        "--from-json", export_path, "--output-dir", str(output_dir), "--rows", "600",
+        "--chunk-rows", "50", "--episode-seconds", "50", "--seed", "3", "--format", "parquet", "--workers", "1"
+    ]) == 0
+
+    frame = pd.read_parquet(next(output_dir.glob("part-*.parquet")))
+    assert len(frame) == 600
+    assert frame["temperature"].dtype == np.float64
+
+
+def test_load_definition_from_db(db, user, make_simulator, make_scenario):
+    simulator = make_simulator("pump-1")
+    scenario = make_scenario("overheat")
+    scenario.simulator_id = simulator.id
+    db.commit()
+
+    definition = load_definition_from_db(simulator_id=simulator.id)
+
+    assert definition["name"] == "pump-1"
+    assert definition["parameters"] == {"temperature": 25.0, "pressure": 100.0}
+    assert [item["name"] for item in definition["scenarios"]] == ["overheat"]
+    assert definition["scenarios"][0]["failure_config"] == {"failure_parameters": {"temperature": 90.0}}
+
+
+def test_simulator_name_requires_user_id():
+    with pytest.raises(SystemExit):
+        parse_args(["--simulator-name", "pump", "--rows", "10"])
@@ -0,0 +1,80 @@
+"""마르코프 고장 유형 - 키 없는 행의 상태 이어가기와 키별 상태 유지"""
+import numpy as np
+import pytest
+
+from app.services.failure_engine import FailureEngine, MarkovStateStore
+
+
+def markov_config(rates, states=("up", "down")):
+    return {
+        "failure_parameters": {},
+        "advanced_config": {
+            "parameters": {
+                "temp": {
+                    "failure_type": "markov",
+                    "states": list(states),
+                    "rates": rates,
+                    "transforms": {"down": {"value": 0}},
+                    "state_parameter": "health"
+                }
+            }
+        }
+    }
+
+
+def run_batch(engine, config, elapsed, keys=None):
+    elapsed = np.asarray(elapsed, dtype=float)
+    columns, _ = engine.apply_failure_scenario_batch({"temp": np.full(len(elapsed), 25.0)}, config, elapsed, keys)
+    return columns
+
+
+class TestMarkovChaining:
+    def test_keyless_rows_follow_previous_state(self):
+        # down은 흡수 상태 - 행마다 독립적으로 뽑으면 down 다음에 up이 나올 수 있음
+        engine = FailureEngine(seed=1, state_store=MarkovStateStore())
+        columns = run_batch(engine, markov_config({"up": {"down": 0.01}}), np.arange(2000.0))
+
+        health = columns["health"]
+        first_down = list(health).index("down")
+        assert set(health[first_down:]) == {"down"}
+        assert set(health[:first_down]) <= {"up"}
+        assert np.all(columns["temp"][first_down:] == 0)
+
+    def test_keyless_state_continues_across_calls(self):
+        engine = FailureEngine(seed=2, state_store=MarkovStateStore())
+        config = markov_config({"up": {"down": 0.5}})
+
+        first = run_batch(engine, config, np.arange(100.0))
+        assert first["health"][-1] == "down"
+
+        second = run_batch(engine, config, np.arange(100.0, 200.0))
+        assert set(second["health"]) == {"down"}
+
+    def test_keyless_restarts_when_elapsed_goes_back(self):
+        engine = FailureEngine(seed=3, state_store=MarkovStateStore())
+        config = markov_config({"up": {"down": 0.5}})
+
+        columns = run_batch(engine, config, np.concatenate([np.arange(100.0), [0.0]]))
+        assert columns["health"][-2] == "down"
+        assert columns["health"][-1] == "up"
+
+    def test_keyless_occupancy_matches_stationary_distribution(self):
+        # up ⇄ down 두 상태 연쇄의 정상 분포: P(down) = a / (a + b)
+        a, b = 0.1, 0.4
+        engine = FailureEngine(seed=4, state_store=MarkovStateStore())
+        columns = run_batch(engine, markov_config({"up": {"down": a}, "down": {"up": b}}), np.arange(40000.0))
+
+        down = np.mean(columns["health"][1000:] == "down")
+        assert down == pytest.approx(a / (a + b), abs=0.02)
+
+    def test_keyed_state_is_kept_per_key(self):
+        store = MarkovStateStore()
+        config = markov_config({"up": {"down": 0.5}})
+        engine = FailureEngine(seed=5, state_store=store)
+
+        first = run_batch(engine, config, [100.0, 0.0], keys=["a", "b"])
+        assert list(first["health"]) == ["down", "up"]
+
+        # 이후 호출은 키별 마지막 상태에서 이어감 (a는 흡수 상태, b는 dt=0이라 그대로)
+        second = run_batch(FailureEngine(seed=6, state_store=store), config, [101.0, 0.0], keys=["a", "b"])
+        assert list(second["health"]) == ["down", "up"]
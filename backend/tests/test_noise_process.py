@@ -0,0 +1,87 @@
+"""유색 노이즈(pink/brown/arma) - 키별 버퍼, 필터 구현, 스펙트럼/자기상관 성질"""
+import numpy as np
+import pytest
+
+from app.services.noise_process import NoiseBufferStore, lfilter, noise_process, sequence
+
+
+def autocorrelation(values: np.ndarray, lag: int = 1) -> float:
+    values = values - values.mean()
+    return float(np.dot(values[:-lag], values[lag:]) / np.dot(values, values))
+
+
+class TestColoredNoise:
+    @pytest.mark.parametrize("noise_config", [
+        {"type": "pink"},
+        {"type": "brown"},
+        {"type": "arma", "ar": [0.8]},
+        {"type": "arma", "ar": [0.5, -0.3], "ma": [0.4]},
+    ])
+    def test_new_keys_start_at_unit_variance(self, noise_config):
+        # 워밍업 덕분에 첫 값부터 정상 상태 분포(분산 1)
+        store = NoiseBufferStore(block_size=8)
+        samples = store.draw(list(range(8000)), noise_process(noise_config), np.random.default_rng(7))
+
+        assert samples.mean() == pytest.approx(0.0, abs=0.06)
+        assert samples.var() == pytest.approx(1.0, abs=0.06)
+
+    def test_ar1_autocorrelation_survives_buffer_refills(self):
+        store = NoiseBufferStore(block_size=16)
+        process = noise_process({"type": "arma", "ar": [0.8]})
+        rng = np.random.default_rng(8)
+
+        values = np.array([store.draw(["pump"], process, rng)[0] for _ in range(20000)])
+
+        assert autocorrelation(values) == pytest.approx(0.8, abs=0.03)
+        assert values.var() == pytest.approx(1.0, abs=0.1)
+
+    def test_pink_spectrum_slope(self):
+        # 독립 행 64개를 한 번에 필터링 (행 방향 벡터화) 후 워밍업 구간 제외
+        process = noise_process({"type": "pink"})
+        white = np.random.default_rng(9).standard_normal((64, process.warmup + 4096))
+        filtered, _ = lfilter(process.b, process.a, white, np.zeros((64, process.order)))
+
+        segments = filtered[:, process.warmup:] * process.gain
+        power = np.mean(np.abs(np.fft.rfft(segments, axis=1)) ** 2, axis=0)
+        frequencies = np.fft.rfftfreq(4096)
+        band = slice(8, 1024)
+        slope = np.polyfit(np.log(frequencies[band]), np.log(power[band]), 1)[0]
+
+        assert slope == pytest.approx(-1.0, abs=0.2)
+
+    def test_sequence_continues_from_filter_state(self):
+        process = noise_process({"type": "arma", "ar": [0.9], "ma": [0.3]})
+
+        whole, _ = sequence(process, 100, np.random.default_rng(10))
+        rng = np.random.default_rng(10)
+        head, state = sequence(process, 40, rng)
+        tail, _ = sequence(process, 60, rng, state)
+
+        np.testing.assert_allclose(np.concatenate([head, tail]), whole)
+
+    def test_lfilter_matches_difference_equation(self):
+        b, a = (1.0, 0.4, -0.2), (1.0, -0.5, 0.3)
+        x = np.random.default_rng(11).standard_normal((3, 200))
+
+        y, _ = lfilter(b, a, x, np.zeros((3, 2)))
+
+        expected = np.zeros_like(x)
+        for t in range(x.shape[1]):
+            expected[:, t] = sum(b[k] * x[:, t - k] for k in range(3) if t - k >= 0)
+            expected[:, t] -= sum(a[k] * expected[:, t - k] for k in range(1, 3) if t - k >= 0)
+        np.testing.assert_allclose(y, expected, atol=1e-12)
+
+    def test_unstable_arma_is_rejected(self):
+        with pytest.raises(ValueError):
+            noise_process({"type": "arma", "ar": [1.2]})
+
+    def test_changed_process_restarts_the_key(self):
+        store = NoiseBufferStore(block_size=16)
+        rng = np.random.default_rng(12)
+        store.draw(["pump"], noise_process({"type": "pink"}), rng)
+        store.draw(["pump"], noise_process({"type": "pink"}), rng)
+        assert store._entries["pump"][1] == 2
+
+        brown = noise_process({"type": "brown"})
+        store.draw(["pump"], brown, rng)
+        assert store._entries["pump"][1] == 1 and store._entries["pump"][3] == brown
@@ -0,0 +1,136 @@
+"""재생 데이터 - 컬럼별 .npy 변환, 재생 위치(loop/ping_pong/hold), 요청/시계 기준 진행"""
+import io
+import json
+import os
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+from fastapi import HTTPException
+
+from app.services import replay_store
+from app.services.replay_store import ReplayDataset, ReplayRegistry, build_replay_dataset, row_position
+from app.services.simulation_clock import clock_registry
+
+CSV = (
+    "t,temperature,pressure,state,ok\n"
+    "0,20,1.5,run,true\n"
+    "1,21,,stop,false\n"
+    "2,22,1.7,run,\n"
+    "3,23,1.8,,true\n"
+).encode("utf-8")
+
+
+def build(tmp_path, content: bytes = CSV):
+    return build_replay_dataset(io.BytesIO(content), "data.csv", len(content), data_dir=str(tmp_path))
+
+
+@pytest.mark.parametrize("wrap, expected", [
+    ("loop", [0, 1, 2, 3, 0, 1, 2, 3, 0]),
+    ("ping_pong", [0, 1, 2, 3, 2, 1, 0, 1, 2]),
+    ("hold", [0, 1, 2, 3, 3, 3, 3, 3, 3]),
+])
+def test_row_position(wrap, expected):
+    assert [row_position(step, 4, wrap) for step in range(9)] == expected
+
+
+@pytest.mark.parametrize("wrap", ["loop", "ping_pong", "hold"])
+def test_row_position_edges(wrap):
+    assert row_position(-5, 4, wrap) == 0
+    assert [row_position(step, 1, wrap) for step in range(3)] == [0, 0, 0]
+
+
+def test_build_writes_typed_columns(tmp_path):
+    manifest = build(tmp_path)
+
+    directory = tmp_path / manifest["dataset_id"]
+    assert sorted(os.listdir(tmp_path)) == [manifest["dataset_id"]]
+    assert not [name for name in os.listdir(directory) if name.endswith(".raw")]
+    assert json.loads((directory / "manifest.json").read_text(encoding="utf-8")) == manifest
+
+    assert manifest["row_count"] == 4
+    by_name = {column["name"]: column for column in manifest["columns"]}
+    assert by_name["temperature"]["dtype"] == "int64"
+    assert by_name["pressure"]["dtype"] == "float64"
+    assert by_name["state"]["kind"] == "category" and by_name["state"]["dtype"] == "int32"
+
+    dataset = ReplayDataset(str(directory))
+    assert dataset.row(1) == {"t": 1, "temperature": 21, "pressure": None, "state": "stop", "ok": False}
+    assert dataset.row(3)["state"] is None
+
+
+def test_build_across_chunks_keeps_types_and_categories(tmp_path, monkeypatch):
+    """청크가 여러 개여도 범주 코드와 정수/실수 판단이 파일 전체 기준"""
+    rows = [f"{i},{i if i < 2500 else i + 0.5},{'abc'[i % 3]}" for i in range(3000)]
+    content = ("n,value,label\n" + "\n".join(rows) + "\n").encode()
+    monkeypatch.setattr(replay_store, "CHUNK_CELLS", 1)
+    monkeypatch.setattr(replay_store, "COPY_ROWS", 700)
+
+    manifest = build(tmp_path, content)
+
+    dataset = ReplayDataset(str(tmp_path / manifest["dataset_id"]))
+    assert dataset.row_count == 3000
+    assert [column["dtype"] for column in manifest["columns"]] == ["int64", "float64", "int32"]
+    assert list(dataset.row(2999).values()) == [2999, 2999.5, "c"]
+    assert list(dataset.row(1000).values()) == [1000, 1000.0, "b"]
+
+
+def test_header_only_file_is_rejected_without_leftovers(tmp_path):
+    with pytest.raises(HTTPException) as error:
+        build(tmp_path, "a,b\n".encode())
+
+    assert error.value.status_code == 400
+    assert os.listdir(tmp_path) == []
+
+
+def test_unsupported_manifest_version(tmp_path):
+    directory = tmp_path / build(tmp_path)["dataset_id"]
+    manifest = json.loads((directory / "manifest.json").read_text(encoding="utf-8"))
+    manifest["version"] = 99
+    (directory / "manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        ReplayDataset(str(directory))
+
+
+def test_request_advance_uses_a_cursor_per_simulator(tmp_path):
+    registry = ReplayRegistry(data_dir=str(tmp_path))
+    config = {"dataset_id": build(tmp_path)["dataset_id"], "wrap": "ping_pong"}
+
+    def times(simulator_id, count):
+        return [registry.current_values(simulator_id, config)["t"] for _ in range(count)]
+
+    assert times(1, 6) == [0, 1, 2, 3, 2, 1]
+    assert times(2, 2) == [0, 1]
+    registry.reset_cursor(1)
+    assert times(1, 1) == [0]
+
+
+def test_clock_advance_follows_the_simulator_clock(tmp_path):
+    registry = ReplayRegistry(data_dir=str(tmp_path))
+    started_at = datetime(2024, 1, 1)
+    config = {
+        "dataset_id": build(tmp_path)["dataset_id"], "advance": "clock", "wrap": "hold",
+        "started_at": started_at.isoformat(), "interval_seconds": 10.0
+    }
+    clock = clock_registry.get_or_create(7)
+    clock.pause()
+    try:
+        clock.seek(started_at + timedelta(seconds=25))
+        assert registry.current_values(7, config)["t"] == 2
+        assert registry.current_values(7, config)["t"] == 2
+
+        clock.seek(started_at + timedelta(hours=1))
+        assert registry.current_values(7, config)["t"] == 3
+    finally:
+        clock_registry.reset(7)
+
+
+def test_forget_reopens_the_dataset(tmp_path):
+    registry = ReplayRegistry(data_dir=str(tmp_path))
+    dataset_id = build(tmp_path)["dataset_id"]
+
+    first = registry.dataset(dataset_id)
+    assert registry.dataset(dataset_id) is first
+    registry.forget(dataset_id)
+    assert registry.dataset(dataset_id) is not first
@@ -0,0 +1,92 @@
+"""DDL_AUTO 스키마 반영 - 지문 빠른 경로, create 1회 실행, 컬럼 기준 인덱스 비교"""
+import pytest
+from sqlalchemy import create_engine, inspect, text
+
+from app.database import Base
+from app.utils import schema_updater
+from app.utils.schema_updater import apply_ddl_auto, check_schema_differences
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """앱 DB와 분리된 빈 SQLite 엔진"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'schema.db'}")
+    yield engine
+    engine.dispose()
+
+
+def index_names(engine, table):
+    return {index["name"] for index in inspect(engine).get_indexes(table)}
+
+
+def test_matching_fingerprint_skips_inspection(engine, monkeypatch):
+    apply_ddl_auto(engine, Base.metadata, "update")
+
+    def fail(*args, **kwargs):
+        raise AssertionError("지문이 같으면 스키마를 조회하지 않아야 함")
+
+    monkeypatch.setattr(schema_updater, "auto_update_schema", fail)
+    apply_ddl_auto(engine, Base.metadata, "update")
+
+
+def test_create_runs_once_per_fingerprint(engine):
+    apply_ddl_auto(engine, Base.metadata, "create")
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO users (name, user_id, password) VALUES ('a', 'alice', 'x')"))
+
+    # 다음 워커/재시작은 같은 지문이므로 데이터를 지우지 않음
+    apply_ddl_auto(engine, Base.metadata, "create")
+    with engine.connect() as conn:
+        assert conn.scalar(text("SELECT COUNT(*) FROM users")) == 1
+
+
+def test_switching_to_create_recreates_once(engine):
+    apply_ddl_auto(engine, Base.metadata, "update")
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO users (name, user_id, password) VALUES ('a', 'alice', 'x')"))
+
+    apply_ddl_auto(engine, Base.metadata, "create")
+    with engine.connect() as conn:
+        assert conn.scalar(text("SELECT COUNT(*) FROM users")) == 0
+
+
+def test_update_adds_missing_index(engine):
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX ix_simulators_user_id_name"))
+
+    apply_ddl_auto(engine, Base.metadata, "update")
+
+    assert "ix_simulators_user_id_name" in index_names(engine, "simulators")
+
+
+def test_equivalent_indexes_under_other_names_are_not_duplicated(engine):
+    """init.sql처럼 idx_* 이름으로 같은 컬럼에 만든 인덱스/기본 키가 있으면 ix_*를 추가하지 않음"""
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX ix_users_user_id"))
+        conn.execute(text("DROP INDEX ix_users_id"))
+        conn.execute(text("CREATE UNIQUE INDEX idx_users_user_id ON users(user_id)"))
+        conn.execute(text("DROP INDEX ix_simulators_user_id_name"))
+        conn.execute(text("CREATE INDEX idx_simulators_user_name ON simulators(user_id, name)"))
+
+    assert check_schema_differences(engine, Base.metadata)["missing_indexes"] == {
+        "simulators": ["ix_simulators_user_id_name"]
+    }
+
+    apply_ddl_auto(engine, Base.metadata, "update")
+
+    assert index_names(engine, "users") == {"idx_users_user_id"}
+    # 유니크 모델 인덱스는 같은 컬럼이어도 기존 인덱스가 유니크가 아니면 추가
+    assert "ix_simulators_user_id_name" in index_names(engine, "simulators")
+
+
+def test_validate_only_reports(engine):
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE simulators DROP COLUMN clock_config"))
+
+    apply_ddl_auto(engine, Base.metadata, "validate")
+
+    columns = {column["name"] for column in inspect(engine).get_columns("simulators")}
+    assert "clock_config" not in columns
@@ -0,0 +1,167 @@
+"""공유 메모리 보드 - seqlock 읽기/쓰기, 항목 단위 읽기, 리더/팔로워 틱 스케줄러"""
+import multiprocessing
+import uuid
+from multiprocessing import shared_memory
+
+import pytest
+
+from app.services.shared_board import LeaderLock, SharedBoard
+from app.services.tick_scheduler import TickScheduler
+
+
+@pytest.fixture
+def board_name():
+    """테스트마다 새 공유 메모리 이름 (끝나면 영역 삭제)"""
+    name = f"test_board_{uuid.uuid4().hex[:12]}"
+    yield name
+    for suffix in ("", "_values", "_table"):
+        try:
+            shm = shared_memory.SharedMemory(name=name + suffix)
+        except FileNotFoundError:
+            continue
+        shm.close()
+        shm.unlink()
+
+
+def test_write_and_read(board_name):
+    writer = SharedBoard.create(board_name, 1024)
+    reader = SharedBoard.attach(board_name)
+    assert reader.read() == (0, None)
+
+    sequence = writer.write(b"hello")
+    assert sequence % 2 == 0
+    assert reader.read() == (sequence, b"hello")
+
+    # 빈 보드를 다시 만들면 이전 sequence가 남아 있어도 payload 없음
+    SharedBoard.create(board_name, 1024)
+    assert reader.read() == (0, None)
+
+    writer.close()
+    reader.close()
+
+
+def test_attach_before_create_and_capacity(board_name):
+    assert SharedBoard.attach(board_name) is None
+
+    board = SharedBoard.create(board_name, 16)
+    with pytest.raises(ValueError):
+        board.write(b"x" * 17)
+    board.close()
+
+
+def test_create_recovers_from_writer_dying_mid_write(board_name):
+    board = SharedBoard.create(board_name, 64)
+    board.write(b"old")
+    # 쓰기 도중 종료된 상태 (sequence 홀수)
+    SharedBoard.HEADER.pack_into(board._shm.buf, 0, SharedBoard.MAGIC, board.sequence + 1, 3)
+
+    recreated = SharedBoard.create(board_name, 64)
+    assert recreated.sequence % 2 == 0
+    recreated.write(b"new")
+    assert SharedBoard.attach(board_name).read()[1] == b"new"
+    board.close()
+
+
+def test_read_entries_selects_slots(board_name):
+    board = SharedBoard.create(board_name, 1024)
+    assert board.read_entries([0]) == (0, None)
+
+    board.write_entries(7, [b"a", b"", b"ccc"])
+    reader = SharedBoard.attach(board_name)
+
+    assert reader.read_entries() == (7, [b"a", b"", b"ccc"])
+    assert reader.read_entries([2, 0]) == (7, [b"ccc", b"a"])
+    assert reader.read_entries([3, -1]) == (7, [None, None])
+    assert reader.read_entries([]) == (7, [])
+
+
+def _write_generations(name: str, generations: int) -> None:
+    board = SharedBoard.attach(name)
+    for generation in range(1, generations + 1):
+        entry = str(generation).encode() * (1 + generation % 50)
+        board.write_entries(generation, [entry] * 64)
+    board.close()
+
+
+def test_reader_never_sees_torn_entries(board_name):
+    """다른 프로세스가 계속 쓰는 동안 읽은 항목은 모두 같은 게시본이어야 함"""
+    SharedBoard.create(board_name, 1 << 20).close()
+    writer = multiprocessing.get_context("spawn").Process(target=_write_generations, args=(board_name, 20000))
+    writer.start()
+
+    reader = SharedBoard.attach(board_name)
+    reads = 0
+    try:
+        while writer.is_alive() or reads == 0:
+            tag, entries = reader.read_entries()
+            if entries is None:
+                continue
+            reads += 1
+            expected = str(tag).encode() * (1 + tag % 50)
+            assert entries == [expected] * 64
+        assert reader.read_entries([0])[0] == 20000
+    finally:
+        writer.join()
+        reader.close()
+
+    assert writer.exitcode == 0
+
+
+def test_leader_lock_is_exclusive(tmp_path):
+    path = str(tmp_path / "board.lock")
+    first, second = LeaderLock(path), LeaderLock(path)
+
+    assert first.try_acquire()
+    assert not second.try_acquire()
+    first.release()
+    assert second.try_acquire()
+    second.release()
+
+
+@pytest.fixture
+def schedulers(board_name, tmp_path, monkeypatch):
+    """같은 보드를 쓰는 리더/팔로워 스케줄러 (루프 없이 step으로 직접 구동)"""
+    monkeypatch.setattr(TickScheduler, "running", property(lambda self: True))
+    options = dict(shared_board=True, board_name=board_name, board_size=1 << 20,
+                   lock_path=str(tmp_path / "board.lock"))
+    leader, follower = TickScheduler(**options), TickScheduler(**options)
+    leader.step()
+    follower.step()
+    assert leader.is_leader and not follower.is_leader
+    yield leader, follower
+    for scheduler in (follower, leader):
+        scheduler._close_boards()
+        scheduler._leader_lock.release()
+
+
+def test_follower_reads_leader_values_from_the_board(db, make_simulator, schedulers):
+    make_simulator("pump-1")
+    make_simulator("pump-2", parameters={"temperature": 30.0})
+    leader, follower = schedulers
+    leader.mark_dirty()
+    leader.step()
+    follower.step()
+
+    assert follower.lookup("ALICE", "pump-1") == leader.lookup("alice", "pump-1")
+    assert follower.lookup_user("alice") == leader.lookup_user("alice")
+    assert follower.lookup("alice", "missing") is None
+    # 팔로워는 값 보드를 디코딩해 두지 않음
+    assert follower._snapshot == {}
+
+
+def test_follower_ignores_values_of_a_newer_table(db, make_simulator, schedulers):
+    make_simulator("pump-1")
+    leader, follower = schedulers
+    leader.mark_dirty()
+    leader.step()
+    follower.step()
+
+    # 리더가 새 테이블(tag 변경)을 게시했지만 팔로워는 아직 읽기 전
+    make_simulator("a-first", parameters={"temperature": -1.0})
+    leader.mark_dirty()
+    leader.step()
+    assert follower.lookup("alice", "pump-1") is None
+
+    follower.step()
+    assert follower.lookup("alice", "pump-1") == leader.lookup("alice", "pump-1")
+    assert follower.lookup("alice", "a-first")["data"]["temperature"] == -1.0
@@ -0,0 +1,151 @@
+"""시뮬레이션 시계 - 기준점 재설정, 배속/일시정지/시점 이동, 시뮬레이터 행에 저장한 상태 복원"""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.schemas.simulator import SimulatorClockUpdate
+from app.services.compiled_cache import compiled_cache
+from app.services.failure_scenario_service import FailureScenarioService
+from app.services.simulation_clock import ClockRegistry, SimulationClock, clock_registry
+from app.services.simulator_service import SimulatorService
+
+START = datetime(2024, 1, 1)
+
+
+class FakeWallClock:
+    """테스트에서 직접 움직이는 실제 시각"""
+
+    def __init__(self):
+        self.now = START
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def tick(self, seconds: float) -> None:
+        self.now += timedelta(seconds=seconds)
+
+
+@pytest.fixture
+def wall():
+    return FakeWallClock()
+
+
+def test_speed_change_keeps_elapsed_virtual_time(wall):
+    clock = SimulationClock(speed=10, wall_clock=wall)
+    wall.tick(6)
+    assert clock.now() == START + timedelta(seconds=60)
+
+    clock.set_speed(2)
+    wall.tick(5)
+    assert clock.now() == START + timedelta(seconds=70)
+
+
+def test_pause_resume_and_advance(wall):
+    clock = SimulationClock(speed=60, wall_clock=wall)
+    wall.tick(1)
+    clock.pause()
+    wall.tick(100)
+    assert clock.now() == START + timedelta(seconds=60)
+
+    # 일시정지 중 이동해도 멈춘 상태 유지
+    clock.advance(30)
+    wall.tick(100)
+    assert clock.now() == START + timedelta(seconds=90)
+
+    clock.resume()
+    wall.tick(1)
+    assert clock.now() == START + timedelta(seconds=150)
+
+
+def test_seek_converts_aware_time_to_naive_utc(wall):
+    clock = SimulationClock(wall_clock=wall)
+    clock.seek(datetime(2024, 6, 1, 9, tzinfo=timezone(timedelta(hours=9))))
+
+    wall.tick(10)
+    assert clock.now() == datetime(2024, 6, 1, 0, 0, 10)
+
+
+def test_state_round_trip_continues_on_another_clock(wall):
+    clock = SimulationClock(speed=3600, wall_clock=wall)
+    wall.tick(2)
+    clock.advance(-600)
+
+    restored = SimulationClock.from_state(clock.to_state(), wall_clock=wall)
+    wall.tick(1)
+    assert restored.now() == clock.now() == START + timedelta(hours=3) - timedelta(seconds=600)
+    assert restored.speed == 3600
+
+
+def test_invalid_speed_is_rejected(wall):
+    with pytest.raises(ValueError):
+        SimulationClock(speed=0, wall_clock=wall)
+    with pytest.raises(ValueError):
+        SimulationClock(wall_clock=wall).set_speed(-1)
+
+
+def test_registry_sync_rebuilds_only_on_change():
+    registry = ClockRegistry()
+    registry.get_or_create(1).set_speed(5)
+    state = registry.persisted(1)
+
+    other = ClockRegistry()
+    other.sync(1, state)
+    clock = other.get(1)
+    assert other.is_custom(1) and clock.speed == 5
+
+    other.sync(1, dict(state))
+    assert other.get(1) is clock
+
+    other.sync(1, None)
+    assert not other.is_custom(1)
+
+
+@pytest.fixture
+def gradual_simulator(db, user, make_simulator, make_scenario):
+    """10분에 걸쳐 온도가 25 → 100으로 오르는 시나리오가 적용된 시뮬레이터"""
+    simulator = make_simulator("pump-1")
+    scenario = make_scenario(
+        failure_parameters={},
+        advanced_config={
+            "parameters": {
+                "temperature": {"failure_type": "gradual", "failure_value": 100.0, "duration_seconds": 600}
+            }
+        }
+    )
+    FailureScenarioService.apply_scenario_to_simulator(db, scenario.id, simulator.id, user.id)
+    return simulator
+
+
+def temperature(db) -> float:
+    db.expire_all()
+    return SimulatorService.get_simulator_data(db, "alice", "pump-1")["data"]["temperature"]
+
+
+def test_clock_drives_time_based_failures(db, user, gradual_simulator):
+    assert temperature(db) == pytest.approx(25.0, abs=0.5)
+
+    SimulatorService.update_simulator_clock(
+        db, gradual_simulator.id, user.id, SimulatorClockUpdate(paused=True, advance_seconds=300)
+    )
+    assert temperature(db) == pytest.approx(62.5, abs=0.5)
+
+
+def test_clock_state_is_restored_from_the_simulator_row(db, user, gradual_simulator):
+    SimulatorService.update_simulator_clock(
+        db, gradual_simulator.id, user.id, SimulatorClockUpdate(paused=True, advance_seconds=450)
+    )
+    db.refresh(gradual_simulator)
+    assert gradual_simulator.clock_config is not None
+
+    # 새 워커처럼 시계와 컴파일 캐시가 비어 있어도 행의 상태로 같은 값이 나와야 함
+    clock_registry.clear()
+    compiled_cache.clear()
+    assert temperature(db) == pytest.approx(81.25, abs=0.5)
+    response = SimulatorService.get_simulator_clock(db, gradual_simulator.id, user.id)
+    assert response["is_custom"] and response["paused"]
+
+    SimulatorService.reset_simulator_clock(db, gradual_simulator.id, user.id)
+    db.refresh(gradual_simulator)
+    assert gradual_simulator.clock_config is None
+    assert not clock_registry.is_custom(gradual_simulator.id)
+    assert temperature(db) == pytest.approx(25.0, abs=0.5)
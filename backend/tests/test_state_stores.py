@@ -0,0 +1,103 @@
+"""장비별 상태 저장소 - 최대 크기 근처의 플릿과 다른 시뮬레이터가 함께 있을 때의 삭제 순서"""
+import numpy as np
+
+from app.services.failure_engine import MarkovStateStore
+from app.services.noise_process import NoiseBufferStore, noise_process
+
+LIMIT = 1000
+PINK = noise_process({"type": "pink"})
+
+
+def fleet_keys(name: str, count: int):
+    return [((name, instance), "temp") for instance in range(count)]
+
+
+class TestNoiseBufferEviction:
+    def test_fleet_near_limit_keeps_buffers_next_to_another_simulator(self):
+        store = NoiseBufferStore(block_size=64, max_entries=LIMIT)
+        rng = np.random.default_rng(0)
+        fleet, other = fleet_keys("fleet", LIMIT - 20), fleet_keys("other", 20)
+
+        for _ in range(10):
+            store.draw(fleet, PINK, rng)
+            store.draw(other, PINK, rng)
+
+        # 버퍼를 다시 만들지 않고 계속 꺼냈으므로 모든 키가 10번째 값까지 진행
+        assert len(store._entries) == LIMIT
+        assert {store._entries[key][1] for key in fleet + other} == {10}
+
+    def test_max_size_fleet_with_another_simulator_keeps_most_buffers(self):
+        """한도만큼의 플릿 + 다른 시뮬레이터 - 넘친 만큼만 버리고 나머지 키는 이어서 진행"""
+        store = NoiseBufferStore(block_size=64, max_entries=LIMIT)
+        rng = np.random.default_rng(0)
+        fleet, other = fleet_keys("fleet", LIMIT), fleet_keys("other", 20)
+
+        store.draw(fleet, PINK, rng)
+        for _ in range(5):
+            store.draw(other, PINK, rng)
+            store.draw(fleet, PINK, rng)
+            continued = sum(store._entries[key][1] > 1 for key in fleet)
+            assert continued >= LIMIT * 0.85
+            assert len(store._entries) <= LIMIT
+
+    def test_least_recently_used_keys_are_evicted_first(self):
+        store = NoiseBufferStore(block_size=64, max_entries=LIMIT)
+        rng = np.random.default_rng(0)
+        deleted, fleet = fleet_keys("deleted", 300), fleet_keys("fleet", LIMIT - 50)
+
+        store.draw(deleted, PINK, rng)
+        store.draw(fleet, PINK, rng)
+        store.draw(fleet, PINK, rng)
+
+        assert set(store._entries) == set(fleet)
+        assert {store._entries[key][1] for key in fleet} == {2}
+
+    def test_overflow_trims_below_the_limit(self):
+        store = NoiseBufferStore(block_size=64, max_entries=LIMIT)
+        rng = np.random.default_rng(0)
+
+        for name in "abcdef":
+            store.draw(fleet_keys(name, 200), PINK, rng)
+
+        # 넘칠 때마다 90%까지 줄이고, 가장 최근 시뮬레이터들은 남음
+        assert len(store._entries) <= LIMIT
+        assert set(fleet_keys("f", 200)) <= set(store._entries)
+        assert not set(fleet_keys("a", 200)) & set(store._entries)
+
+
+class TestMarkovStateEviction:
+    def save(self, store, keys, state):
+        store.save(keys, np.full(len(keys), state), np.full(len(keys), 1.0))
+
+    def test_fleet_near_limit_keeps_states_next_to_another_simulator(self):
+        store = MarkovStateStore(max_entries=LIMIT)
+        fleet, other = fleet_keys("fleet", LIMIT - 20), fleet_keys("other", 20)
+
+        for _ in range(3):
+            self.save(store, fleet, 2)
+            self.save(store, other, 1)
+
+        states, _ = store.load(fleet + other)
+        assert states.tolist() == [2] * len(fleet) + [1] * len(other)
+
+    def test_least_recently_saved_keys_are_evicted_first(self):
+        store = MarkovStateStore(max_entries=LIMIT)
+        deleted, fleet = fleet_keys("deleted", 300), fleet_keys("fleet", LIMIT - 50)
+
+        self.save(store, deleted, 3)
+        self.save(store, fleet, 2)
+
+        assert set(store.load(deleted)[0].tolist()) == {-1}
+        assert set(store.load(fleet)[0].tolist()) == {2}
+
+    def test_max_size_fleet_with_another_simulator_keeps_most_states(self):
+        store = MarkovStateStore(max_entries=LIMIT)
+        fleet, other = fleet_keys("fleet", LIMIT), fleet_keys("other", 20)
+
+        self.save(store, fleet, 2)
+        for _ in range(5):
+            self.save(store, other, 1)
+            states, _ = store.load(fleet)
+            assert (states == 2).sum() >= LIMIT * 0.85
+            self.save(store, fleet, 2)
+            assert len(store._states) <= LIMIT